@@ -6,6 +6,15 @@ for different run modes.
 
 from rice_factor.adapters.agents.base import BaseCoordinator
 from rice_factor.adapters.agents.hybrid_mode import HybridCoordinator
+from rice_factor.adapters.agents.message_bus import (
+    InboxFullError,
+    InProcessTransport,
+    MessageBus,
+    MessageBusError,
+    MessageBusMetrics,
+    MessageTransport,
+    SocketTransport,
+)
 from rice_factor.adapters.agents.orchestrator_mode import OrchestratorCoordinator
 from rice_factor.adapters.agents.role_locked_mode import RoleLockedCoordinator
 from rice_factor.adapters.agents.solo_mode import SoloCoordinator
@@ -14,8 +23,15 @@ from rice_factor.adapters.agents.voting_mode import VotingCoordinator
 __all__ = [
     "BaseCoordinator",
     "HybridCoordinator",
+    "InProcessTransport",
+    "InboxFullError",
+    "MessageBus",
+    "MessageBusError",
+    "MessageBusMetrics",
+    "MessageTransport",
     "OrchestratorCoordinator",
     "RoleLockedCoordinator",
+    "SocketTransport",
     "SoloCoordinator",
     "VotingCoordinator",
 ]
@@ -6,10 +6,13 @@ It handles common functionality like message routing and agent management.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from rice_factor.adapters.agents.message_bus import MessageBus
 from rice_factor.domain.models.agent import Agent
 from rice_factor.domain.models.messages import (
     AgentMessage,
@@ -19,41 +22,75 @@ from rice_factor.domain.models.messages import (
 from rice_factor.domain.ports.coordinator import CoordinationContext, CoordinatorPort
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from rice_factor.config.run_mode_config import RunModeConfig
 
+T = TypeVar("T")
+
+
+@dataclass
+class FanOutResult(Generic[T]):
+    """Outcome of running one call per agent concurrently.
+
+    Attributes:
+        results: Results by agent ID, in the order the agents were given.
+        timed_out: IDs of agents that exceeded the per-agent timeout.
+        cancelled: IDs of agents cancelled because the fan-out stopped early.
+    """
+
+    results: dict[str, T] = field(default_factory=dict)
+    timed_out: list[str] = field(default_factory=list)
+    cancelled: list[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every agent returned a result."""
+        return not self.timed_out and not self.cancelled
+
 
 class BaseCoordinator(CoordinatorPort):
     """Base class for coordinator implementations.
 
     Provides common functionality for:
     - Agent lifecycle management
-    - Message routing
+    - Message routing over a MessageBus
     - Authority validation
 
     Subclasses must implement the coordinate() method for their
     specific coordination logic.
     """
 
-    def __init__(self, config: RunModeConfig) -> None:
+    def __init__(self, config: RunModeConfig, bus: MessageBus | None = None) -> None:
         """Initialize the coordinator.
 
         Args:
             config: The run mode configuration.
+            bus: Message bus to communicate over (a private in-process
+                bus by default).
         """
         self._config = config
         self._agents: dict[str, Agent] = {}
-        self._message_queue: list[AgentMessage] = []
-        self._responses: dict[str, list[AgentMessage]] = {}
+        self._owns_bus = bus is None
+        self._bus = bus or MessageBus(max_queue_size=config.inbox_size)
+        self._open_channels: set[str] = set()
+        self._messages_sent = 0
 
         # Initialize agents from config
         for agent_config in config.agents:
             self._agents[agent_config.agent_id] = Agent(config=agent_config)
+            self._bus.register(agent_config.agent_id, handler=self._on_agent_message)
 
     @property
     def config(self) -> RunModeConfig:
         """Get the run mode configuration."""
         return self._config
 
+    @property
+    def bus(self) -> MessageBus:
+        """Get the message bus agents communicate over."""
+        return self._bus
+
     @property
     @abstractmethod
     def mode_name(self) -> str:
@@ -103,34 +140,127 @@ class BaseCoordinator(CoordinatorPort):
     ) -> None:
         """Send a message to an agent or broadcast.
 
+        Replies correlated with the message are routed to a channel that
+        collect_responses() reads.
+
         Args:
             message: The message to send.
         """
-        self._message_queue.append(message)
-
-        # Initialize response list for this message
-        if message.message_id not in self._responses:
-            self._responses[message.message_id] = []
+        self._open_channel(message.message_id)
+        await self._bus.publish(message)
+        self._messages_sent += 1
 
     async def collect_responses(
         self,
         message_id: str,
-        timeout_ms: int = 30000,  # noqa: ARG002
+        timeout_ms: int = 30000,
     ) -> list[AgentMessage]:
         """Collect responses to a message.
 
-        Note: In this base implementation, responses are synchronously
-        collected since we're not dealing with actual async LLM calls yet.
-        Subclasses can override for real async behavior.
+        Waits until every recipient of the message has replied or the
+        timeout expires, whichever comes first.
 
         Args:
             message_id: ID of the message to collect responses for.
-            timeout_ms: Maximum time to wait for responses (unused in base).
+            timeout_ms: Maximum time to wait for responses.
 
         Returns:
-            List of response messages.
+            List of response messages received.
+        """
+        self._open_channels.discard(message_id)
+        return await self._bus.collect(message_id, timeout=timeout_ms / 1000)
+
+    async def close(self) -> None:
+        """Close open reply channels, and the bus if this coordinator made it.
+
+        A bus passed in by the caller is shared and left running.
+        """
+        self._close_channels()
+        if self._owns_bus:
+            await self._bus.close()
+
+    def _open_channel(self, message_id: str) -> None:
+        """Open a reply channel on the bus and remember to close it."""
+        self._bus.open_channel(message_id)
+        self._open_channels.add(message_id)
+
+    def _close_channels(self) -> None:
+        """Close the reply channels opened since the last call.
+
+        Called when coordinate() finishes, so channels do not outlive the
+        coordination that opened them.
         """
-        return self._responses.get(message_id, [])
+        for message_id in self._open_channels:
+            self._bus.close_channel(message_id)
+        self._open_channels.clear()
+
+    async def _fan_out(
+        self,
+        agents: list[Agent],
+        call: Callable[[Agent], Awaitable[T]],
+        stop_when: Callable[[dict[str, T]], bool] | None = None,
+    ) -> FanOutResult[T]:
+        """Run call for every agent with bounded concurrency.
+
+        At most config.max_concurrency calls run at once, and each gets
+        config.agent_timeout_seconds. A timed-out agent is left out of the
+        results rather than failing the whole fan-out.
+
+        Args:
+            agents: Agents to call.
+            call: Coroutine function producing one agent's result.
+            stop_when: Optional predicate on the results so far; once it
+                returns True the remaining calls are cancelled.
+
+        Returns:
+            FanOutResult with results and timed-out/cancelled agent IDs.
+
+        Raises:
+            Exception: The first non-timeout error raised by a call. The
+                other calls are cancelled.
+        """
+        semaphore = asyncio.Semaphore(self._config.max_concurrency)
+        timeout = self._config.agent_timeout_seconds
+
+        async def run(agent: Agent) -> T:
+            async with semaphore:
+                return await asyncio.wait_for(call(agent), timeout=timeout)
+
+        tasks = {asyncio.create_task(run(agent)): agent.agent_id for agent in agents}
+        results: dict[str, T] = {}
+        timed_out: set[str] = set()
+        pending = set(tasks)
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                error: BaseException | None = None
+                for task in done:
+                    exc = task.exception()
+                    if isinstance(exc, TimeoutError):
+                        timed_out.add(tasks[task])
+                    elif exc is not None:
+                        error = error or exc
+                    else:
+                        results[tasks[task]] = task.result()
+                if error is not None:
+                    raise error
+                if pending and stop_when is not None and stop_when(results):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        cancelled = {tasks[task] for task in pending}
+        order = [agent.agent_id for agent in agents]
+        return FanOutResult(
+            results={aid: results[aid] for aid in order if aid in results},
+            timed_out=[aid for aid in order if aid in timed_out],
+            cancelled=[aid for aid in order if aid in cancelled],
+        )
 
     def _generate_message_id(self) -> str:
         """Generate a unique message ID.
@@ -172,16 +302,35 @@ class BaseCoordinator(CoordinatorPort):
             content=task_content,
         )
 
-    def _add_response(self, message_id: str, response: AgentMessage) -> None:
-        """Add a response to the response collection.
+    async def _add_response(self, message_id: str, response: AgentMessage) -> None:
+        """Publish an agent's response to a message.
 
         Args:
             message_id: ID of the original message.
             response: The response message.
         """
-        if message_id not in self._responses:
-            self._responses[message_id] = []
-        self._responses[message_id].append(response)
+        if response.correlation_id != message_id:
+            response = replace(response, correlation_id=message_id)
+        self._open_channel(message_id)
+        await self._bus.publish(response)
+
+    async def _on_agent_message(
+        self,
+        message: AgentMessage,  # noqa: ARG002
+    ) -> AgentMessage | None:
+        """Handle a message delivered to an in-process agent's inbox.
+
+        Agents in this process are driven by the coordinator itself, which
+        publishes their responses with _add_response(), so delivered
+        messages only need to be consumed.
+
+        Args:
+            message: The delivered message.
+
+        Returns:
+            An optional reply to publish.
+        """
+        return None
 
     def _mark_task_completed(self, agent_id: str) -> None:
         """Mark a task as completed for an agent.
@@ -196,6 +345,6 @@ class BaseCoordinator(CoordinatorPort):
         """Get the total number of messages sent.
 
         Returns:
-            Count of messages in the queue.
+            Count of messages sent with send_message().
         """
-        return len(self._message_queue)
+        return self._messages_sent
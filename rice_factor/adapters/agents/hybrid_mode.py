@@ -27,6 +27,7 @@ from rice_factor.domain.models.messages import (
 from rice_factor.domain.ports.coordinator import CoordinationContext  # noqa: TC001
 
 if TYPE_CHECKING:
+    from rice_factor.adapters.agents.message_bus import MessageBus
     from rice_factor.config.run_mode_config import RunModeConfig
 
 
@@ -47,7 +48,7 @@ class HybridCoordinator(BaseCoordinator):
     In hybrid mode:
     - Different phases use different run modes
     - Mode is selected based on task type or explicit phase
-    - All modes share the same agent pool
+    - All modes share the same agent pool and message bus
     - Seamless switching between coordination strategies
 
     Common phase mappings:
@@ -59,13 +60,14 @@ class HybridCoordinator(BaseCoordinator):
     - Deployment: Solo (simple, low overhead)
     """
 
-    def __init__(self, config: RunModeConfig) -> None:
+    def __init__(self, config: RunModeConfig, bus: MessageBus | None = None) -> None:
         """Initialize the hybrid coordinator.
 
         Args:
             config: The run mode configuration.
+            bus: Message bus shared with the phase coordinators.
         """
-        super().__init__(config)
+        super().__init__(config, bus)
         self._phase_coordinators: dict[RunMode, BaseCoordinator] = {}
         self._current_phase: str | None = None
         self._phase_results: list[dict[str, Any]] = []
@@ -116,16 +118,16 @@ class HybridCoordinator(BaseCoordinator):
             New coordinator instance.
         """
         if mode == RunMode.SOLO:
-            return SoloCoordinator(self._config)
+            return SoloCoordinator(self._config, self._bus)
         elif mode == RunMode.ORCHESTRATOR:
-            return OrchestratorCoordinator(self._config)
+            return OrchestratorCoordinator(self._config, self._bus)
         elif mode == RunMode.VOTING:
-            return VotingCoordinator(self._config)
+            return VotingCoordinator(self._config, self._bus)
         elif mode == RunMode.ROLE_LOCKED:
-            return RoleLockedCoordinator(self._config)
+            return RoleLockedCoordinator(self._config, self._bus)
         else:
             # Default to solo
-            return SoloCoordinator(self._config)
+            return SoloCoordinator(self._config, self._bus)
 
     async def coordinate(
         self,
@@ -199,6 +201,8 @@ class HybridCoordinator(BaseCoordinator):
                 errors=(str(e),),
                 duration_ms=duration_ms,
             )
+        finally:
+            self._close_channels()
 
     async def coordinate_multi_phase(
         self,
@@ -0,0 +1,686 @@
+"""Asyncio message bus for agent coordinators.
+
+Every agent gets a bounded inbox queue. Publishing to a full inbox waits
+for space (backpressure) and fails with InboxFullError if none frees up in
+time. Replies are routed by correlation ID: once a channel is opened for a
+message ID, any message whose correlation_id matches is delivered to that
+channel instead of an inbox, where it can be streamed or collected.
+
+Delivery goes through a pluggable MessageTransport. InProcessTransport (the
+default) delivers directly; SocketTransport forwards messages for remote
+agents over Unix domain sockets so agents can run as separate processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from rice_factor.adapters.metrics.prometheus_adapter import (
+    MetricDefinition,
+    MetricType,
+)
+from rice_factor.domain.models.messages import (
+    AgentMessage,
+    MessagePriority,
+    MessageType,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+    from pathlib import Path
+
+    from rice_factor.adapters.metrics.prometheus_adapter import MetricsRegistry
+
+    MessageHandler = Callable[[AgentMessage], Awaitable[AgentMessage | None]]
+
+DEFAULT_INBOX_SIZE = 100
+DEFAULT_PUT_TIMEOUT_SECONDS = 30.0
+
+MESSAGE_BUS_METRICS = [
+    MetricDefinition(
+        name="rice_factor_agent_messages_total",
+        help_text="Agent messages handled by the message bus",
+        metric_type=MetricType.COUNTER,
+        labels=["event"],
+    ),
+    MetricDefinition(
+        name="rice_factor_agent_inbox_depth",
+        help_text="Messages waiting in an agent inbox",
+        metric_type=MetricType.GAUGE,
+        labels=["agent"],
+    ),
+    MetricDefinition(
+        name="rice_factor_agent_message_rate",
+        help_text="Messages published per second since the bus started",
+        metric_type=MetricType.GAUGE,
+    ),
+]
+
+
+class MessageBusError(Exception):
+    """Raised when a message cannot be routed."""
+
+
+class InboxFullError(MessageBusError):
+    """Raised when an agent inbox stays full for longer than the timeout."""
+
+    def __init__(self, agent_id: str, timeout: float) -> None:
+        """Initialize the error.
+
+        Args:
+            agent_id: Agent whose inbox was full.
+            timeout: Seconds waited for space.
+        """
+        self.agent_id = agent_id
+        self.timeout = timeout
+        super().__init__(f"Inbox of agent '{agent_id}' full for {timeout}s")
+
+
+def encode_message(message: AgentMessage) -> bytes:
+    """Encode a message as one line of JSON.
+
+    Args:
+        message: The message to encode.
+
+    Returns:
+        UTF-8 JSON terminated by a newline.
+    """
+    data = {
+        "message_id": message.message_id,
+        "message_type": message.message_type.value,
+        "sender_id": message.sender_id,
+        "recipient_id": message.recipient_id,
+        "content": message.content,
+        "priority": message.priority.value,
+        "timestamp": message.timestamp.isoformat(),
+        "correlation_id": message.correlation_id,
+        "metadata": message.metadata,
+    }
+    return json.dumps(data, default=str).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> AgentMessage:
+    """Decode a message encoded by encode_message.
+
+    Args:
+        line: One line of JSON.
+
+    Returns:
+        The decoded AgentMessage.
+
+    Raises:
+        MessageBusError: If the line is not a valid message.
+    """
+    try:
+        data = json.loads(line)
+        return AgentMessage(
+            message_id=data["message_id"],
+            message_type=MessageType(data["message_type"]),
+            sender_id=data["sender_id"],
+            recipient_id=data.get("recipient_id"),
+            content=data.get("content", {}),
+            priority=MessagePriority(data.get("priority", "normal")),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            correlation_id=data.get("correlation_id"),
+            metadata=data.get("metadata", {}),
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        raise MessageBusError(f"Invalid message on the wire: {e}") from e
+
+
+class MessageTransport(ABC):
+    """Moves published messages to wherever their recipients live.
+
+    A transport is attached to one bus. Messages for agents in this
+    process are handed back to the bus with deliver_locally().
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unattached transport."""
+        self._deliver: Callable[[AgentMessage], Awaitable[None]] | None = None
+
+    def attach(self, deliver: Callable[[AgentMessage], Awaitable[None]]) -> None:
+        """Attach the transport to a bus.
+
+        Args:
+            deliver: Bus callback that routes a message to local inboxes.
+        """
+        self._deliver = deliver
+
+    def remote_agents(self) -> set[str]:
+        """Return IDs of agents reached through this transport."""
+        return set()
+
+    async def start(self) -> None:  # noqa: B027
+        """Start accepting messages (no-op by default)."""
+
+    @abstractmethod
+    async def send(self, message: AgentMessage) -> None:
+        """Send a message towards its recipient(s).
+
+        Args:
+            message: The message to send.
+        """
+        ...
+
+    async def close(self) -> None:  # noqa: B027
+        """Release transport resources (no-op by default)."""
+
+    async def deliver_locally(self, message: AgentMessage) -> None:
+        """Hand a message to the attached bus.
+
+        Raises:
+            MessageBusError: If the transport is not attached.
+        """
+        if self._deliver is None:
+            raise MessageBusError("Transport is not attached to a message bus")
+        await self._deliver(message)
+
+
+class InProcessTransport(MessageTransport):
+    """Transport for agents that all live in the current process."""
+
+    async def send(self, message: AgentMessage) -> None:
+        """Deliver the message to the local bus."""
+        await self.deliver_locally(message)
+
+
+class SocketTransport(MessageTransport):
+    """Transport that reaches agents in other processes over Unix sockets.
+
+    Each process listens on its own socket. Messages for agents listed in
+    peers are written to that agent's socket as JSON lines; broadcasts go
+    to every peer as well as to local agents. Everything else is
+    delivered locally.
+
+    Example:
+        >>> transport = SocketTransport(
+        ...     listen_path=Path("/tmp/coordinator.sock"),
+        ...     peers={"reviewer": Path("/tmp/reviewer.sock")},
+        ... )
+        >>> bus = MessageBus(transport=transport)
+        >>> await bus.start()
+    """
+
+    def __init__(
+        self,
+        listen_path: Path | None = None,
+        peers: dict[str, Path] | None = None,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            listen_path: Socket path to accept messages on (None to only send).
+            peers: Socket path of the process hosting each remote agent.
+        """
+        super().__init__()
+        self._listen_path = listen_path
+        self._peers = dict(peers or {})
+        self._server: asyncio.AbstractServer | None = None
+        self._writers: dict[Path, asyncio.StreamWriter] = {}
+        self._connect_lock = asyncio.Lock()
+
+    def remote_agents(self) -> set[str]:
+        """Return IDs of agents hosted by peer processes."""
+        return set(self._peers)
+
+    async def start(self) -> None:
+        """Start listening on listen_path, if set."""
+        if self._listen_path is None or self._server is not None:
+            return
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(self._listen_path)
+        )
+
+    async def send(self, message: AgentMessage) -> None:
+        """Route the message to a peer socket or the local bus."""
+        if message.is_broadcast():
+            await self.deliver_locally(message)
+            for path in sorted(set(self._peers.values())):
+                await self._write(path, message)
+        elif message.recipient_id in self._peers:
+            await self._write(self._peers[message.recipient_id], message)
+        else:
+            await self.deliver_locally(message)
+
+    async def close(self) -> None:
+        """Close peer connections and stop listening."""
+        for writer in self._writers.values():
+            writer.close()
+            with contextlib.suppress(OSError, ConnectionError):
+                await writer.wait_closed()
+        self._writers.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if self._listen_path is not None:
+                with contextlib.suppress(OSError):
+                    self._listen_path.unlink()
+
+    async def _write(self, path: Path, message: AgentMessage) -> None:
+        """Write a message to a peer, connecting on first use.
+
+        Raises:
+            MessageBusError: If the peer cannot be reached.
+        """
+        try:
+            async with self._connect_lock:
+                writer = self._writers.get(path)
+                if writer is None or writer.is_closing():
+                    _, writer = await asyncio.open_unix_connection(str(path))
+                    self._writers[path] = writer
+            writer.write(encode_message(message))
+            await writer.drain()
+        except (OSError, ConnectionError) as e:
+            self._writers.pop(path, None)
+            raise MessageBusError(f"Could not reach peer at {path}: {e}") from e
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Deliver every message received on a peer connection."""
+        try:
+            while line := await reader.readline():
+                await self.deliver_locally(decode_message(line))
+        finally:
+            writer.close()
+
+
+@dataclass
+class MessageBusMetrics:
+    """Counters describing message bus traffic.
+
+    Attributes:
+        published: Messages published.
+        delivered: Messages placed in an agent inbox.
+        replies: Messages routed to a correlation channel.
+        undeliverable: Messages with no matching inbox or channel.
+        handler_errors: Messages whose handler raised.
+        max_queue_depth: Deepest any inbox has been.
+        started_at: Monotonic time the bus was created.
+    """
+
+    published: int = 0
+    delivered: int = 0
+    replies: int = 0
+    undeliverable: int = 0
+    handler_errors: int = 0
+    max_queue_depth: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def throughput(self, now: float | None = None) -> float:
+        """Return messages published per second since the bus started."""
+        elapsed = (now if now is not None else time.monotonic()) - self.started_at
+        return self.published / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "published": self.published,
+            "delivered": self.delivered,
+            "replies": self.replies,
+            "undeliverable": self.undeliverable,
+            "handler_errors": self.handler_errors,
+            "max_queue_depth": self.max_queue_depth,
+            "throughput_per_second": round(self.throughput(), 3),
+        }
+
+
+class MessageBus:
+    """Routes agent messages through bounded per-agent inboxes.
+
+    Agents registered with a handler are served by a worker task that
+    drains their inbox and publishes whatever reply the handler returns.
+    Agents registered without one read their inbox with receive().
+
+    Example:
+        >>> bus = MessageBus(max_queue_size=10)
+        >>> bus.register("reviewer", handler=review)
+        >>> reply = await bus.request(message, timeout=5.0)
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_INBOX_SIZE,
+        transport: MessageTransport | None = None,
+        put_timeout: float | None = DEFAULT_PUT_TIMEOUT_SECONDS,
+        registry: MetricsRegistry | None = None,
+    ) -> None:
+        """Initialize the bus.
+
+        Args:
+            max_queue_size: Capacity of each agent inbox.
+            transport: Transport to publish through (in-process by default).
+            put_timeout: Seconds to wait for space in a full inbox
+                (None to wait indefinitely).
+            registry: Optional metrics registry to export traffic metrics to.
+
+        Raises:
+            ValueError: If max_queue_size is less than 1.
+        """
+        if max_queue_size < 1:
+            raise ValueError(f"max_queue_size must be at least 1, got {max_queue_size}")
+        self._max_queue_size = max_queue_size
+        self._put_timeout = put_timeout
+        self._transport = transport or InProcessTransport()
+        self._transport.attach(self._deliver)
+        self._inboxes: dict[str, asyncio.Queue[AgentMessage]] = {}
+        self._handlers: dict[str, MessageHandler] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+        self._channels: dict[str, list[AgentMessage]] = {}
+        self._channel_events: dict[str, asyncio.Event] = {}
+        self._expected: dict[str, int] = {}
+        self._metrics = MessageBusMetrics()
+        self._registry = registry
+        if registry is not None:
+            for definition in MESSAGE_BUS_METRICS:
+                if registry.get_definition(definition.name) is None:
+                    registry.register(definition)
+
+    @property
+    def metrics(self) -> MessageBusMetrics:
+        """Get the traffic counters."""
+        return self._metrics
+
+    @property
+    def transport(self) -> MessageTransport:
+        """Get the transport messages are published through."""
+        return self._transport
+
+    def register(self, agent_id: str, handler: MessageHandler | None = None) -> None:
+        """Create an inbox for an agent.
+
+        Registering an agent again keeps its inbox and replaces the handler
+        if one is given.
+
+        Args:
+            agent_id: The agent's ID.
+            handler: Optional coroutine function that processes each inbox
+                message and returns an optional reply.
+        """
+        if agent_id not in self._inboxes:
+            self._inboxes[agent_id] = asyncio.Queue(maxsize=self._max_queue_size)
+        if handler is not None:
+            self._handlers[agent_id] = handler
+
+    def queue_depths(self) -> dict[str, int]:
+        """Return the number of messages waiting in each inbox."""
+        return {agent_id: q.qsize() for agent_id, q in self._inboxes.items()}
+
+    async def start(self) -> None:
+        """Start the transport (needed for SocketTransport listeners)."""
+        await self._transport.start()
+
+    async def close(self) -> None:
+        """Stop inbox workers, close every channel and close the transport."""
+        for correlation_id in list(self._channels):
+            self.close_channel(correlation_id)
+        workers = [w for w in self._workers.values() if not w.done()]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        await self._transport.close()
+
+    def open_channel(self, correlation_id: str) -> None:
+        """Start routing messages with this correlation ID to a channel.
+
+        Args:
+            correlation_id: Usually the message ID of a request.
+        """
+        if correlation_id not in self._channels:
+            self._channels[correlation_id] = []
+            self._channel_events[correlation_id] = asyncio.Event()
+            self._expected[correlation_id] = 0
+
+    def close_channel(self, correlation_id: str) -> None:
+        """Stop routing messages with this correlation ID to a channel.
+
+        Replies received so far are discarded, and streams reading the
+        channel stop. Later replies are routed like any other message.
+
+        Args:
+            correlation_id: The channel to close.
+        """
+        self._channels.pop(correlation_id, None)
+        self._expected.pop(correlation_id, None)
+        event = self._channel_events.pop(correlation_id, None)
+        if event is not None:
+            event.set()
+
+    def replies(self, correlation_id: str) -> list[AgentMessage]:
+        """Return the replies received so far on a channel."""
+        return list(self._channels.get(correlation_id, []))
+
+    async def publish(self, message: AgentMessage) -> None:
+        """Publish a message.
+
+        If a channel is open for the message's own ID, the number of
+        recipients is recorded as the number of replies to expect.
+
+        Args:
+            message: The message to publish.
+
+        Raises:
+            InboxFullError: If a recipient inbox stays full.
+            MessageBusError: If the transport cannot deliver the message.
+        """
+        self._metrics.published += 1
+        self._record("published")
+        if self._registry is not None:
+            self._registry.set_gauge(
+                "rice_factor_agent_message_rate", self._metrics.throughput()
+            )
+
+        if message.message_id in self._channels:
+            self._expected[message.message_id] = len(self._recipients(message))
+        await self._transport.send(message)
+
+    async def receive(
+        self,
+        agent_id: str,
+        timeout: float | None = None,
+    ) -> AgentMessage:
+        """Take the next message from an agent's inbox.
+
+        Args:
+            agent_id: The agent's ID.
+            timeout: Seconds to wait for a message (None to wait forever).
+
+        Returns:
+            The next message.
+
+        Raises:
+            MessageBusError: If the agent is not registered.
+            TimeoutError: If no message arrives in time.
+        """
+        queue = self._inboxes.get(agent_id)
+        if queue is None:
+            raise MessageBusError(f"Agent '{agent_id}' is not registered")
+        message = await asyncio.wait_for(queue.get(), timeout=timeout)
+        queue.task_done()
+        self._record_depth(agent_id)
+        return message
+
+    async def request(
+        self,
+        message: AgentMessage,
+        timeout: float | None = None,
+    ) -> AgentMessage:
+        """Publish a message and wait for the first reply.
+
+        The reply channel is closed once the call returns.
+
+        Args:
+            message: The request to publish.
+            timeout: Seconds to wait for the reply.
+
+        Returns:
+            The first reply correlated with the request.
+
+        Raises:
+            TimeoutError: If no reply arrives in time.
+        """
+        self.open_channel(message.message_id)
+        try:
+            await self.publish(message)
+            async with asyncio.timeout(timeout):
+                async for reply in self.stream(message.message_id, count=1):
+                    return reply
+            raise TimeoutError(f"No reply to message {message.message_id}")
+        finally:
+            self.close_channel(message.message_id)
+
+    async def stream(
+        self,
+        correlation_id: str,
+        count: int | None = None,
+    ) -> AsyncIterator[AgentMessage]:
+        """Yield replies on a channel as they arrive.
+
+        Args:
+            correlation_id: The channel to read.
+            count: Number of replies to wait for (defaults to the number
+                of recipients of the correlated message).
+
+        Yields:
+            Replies in arrival order, including ones already received,
+            until the count is reached or the channel is closed.
+        """
+        self.open_channel(correlation_id)
+        replies = self._channels[correlation_id]
+        event = self._channel_events[correlation_id]
+        index = 0
+        while True:
+            while index < len(replies):
+                yield replies[index]
+                index += 1
+            if correlation_id not in self._channels:
+                return
+            target = self._expected[correlation_id] if count is None else count
+            if index >= target:
+                return
+            event.clear()
+            await event.wait()
+
+    async def collect(
+        self,
+        correlation_id: str,
+        count: int | None = None,
+        timeout: float | None = None,
+    ) -> list[AgentMessage]:
+        """Wait for replies on a channel, close it and return the replies.
+
+        Args:
+            correlation_id: The channel to read.
+            count: Number of replies to wait for (see stream()).
+            timeout: Seconds to wait; whatever arrived by then is returned.
+
+        Returns:
+            Replies received, in arrival order.
+        """
+        with contextlib.suppress(TimeoutError):
+            async with asyncio.timeout(timeout):
+                async for _ in self.stream(correlation_id, count=count):
+                    pass
+        replies = self.replies(correlation_id)
+        self.close_channel(correlation_id)
+        return replies
+
+    def _recipients(self, message: AgentMessage) -> list[str]:
+        """Return the agents a message is addressed to."""
+        if message.is_broadcast():
+            agents = set(self._inboxes) | self._transport.remote_agents()
+            return sorted(a for a in agents if a != message.sender_id)
+        if message.recipient_id in self._inboxes or (
+            message.recipient_id in self._transport.remote_agents()
+        ):
+            return [message.recipient_id]
+        return []
+
+    async def _deliver(self, message: AgentMessage) -> None:
+        """Route a message to its correlation channel or local inboxes."""
+        correlation_id = message.correlation_id
+        if correlation_id is not None and correlation_id in self._channels:
+            self._channels[correlation_id].append(message)
+            self._channel_events[correlation_id].set()
+            self._metrics.replies += 1
+            self._record("reply")
+            return
+
+        if message.is_broadcast():
+            recipients = [a for a in self._inboxes if a != message.sender_id]
+        elif message.recipient_id in self._inboxes:
+            recipients = [message.recipient_id]
+        else:
+            self._metrics.undeliverable += 1
+            self._record("undeliverable")
+            return
+
+        for agent_id in recipients:
+            await self._put(agent_id, message)
+
+    async def _put(self, agent_id: str, message: AgentMessage) -> None:
+        """Put a message in an inbox, waiting for space if it is full.
+
+        Raises:
+            InboxFullError: If no space frees up within put_timeout.
+        """
+        queue = self._inboxes[agent_id]
+        try:
+            await asyncio.wait_for(queue.put(message), timeout=self._put_timeout)
+        except TimeoutError:
+            raise InboxFullError(agent_id, self._put_timeout or 0.0) from None
+
+        self._metrics.delivered += 1
+        self._record("delivered")
+        self._record_depth(agent_id)
+
+        if agent_id in self._handlers:
+            worker = self._workers.get(agent_id)
+            if worker is None or worker.done():
+                self._workers[agent_id] = asyncio.create_task(self._drain(agent_id))
+
+    async def _drain(self, agent_id: str) -> None:
+        """Hand inbox messages to the agent's handler until it is empty."""
+        queue = self._inboxes[agent_id]
+        handler = self._handlers[agent_id]
+        while not queue.empty():
+            message = queue.get_nowait()
+            self._record_depth(agent_id)
+            try:
+                reply = await handler(message)
+            except Exception:
+                self._metrics.handler_errors += 1
+                self._record("handler_error")
+                continue
+            finally:
+                queue.task_done()
+            if reply is not None:
+                await self.publish(reply)
+
+    def _record(self, event: str) -> None:
+        """Count a bus event in the metrics registry."""
+        if self._registry is not None:
+            self._registry.increment(
+                "rice_factor_agent_messages_total", {"event": event}
+            )
+
+    def _record_depth(self, agent_id: str) -> None:
+        """Track the depth of an inbox after it changed."""
+        depth = self._inboxes[agent_id].qsize()
+        self._metrics.max_queue_depth = max(self._metrics.max_queue_depth, depth)
+        if self._registry is not None:
+            self._registry.set_gauge(
+                "rice_factor_agent_inbox_depth", float(depth), {"agent": agent_id}
+            )
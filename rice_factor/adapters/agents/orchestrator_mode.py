@@ -27,6 +27,7 @@ from rice_factor.domain.models.messages import (
 from rice_factor.domain.ports.coordinator import CoordinationContext  # noqa: TC001
 
 if TYPE_CHECKING:
+    from rice_factor.adapters.agents.message_bus import MessageBus
     from rice_factor.config.run_mode_config import RunModeConfig
 
 
@@ -46,16 +47,22 @@ class OrchestratorCoordinator(BaseCoordinator):
     4. Critic reviews (if mandatory)
     5. Orchestrator synthesizes final result
     6. Orchestrator emits artifact
+
+    Helpers work on their subtasks concurrently, bounded by
+    config.max_concurrency. A helper exceeding config.agent_timeout_seconds
+    is skipped and the orchestrator synthesizes from the other responses.
     """
 
-    def __init__(self, config: RunModeConfig) -> None:
+    def __init__(self, config: RunModeConfig, bus: MessageBus | None = None) -> None:
         """Initialize the orchestrator coordinator.
 
         Args:
             config: The run mode configuration.
+            bus: Message bus to communicate over.
         """
-        super().__init__(config)
+        super().__init__(config, bus)
         self._round_count = 0
+        self._timed_out: list[str] = []
 
     @property
     def mode_name(self) -> str:
@@ -84,6 +91,7 @@ class OrchestratorCoordinator(BaseCoordinator):
         start_time = time.time()
         session_id = self._generate_session_id()
         self._round_count = 0
+        self._timed_out = []
 
         try:
             # Get orchestrator (authority agent)
@@ -140,6 +148,7 @@ class OrchestratorCoordinator(BaseCoordinator):
                 artifact_id=final_result.get("artifact_id"),
                 final_decision=final_result.get("decision"),
                 reasoning=final_result.get("reasoning"),
+                errors=tuple(self._timed_out),
                 duration_ms=duration_ms,
             )
 
@@ -153,6 +162,8 @@ class OrchestratorCoordinator(BaseCoordinator):
                 errors=(str(e),),
                 duration_ms=duration_ms,
             )
+        finally:
+            self._close_channels()
 
     async def _plan_delegation(
         self,
@@ -204,13 +215,14 @@ class OrchestratorCoordinator(BaseCoordinator):
             context: The coordination context.
 
         Returns:
-            List of response messages from helpers.
+            Response messages from helpers that finished in time, in
+            assignment order.
         """
-        responses: list[AgentMessage] = []
-
         assignments = delegation_plan.get("assignments", {})
         if not isinstance(assignments, dict):
             assignments = {}
+
+        delegations: dict[str, AgentMessage] = {}
         for agent_id, subtask in assignments.items():
             # Create delegation message
             delegation_msg = AgentMessage(
@@ -230,13 +242,24 @@ class OrchestratorCoordinator(BaseCoordinator):
 
             await self.send_message(delegation_msg)
             self._round_count += 1
+            delegations[agent_id] = delegation_msg
+
+        # Helpers work on their subtasks concurrently
+        helpers = [self._agents[agent_id] for agent_id in delegations]
+        outcome = await self._fan_out(
+            helpers,
+            lambda agent: self._process_helper_task(
+                agent.agent_id, delegations[agent.agent_id]
+            ),
+        )
+        self._timed_out.extend(
+            f"Helper '{agent_id}' timed out" for agent_id in outcome.timed_out
+        )
 
-            # Simulate helper processing
-            response = await self._process_helper_task(agent_id, delegation_msg)
-            responses.append(response)
+        for agent_id in outcome.results:
             self._mark_task_completed(agent_id)
 
-        return responses
+        return list(outcome.results.values())
 
     async def _get_critic_review(
         self,
@@ -450,7 +473,7 @@ class OrchestratorCoordinator(BaseCoordinator):
             correlation_id=task_message.message_id,
         )
 
-        self._add_response(task_message.message_id, response)
+        await self._add_response(task_message.message_id, response)
         return response
 
     async def _process_critic_review(
@@ -481,5 +504,5 @@ class OrchestratorCoordinator(BaseCoordinator):
             correlation_id=review_request.message_id,
         )
 
-        self._add_response(review_request.message_id, response)
+        await self._add_response(review_request.message_id, response)
         return response
@@ -26,6 +26,7 @@ from rice_factor.domain.models.messages import (
 from rice_factor.domain.ports.coordinator import CoordinationContext  # noqa: TC001
 
 if TYPE_CHECKING:
+    from rice_factor.adapters.agents.message_bus import MessageBus
     from rice_factor.config.run_mode_config import RunModeConfig
 
 
@@ -60,13 +61,14 @@ class RoleLockedCoordinator(BaseCoordinator):
     7. Primary finalizes if critic approves
     """
 
-    def __init__(self, config: RunModeConfig) -> None:
+    def __init__(self, config: RunModeConfig, bus: MessageBus | None = None) -> None:
         """Initialize the role-locked coordinator.
 
         Args:
             config: The run mode configuration.
+            bus: Message bus to communicate over.
         """
-        super().__init__(config)
+        super().__init__(config, bus)
         self._workflow_state: dict[str, Any] = {}
         self._handoff_log: list[dict[str, str]] = []
 
@@ -155,6 +157,8 @@ class RoleLockedCoordinator(BaseCoordinator):
                 errors=(str(e),),
                 duration_ms=duration_ms,
             )
+        finally:
+            self._close_channels()
 
     async def _execute_workflow(
         self,
@@ -347,7 +351,7 @@ class RoleLockedCoordinator(BaseCoordinator):
             content=output,
             correlation_id=task_msg.message_id,
         )
-        self._add_response(task_msg.message_id, response)
+        await self._add_response(task_msg.message_id, response)
 
         return output
 
@@ -446,7 +450,7 @@ class RoleLockedCoordinator(BaseCoordinator):
             content=result,
             correlation_id=review_msg.message_id,
         )
-        self._add_response(review_msg.message_id, response)
+        await self._add_response(review_msg.message_id, response)
 
         return result
 
@@ -24,6 +24,7 @@ from rice_factor.domain.models.messages import (
 from rice_factor.domain.ports.coordinator import CoordinationContext  # noqa: TC001
 
 if TYPE_CHECKING:
+    from rice_factor.adapters.agents.message_bus import MessageBus
     from rice_factor.config.run_mode_config import RunModeConfig
 
 
@@ -39,13 +40,14 @@ class SoloCoordinator(BaseCoordinator):
     This is the lowest overhead mode with the lowest safety margin.
     """
 
-    def __init__(self, config: RunModeConfig) -> None:
+    def __init__(self, config: RunModeConfig, bus: MessageBus | None = None) -> None:
         """Initialize the solo coordinator.
 
         Args:
             config: The run mode configuration.
+            bus: Message bus to communicate over.
         """
-        super().__init__(config)
+        super().__init__(config, bus)
 
     @property
     def mode_name(self) -> str:
@@ -120,6 +122,8 @@ class SoloCoordinator(BaseCoordinator):
                 errors=(str(e),),
                 duration_ms=duration_ms,
             )
+        finally:
+            self._close_channels()
 
     async def _process_task(
         self,
@@ -154,7 +158,7 @@ class SoloCoordinator(BaseCoordinator):
             correlation_id=task_message.message_id,
         )
 
-        self._add_response(task_message.message_id, response)
+        await self._add_response(task_message.message_id, response)
 
         # Return simulated result
         return {
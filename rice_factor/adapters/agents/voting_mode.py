@@ -26,9 +26,44 @@ from rice_factor.domain.models.messages import (
 from rice_factor.domain.ports.coordinator import CoordinationContext  # noqa: TC001
 
 if TYPE_CHECKING:
+    from rice_factor.adapters.agents.message_bus import MessageBus
     from rice_factor.config.run_mode_config import RunModeConfig
 
 
+def is_vote_decided(votes: list[Vote], electorate: int, threshold: float) -> bool:
+    """Check whether outstanding votes can no longer change the outcome.
+
+    The outcome is decided either when one choice has at least threshold
+    of the full electorate and no other choice can catch up, or when no
+    choice can reach the threshold any more.
+
+    Args:
+        votes: Votes cast so far.
+        electorate: Total number of agents entitled to vote.
+        threshold: Minimum vote ratio for consensus.
+
+    Returns:
+        True if waiting for the remaining votes is unnecessary.
+    """
+    remaining = electorate - len(votes)
+    if remaining <= 0:
+        return True
+
+    counts: dict[str, int] = {}
+    for vote in votes:
+        counts[vote.choice] = counts.get(vote.choice, 0) + 1
+    ranked = sorted(counts.values(), reverse=True)
+    leader = ranked[0] if ranked else 0
+    runner_up = ranked[1] if len(ranked) > 1 else 0
+
+    # Leader has the threshold locked in and cannot be tied or overtaken
+    if leader >= threshold * electorate and runner_up + remaining < leader:
+        return True
+
+    # Nobody, including a choice with no votes yet, can reach the threshold
+    return leader + remaining < threshold * electorate
+
+
 class VotingCoordinator(BaseCoordinator):
     """Coordinator for voting mode (consensus through voting).
 
@@ -42,17 +77,25 @@ class VotingCoordinator(BaseCoordinator):
     - Majority vote
     - Weighted by confidence
     - Threshold-based consensus
+
+    Proposals and votes are requested from all agents concurrently (up to
+    config.max_concurrency at a time). Voting closes as soon as the outcome
+    can no longer change. An agent that exceeds config.agent_timeout_seconds
+    is left out: its proposal is not considered and its vote counts as an
+    abstention.
     """
 
-    def __init__(self, config: RunModeConfig) -> None:
+    def __init__(self, config: RunModeConfig, bus: MessageBus | None = None) -> None:
         """Initialize the voting coordinator.
 
         Args:
             config: The run mode configuration.
+            bus: Message bus to communicate over.
         """
-        super().__init__(config)
+        super().__init__(config, bus)
         self._proposals: dict[str, dict[str, Any]] = {}
         self._votes: list[Vote] = []
+        self._timed_out: list[str] = []
 
     @property
     def mode_name(self) -> str:
@@ -82,6 +125,7 @@ class VotingCoordinator(BaseCoordinator):
         session_id = self._generate_session_id()
         self._proposals = {}
         self._votes = []
+        self._timed_out = []
 
         try:
             # Get voting agents
@@ -116,6 +160,7 @@ class VotingCoordinator(BaseCoordinator):
                 votes=vote_result,
                 final_decision=final_decision,
                 reasoning=reasoning,
+                errors=tuple(self._timed_out),
                 duration_ms=duration_ms,
             )
 
@@ -129,6 +174,8 @@ class VotingCoordinator(BaseCoordinator):
                 errors=(str(e),),
                 duration_ms=duration_ms,
             )
+        finally:
+            self._close_channels()
 
     async def _collect_proposals(
         self,
@@ -144,8 +191,6 @@ class VotingCoordinator(BaseCoordinator):
         Returns:
             Dict mapping proposal IDs to proposal content.
         """
-        proposals: dict[str, dict[str, Any]] = {}
-
         for agent in voting_agents:
             # Create proposal request
             request_msg = AgentMessage(
@@ -165,12 +210,24 @@ class VotingCoordinator(BaseCoordinator):
 
             await self.send_message(request_msg)
 
-            # Simulate agent processing
-            proposal = await self._generate_proposal(agent, context)
-            proposal_id = f"proposal-{agent.agent_id}"
+        outcome = await self._fan_out(
+            voting_agents,
+            lambda agent: self._generate_proposal(agent, context),
+        )
+        self._timed_out.extend(
+            f"Agent '{agent_id}' timed out generating a proposal"
+            for agent_id in outcome.timed_out
+        )
+
+        proposals: dict[str, dict[str, Any]] = {}
+        for agent_id, proposal in outcome.results.items():
+            proposal_id = f"proposal-{agent_id}"
             proposals[proposal_id] = proposal
             self._proposals[proposal_id] = proposal
-            self._mark_task_completed(agent.agent_id)
+            self._mark_task_completed(agent_id)
+
+        if not proposals:
+            raise ValueError("No proposals received before the agent timeout")
 
         return proposals
 
@@ -190,8 +247,8 @@ class VotingCoordinator(BaseCoordinator):
         Returns:
             VoteResult with tallied votes.
         """
-        votes: list[Vote] = []
         proposal_ids = list(proposals.keys())
+        threshold = self._config.voting_threshold
 
         for agent in voting_agents:
             # Create vote request
@@ -212,12 +269,21 @@ class VotingCoordinator(BaseCoordinator):
 
             await self.send_message(vote_request)
 
-            # Simulate agent voting
-            vote = await self._cast_vote(agent, proposal_ids, context)
-            votes.append(vote)
-            self._votes.append(vote)
+        outcome = await self._fan_out(
+            voting_agents,
+            lambda agent: self._cast_vote(agent, proposal_ids, context),
+            stop_when=lambda cast: is_vote_decided(
+                list(cast.values()), len(voting_agents), threshold
+            ),
+        )
+        self._timed_out.extend(
+            f"Agent '{agent_id}' timed out voting" for agent_id in outcome.timed_out
+        )
+
+        votes = list(outcome.results.values())
+        self._votes.extend(votes)
 
-        return VoteResult.from_votes(votes, threshold=self._config.voting_threshold)
+        return VoteResult.from_votes(votes, threshold=threshold)
 
     async def _generate_proposal(
         self,
@@ -1,5 +1,9 @@
 """LLM provider adapters (Claude, OpenAI, local models) and CLI agents."""
 
+from rice_factor.adapters.llm.batching import (
+    BatchGenerationResult,
+    BatchingAdapter,
+)
 from rice_factor.adapters.llm.claude import ClaudeAdapter, create_claude_adapter_from_config
 from rice_factor.adapters.llm.claude_client import ClaudeClient, ClaudeClientError
 from rice_factor.adapters.llm.cli import (
@@ -26,6 +30,10 @@ from rice_factor.adapters.llm.ollama_adapter import (
     OllamaClientError,
     create_ollama_adapter_from_config,
 )
+from rice_factor.adapters.llm.ollama_lifecycle import (
+    ModelLifecycleStats,
+    OllamaModelManager,
+)
 from rice_factor.adapters.llm.openai_adapter import (
     OpenAIAdapter,
     create_openai_adapter_from_config,
@@ -46,6 +54,7 @@ from rice_factor.adapters.llm.orchestrator import (
 )
 from rice_factor.adapters.llm.provider_selector import (
     AllProvidersFailedError,
+    ContextOverflowError,
     ProviderConfig,
     ProviderSelector,
     SelectionResult,
@@ -53,6 +62,11 @@ from rice_factor.adapters.llm.provider_selector import (
     create_provider_selector_from_config,
 )
 from rice_factor.adapters.llm.stub import StubLLMAdapter
+from rice_factor.adapters.llm.stub_server import (
+    StubLLMServer,
+    StubServerConfig,
+    StubServerStats,
+)
 from rice_factor.adapters.llm.usage_tracker import (
     ProviderStats,
     UsageRecord,
@@ -122,6 +136,8 @@ __all__ = [
     "AgentConfig",
     "AiderAdapter",
     "AllProvidersFailedError",
+    "BatchGenerationResult",
+    "BatchingAdapter",
     "CLIAgent",
     "CLIAgentDetector",
     "CLIAgentPort",
@@ -131,13 +147,16 @@ __all__ = [
     "ClaudeClientError",
     "ClaudeCodeAdapter",
     "CodexAdapter",
+    "ContextOverflowError",
     "DetectedAgent",
     "GeminiCLIAdapter",
     "LLMAdapter",
+    "ModelLifecycleStats",
     "NoAgentAvailableError",
     "OllamaAdapter",
     "OllamaClient",
     "OllamaClientError",
+    "OllamaModelManager",
     "OpenAIAdapter",
     "OpenAIClient",
     "OpenAIClientError",
@@ -153,6 +172,9 @@ __all__ = [
     "SelectionResult",
     "SelectionStrategy",
     "StubLLMAdapter",
+    "StubLLMServer",
+    "StubServerConfig",
+    "StubServerStats",
     "UnifiedOrchestrator",
     "UsageRecord",
     "UsageTracker",
@@ -0,0 +1,284 @@
+"""Batched generation for OpenAI-compatible servers.
+
+vLLM and most OpenAI-compatible servers batch concurrent requests on the
+GPU (continuous batching), so a batch job that sends its prompts one at a
+time leaves the server mostly idle. The helpers here submit many prompts
+at once, either as concurrent requests bounded by an in-flight limit or as
+one multi-prompt /completions request, and return per-prompt results in
+prompt order with per-item errors.
+
+BatchingAdapter lets code that calls LLMPort.generate() from many threads
+(such as BatchCompiler) benefit without changes: calls that arrive within
+a short window are coalesced into one generate_batch() call.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from rice_factor.domain.artifacts.compiler_types import (
+        CompilerContext,
+        CompilerPassType,
+        CompilerResult,
+    )
+
+# Concurrent requests per batch; servers queue anything beyond their own
+# batch size, so more mostly adds memory pressure on the client
+DEFAULT_MAX_IN_FLIGHT = 8
+
+GenerationRequest = tuple["CompilerPassType", "CompilerContext", dict[str, object]]
+
+
+@dataclass
+class BatchGenerationResult:
+    """Outcome of one prompt in a batch.
+
+    Attributes:
+        index: Position of the prompt in the batch.
+        response: Raw API response for this prompt, if it succeeded.
+        error: Exception raised for this prompt, if it failed.
+    """
+
+    index: int
+    response: dict[str, Any] | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the prompt produced a response."""
+        return self.error is None
+
+
+def run_in_flight(
+    calls: Sequence[Callable[[], dict[str, Any]]],
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> list[BatchGenerationResult]:
+    """Run request callables concurrently with a bounded in-flight count.
+
+    Args:
+        calls: One callable per prompt, each performing a single request.
+        max_in_flight: Maximum number of requests running at once.
+
+    Returns:
+        One result per call, in call order. Exceptions are captured per
+        call rather than raised.
+
+    Raises:
+        ValueError: If max_in_flight is less than 1.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    def run(index: int) -> BatchGenerationResult:
+        try:
+            return BatchGenerationResult(index=index, response=calls[index]())
+        except Exception as e:
+            return BatchGenerationResult(index=index, error=e)
+
+    if not calls:
+        return []
+    workers = min(max_in_flight, len(calls))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-batch") as pool:
+        return list(pool.map(run, range(len(calls))))
+
+
+def split_choices(response: dict[str, Any], count: int) -> list[BatchGenerationResult]:
+    """Split a multi-prompt /completions response into per-prompt results.
+
+    With a list of prompts (and n=1) each choice's index is the index of
+    the prompt it answers. Token usage is reported for the whole request,
+    so it is dropped from the per-prompt responses.
+
+    Args:
+        response: Response to a /completions request with a prompt list.
+        count: Number of prompts sent.
+
+    Returns:
+        One result per prompt, in prompt order; prompts without a choice
+        get an error.
+    """
+    by_index: dict[int, dict[str, Any]] = {}
+    for position, choice in enumerate(response.get("choices", [])):
+        by_index[int(choice.get("index", position))] = choice
+
+    base = {k: v for k, v in response.items() if k not in ("choices", "usage")}
+    results: list[BatchGenerationResult] = []
+    for index in range(count):
+        choice = by_index.get(index)
+        if choice is None:
+            results.append(
+                BatchGenerationResult(
+                    index=index, error=ValueError(f"No choice for prompt {index}")
+                )
+            )
+        else:
+            results.append(
+                BatchGenerationResult(
+                    index=index, response={**base, "choices": [{**choice, "index": 0}]}
+                )
+            )
+    return results
+
+
+class BatchGenerator(Protocol):
+    """An adapter that can generate several artifacts in one call."""
+
+    def generate(
+        self,
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        schema: dict[str, object],
+    ) -> CompilerResult:
+        """Generate one artifact."""
+        ...
+
+    def generate_batch(
+        self, requests: Sequence[GenerationRequest]
+    ) -> list[CompilerResult]:
+        """Generate one artifact per request, in request order."""
+        ...
+
+
+@dataclass
+class _Pending:
+    """A generate() call waiting for its batch."""
+
+    request: GenerationRequest
+    done: threading.Event = field(default_factory=threading.Event)
+    taken: bool = False
+    result: CompilerResult | None = None
+    error: BaseException | None = None
+
+
+class BatchingAdapter:
+    """LLMPort wrapper that coalesces concurrent generate() calls.
+
+    The oldest queued caller waits up to max_wait seconds (or until
+    max_batch_size calls are queued) and then sends the queued requests
+    through the wrapped adapter's generate_batch(); each caller receives
+    its own result. A single caller therefore pays at most max_wait of
+    extra latency, and callers left over from a full batch start the
+    next one.
+
+    Example:
+        >>> llm = BatchingAdapter(create_vllm_adapter_from_config())
+        >>> result = llm.generate(pass_type, context, schema)
+    """
+
+    def __init__(
+        self,
+        adapter: BatchGenerator,
+        max_batch_size: int = 16,
+        max_wait: float = 0.05,
+    ) -> None:
+        """Initialize the batching wrapper.
+
+        Args:
+            adapter: Adapter providing generate_batch().
+            max_batch_size: Maximum requests sent in one batch.
+            max_wait: Seconds the first caller waits for others to join.
+
+        Raises:
+            ValueError: If max_batch_size is less than 1.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._adapter = adapter
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._cond = threading.Condition()
+        self._queue: list[_Pending] = []
+        self._collecting = False
+        self._batch_sizes: list[int] = []
+
+    @property
+    def adapter(self) -> BatchGenerator:
+        """Return the wrapped adapter."""
+        return self._adapter
+
+    @property
+    def batch_sizes(self) -> list[int]:
+        """Return the size of every batch sent so far."""
+        with self._cond:
+            return list(self._batch_sizes)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate other attributes (model, is_available, ...) to the adapter."""
+        return getattr(self._adapter, name)
+
+    def generate(
+        self,
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        schema: dict[str, object],
+    ) -> CompilerResult:
+        """Generate an artifact as part of the next batch.
+
+        Args:
+            pass_type: The compiler pass type.
+            context: The compilation context.
+            schema: JSON Schema for the expected output.
+
+        Returns:
+            CompilerResult for this request.
+        """
+        pending = _Pending(request=(pass_type, context, schema))
+        batch: list[_Pending] = []
+        with self._cond:
+            self._queue.append(pending)
+            self._cond.notify_all()
+            while not pending.taken:
+                # The oldest queued caller collects the next batch
+                if self._queue[0] is pending and not self._collecting:
+                    batch = self._take_batch()
+                else:
+                    self._cond.wait()
+
+        if batch:
+            self._dispatch(batch)
+        else:
+            pending.done.wait()
+
+        if pending.error is not None:
+            raise pending.error
+        assert pending.result is not None
+        return pending.result
+
+    def _take_batch(self) -> list[_Pending]:
+        """Wait for the batch to fill (or max_wait) and take it off the queue.
+
+        Must be called with the condition held.
+        """
+        self._collecting = True
+        self._cond.wait_for(
+            lambda: len(self._queue) >= self._max_batch_size,
+            timeout=self._max_wait,
+        )
+        batch = self._queue[: self._max_batch_size]
+        del self._queue[: self._max_batch_size]
+        for queued in batch:
+            queued.taken = True
+        self._batch_sizes.append(len(batch))
+        self._collecting = False
+        # Let the next queued caller start collecting
+        self._cond.notify_all()
+        return batch
+
+    def _dispatch(self, batch: list[_Pending]) -> None:
+        """Run one batch and hand each caller its result."""
+        try:
+            results = self._adapter.generate_batch([p.request for p in batch])
+            for pending, result in zip(batch, results, strict=True):
+                pending.result = result
+        except BaseException as e:
+            for pending in batch:
+                pending.error = e
+        finally:
+            for pending in batch:
+                pending.done.set()
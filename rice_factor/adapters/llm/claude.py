@@ -4,10 +4,14 @@ This module provides the ClaudeAdapter class that implements the LLMPort
 protocol for generating artifacts using Claude (Anthropic API).
 """
 
+from __future__ import annotations
+
 import json
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from rice_factor.adapters.llm.claude_client import ClaudeClient, ClaudeClientError
+from rice_factor.adapters.llm.usage_tracker import get_usage_tracker
 from rice_factor.domain.artifacts.compiler_types import (
     CompilerContext,
     CompilerPassType,
@@ -19,8 +23,18 @@ from rice_factor.domain.failures.llm_errors import (
     LLMRateLimitError,
     LLMTimeoutError,
 )
-from rice_factor.domain.prompts import PromptManager
+from rice_factor.domain.prompts import (
+    PromptManager,
+    SchemaRenderMode,
+    render_schema,
+    schema_fence_language,
+)
 from rice_factor.domain.services.json_extractor import JSONExtractor
+from rice_factor.domain.services.model_registry import get_model_registry
+
+if TYPE_CHECKING:
+    from rice_factor.adapters.llm.usage_tracker import UsageTracker
+    from rice_factor.domain.services.cost_tracker import CostTracker
 
 
 class ClaudeAdapter:
@@ -34,6 +48,11 @@ class ClaudeAdapter:
     - Top-p: <= 0.3
     - No streaming
 
+    The request is split into content blocks so that the stable prefix
+    (system prompt, output schema, .project/ files) can be served from
+    Anthropic's prompt cache, while artifacts and the target file are sent
+    uncached after the last cache breakpoint.
+
     Attributes:
         model: The Claude model to use.
         max_tokens: Maximum tokens per response.
@@ -45,6 +64,9 @@ class ClaudeAdapter:
     MAX_TEMPERATURE = 0.2
     MAX_TOP_P = 0.3
 
+    # Cache breakpoint marker for stable prompt blocks
+    CACHE_CONTROL: ClassVar[dict[str, str]] = {"type": "ephemeral"}
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -55,6 +77,10 @@ class ClaudeAdapter:
         top_p: float = 0.3,
         timeout: float = 120.0,
         max_retries: int = 3,
+        prompt_caching: bool = True,
+        schema_mode: SchemaRenderMode = SchemaRenderMode.COMPACT,
+        usage_tracker: UsageTracker | None = None,
+        cost_tracker: CostTracker | None = None,
     ) -> None:
         """Initialize the Claude adapter.
 
@@ -66,6 +92,10 @@ class ClaudeAdapter:
             top_p: Top-p sampling (capped at 0.3).
             timeout: Request timeout in seconds.
             max_retries: Maximum retry attempts.
+            prompt_caching: Whether to mark stable blocks as cacheable.
+            schema_mode: How the output schema is rendered into the prompt.
+            usage_tracker: Tracker for token usage. Defaults to the global one.
+            cost_tracker: Optional cost tracker to also record usage into.
 
         Raises:
             ClaudeClientError: If anthropic SDK is not available.
@@ -75,13 +105,17 @@ class ClaudeAdapter:
         self._max_tokens = max_tokens
         self._temperature = min(temperature, self.MAX_TEMPERATURE)
         self._top_p = min(top_p, self.MAX_TOP_P)
+        self._prompt_caching = prompt_caching
+        self._usage_tracker = usage_tracker
+        self._cost_tracker = cost_tracker
 
         self._client = ClaudeClient(
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
         )
-        self._prompt_manager = PromptManager()
+        self._schema_mode = schema_mode
+        self._prompt_manager = PromptManager(schema_mode=schema_mode)
         self._json_extractor = JSONExtractor()
 
     @property
@@ -99,6 +133,11 @@ class ClaudeAdapter:
         """Return the top-p setting."""
         return self._top_p
 
+    @property
+    def prompt_caching(self) -> bool:
+        """Return whether prompt caching is enabled."""
+        return self._prompt_caching
+
     def generate(
         self,
         pass_type: CompilerPassType,
@@ -115,22 +154,70 @@ class ClaudeAdapter:
         Returns:
             CompilerResult with payload on success or error details on failure.
         """
-        try:
-            # Build messages
-            messages = self._build_messages(pass_type, context, schema)
+        messages = self._build_messages(pass_type, context, schema)
+        system = self._build_system(pass_type)
+        return self._complete(pass_type, messages, system)
 
-            # Get system prompt
-            system_prompt = self._prompt_manager.get_system_prompt(pass_type)
+    def repair(
+        self,
+        pass_type: CompilerPassType,
+        request: CompilerContext,
+        schema: dict[str, object],
+    ) -> CompilerResult:
+        """Patch invalid sub-trees of an artifact using Claude.
 
+        Sends only the repair system prompt and the patch schema, not the
+        pass prompt or the artifact schema.
+
+        Args:
+            pass_type: The pass that produced the invalid artifact.
+            request: Repair context built by the OutputRepairer.
+            schema: JSON Schema of the expected patch object.
+
+        Returns:
+            CompilerResult with the patch on success or error details on failure.
+        """
+        prompt = self._prompt_manager.get_repair_prompt(request, schema)
+        messages = [
+            {"role": "user", "content": [self._text_block(prompt, cacheable=False)]}
+        ]
+        system = [
+            self._text_block(
+                self._prompt_manager.get_repair_system_prompt(), cacheable=True
+            )
+        ]
+        return self._complete(pass_type, messages, system)
+
+    def _complete(
+        self,
+        pass_type: CompilerPassType,
+        messages: list[dict[str, Any]],
+        system: list[dict[str, Any]],
+    ) -> CompilerResult:
+        """Send a request to Claude and parse the JSON payload.
+
+        Args:
+            pass_type: The compiler pass type (for usage tracking).
+            messages: Message list for the API.
+            system: System prompt content blocks.
+
+        Returns:
+            CompilerResult with payload on success or error details on failure.
+        """
+        try:
             # Call Claude API
+            start = time.perf_counter()
             response = self._client.create_message(
                 model=self._model,
                 messages=messages,
-                system=system_prompt,
+                system=system,
                 max_tokens=self._max_tokens,
                 temperature=self._temperature,
                 top_p=self._top_p,
             )
+            self._record_usage(
+                pass_type, response, (time.perf_counter() - start) * 1000
+            )
 
             # Extract response text
             response_text = self._extract_response_text(response)
@@ -183,14 +270,31 @@ class ClaudeAdapter:
                 error_details=f"Unexpected error: {e}",
             )
 
+    def _build_system(self, pass_type: CompilerPassType) -> list[dict[str, Any]]:
+        """Build the system prompt as a single cacheable content block.
+
+        Args:
+            pass_type: The compiler pass type.
+
+        Returns:
+            List containing the system prompt text block.
+        """
+        system_prompt = self._prompt_manager.get_system_prompt(pass_type)
+        return [self._text_block(system_prompt, cacheable=True)]
+
     def _build_messages(
         self,
-        pass_type: CompilerPassType,
+        pass_type: CompilerPassType,  # noqa: ARG002
         context: CompilerContext,
         schema: dict[str, object],
     ) -> list[dict[str, Any]]:
         """Build the message list for Claude API.
 
+        The user message is split into content blocks ordered from most to
+        least stable: output schema, then .project/ files (both cacheable),
+        then the per-invocation artifacts, context packed for the target
+        and target file.
+
         Args:
             pass_type: The compiler pass type.
             context: The compilation context.
@@ -199,17 +303,95 @@ class ClaudeAdapter:
         Returns:
             List of message dicts with "role" and "content".
         """
-        # Get the full prompt with schema injection
-        user_prompt = self._prompt_manager.get_full_prompt(
-            pass_type, context, include_schema=True
+        schema_text = render_schema(schema, self._schema_mode)
+        fence = schema_fence_language(self._schema_mode)
+        blocks = [
+            self._text_block(
+                f"JSON SCHEMA:\n```{fence}\n{schema_text}\n```\n\n"
+                "Your output MUST conform exactly to this schema.",
+                cacheable=True,
+            )
+        ]
+
+        project_files = self._prompt_manager.format_project_files(
+            context.project_files
         )
+        if project_files:
+            blocks.append(
+                self._text_block(f"CONTEXT:\n{project_files}", cacheable=True)
+            )
+
+        dynamic = self._prompt_manager.format_dynamic_context(context)
+        if dynamic:
+            blocks.append(self._text_block(dynamic, cacheable=False))
+
+        return [{"role": "user", "content": blocks}]
+
+    def _text_block(self, text: str, *, cacheable: bool) -> dict[str, Any]:
+        """Create a text content block, marking it cacheable if enabled.
+
+        Args:
+            text: Block text.
+            cacheable: Whether the block belongs to the stable prompt prefix.
+
+        Returns:
+            Anthropic text content block.
+        """
+        block: dict[str, Any] = {"type": "text", "text": text}
+        if cacheable and self._prompt_caching:
+            block["cache_control"] = dict(self.CACHE_CONTROL)
+        return block
 
-        # Add schema details if not already included
-        schema_json = json.dumps(schema, indent=2)
-        if "JSON SCHEMA" not in user_prompt:
-            user_prompt += f"\n\n## Required Output Schema\n\n```json\n{schema_json}\n```"
+    def _record_usage(
+        self,
+        pass_type: CompilerPassType,
+        response: dict[str, Any],
+        latency_ms: float,
+    ) -> None:
+        """Record token usage, including prompt cache counters.
 
-        return [{"role": "user", "content": user_prompt}]
+        Args:
+            pass_type: The compiler pass type.
+            response: The Claude API response dict.
+            latency_ms: Request latency in milliseconds.
+        """
+        usage = response.get("usage")
+        if not isinstance(usage, dict):
+            return
+
+        input_tokens = int(usage.get("input_tokens", 0))
+        output_tokens = int(usage.get("output_tokens", 0))
+        cache_read = int(usage.get("cache_read_input_tokens", 0))
+        cache_write = int(usage.get("cache_creation_input_tokens", 0))
+
+        model_info = get_model_registry().get(self._model)
+        cost_in = model_info.cost_per_1k_input if model_info else 0.0
+        cost_out = model_info.cost_per_1k_output if model_info else 0.0
+
+        tracker = self._usage_tracker or get_usage_tracker()
+        record = tracker.record_with_tokens(
+            provider="claude",
+            model=self._model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            latency_ms=latency_ms,
+            cost_per_1k_input=cost_in,
+            cost_per_1k_output=cost_out,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
+        )
+
+        if self._cost_tracker is not None:
+            self._cost_tracker.record(
+                provider="claude",
+                model=self._model,
+                operation=pass_type.value,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost_usd=record.cost_usd,
+                cache_read_tokens=cache_read,
+                cache_write_tokens=cache_write,
+            )
 
     def _extract_response_text(self, response: dict[str, Any]) -> str:
         """Extract the text content from Claude response.
@@ -265,4 +447,6 @@ def create_claude_adapter_from_config() -> ClaudeAdapter:
         top_p=settings.get("llm.top_p", 0.3),
         timeout=settings.get("llm.timeout", 120.0),
         max_retries=settings.get("llm.max_retries", 3),
+        prompt_caching=settings.get("llm.prompt_caching", True),
+        schema_mode=SchemaRenderMode(settings.get("llm.schema_mode", "compact")),
     )
@@ -106,7 +106,7 @@ class ClaudeClient:
         model: str,
         messages: list[dict[str, Any]],
         *,
-        system: str | None = None,
+        system: str | list[dict[str, Any]] | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.0,
         top_p: float = 0.3,
@@ -116,7 +116,8 @@ class ClaudeClient:
         Args:
             model: The model to use (e.g., "claude-3-5-sonnet-20241022").
             messages: List of message dicts with "role" and "content".
-            system: Optional system message.
+            system: Optional system message, either a plain string or a list
+                of content blocks (used for prompt caching).
             max_tokens: Maximum tokens in response.
             temperature: Temperature for generation (0.0-0.2 for determinism).
             top_p: Top-p sampling (<=0.3 for determinism).
@@ -171,7 +172,7 @@ class ClaudeClient:
         model: str,
         messages: list[dict[str, Any]],
         *,
-        system: str | None = None,
+        system: str | list[dict[str, Any]] | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.0,
         top_p: float = 0.3,
@@ -181,7 +182,7 @@ class ClaudeClient:
         Args:
             model: The model to use.
             messages: List of message dicts.
-            system: Optional system message.
+            system: Optional system message (string or content blocks).
             max_tokens: Maximum tokens in response.
             temperature: Temperature for generation.
             top_p: Top-p sampling.
@@ -207,6 +208,10 @@ class ClaudeClient:
 
             response = self.client.messages.create(**kwargs)
 
+            # Prompt caching counters are only present when caching is used
+            cache_read = getattr(response.usage, "cache_read_input_tokens", None)
+            cache_write = getattr(response.usage, "cache_creation_input_tokens", None)
+
             # Convert response to dict
             return {
                 "id": response.id,
@@ -222,6 +227,12 @@ class ClaudeClient:
                 "usage": {
                     "input_tokens": response.usage.input_tokens,
                     "output_tokens": response.usage.output_tokens,
+                    "cache_read_input_tokens": (
+                        cache_read if isinstance(cache_read, int) else 0
+                    ),
+                    "cache_creation_input_tokens": (
+                        cache_write if isinstance(cache_write, int) else 0
+                    ),
                 },
             }
 
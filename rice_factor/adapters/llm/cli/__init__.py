@@ -9,6 +9,11 @@ from rice_factor.adapters.llm.cli.aider_adapter import (
     AiderAdapter,
     create_aider_adapter_from_config,
 )
+from rice_factor.adapters.llm.cli.availability_cache import (
+    AgentAvailabilityCache,
+    AgentProbe,
+    create_agent_cache_from_config,
+)
 from rice_factor.adapters.llm.cli.base import (
     CLIAgentPort,
     CLITaskResult,
@@ -38,6 +43,11 @@ from rice_factor.adapters.llm.cli.qwen_code_adapter import (
     QwenCodeAdapter,
     create_qwen_code_adapter_from_config,
 )
+from rice_factor.adapters.llm.cli.workspace import (
+    IsolatedWorkspace,
+    WorkspaceError,
+    WorkspaceKind,
+)
 
 # Type alias for any CLI agent adapter
 CLIAgent = (
@@ -50,7 +60,9 @@ CLIAgent = (
 )
 
 __all__ = [
+    "AgentAvailabilityCache",
     "AgentConfig",
+    "AgentProbe",
     "AiderAdapter",
     "CLIAgent",
     "CLIAgentDetector",
@@ -60,8 +72,12 @@ __all__ = [
     "CodexAdapter",
     "DetectedAgent",
     "GeminiCLIAdapter",
+    "IsolatedWorkspace",
     "OpenCodeAdapter",
     "QwenCodeAdapter",
+    "WorkspaceError",
+    "WorkspaceKind",
+    "create_agent_cache_from_config",
     "create_aider_adapter_from_config",
     "create_claude_code_adapter_from_config",
     "create_codex_adapter_from_config",
@@ -0,0 +1,319 @@
+"""Persistent cache of CLI agent probe results.
+
+Probing a CLI agent means resolving its binary on PATH and, for detection,
+spawning it with ``--version``. Doing that for every agent on every
+orchestration is slow, so probe results are cached on disk and reused
+across invocations.
+
+An entry is keyed by the resolved binary path plus its mtime: reinstalling,
+upgrading or removing the tool invalidates it immediately. Entries older
+than the TTL are still served, but a background refresh is started so the
+next caller sees up-to-date results.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from rice_factor.adapters.llm.cli.base import DetectedAgent
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_CACHE_FILE = Path.home() / ".rice-factor" / "cache" / "agents.json"
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+def binary_fingerprint(path: str | None) -> tuple[str | None, float | None]:
+    """Compute the cache key for an agent binary.
+
+    Args:
+        path: Path of the binary as found on PATH, or None if not found.
+
+    Returns:
+        Tuple of (resolved path, mtime). Both are None for a missing
+        binary; mtime is None if the binary cannot be stat'ed.
+    """
+    if path is None:
+        return None, None
+    resolved = Path(path).resolve()
+    try:
+        return str(resolved), resolved.stat().st_mtime
+    except OSError:
+        return str(resolved), None
+
+
+@dataclass
+class AgentProbe:
+    """Result of probing one CLI agent.
+
+    Attributes:
+        name: Agent identifier.
+        command: CLI command name.
+        available: Whether the command was found.
+        version: Version string if it was probed and reported.
+        path: Path of the command as found on PATH.
+        resolved_path: Resolved binary path (cache key).
+        mtime: Modification time of the resolved binary (cache key).
+        version_checked: Whether the version was probed at all.
+        probed_at: Unix time of the probe.
+    """
+
+    name: str
+    command: str
+    available: bool
+    version: str | None = None
+    path: str | None = None
+    resolved_path: str | None = None
+    mtime: float | None = None
+    version_checked: bool = False
+    probed_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def for_command(
+        cls,
+        name: str,
+        command: str,
+        available: bool | None = None,
+        version: str | None = None,
+        version_checked: bool = False,
+    ) -> AgentProbe:
+        """Create a probe for a command, resolving its fingerprint.
+
+        Args:
+            name: Agent identifier.
+            command: CLI command name.
+            available: Availability override (defaults to found on PATH).
+            version: Version string if probed.
+            version_checked: Whether the version was probed.
+
+        Returns:
+            AgentProbe stamped with the current time.
+        """
+        path = shutil.which(command)
+        resolved_path, mtime = binary_fingerprint(path)
+        return cls(
+            name=name,
+            command=command,
+            available=path is not None if available is None else available,
+            version=version,
+            path=path,
+            resolved_path=resolved_path,
+            mtime=mtime,
+            version_checked=version_checked,
+        )
+
+    def age_seconds(self, now: float | None = None) -> float:
+        """Return seconds since the probe was taken."""
+        return max(0.0, (now if now is not None else time.time()) - self.probed_at)
+
+    def to_detected_agent(self) -> DetectedAgent:
+        """Convert to a DetectedAgent."""
+        return DetectedAgent(
+            name=self.name,
+            command=self.command,
+            version=self.version,
+            available=self.available,
+            path=self.path,
+            checked_at=self.probed_at,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "command": self.command,
+            "available": self.available,
+            "version": self.version,
+            "path": self.path,
+            "resolved_path": self.resolved_path,
+            "mtime": self.mtime,
+            "version_checked": self.version_checked,
+            "probed_at": self.probed_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AgentProbe:
+        """Create from dictionary."""
+        return cls(
+            name=data["name"],
+            command=data["command"],
+            available=bool(data["available"]),
+            version=data.get("version"),
+            path=data.get("path"),
+            resolved_path=data.get("resolved_path"),
+            mtime=data.get("mtime"),
+            version_checked=bool(data.get("version_checked", False)),
+            probed_at=float(data.get("probed_at", 0.0)),
+        )
+
+
+class AgentAvailabilityCache:
+    """TTL cache of agent probes, persisted as JSON.
+
+    Thread-safe; writes are atomic so concurrent invocations never read a
+    partially written file.
+
+    Example:
+        >>> cache = AgentAvailabilityCache(ttl_seconds=600)
+        >>> probe = cache.get("claude_code", "claude")
+        >>> if probe is None:
+        ...     cache.put(AgentProbe.for_command("claude_code", "claude"))
+    """
+
+    def __init__(
+        self,
+        cache_file: Path | None = DEFAULT_CACHE_FILE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache, loading any persisted entries.
+
+        Args:
+            cache_file: JSON file to persist to (None for memory only).
+            ttl_seconds: Age after which entries are refreshed.
+        """
+        self._cache_file = cache_file
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[str, AgentProbe] = {}
+        self._refreshing: set[str] = set()
+        self._load()
+
+    @property
+    def ttl_seconds(self) -> float:
+        """Return the refresh TTL in seconds."""
+        return self._ttl_seconds
+
+    def get(self, name: str, command: str) -> AgentProbe | None:
+        """Return the cached probe if the binary is unchanged.
+
+        Stale entries are returned too; use is_fresh() to decide whether
+        to refresh them.
+
+        Args:
+            name: Agent identifier.
+            command: CLI command name.
+
+        Returns:
+            The cached AgentProbe, or None if missing or invalidated.
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None or entry.command != command:
+            return None
+        if binary_fingerprint(shutil.which(command)) != (entry.resolved_path, entry.mtime):
+            return None
+        return entry
+
+    def is_fresh(self, probe: AgentProbe, now: float | None = None) -> bool:
+        """Check whether a probe is within the TTL."""
+        return probe.age_seconds(now) < self._ttl_seconds
+
+    def put(self, probe: AgentProbe) -> None:
+        """Store a probe and persist the cache.
+
+        Args:
+            probe: The probe result to store.
+        """
+        with self._lock:
+            self._entries[probe.name] = probe
+        self._save()
+
+    def clear(self) -> None:
+        """Drop all entries, including the persisted file."""
+        with self._lock:
+            self._entries.clear()
+        if self._cache_file is not None:
+            with contextlib.suppress(OSError):
+                self._cache_file.unlink()
+
+    def refresh_in_background(
+        self,
+        name: str,
+        probe_fn: Callable[[], AgentProbe],
+    ) -> bool:
+        """Re-probe an agent on a daemon thread and store the result.
+
+        Args:
+            name: Agent identifier.
+            probe_fn: Function that probes the agent.
+
+        Returns:
+            True if a refresh was started, False if one is already running.
+        """
+        with self._lock:
+            if name in self._refreshing:
+                return False
+            self._refreshing.add(name)
+
+        def run() -> None:
+            try:
+                self.put(probe_fn())
+            except Exception:
+                pass  # Keep serving the stale entry
+            finally:
+                with self._lock:
+                    self._refreshing.discard(name)
+
+        threading.Thread(target=run, name=f"agent-probe-{name}", daemon=True).start()
+        return True
+
+    def _load(self) -> None:
+        """Load entries from the cache file, ignoring unreadable files."""
+        if self._cache_file is None or not self._cache_file.exists():
+            return
+        try:
+            data = json.loads(self._cache_file.read_text(encoding="utf-8"))
+            entries = {
+                name: AgentProbe.from_dict(entry)
+                for name, entry in data.get("agents", {}).items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return
+        self._entries = entries
+
+    def _save(self) -> None:
+        """Atomically write entries to the cache file."""
+        if self._cache_file is None:
+            return
+        with self._lock:
+            data = {
+                "agents": {name: p.to_dict() for name, p in self._entries.items()}
+            }
+        tmp = self._cache_file.with_name(
+            f"{self._cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp.replace(self._cache_file)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+
+
+def create_agent_cache_from_config() -> AgentAvailabilityCache | None:
+    """Create the agent probe cache from application configuration.
+
+    Returns:
+        AgentAvailabilityCache, or None if caching is disabled.
+    """
+    from rice_factor.config.settings import settings
+
+    if not settings.get("cli_agents.probe_cache.enabled", True):
+        return None
+    cache_file = settings.get("cli_agents.probe_cache.path", None)
+    return AgentAvailabilityCache(
+        cache_file=Path(cache_file).expanduser() if cache_file else DEFAULT_CACHE_FILE,
+        ttl_seconds=float(
+            settings.get("cli_agents.probe_cache.ttl_seconds", DEFAULT_TTL_SECONDS)
+        ),
+    )
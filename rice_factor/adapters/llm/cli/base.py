@@ -6,6 +6,8 @@ adapters must implement, along with related data types.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
@@ -50,6 +52,8 @@ class DetectedAgent:
         version: Version string if available.
         available: Whether the agent is installed and accessible.
         path: Full path to the executable if available.
+        checked_at: Unix time the agent was probed (may predate this run
+            when served from the probe cache).
     """
 
     name: str
@@ -57,6 +61,7 @@ class DetectedAgent:
     version: str | None = None
     available: bool = False
     path: str | None = None
+    checked_at: float | None = None
 
 
 @runtime_checkable
@@ -148,3 +153,33 @@ class CLIAgentPort(Protocol):
             List of capability strings this agent supports.
         """
         ...
+
+
+async def communicate_or_kill(
+    process: asyncio.subprocess.Process,
+    timeout: float,
+) -> tuple[bytes, bytes]:
+    """Wait for a CLI agent process, killing it on timeout or cancellation.
+
+    Without this, a timed-out or cancelled agent keeps running (and editing
+    files) after the caller has given up on it.
+
+    Args:
+        process: The running agent process.
+        timeout: Maximum seconds to wait.
+
+    Returns:
+        Tuple of (stdout, stderr) bytes.
+
+    Raises:
+        TimeoutError: If the process did not finish in time.
+        asyncio.CancelledError: If the waiting task was cancelled.
+    """
+    try:
+        return await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except (TimeoutError, asyncio.CancelledError):
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        with contextlib.suppress(Exception):
+            await process.wait()
+        raise
@@ -13,7 +13,7 @@ import shutil
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from rice_factor.adapters.llm.cli.base import CLITaskResult
+from rice_factor.adapters.llm.cli.base import CLITaskResult, communicate_or_kill
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -101,10 +101,7 @@ class CodexAdapter:
                 stderr=asyncio.subprocess.PIPE,
             )
 
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout,
-            )
+            stdout, stderr = await communicate_or_kill(process, timeout)
 
             duration = asyncio.get_event_loop().time() - start_time
             stdout_text = stdout.decode("utf-8", errors="replace")
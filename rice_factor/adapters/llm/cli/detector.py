@@ -6,12 +6,21 @@ coding agents installed on the system.
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rice_factor.adapters.llm.cli.base import DetectedAgent
+from rice_factor.adapters.llm.cli.availability_cache import AgentProbe
+from rice_factor.adapters.llm.cli.base import DetectedAgent  # noqa: TC001 - re-exported
+
+if TYPE_CHECKING:
+    from rice_factor.adapters.llm.cli.availability_cache import (
+        AgentAvailabilityCache,
+    )
 
 
 @dataclass
@@ -41,7 +50,9 @@ class CLIAgentDetector:
     """Auto-detect available CLI coding agents.
 
     Scans the system PATH for known CLI coding tools and reports
-    their availability and version information.
+    their availability and version information. Agents are probed
+    concurrently; with a cache, results are reused across invocations
+    and refreshed in the background once older than the cache TTL.
 
     Example:
         >>> detector = CLIAgentDetector()
@@ -52,23 +63,40 @@ class CLIAgentDetector:
     """
 
     configs: dict[str, AgentConfig] = field(default_factory=lambda: DEFAULT_AGENT_CONFIGS.copy())
+    cache: AgentAvailabilityCache | None = None
 
     def detect_all(self) -> list[DetectedAgent]:
-        """Detect all configured CLI agents.
+        """Detect all configured CLI agents concurrently.
 
         Returns:
-            List of DetectedAgent objects with availability info.
+            List of DetectedAgent objects with availability info, in
+            configuration order.
         """
-        results: list[DetectedAgent] = []
+        items = list(self.configs.items())
+        if len(items) <= 1:
+            return [self.detect_agent(name, config) for name, config in items]
 
-        for name, config in self.configs.items():
-            agent = self.detect_agent(name, config)
-            results.append(agent)
+        with ThreadPoolExecutor(max_workers=len(items)) as pool:
+            return list(pool.map(lambda item: self.detect_agent(*item), items))
 
-        return results
+    async def detect_all_async(self) -> list[DetectedAgent]:
+        """Detect all configured CLI agents concurrently from async code.
+
+        Returns:
+            List of DetectedAgent objects with availability info, in
+            configuration order.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(self.detect_agent, name, config)
+                    for name, config in self.configs.items()
+                )
+            )
+        )
 
     def detect_agent(self, name: str, config: AgentConfig) -> DetectedAgent:
-        """Detect a single CLI agent.
+        """Detect a single CLI agent, using the cache if configured.
 
         Args:
             name: Agent identifier.
@@ -77,20 +105,35 @@ class CLIAgentDetector:
         Returns:
             DetectedAgent with availability and version info.
         """
-        path = shutil.which(config.command)
-        available = path is not None
-
-        version = None
-        if available:
-            version = self._get_version(config)
-
-        return DetectedAgent(
-            name=name,
-            command=config.command,
-            version=version,
-            available=available,
-            path=path,
-        )
+        if self.cache is not None:
+            cached = self.cache.get(name, config.command)
+            if cached is not None and (cached.version_checked or not cached.available):
+                if not self.cache.is_fresh(cached):
+                    self.cache.refresh_in_background(
+                        name, lambda: self._probe(name, config)
+                    )
+                return cached.to_detected_agent()
+
+        probe = self._probe(name, config)
+        if self.cache is not None:
+            self.cache.put(probe)
+        return probe.to_detected_agent()
+
+    def _probe(self, name: str, config: AgentConfig) -> AgentProbe:
+        """Probe an agent's binary and version without the cache.
+
+        Args:
+            name: Agent identifier.
+            config: Agent configuration.
+
+        Returns:
+            AgentProbe with availability and version info.
+        """
+        probe = AgentProbe.for_command(name, config.command)
+        if probe.available:
+            probe.version = self._get_version(config)
+            probe.version_checked = True
+        return probe
 
     def detect_available(self) -> list[DetectedAgent]:
         """Detect only available (installed) CLI agents.
@@ -160,18 +203,30 @@ class CLIAgentDetector:
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
             return None
 
-    def to_dict(self) -> dict[str, dict[str, Any]]:
+    def to_dict(
+        self, agents: list[DetectedAgent] | None = None
+    ) -> dict[str, dict[str, Any]]:
         """Export detection results as a dictionary.
 
+        Args:
+            agents: Already detected agents (detects all if None).
+
         Returns:
             Dict mapping agent names to their detection info.
         """
+        now = time.time()
         results: dict[str, dict[str, Any]] = {}
-        for agent in self.detect_all():
+        for agent in agents if agents is not None else self.detect_all():
             results[agent.name] = {
                 "command": agent.command,
                 "available": agent.available,
                 "version": agent.version,
                 "path": agent.path,
+                "checked_at": agent.checked_at,
+                "cache_age_seconds": (
+                    round(max(0.0, now - agent.checked_at), 1)
+                    if agent.checked_at is not None
+                    else None
+                ),
             }
         return results
@@ -20,7 +20,7 @@ import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from rice_factor.adapters.llm.cli.base import CLITaskResult
+from rice_factor.adapters.llm.cli.base import CLITaskResult, communicate_or_kill
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -94,10 +94,7 @@ class OpenCodeAdapter:
                 stderr=asyncio.subprocess.PIPE,
             )
 
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout,
-            )
+            stdout, stderr = await communicate_or_kill(process, timeout)
 
             duration = time.monotonic() - start_time
             output = stdout.decode("utf-8")
@@ -0,0 +1,312 @@
+"""Isolated working-tree copies for CLI agents.
+
+Racing several CLI agents on one task requires each agent to edit its own
+copy of the project. A clean git repository gets a detached git worktree,
+which is cheap. Anything else (no git, or uncommitted changes that a
+worktree would not carry over) gets a plain directory copy of the files git
+would track: .git, node_modules and .gitignore'd files are left out.
+
+Once a winner is chosen, its changes are applied back onto the source
+tree and every workspace is removed. For a worktree, the changes are
+computed against the commit it was created from, so commits the agent made
+are carried over. For a copy, they are computed against a snapshot taken
+when the copy was made, so files created in the source meanwhile are left
+alone.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+
+# Directories never copied into (or back from) a workspace
+SKIPPED_DIRS = frozenset({".git", "node_modules"})
+
+
+class WorkspaceKind(Enum):
+    """How a workspace was created."""
+
+    WORKTREE = "worktree"
+    COPY = "copy"
+
+
+class WorkspaceError(Exception):
+    """Raised when a workspace cannot be created or applied."""
+
+
+def _git(cwd: Path, *args: str, input_bytes: bytes | None = None) -> bytes:
+    """Run a git command and return its stdout.
+
+    Raises:
+        WorkspaceError: If git fails or is not installed.
+    """
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            input=input_bytes,
+            capture_output=True,
+            check=False,
+        )
+    except FileNotFoundError as e:
+        raise WorkspaceError("git is not installed") from e
+    if result.returncode != 0:
+        message = result.stderr.decode("utf-8", errors="replace").strip()
+        raise WorkspaceError(f"git {args[0]} failed: {message}")
+    return result.stdout
+
+
+def _is_git_repo(path: Path) -> bool:
+    """Check whether path is inside a git work tree."""
+    try:
+        return _git(path, "rev-parse", "--is-inside-work-tree").strip() == b"true"
+    except WorkspaceError:
+        return False
+
+
+def _is_clean_git_repo(path: Path) -> bool:
+    """Check whether path is the top of a git repo with no local changes."""
+    try:
+        top = _git(path, "rev-parse", "--show-toplevel").decode().strip()
+        if Path(top).resolve() != path.resolve():
+            return False
+        return _git(path, "status", "--porcelain").strip() == b""
+    except WorkspaceError:
+        return False
+
+
+@dataclass
+class IsolatedWorkspace:
+    """A private copy of a working tree for one agent.
+
+    Attributes:
+        source: The original working directory.
+        path: Root of the isolated copy.
+        kind: Whether the copy is a git worktree or a directory copy.
+        snapshot: For a copy, the digest of each copied file at copy time.
+        base: For a worktree, the commit it was checked out at.
+    """
+
+    source: Path
+    path: Path
+    kind: WorkspaceKind
+    snapshot: dict[str, str] = field(default_factory=dict)
+    base: str = ""
+
+    @classmethod
+    def create(cls, source: Path, label: str = "agent") -> IsolatedWorkspace:
+        """Create an isolated copy of source.
+
+        Args:
+            source: Working directory to copy.
+            label: Short name used in the temporary directory name.
+
+        Returns:
+            The created workspace.
+
+        Raises:
+            WorkspaceError: If the copy could not be created.
+        """
+        root = Path(tempfile.mkdtemp(prefix=f"rice-factor-{label}-"))
+        path = root / source.name
+        try:
+            if _is_clean_git_repo(source):
+                base = _git(source, "rev-parse", "HEAD").decode().strip()
+                _git(source, "worktree", "add", "--detach", str(path), base)
+                return cls(
+                    source=source, path=path, kind=WorkspaceKind.WORKTREE, base=base
+                )
+            snapshot = _copy_files(source, path)
+            return cls(
+                source=source, path=path, kind=WorkspaceKind.COPY, snapshot=snapshot
+            )
+        except (OSError, WorkspaceError) as e:
+            shutil.rmtree(root, ignore_errors=True)
+            raise WorkspaceError(f"Could not create workspace for {source}: {e}") from e
+
+    def apply_to_source(self) -> list[str]:
+        """Apply the changes made in this workspace to the source tree.
+
+        Returns:
+            Sorted relative paths that were added, modified or deleted.
+
+        Raises:
+            WorkspaceError: If the changes could not be applied.
+        """
+        if self.kind == WorkspaceKind.WORKTREE:
+            return self._apply_worktree()
+        return self._apply_copy()
+
+    def cleanup(self) -> None:
+        """Remove the workspace (and its worktree registration)."""
+        if self.kind == WorkspaceKind.WORKTREE:
+            with contextlib.suppress(WorkspaceError):
+                _git(self.source, "worktree", "remove", "--force", str(self.path))
+        shutil.rmtree(self.path.parent, ignore_errors=True)
+
+    def _apply_worktree(self) -> list[str]:
+        """Apply a worktree's changes to the source with git apply.
+
+        The diff is taken against the base commit rather than the worktree's
+        HEAD, so it includes anything the agent committed.
+        """
+        _git(self.path, "add", "-A")
+        changed = _git(
+            self.path, "diff", "--cached", "--name-only", self.base
+        ).decode()
+        patch = _git(self.path, "diff", "--cached", "--binary", self.base)
+        if patch.strip():
+            _git(self.source, "apply", "--binary", "-", input_bytes=patch)
+        return sorted(line for line in changed.splitlines() if line)
+
+    def _apply_copy(self) -> list[str]:
+        """Apply the files the agent changed in a copy onto the source.
+
+        Only differences from the copy-time snapshot are applied: files the
+        agent added or modified are copied back, files it deleted are
+        removed. New files that .gitignore excludes (build outputs) are
+        not copied back.
+        """
+        changed: list[str] = []
+        try:
+            current = set(_walk_files(self.path))
+            added = current - self.snapshot.keys()
+            current -= _ignored(self.source, sorted(added))
+
+            for rel in sorted(current):
+                src = self.path / rel
+                if self.snapshot.get(rel) == _digest(src):
+                    continue
+                dest = self.source / rel
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                if dest.is_symlink():
+                    dest.unlink()
+                shutil.copy2(src, dest, follow_symlinks=False)
+                changed.append(rel)
+
+            for rel in sorted(self.snapshot.keys() - current):
+                dest = self.source / rel
+                if dest.is_symlink() or dest.exists():
+                    dest.unlink()
+                changed.append(rel)
+        except OSError as e:
+            raise WorkspaceError(f"Could not apply workspace changes: {e}") from e
+
+        return sorted(changed)
+
+
+def _digest(path: Path) -> str:
+    """Return the SHA-256 of a file (of its target, for a symlink)."""
+    if path.is_symlink():
+        return hashlib.sha256(str(path.readlink()).encode()).hexdigest()
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _walk_files(root: Path) -> list[str]:
+    """List files and symlinks under root, relative to it.
+
+    Directories in SKIPPED_DIRS are not descended into.
+    """
+    files: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        base = Path(dirpath)
+        links = [d for d in dirnames if (base / d).is_symlink()]
+        dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS and d not in links]
+        for name in [*filenames, *links]:
+            files.append((base / name).relative_to(root).as_posix())
+    return files
+
+
+def _source_files(source: Path) -> list[str]:
+    """List the files of source that belong in a workspace copy.
+
+    In a git repository these are the tracked and untracked files that
+    .gitignore does not exclude; otherwise every file, minus the patterns
+    of a top-level .gitignore.
+    """
+    if _is_git_repo(source):
+        output = _git(
+            source, "ls-files", "-z", "--cached", "--others", "--exclude-standard"
+        )
+        files = {rel for rel in output.decode("utf-8").split("\0") if rel}
+    else:
+        files = set(_walk_files(source))
+        files -= _ignored(source, sorted(files))
+    return sorted(
+        rel
+        for rel in files
+        if not SKIPPED_DIRS.intersection(rel.split("/"))
+        and ((source / rel).is_symlink() or (source / rel).is_file())
+    )
+
+
+def _ignored(source: Path, paths: list[str]) -> set[str]:
+    """Return the paths (relative to source) that .gitignore excludes."""
+    if not paths:
+        return set()
+    if _is_git_repo(source):
+        try:
+            result = subprocess.run(
+                ["git", "check-ignore", "-z", "--stdin"],
+                cwd=source,
+                input="\0".join(paths).encode("utf-8"),
+                capture_output=True,
+                check=False,
+            )
+        except FileNotFoundError:
+            return set()
+        # Exit status 1 means no path is ignored
+        return {rel for rel in result.stdout.decode("utf-8").split("\0") if rel}
+
+    gitignore = source / ".gitignore"
+    if not gitignore.is_file():
+        return set()
+    patterns = [
+        line.strip().rstrip("/")
+        for line in gitignore.read_text(encoding="utf-8").splitlines()
+        if line.strip() and not line.startswith(("#", "!"))
+    ]
+    return {rel for rel in paths if _matches_any(rel, patterns)}
+
+
+def _matches_any(rel: str, patterns: list[str]) -> bool:
+    """Check a path against simple .gitignore patterns (no negation).
+
+    A pattern containing a slash is matched against the path and its parent
+    directories from the root; any other pattern against each component.
+    """
+    parts = rel.split("/")
+    prefixes = ["/".join(parts[: i + 1]) for i in range(len(parts))]
+    for pattern in patterns:
+        if "/" in pattern:
+            anchored = pattern.lstrip("/")
+            if any(fnmatch.fnmatch(prefix, anchored) for prefix in prefixes):
+                return True
+        elif any(fnmatch.fnmatch(part, pattern) for part in parts):
+            return True
+    return False
+
+
+def _copy_files(source: Path, dest: Path) -> dict[str, str]:
+    """Copy the workspace files of source into dest.
+
+    Returns:
+        Digest of each copied file, keyed by relative path.
+    """
+    snapshot: dict[str, str] = {}
+    for rel in _source_files(source):
+        target = dest / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source / rel, target, follow_symlinks=False)
+        snapshot[rel] = _digest(target)
+    dest.mkdir(parents=True, exist_ok=True)
+    return snapshot
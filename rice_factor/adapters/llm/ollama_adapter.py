@@ -10,8 +10,18 @@ at localhost:11434 for model inference.
 from __future__ import annotations
 
 import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
+from rice_factor.adapters.llm.batching import DEFAULT_MAX_IN_FLIGHT
+from rice_factor.adapters.llm.ollama_lifecycle import (
+    DEFAULT_KEEP_ALIVE,
+    KeepAlive,
+    OllamaModelManager,
+)
 from rice_factor.domain.artifacts.compiler_types import (
     CompilerContext,
     CompilerPassType,
@@ -22,11 +32,20 @@ from rice_factor.domain.failures.llm_errors import (
     LLMError,
     LLMTimeoutError,
 )
-from rice_factor.domain.prompts import PromptManager
+from rice_factor.domain.prompts import (
+    PromptManager,
+    SchemaRenderMode,
+    render_schema,
+    schema_fence_language,
+)
 from rice_factor.domain.services.json_extractor import JSONExtractor
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Sequence
+
+    from rice_factor.adapters.metrics.prometheus_adapter import MetricsRegistry
+
+logger = logging.getLogger(__name__)
 
 
 class OllamaClientError(Exception):
@@ -73,6 +92,7 @@ class OllamaClient:
         temperature: float = 0.1,
         max_tokens: int = 4096,
         stream: bool = False,
+        keep_alive: str | int | None = None,
     ) -> dict[str, Any]:
         """Generate completion from Ollama.
 
@@ -82,6 +102,8 @@ class OllamaClient:
             temperature: Temperature for generation.
             max_tokens: Maximum tokens to generate.
             stream: Whether to stream responses (not supported in sync mode).
+            keep_alive: How long the model stays loaded afterwards
+                (e.g. "10m"; server default if None).
 
         Returns:
             Response dict with 'response' key containing generated text.
@@ -102,12 +124,52 @@ class OllamaClient:
             },
             "stream": False,
         }
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+
+        if self._httpx_available:
+            return self._generate_httpx(payload)
+        else:
+            return self._generate_requests(payload)
+
+    def load_model(
+        self,
+        model: str,
+        keep_alive: str | int | None = None,
+    ) -> dict[str, Any]:
+        """Load a model into memory without generating.
+
+        Args:
+            model: Model name.
+            keep_alive: How long the model stays loaded (server default if None).
+
+        Returns:
+            Response dict (load_duration is in nanoseconds).
+
+        Raises:
+            OllamaClientError: If request fails.
+            LLMTimeoutError: If request times out.
+        """
+        payload: dict[str, Any] = {"model": model}
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
 
         if self._httpx_available:
             return self._generate_httpx(payload)
         else:
             return self._generate_requests(payload)
 
+    def unload_model(self, model: str) -> None:
+        """Unload a model from memory.
+
+        Args:
+            model: Model name.
+
+        Raises:
+            OllamaClientError: If request fails.
+        """
+        self.load_model(model, keep_alive=0)
+
     def _generate_httpx(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Generate using httpx."""
         import httpx
@@ -159,6 +221,7 @@ class OllamaClient:
         temperature: float = 0.1,
         max_tokens: int = 4096,
         stream: bool = False,
+        keep_alive: str | int | None = None,
     ) -> dict[str, Any] | AsyncIterator[str]:
         """Generate completion from Ollama asynchronously.
 
@@ -168,6 +231,7 @@ class OllamaClient:
             temperature: Temperature for generation.
             max_tokens: Maximum tokens to generate.
             stream: Whether to stream responses.
+            keep_alive: How long the model stays loaded afterwards.
 
         Returns:
             Response dict or async iterator of response chunks.
@@ -191,6 +255,8 @@ class OllamaClient:
             },
             "stream": stream,
         }
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
 
         if stream:
             return self._stream_response_async(payload)
@@ -329,8 +395,12 @@ class OllamaAdapter:
     - Temperature: 0.0-0.2
     - No streaming for deterministic output
 
+    Manages model lifecycle through an OllamaModelManager: passes may use
+    different models, each request carries a per-pass keep-alive, and
+    warm_up() preloads models before the first request.
+
     Attributes:
-        model: The Ollama model to use.
+        model: The default Ollama model.
         max_tokens: Maximum tokens per response.
         temperature: Temperature for generation.
     """
@@ -346,6 +416,13 @@ class OllamaAdapter:
         max_tokens: int = 4096,
         temperature: float = 0.0,
         timeout: float = 120.0,
+        schema_mode: SchemaRenderMode = SchemaRenderMode.COMPACT,
+        pass_models: dict[CompilerPassType, str] | None = None,
+        keep_alive: dict[CompilerPassType, KeepAlive] | None = None,
+        default_keep_alive: KeepAlive = DEFAULT_KEEP_ALIVE,
+        max_resident_models: int = 1,
+        registry: MetricsRegistry | None = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
     ) -> None:
         """Initialize the Ollama adapter.
 
@@ -355,17 +432,34 @@ class OllamaAdapter:
             max_tokens: Maximum tokens in response.
             temperature: Temperature for generation (capped at 0.2).
             timeout: Request timeout in seconds.
+            schema_mode: How the output schema is rendered into the prompt.
+            pass_models: Models overriding the default for specific passes.
+            keep_alive: Keep-alive per pass (merged over tuned defaults).
+            default_keep_alive: Keep-alive for preloads and other requests.
+            max_resident_models: Models the server can hold at once.
+            registry: Optional metrics registry for load and request timings.
+            max_in_flight: Concurrent requests per model in generate_batch().
         """
         self._model = model
+        self._pass_models: dict[CompilerPassType, str] = dict(pass_models or {})
         self._max_tokens = max_tokens
         self._temperature = min(temperature, self.MAX_TEMPERATURE)
         self._timeout = timeout
+        self._max_in_flight = max_in_flight
 
         self._client = OllamaClient(
             base_url=base_url,
             timeout=timeout,
         )
-        self._prompt_manager = PromptManager()
+        self._lifecycle = OllamaModelManager(
+            self._client,
+            keep_alive=keep_alive,
+            default_keep_alive=default_keep_alive,
+            max_resident=max_resident_models,
+            registry=registry,
+        )
+        self._schema_mode = schema_mode
+        self._prompt_manager = PromptManager(schema_mode=schema_mode)
         self._json_extractor = JSONExtractor()
 
     @property
@@ -373,6 +467,38 @@ class OllamaAdapter:
         """Return the model identifier."""
         return self._model
 
+    @property
+    def lifecycle(self) -> OllamaModelManager:
+        """Return the model lifecycle manager."""
+        return self._lifecycle
+
+    def model_for(self, pass_type: CompilerPassType) -> str:
+        """Return the model used for a compiler pass.
+
+        Args:
+            pass_type: The compiler pass type.
+
+        Returns:
+            The pass's model, or the default model.
+        """
+        return self._pass_models.get(pass_type, self._model)
+
+    def warm_up(self) -> dict[str, float]:
+        """Preload the default and per-pass models.
+
+        Failures are logged rather than raised, so an unavailable server
+        does not prevent startup; the first request will report it.
+
+        Returns:
+            Load time in seconds per model that was loaded.
+        """
+        models = [self._model, *self._pass_models.values()]
+        try:
+            return self._lifecycle.preload(models)
+        except (OllamaClientError, LLMError) as e:
+            logger.warning("Ollama warm-up failed: %s", e)
+            return {}
+
     @property
     def temperature(self) -> float:
         """Return the temperature setting."""
@@ -399,23 +525,61 @@ class OllamaAdapter:
         Returns:
             CompilerResult with payload on success or error details on failure.
         """
-        try:
-            # Build prompt
-            user_prompt = self._build_prompt(pass_type, context, schema)
+        user_prompt = self._build_prompt(pass_type, context, schema)
+        system_prompt = self._prompt_manager.get_system_prompt(pass_type)
+
+        # Combine system and user prompts for Ollama
+        return self._complete(pass_type, f"{system_prompt}\n\n{user_prompt}")
 
-            # Get system prompt
-            system_prompt = self._prompt_manager.get_system_prompt(pass_type)
+    def repair(
+        self,
+        pass_type: CompilerPassType,
+        request: CompilerContext,
+        schema: dict[str, object],
+    ) -> CompilerResult:
+        """Patch invalid sub-trees of an artifact using Ollama.
 
-            # Combine system and user prompts for Ollama
-            full_prompt = f"{system_prompt}\n\n{user_prompt}"
+        Sends only the repair system prompt and the patch schema, not the
+        pass prompt or the artifact schema. The pass model is reused.
 
-            # Call Ollama API
-            response = self._client.generate(
-                model=self._model,
-                prompt=full_prompt,
-                temperature=self._temperature,
-                max_tokens=self._max_tokens,
-            )
+        Args:
+            pass_type: The pass that produced the invalid artifact.
+            request: Repair context built by the OutputRepairer.
+            schema: JSON Schema of the expected patch object.
+
+        Returns:
+            CompilerResult with the patch on success or error details on failure.
+        """
+        user_prompt = self._prompt_manager.get_repair_prompt(request, schema)
+        system_prompt = self._prompt_manager.get_repair_system_prompt()
+        return self._complete(pass_type, f"{system_prompt}\n\n{user_prompt}")
+
+    def _complete(self, pass_type: CompilerPassType, full_prompt: str) -> CompilerResult:
+        """Send a prompt to the pass model and parse the JSON payload.
+
+        Args:
+            pass_type: The compiler pass type (selects model and keep-alive).
+            full_prompt: Combined system and user prompt.
+
+        Returns:
+            CompilerResult with payload on success or error details on failure.
+        """
+        try:
+            # Call Ollama API, making room for the model first
+            model = self.model_for(pass_type)
+            self._lifecycle.acquire(model)
+            try:
+                start = time.perf_counter()
+                response = self._client.generate(
+                    model=model,
+                    prompt=full_prompt,
+                    temperature=self._temperature,
+                    max_tokens=self._max_tokens,
+                    keep_alive=self._lifecycle.keep_alive_for(pass_type),
+                )
+                self._lifecycle.record(model, response, time.perf_counter() - start)
+            finally:
+                self._lifecycle.release(model)
 
             # Extract response text
             response_text = response.get("response", "")
@@ -470,6 +634,60 @@ class OllamaAdapter:
                 error_details=f"Unexpected error: {e}",
             )
 
+    def generate_batch(
+        self,
+        requests: Sequence[tuple[CompilerPassType, CompilerContext, dict[str, object]]],
+    ) -> list[CompilerResult]:
+        """Generate several artifacts, grouped by model to minimise swaps.
+
+        Each model's requests are sent concurrently (up to max_in_flight) so
+        the server can run them in parallel; the next model's requests start
+        once the previous model is drained.
+
+        Args:
+            requests: (pass_type, context, schema) per artifact.
+
+        Returns:
+            One CompilerResult per request, in request order. Timeouts and
+            API errors become failed results instead of aborting the batch.
+        """
+        if not requests:
+            return []
+
+        groups: list[list[int]] = []
+        previous: str | None = None
+        for index in self._lifecycle.schedule(requests, lambda r: self.model_for(r[0])):
+            model = self.model_for(requests[index][0])
+            if model != previous:
+                groups.append([])
+                previous = model
+            groups[-1].append(index)
+
+        results: list[CompilerResult | None] = [None] * len(requests)
+        workers = max(1, min(self._max_in_flight, len(requests)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ollama-batch") as pool:
+            for group in groups:
+                group_results = pool.map(
+                    self._generate_or_fail, [requests[index] for index in group]
+                )
+                for index, result in zip(group, group_results, strict=True):
+                    results[index] = result
+        return [result for result in results if result is not None]
+
+    def _generate_or_fail(
+        self, request: tuple[CompilerPassType, CompilerContext, dict[str, object]]
+    ) -> CompilerResult:
+        """Generate one batch item, turning LLM errors into a failed result."""
+        pass_type, context, schema = request
+        try:
+            return self.generate(pass_type, context, schema)
+        except LLMError as e:
+            return CompilerResult(
+                success=False,
+                error_type=e.__class__.__name__,
+                error_details=str(e),
+            )
+
     def _build_prompt(
         self,
         pass_type: CompilerPassType,
@@ -492,9 +710,10 @@ class OllamaAdapter:
         )
 
         # Add schema details if not already included
-        schema_json = json.dumps(schema, indent=2)
         if "JSON SCHEMA" not in user_prompt:
-            user_prompt += f"\n\n## Required Output Schema\n\n```json\n{schema_json}\n```"
+            schema_text = render_schema(schema, self._schema_mode)
+            fence = schema_fence_language(self._schema_mode)
+            user_prompt += f"\n\n## Required Output Schema\n\n```{fence}\n{schema_text}\n```"
 
         return user_prompt
 
@@ -538,10 +757,29 @@ def create_ollama_adapter_from_config() -> OllamaAdapter:
     """
     from rice_factor.config.settings import settings
 
-    return OllamaAdapter(
+    pass_models = settings.get("llm.ollama.pass_models", {}) or {}
+    keep_alive = settings.get("llm.ollama.keep_alive", {}) or {}
+
+    adapter = OllamaAdapter(
         base_url=settings.get("llm.ollama.base_url", "http://localhost:11434"),
         model=settings.get("llm.ollama.model", "codestral"),
         max_tokens=settings.get("llm.ollama.max_tokens", 4096),
         temperature=settings.get("llm.ollama.temperature", 0.0),
         timeout=settings.get("llm.ollama.timeout", 120.0),
+        schema_mode=SchemaRenderMode(settings.get("llm.schema_mode", "compact")),
+        pass_models={CompilerPassType(k): v for k, v in pass_models.items()},
+        keep_alive={CompilerPassType(k): v for k, v in keep_alive.items()},
+        default_keep_alive=settings.get(
+            "llm.ollama.default_keep_alive", DEFAULT_KEEP_ALIVE
+        ),
+        max_resident_models=settings.get("llm.ollama.max_resident_models", 1),
+        max_in_flight=settings.get("llm.ollama.max_in_flight", DEFAULT_MAX_IN_FLIGHT),
     )
+
+    # Load models in the background so startup is not blocked on the server
+    if settings.get("llm.ollama.preload", False):
+        threading.Thread(
+            target=adapter.warm_up, name="ollama-warm-up", daemon=True
+        ).start()
+
+    return adapter
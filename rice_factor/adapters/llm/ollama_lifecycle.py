@@ -0,0 +1,358 @@
+"""Model lifecycle management for the Ollama adapter.
+
+Ollama loads a model into memory on its first request and unloads it once
+its keep-alive expires, so the first request after idle pays the model
+load (often tens of seconds for large models), and alternating between
+models makes the server swap them in and out of VRAM.
+
+The OllamaModelManager preloads models, picks a keep-alive per compiler
+pass, tracks which models are resident and in use, and unloads the least
+recently used idle one before a different model is needed. It also orders queued
+requests so that requests for the same model run back to back. Load time
+and request latency are recorded separately.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from rice_factor.adapters.metrics.prometheus_adapter import (
+    MetricDefinition,
+    MetricType,
+)
+from rice_factor.domain.artifacts.compiler_types import CompilerPassType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from rice_factor.adapters.llm.ollama_adapter import OllamaClient
+    from rice_factor.adapters.metrics.prometheus_adapter import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+KeepAlive = str | int
+
+# Ollama's own default keep-alive
+DEFAULT_KEEP_ALIVE: KeepAlive = "5m"
+
+# Passes that run once per project release the model sooner; passes that
+# fan out over many targets keep it loaded between targets.
+DEFAULT_PASS_KEEP_ALIVE: dict[CompilerPassType, KeepAlive] = {
+    CompilerPassType.PROJECT: "2m",
+    CompilerPassType.ARCHITECTURE: "2m",
+    CompilerPassType.SCAFFOLD: "5m",
+    CompilerPassType.TEST: "10m",
+    CompilerPassType.IMPLEMENTATION: "30m",
+    CompilerPassType.REFACTOR: "10m",
+}
+
+# Ollama reports a few milliseconds of load_duration for a model that is
+# already loaded; anything above this was a cold load.
+COLD_LOAD_SECONDS = 0.25
+
+_NANOSECONDS_PER_SECOND = 1e9
+
+OLLAMA_METRICS = [
+    MetricDefinition(
+        name="rice_factor_llm_model_load_seconds",
+        help_text="Time the LLM server spent loading a model before a request",
+        metric_type=MetricType.HISTOGRAM,
+        labels=["provider", "model"],
+        buckets=[0.5, 1, 2, 5, 10, 20, 30, 60, 120],
+    ),
+    MetricDefinition(
+        name="rice_factor_llm_request_duration_seconds",
+        help_text="LLM request duration in seconds",
+        metric_type=MetricType.HISTOGRAM,
+        labels=["provider", "model"],
+        buckets=[0.1, 0.5, 1, 2, 5, 10, 30, 60, 120],
+    ),
+    MetricDefinition(
+        name="rice_factor_llm_model_swaps_total",
+        help_text="Models unloaded to make room for another model",
+        metric_type=MetricType.COUNTER,
+        labels=["provider", "model"],
+    ),
+]
+
+
+@dataclass
+class ModelLifecycleStats:
+    """Load and request timings for one model.
+
+    Attributes:
+        loads: Number of cold loads (preloads included).
+        load_seconds: Total time spent loading.
+        requests: Number of generation requests.
+        request_seconds: Total request time, excluding loads.
+        evictions: Number of times the model was unloaded for another.
+    """
+
+    loads: int = 0
+    load_seconds: float = 0.0
+    requests: int = 0
+    request_seconds: float = 0.0
+    evictions: int = 0
+
+    @property
+    def avg_load_seconds(self) -> float:
+        """Average cold load time."""
+        return self.load_seconds / self.loads if self.loads else 0.0
+
+    @property
+    def avg_request_seconds(self) -> float:
+        """Average request time, excluding loads."""
+        return self.request_seconds / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "loads": self.loads,
+            "load_seconds": round(self.load_seconds, 3),
+            "avg_load_seconds": round(self.avg_load_seconds, 3),
+            "requests": self.requests,
+            "request_seconds": round(self.request_seconds, 3),
+            "avg_request_seconds": round(self.avg_request_seconds, 3),
+            "evictions": self.evictions,
+        }
+
+
+class OllamaModelManager:
+    """Keeps the right Ollama models loaded.
+
+    Example:
+        >>> manager = OllamaModelManager(client, max_resident=1)
+        >>> manager.preload(["codestral"])
+        >>> manager.acquire("codestral")
+        >>> manager.release("codestral")
+    """
+
+    def __init__(
+        self,
+        client: OllamaClient,
+        keep_alive: dict[CompilerPassType, KeepAlive] | None = None,
+        default_keep_alive: KeepAlive = DEFAULT_KEEP_ALIVE,
+        max_resident: int = 1,
+        registry: MetricsRegistry | None = None,
+    ) -> None:
+        """Initialize the model manager.
+
+        Args:
+            client: Ollama client used to load and unload models.
+            keep_alive: Keep-alive per pass (merged over the defaults).
+            default_keep_alive: Keep-alive for preloads and unknown passes.
+            max_resident: Models the server can hold at once.
+            registry: Optional metrics registry to export timings to.
+
+        Raises:
+            ValueError: If max_resident is less than 1.
+        """
+        if max_resident < 1:
+            raise ValueError(f"max_resident must be at least 1, got {max_resident}")
+        self._client = client
+        self._keep_alive: dict[CompilerPassType, KeepAlive] = dict(DEFAULT_PASS_KEEP_ALIVE)
+        self._keep_alive.update(keep_alive or {})
+        self._default_keep_alive = default_keep_alive
+        self._max_resident = max_resident
+        self._resident: OrderedDict[str, None] = OrderedDict()
+        self._in_use: dict[str, int] = {}
+        self._stats: dict[str, ModelLifecycleStats] = {}
+        self._lock = threading.Lock()
+        self._registry = registry
+        if registry is not None:
+            for definition in OLLAMA_METRICS:
+                if registry.get_definition(definition.name) is None:
+                    registry.register(definition)
+
+    @property
+    def max_resident(self) -> int:
+        """Get the number of models the server can hold at once."""
+        return self._max_resident
+
+    @property
+    def resident(self) -> list[str]:
+        """Get resident models, least recently used first."""
+        with self._lock:
+            return list(self._resident)
+
+    def keep_alive_for(self, pass_type: CompilerPassType | None) -> KeepAlive:
+        """Get the keep-alive to send with a request for a pass.
+
+        Args:
+            pass_type: The compiler pass, or None for other requests.
+
+        Returns:
+            Ollama keep-alive duration (e.g. "10m", or seconds).
+        """
+        if pass_type is None:
+            return self._default_keep_alive
+        return self._keep_alive.get(pass_type, self._default_keep_alive)
+
+    def preload(self, models: Iterable[str]) -> dict[str, float]:
+        """Load models so the first real request does not wait for them.
+
+        Only the last max_resident models stay resident; loading more
+        than the server can hold would only evict the earlier ones.
+
+        Args:
+            models: Models to load, in order of priority.
+
+        Returns:
+            Load time in seconds per model that was loaded.
+        """
+        unique = list(dict.fromkeys(models))
+        to_load = unique[: self._max_resident]
+        if len(unique) > len(to_load):
+            logger.info(
+                "Preloading %d of %d models (max_resident=%d)",
+                len(to_load),
+                len(unique),
+                self._max_resident,
+            )
+
+        timings: dict[str, float] = {}
+        for model in reversed(to_load):
+            self.acquire(model)
+            try:
+                response = self._client.load_model(
+                    model, keep_alive=self._default_keep_alive
+                )
+            finally:
+                self.release(model)
+            seconds = response.get("load_duration", 0) / _NANOSECONDS_PER_SECOND
+            self._record_load(model, seconds)
+            timings[model] = seconds
+        return timings
+
+    def acquire(self, model: str) -> None:
+        """Mark a model as in use, unloading idle models to make room.
+
+        Every acquire must be paired with a release once the request is
+        done. Models in use are never unloaded: if every resident model is
+        busy, the new one is admitted over max_resident and the excess is
+        unloaded by a later acquire once it is idle.
+
+        Args:
+            model: The model about to be used.
+        """
+        evicted: list[str] = []
+        with self._lock:
+            self._in_use[model] = self._in_use.get(model, 0) + 1
+            if model in self._resident:
+                self._resident.move_to_end(model)
+                return
+            idle = [name for name in self._resident if name not in self._in_use]
+            while idle and len(self._resident) >= self._max_resident:
+                name = idle.pop(0)
+                del self._resident[name]
+                self._stats.setdefault(name, ModelLifecycleStats()).evictions += 1
+                evicted.append(name)
+            self._resident[model] = None
+
+        for name in evicted:
+            logger.debug("Unloading %s to make room for %s", name, model)
+            if self._registry is not None:
+                self._registry.increment(
+                    "rice_factor_llm_model_swaps_total",
+                    labels={"provider": "ollama", "model": name},
+                )
+            try:
+                self._client.unload_model(name)
+            except Exception as e:
+                # The server evicts on its own when memory runs out
+                logger.warning("Failed to unload %s: %s", name, e)
+
+    def release(self, model: str) -> None:
+        """Mark a request for a model as done.
+
+        Args:
+            model: The model passed to acquire.
+        """
+        with self._lock:
+            count = self._in_use.pop(model, 0) - 1
+            if count > 0:
+                self._in_use[model] = count
+
+    def record(
+        self,
+        model: str,
+        response: dict[str, Any],
+        elapsed_seconds: float,
+    ) -> None:
+        """Record the timings of a generation request.
+
+        Args:
+            model: The model that served the request.
+            response: Ollama response (for load_duration).
+            elapsed_seconds: Wall-clock time of the request.
+        """
+        load = response.get("load_duration", 0) / _NANOSECONDS_PER_SECOND
+        cold = load >= COLD_LOAD_SECONDS
+        if cold:
+            self._record_load(model, load)
+        request = max(elapsed_seconds - load, 0.0) if cold else elapsed_seconds
+
+        with self._lock:
+            stats = self._stats.setdefault(model, ModelLifecycleStats())
+            stats.requests += 1
+            stats.request_seconds += request
+        if self._registry is not None:
+            self._registry.observe_histogram(
+                "rice_factor_llm_request_duration_seconds",
+                request,
+                labels={"provider": "ollama", "model": model},
+            )
+
+    def schedule(self, items: Sequence[T], model_of: Callable[[T], str]) -> list[int]:
+        """Order queued requests to minimise model swaps.
+
+        Requests are grouped by model, keeping their order within a group.
+        Groups for resident models run first, most recently used first, so
+        the model already in memory is drained before another is loaded.
+
+        Args:
+            items: Queued requests.
+            model_of: Returns the model a request needs.
+
+        Returns:
+            Indices into items in execution order.
+        """
+        groups: dict[str, list[int]] = {}
+        for index, item in enumerate(items):
+            groups.setdefault(model_of(item), []).append(index)
+
+        with self._lock:
+            recent = list(reversed(self._resident))
+        order = [model for model in recent if model in groups]
+        order.extend(model for model in groups if model not in order)
+        return [index for model in order for index in groups[model]]
+
+    def get_stats(self, model: str) -> ModelLifecycleStats:
+        """Get a copy of the timings for a model."""
+        with self._lock:
+            stats = self._stats.get(model, ModelLifecycleStats())
+            return ModelLifecycleStats(**vars(stats))
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Get timings for every model."""
+        with self._lock:
+            return {model: stats.to_dict() for model, stats in self._stats.items()}
+
+    def _record_load(self, model: str, seconds: float) -> None:
+        """Record a cold model load."""
+        with self._lock:
+            stats = self._stats.setdefault(model, ModelLifecycleStats())
+            stats.loads += 1
+            stats.load_seconds += seconds
+        if self._registry is not None:
+            self._registry.observe_histogram(
+                "rice_factor_llm_model_load_seconds",
+                seconds,
+                labels={"provider": "ollama", "model": model},
+            )
@@ -20,7 +20,12 @@ from rice_factor.domain.failures.llm_errors import (
     LLMRateLimitError,
     LLMTimeoutError,
 )
-from rice_factor.domain.prompts import PromptManager
+from rice_factor.domain.prompts import (
+    PromptManager,
+    SchemaRenderMode,
+    render_schema,
+    schema_fence_language,
+)
 from rice_factor.domain.services.json_extractor import JSONExtractor
 
 
@@ -57,6 +62,7 @@ class OpenAIAdapter:
         max_retries: int = 3,
         azure_endpoint: str | None = None,
         azure_api_version: str | None = None,
+        schema_mode: SchemaRenderMode = SchemaRenderMode.COMPACT,
     ) -> None:
         """Initialize the OpenAI adapter.
 
@@ -70,6 +76,7 @@ class OpenAIAdapter:
             max_retries: Maximum retry attempts.
             azure_endpoint: Azure OpenAI endpoint URL (optional).
             azure_api_version: Azure OpenAI API version (optional).
+            schema_mode: How the output schema is rendered into the prompt.
         """
         self._model = model
         self._max_tokens = max_tokens
@@ -86,7 +93,8 @@ class OpenAIAdapter:
             azure_endpoint=azure_endpoint,
             azure_api_version=azure_api_version,
         )
-        self._prompt_manager = PromptManager()
+        self._schema_mode = schema_mode
+        self._prompt_manager = PromptManager(schema_mode=schema_mode)
         self._json_extractor = JSONExtractor()
 
     @property
@@ -125,11 +133,51 @@ class OpenAIAdapter:
         Returns:
             CompilerResult with success status and payload or error.
         """
-        try:
-            # Build messages
-            messages = self._build_messages(pass_type, context, schema)
-            system_prompt = self._prompt_manager.get_system_prompt(pass_type)
+        messages = self._build_messages(pass_type, context, schema)
+        system_prompt = self._prompt_manager.get_system_prompt(pass_type)
+        return self._complete(messages, system_prompt)
+
+    def repair(
+        self,
+        pass_type: CompilerPassType,  # noqa: ARG002
+        request: CompilerContext,
+        schema: dict[str, object],
+    ) -> CompilerResult:
+        """Patch invalid sub-trees of an artifact using OpenAI.
+
+        Sends only the repair system prompt and the patch schema, not the
+        pass prompt or the artifact schema.
+
+        Args:
+            pass_type: The pass that produced the invalid artifact.
+            request: Repair context built by the OutputRepairer.
+            schema: JSON Schema of the expected patch object.
 
+        Returns:
+            CompilerResult with the patch on success or error details on failure.
+        """
+        messages = [
+            {
+                "role": "user",
+                "content": self._prompt_manager.get_repair_prompt(request, schema),
+            }
+        ]
+        system_prompt = self._prompt_manager.get_repair_system_prompt()
+        return self._complete(messages, system_prompt)
+
+    def _complete(
+        self, messages: list[dict[str, Any]], system_prompt: str
+    ) -> CompilerResult:
+        """Send a JSON-mode chat completion and parse the payload.
+
+        Args:
+            messages: User messages for the API.
+            system_prompt: System prompt sent before the messages.
+
+        Returns:
+            CompilerResult with success status and payload or error.
+        """
+        try:
             # Call OpenAI API with JSON mode
             response = self._client.create_chat_completion(
                 model=self._model,
@@ -219,8 +267,9 @@ class OpenAIAdapter:
         content_parts = []
 
         # Add schema
-        schema_json = json.dumps(schema, indent=2)
-        content_parts.append(f"OUTPUT SCHEMA:\n```json\n{schema_json}\n```")
+        schema_text = render_schema(schema, self._schema_mode)
+        fence = schema_fence_language(self._schema_mode)
+        content_parts.append(f"OUTPUT SCHEMA:\n```{fence}\n{schema_text}\n```")
 
         # Add project files
         if context.project_files:
@@ -316,4 +365,5 @@ def create_openai_adapter_from_config() -> OpenAIAdapter:
         max_retries=settings.get("llm.max_retries", 3),
         azure_endpoint=settings.get("azure.openai_endpoint", None),
         azure_api_version=settings.get("azure.openai_api_version", None),
+        schema_mode=SchemaRenderMode(settings.get("llm.schema_mode", "compact")),
     )
@@ -13,8 +13,15 @@ Supports:
 from __future__ import annotations
 
 import json
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
+from rice_factor.adapters.llm.batching import (
+    DEFAULT_MAX_IN_FLIGHT,
+    BatchGenerationResult,
+    run_in_flight,
+    split_choices,
+)
 from rice_factor.domain.artifacts.compiler_types import (
     CompilerContext,
     CompilerPassType,
@@ -25,11 +32,21 @@ from rice_factor.domain.failures.llm_errors import (
     LLMError,
     LLMTimeoutError,
 )
-from rice_factor.domain.prompts import PromptManager
+from rice_factor.domain.prompts import (
+    PromptManager,
+    SchemaRenderMode,
+    render_schema,
+    schema_fence_language,
+)
 from rice_factor.domain.services.json_extractor import JSONExtractor
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Sequence
+
+    import httpx
+    import requests
+
+    from rice_factor.adapters.llm.batching import GenerationRequest
 
 
 class OpenAICompatClientError(Exception):
@@ -45,24 +62,28 @@ KNOWN_PROVIDERS = {
         "default_model": "gpt-3.5-turbo",
         "supports_chat": True,
         "supports_completions": True,
+        "supports_prompt_lists": False,
     },
     "lmstudio": {
         "default_url": "http://localhost:1234/v1",
         "default_model": "local-model",
         "supports_chat": True,
         "supports_completions": True,
+        "supports_prompt_lists": False,
     },
     "tgi": {
         "default_url": "http://localhost:8080/v1",
         "default_model": "tgi",
         "supports_chat": True,
         "supports_completions": False,
+        "supports_prompt_lists": False,
     },
     "generic": {
         "default_url": "http://localhost:8000/v1",
         "default_model": "default",
         "supports_chat": True,
         "supports_completions": True,
+        "supports_prompt_lists": True,
     },
 }
 
@@ -126,6 +147,13 @@ class OpenAICompatClient:
         """Check if this provider supports the completions API."""
         return bool(self._provider_config.get("supports_completions", True))
 
+    @property
+    def supports_prompt_lists(self) -> bool:
+        """Check if the completions API accepts a list of prompts."""
+        return self.supports_completions and bool(
+            self._provider_config.get("supports_prompt_lists", False)
+        )
+
     def generate(
         self,
         model: str,
@@ -206,20 +234,129 @@ class OpenAICompatClient:
         else:
             return self._post_requests("/chat/completions", payload)
 
-    def _post_httpx(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any]:
-        """POST using httpx."""
+    def generate_batch(
+        self,
+        model: str,
+        prompts: Sequence[str],
+        temperature: float = 0.1,
+        max_tokens: int = 4096,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        use_chat: bool | None = None,
+        multi_prompt: bool = False,
+    ) -> list[BatchGenerationResult]:
+        """Generate completions for several prompts at once.
+
+        By default the prompts are sent as concurrent requests over one
+        connection pool, at most max_in_flight at a time. With
+        multi_prompt, and a provider whose completions API accepts a
+        prompt list, they are sent as a single request instead; that
+        saves round-trips, but a failed request fails every prompt.
+
+        Args:
+            model: Model name.
+            prompts: The prompts to send.
+            temperature: Temperature for generation.
+            max_tokens: Maximum tokens to generate per prompt.
+            max_in_flight: Maximum concurrent requests.
+            use_chat: Force chat or completion API. Auto-selects if None.
+            multi_prompt: Send all prompts in one completions request.
+
+        Returns:
+            One result per prompt, in prompt order, each holding either
+            the response (in single-prompt format) or the error.
+        """
+        if not prompts:
+            return []
+        if use_chat is None:
+            use_chat = self.supports_chat
+
+        payload: dict[str, Any]
+        if multi_prompt and self.supports_prompt_lists:
+            payload = {
+                "model": model,
+                "prompt": list(prompts),
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": False,
+            }
+            try:
+                if self._httpx_available:
+                    response = self._post_httpx("/completions", payload)
+                else:
+                    response = self._post_requests("/completions", payload)
+            except Exception as e:
+                return [
+                    BatchGenerationResult(index=i, error=e) for i in range(len(prompts))
+                ]
+            return split_choices(response, len(prompts))
+
+        endpoint = "/chat/completions" if use_chat else "/completions"
+        payloads: list[dict[str, Any]] = []
+        for prompt in prompts:
+            payload = {
+                "model": model,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": False,
+            }
+            if use_chat:
+                payload["messages"] = [{"role": "user", "content": prompt}]
+            else:
+                payload["prompt"] = prompt
+            payloads.append(payload)
+
+        if self._httpx_available:
+            import httpx
+
+            limits = httpx.Limits(max_connections=max_in_flight)
+            with httpx.Client(timeout=self.timeout, limits=limits) as client:
+                return run_in_flight(
+                    [
+                        partial(self._post_httpx, endpoint, payload, client)
+                        for payload in payloads
+                    ],
+                    max_in_flight,
+                )
+
+        try:
+            import requests
+        except ImportError:
+            # Every prompt reports the missing-dependency error
+            return run_in_flight(
+                [partial(self._post_requests, endpoint, p) for p in payloads],
+                max_in_flight,
+            )
+        with requests.Session() as session:
+            return run_in_flight(
+                [
+                    partial(self._post_requests, endpoint, payload, session)
+                    for payload in payloads
+                ],
+                max_in_flight,
+            )
+
+    def _post_httpx(
+        self,
+        endpoint: str,
+        payload: dict[str, Any],
+        client: httpx.Client | None = None,
+    ) -> dict[str, Any]:
+        """POST using httpx, on a shared client if one is given."""
         import httpx
 
+        if client is None:
+            with httpx.Client(timeout=self.timeout) as own_client:
+                return self._post_httpx(endpoint, payload, own_client)
+
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    f"{self.base_url}{endpoint}",
-                    headers=self._get_headers(),
-                    json=payload,
-                )
-                response.raise_for_status()
-                result: dict[str, Any] = response.json()
-                return result
+            response = client.post(
+                f"{self.base_url}{endpoint}",
+                headers=self._get_headers(),
+                json=payload,
+            )
+            response.raise_for_status()
+            result: dict[str, Any] = response.json()
+            return result
         except httpx.TimeoutException as e:
             raise LLMTimeoutError(f"Request timed out: {e}") from e
         except httpx.HTTPStatusError as e:
@@ -227,8 +364,13 @@ class OpenAICompatClient:
         except httpx.RequestError as e:
             raise OpenAICompatClientError(f"Request failed: {e}") from e
 
-    def _post_requests(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any]:
-        """POST using requests (fallback)."""
+    def _post_requests(
+        self,
+        endpoint: str,
+        payload: dict[str, Any],
+        session: requests.Session | None = None,
+    ) -> dict[str, Any]:
+        """POST using requests (fallback), on a shared session if given."""
         try:
             import requests
         except ImportError as e:
@@ -238,7 +380,7 @@ class OpenAICompatClient:
             ) from e
 
         try:
-            response = requests.post(
+            response = (session or requests).post(
                 f"{self.base_url}{endpoint}",
                 headers=self._get_headers(),
                 json=payload,
@@ -469,6 +611,9 @@ class OpenAICompatAdapter:
     Enforces determinism controls:
     - Temperature: 0.0-0.2
 
+    generate_batch() sends many requests at once so the server can batch
+    them instead of serving one round-trip at a time.
+
     Attributes:
         model: The model to use.
         max_tokens: Maximum tokens per response.
@@ -489,6 +634,9 @@ class OpenAICompatAdapter:
         temperature: float = 0.0,
         timeout: float = 120.0,
         provider: str = "generic",
+        schema_mode: SchemaRenderMode = SchemaRenderMode.COMPACT,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        multi_prompt: bool = False,
     ) -> None:
         """Initialize the OpenAI-compatible adapter.
 
@@ -500,6 +648,10 @@ class OpenAICompatAdapter:
             temperature: Temperature for generation (capped at 0.2).
             timeout: Request timeout in seconds.
             provider: Provider type hint (localai, lmstudio, tgi, generic).
+            schema_mode: How the output schema is rendered into the prompt.
+            max_in_flight: Maximum concurrent requests in generate_batch().
+            multi_prompt: Send batches as one multi-prompt request when the
+                provider supports it.
         """
         provider_config = KNOWN_PROVIDERS.get(provider.lower(), KNOWN_PROVIDERS["generic"])
         self._model = model or str(provider_config.get("default_model", "default"))
@@ -507,6 +659,8 @@ class OpenAICompatAdapter:
         self._temperature = min(temperature, self.MAX_TEMPERATURE)
         self._timeout = timeout
         self._provider = provider
+        self._max_in_flight = max_in_flight
+        self._multi_prompt = multi_prompt
 
         self._client = OpenAICompatClient(
             base_url=base_url,
@@ -514,7 +668,8 @@ class OpenAICompatAdapter:
             timeout=timeout,
             provider=provider,
         )
-        self._prompt_manager = PromptManager()
+        self._schema_mode = schema_mode
+        self._prompt_manager = PromptManager(schema_mode=schema_mode)
         self._json_extractor = JSONExtractor()
 
     @property
@@ -553,16 +708,41 @@ class OpenAICompatAdapter:
         Returns:
             CompilerResult with payload on success or error details on failure.
         """
-        try:
-            # Build prompt
-            user_prompt = self._build_prompt(pass_type, context, schema)
+        return self._complete(self._build_full_prompt(pass_type, context, schema))
+
+    def repair(
+        self,
+        pass_type: CompilerPassType,  # noqa: ARG002
+        request: CompilerContext,
+        schema: dict[str, object],
+    ) -> CompilerResult:
+        """Patch invalid sub-trees of an artifact using the OpenAI-compatible API.
+
+        Sends only the repair system prompt and the patch schema, not the
+        pass prompt or the artifact schema.
+
+        Args:
+            pass_type: The pass that produced the invalid artifact.
+            request: Repair context built by the OutputRepairer.
+            schema: JSON Schema of the expected patch object.
 
-            # Get system prompt
-            system_prompt = self._prompt_manager.get_system_prompt(pass_type)
+        Returns:
+            CompilerResult with the patch on success or error details on failure.
+        """
+        user_prompt = self._prompt_manager.get_repair_prompt(request, schema)
+        system_prompt = self._prompt_manager.get_repair_system_prompt()
+        return self._complete(f"{system_prompt}\n\n{user_prompt}")
 
-            # Combine prompts
-            full_prompt = f"{system_prompt}\n\n{user_prompt}"
+    def _complete(self, full_prompt: str) -> CompilerResult:
+        """Send a combined prompt and parse the JSON payload.
+
+        Args:
+            full_prompt: Combined system and user prompt.
 
+        Returns:
+            CompilerResult with payload on success or error details on failure.
+        """
+        try:
             # Call API
             response = self._client.generate(
                 model=self._model,
@@ -570,7 +750,76 @@ class OpenAICompatAdapter:
                 temperature=self._temperature,
                 max_tokens=self._max_tokens,
             )
+            return self._parse_response(response)
+
+        except LLMTimeoutError:
+            raise
+
+        except LLMAPIError:
+            raise
+
+        except Exception as e:
+            return self._error_result(e)
 
+    def generate_batch(
+        self, requests: Sequence[GenerationRequest]
+    ) -> list[CompilerResult]:
+        """Generate several artifacts with concurrent requests.
+
+        Args:
+            requests: (pass_type, context, schema) per artifact.
+
+        Returns:
+            One CompilerResult per request, in request order. A failed
+            request (including a timeout) becomes a failed result instead
+            of aborting the batch.
+        """
+        results: list[CompilerResult | None] = [None] * len(requests)
+        prompts: list[str] = []
+        positions: list[int] = []
+        for index, (pass_type, context, schema) in enumerate(requests):
+            try:
+                prompts.append(self._build_full_prompt(pass_type, context, schema))
+                positions.append(index)
+            except Exception as e:
+                results[index] = self._error_result(e)
+
+        generations = self._client.generate_batch(
+            model=self._model,
+            prompts=prompts,
+            temperature=self._temperature,
+            max_tokens=self._max_tokens,
+            max_in_flight=self._max_in_flight,
+            multi_prompt=self._multi_prompt,
+        )
+        for index, generation in zip(positions, generations, strict=True):
+            if generation.error is not None:
+                results[index] = self._error_result(generation.error)
+            else:
+                results[index] = self._parse_response(generation.response or {})
+        return [result for result in results if result is not None]
+
+    def _build_full_prompt(
+        self,
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        schema: dict[str, object],
+    ) -> str:
+        """Build the combined system and user prompt."""
+        user_prompt = self._build_prompt(pass_type, context, schema)
+        system_prompt = self._prompt_manager.get_system_prompt(pass_type)
+        return f"{system_prompt}\n\n{user_prompt}"
+
+    def _parse_response(self, response: dict[str, Any]) -> CompilerResult:
+        """Turn an API response into a CompilerResult.
+
+        Args:
+            response: The API response dict.
+
+        Returns:
+            CompilerResult with the parsed payload or error details.
+        """
+        try:
             # Extract response text
             response_text = self._extract_response_text(response)
 
@@ -590,39 +839,35 @@ class OpenAICompatAdapter:
 
             return CompilerResult(success=True, payload=payload)
 
-        except LLMTimeoutError:
-            raise
-
-        except LLMAPIError:
-            raise
+        except Exception as e:
+            return self._error_result(e)
 
-        except json.JSONDecodeError as e:
+    @staticmethod
+    def _error_result(error: Exception) -> CompilerResult:
+        """Convert an exception into a failed CompilerResult."""
+        if isinstance(error, json.JSONDecodeError):
             return CompilerResult(
                 success=False,
                 error_type="invalid_json",
-                error_details=f"Failed to parse JSON from response: {e}",
+                error_details=f"Failed to parse JSON from response: {error}",
             )
-
-        except LLMError as e:
+        if isinstance(error, LLMError):
             return CompilerResult(
                 success=False,
-                error_type=e.__class__.__name__,
-                error_details=str(e),
+                error_type=error.__class__.__name__,
+                error_details=str(error),
             )
-
-        except OpenAICompatClientError as e:
+        if isinstance(error, OpenAICompatClientError):
             return CompilerResult(
                 success=False,
                 error_type="client_error",
-                error_details=str(e),
-            )
-
-        except Exception as e:
-            return CompilerResult(
-                success=False,
-                error_type="unexpected_error",
-                error_details=f"Unexpected error: {e}",
+                error_details=str(error),
             )
+        return CompilerResult(
+            success=False,
+            error_type="unexpected_error",
+            error_details=f"Unexpected error: {error}",
+        )
 
     def _build_prompt(
         self,
@@ -644,9 +889,10 @@ class OpenAICompatAdapter:
             pass_type, context, include_schema=True
         )
 
-        schema_json = json.dumps(schema, indent=2)
         if "JSON SCHEMA" not in user_prompt:
-            user_prompt += f"\n\n## Required Output Schema\n\n```json\n{schema_json}\n```"
+            schema_text = render_schema(schema, self._schema_mode)
+            fence = schema_fence_language(self._schema_mode)
+            user_prompt += f"\n\n## Required Output Schema\n\n```{fence}\n{schema_text}\n```"
 
         return user_prompt
 
@@ -721,4 +967,9 @@ def create_openai_compat_adapter_from_config() -> OpenAICompatAdapter:
         temperature=settings.get("llm.openai_compat.temperature", 0.0),
         timeout=settings.get("llm.openai_compat.timeout", 120.0),
         provider=settings.get("llm.openai_compat.provider", "generic"),
+        schema_mode=SchemaRenderMode(settings.get("llm.schema_mode", "compact")),
+        max_in_flight=settings.get(
+            "llm.openai_compat.max_in_flight", DEFAULT_MAX_IN_FLIGHT
+        ),
+        multi_prompt=settings.get("llm.openai_compat.multi_prompt", False),
     )
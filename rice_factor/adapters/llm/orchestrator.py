@@ -7,13 +7,22 @@ appropriate mode based on task type and availability.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from rice_factor.adapters.llm.cli.availability_cache import AgentProbe
+from rice_factor.adapters.llm.cli.workspace import IsolatedWorkspace, WorkspaceError
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rice_factor.adapters.llm.cli.availability_cache import (
+        AgentAvailabilityCache,
+    )
     from rice_factor.adapters.llm.cli.base import CLIAgentPort, CLITaskResult
     from rice_factor.adapters.llm.provider_selector import (
         ProviderSelector,
@@ -27,6 +36,7 @@ class OrchestrationMode(Enum):
     API = "api"  # Use REST API providers only
     CLI = "cli"  # Use CLI agents only
     AUTO = "auto"  # Select based on task type
+    RACE = "race"  # Run top CLI agents concurrently, keep the first good result
 
 
 # Tasks that benefit from CLI agents (complex, multi-file, interactive)
@@ -48,6 +58,9 @@ API_PREFERRED_TASKS: set[str] = {
     "simple_fix",
 }
 
+# Cost units charged per racing agent when no estimate is configured
+DEFAULT_RACE_AGENT_COST = 1.0
+
 
 class NoAgentAvailableError(Exception):
     """Raised when no CLI agent is available for a task."""
@@ -105,6 +118,12 @@ class UnifiedOrchestrator:
         default_mode: Default orchestration mode.
         fallback_to_cli: Whether to fall back to CLI on API failure.
         fallback_to_api: Whether to fall back to API on CLI failure.
+        availability_cache: Optional probe cache for agent availability.
+        race_max_agents: Maximum number of agents racing in RACE mode.
+        race_cost_cap: Per-task cost budget for RACE mode (None = no cap).
+        race_agent_costs: Estimated cost of one run per agent name.
+        race_validator: Optional check a racing result must pass, called
+            with the result and the workspace it was produced in.
     """
 
     api_selector: ProviderSelector | None = None
@@ -112,6 +131,11 @@ class UnifiedOrchestrator:
     default_mode: OrchestrationMode = OrchestrationMode.AUTO
     fallback_to_cli: bool = True
     fallback_to_api: bool = True
+    availability_cache: AgentAvailabilityCache | None = None
+    race_max_agents: int = 2
+    race_cost_cap: float | None = None
+    race_agent_costs: dict[str, float] = field(default_factory=dict)
+    race_validator: Callable[[CLITaskResult, Path], bool] | None = None
 
     @classmethod
     def from_agents_list(
@@ -121,6 +145,8 @@ class UnifiedOrchestrator:
         default_mode: OrchestrationMode = OrchestrationMode.AUTO,
         fallback_to_cli: bool = True,
         fallback_to_api: bool = True,
+        availability_cache: AgentAvailabilityCache | None = None,
+        **race_options: Any,
     ) -> UnifiedOrchestrator:
         """Create orchestrator from a list of CLI agents.
 
@@ -130,6 +156,9 @@ class UnifiedOrchestrator:
             default_mode: Default orchestration mode.
             fallback_to_cli: Fall back to CLI on API failure.
             fallback_to_api: Fall back to API on CLI failure.
+            availability_cache: Optional probe cache for agent availability.
+            **race_options: RACE mode settings (race_max_agents,
+                race_cost_cap, race_agent_costs, race_validator).
 
         Returns:
             Configured UnifiedOrchestrator.
@@ -141,6 +170,8 @@ class UnifiedOrchestrator:
             default_mode=default_mode,
             fallback_to_cli=fallback_to_cli,
             fallback_to_api=fallback_to_api,
+            availability_cache=availability_cache,
+            **race_options,
         )
 
     async def execute(
@@ -170,6 +201,8 @@ class UnifiedOrchestrator:
 
         if mode == OrchestrationMode.API:
             return await self._execute_api(prompt, task_type, working_dir, **kwargs)
+        elif mode == OrchestrationMode.RACE:
+            return await self._execute_race(prompt, task_type, working_dir, **kwargs)
         else:
             return await self._execute_cli(prompt, task_type, working_dir, **kwargs)
 
@@ -288,9 +321,7 @@ class UnifiedOrchestrator:
         errors: list[str] = []
         for agent in available_agents:
             # Check if agent supports the task type
-            if task_type not in agent.get_capabilities() and task_type not in {
-                "code_generation"
-            }:
+            if not self._supports_task(agent, task_type):
                 continue
 
             try:
@@ -325,21 +356,270 @@ class UnifiedOrchestrator:
             metadata={"errors": errors},
         )
 
+    async def _execute_race(
+        self,
+        prompt: str,
+        task_type: str,
+        working_dir: Path | None,
+        **kwargs: Any,
+    ) -> OrchestrationResult:
+        """Race the top CLI agents in isolated workspaces.
+
+        Each racing agent works on its own copy of the working tree. The
+        first successful result that passes race_validator wins: its
+        changes are applied to working_dir, and the other agents are
+        cancelled, which kills their subprocesses.
+
+        Args:
+            prompt: Task prompt.
+            task_type: Task type.
+            working_dir: Working directory.
+            **kwargs: Additional arguments; cost_cap overrides race_cost_cap
+                and timeout_seconds bounds each agent.
+
+        Returns:
+            OrchestrationResult.
+        """
+        if not working_dir:
+            working_dir = Path.cwd()
+
+        candidates = [
+            agent
+            for agent in await self._get_available_agents()
+            if self._supports_task(agent, task_type)
+        ]
+        racers = self._select_racers(candidates, kwargs.pop("cost_cap", self.race_cost_cap))
+
+        if not racers:
+            if self.fallback_to_api:
+                return await self._execute_api(prompt, task_type, working_dir, **kwargs)
+            return OrchestrationResult(
+                success=False,
+                mode=OrchestrationMode.RACE,
+                metadata={"error": "No CLI agents available"},
+            )
+
+        timeout = kwargs.pop("timeout_seconds", None) or 300.0
+        racer_names = [agent.name for agent in racers]
+        errors: list[str] = []
+
+        # Created one at a time: concurrent `git worktree add` calls contend
+        # for the repository's lock files
+        workspaces: list[IsolatedWorkspace] = []
+        try:
+            for agent in racers:
+                workspaces.append(
+                    await asyncio.to_thread(
+                        IsolatedWorkspace.create, working_dir, agent.name
+                    )
+                )
+        except WorkspaceError as e:
+            await asyncio.gather(*(asyncio.to_thread(ws.cleanup) for ws in workspaces))
+            return OrchestrationResult(
+                success=False,
+                mode=OrchestrationMode.RACE,
+                metadata={"error": str(e), "racers": racer_names},
+            )
+
+        tasks = {
+            asyncio.create_task(self._run_racer(agent, workspace, prompt, timeout)): (
+                agent,
+                workspace,
+            )
+            for agent, workspace in zip(racers, workspaces, strict=True)
+        }
+        winner: tuple[CLIAgentPort, IsolatedWorkspace, CLITaskResult] | None = None
+        applied: list[str] = []
+
+        try:
+            pending = set(tasks)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    agent, workspace = tasks[task]
+                    exc = task.exception()
+                    if exc is not None:
+                        errors.append(f"{agent.name}: {type(exc).__name__}: {exc}")
+                        continue
+                    cli_result, valid = task.result()
+                    if not cli_result.success:
+                        errors.append(f"{agent.name}: {cli_result.error}")
+                    elif not valid:
+                        errors.append(f"{agent.name}: result failed validation")
+                    elif winner is None:
+                        winner = (agent, workspace, cli_result)
+
+            # Stop the losers before touching the source tree
+            await self._cancel_racers(tasks)
+            if winner is not None:
+                try:
+                    applied = await asyncio.to_thread(winner[1].apply_to_source)
+                except WorkspaceError as e:
+                    errors.append(f"{winner[0].name}: {e}")
+                    winner = None
+        finally:
+            await self._cancel_racers(tasks)
+            await asyncio.gather(*(asyncio.to_thread(ws.cleanup) for ws in workspaces))
+
+        if winner is not None:
+            agent, _, cli_result = winner
+            return OrchestrationResult(
+                success=True,
+                mode=OrchestrationMode.RACE,
+                cli_result=cli_result,
+                provider_name=agent.name,
+                duration_seconds=cli_result.duration_seconds,
+                metadata={
+                    "racers": racer_names,
+                    "applied_files": applied,
+                    "errors": errors,
+                },
+            )
+
+        if self.fallback_to_api:
+            return await self._execute_api(prompt, task_type, working_dir, **kwargs)
+
+        return OrchestrationResult(
+            success=False,
+            mode=OrchestrationMode.RACE,
+            metadata={"racers": racer_names, "errors": errors},
+        )
+
+    async def _run_racer(
+        self,
+        agent: CLIAgentPort,
+        workspace: IsolatedWorkspace,
+        prompt: str,
+        timeout: float,
+    ) -> tuple[CLITaskResult, bool]:
+        """Run one racing agent and validate its result.
+
+        Args:
+            agent: CLI agent to run.
+            workspace: The agent's isolated workspace.
+            prompt: Task prompt.
+            timeout: Timeout for the agent.
+
+        Returns:
+            Tuple of (result, passed validation).
+        """
+        cli_result = await agent.execute_task(
+            prompt=prompt,
+            working_dir=workspace.path,
+            timeout_seconds=timeout,
+        )
+        if not cli_result.success or self.race_validator is None:
+            return cli_result, cli_result.success
+        valid = await asyncio.to_thread(self.race_validator, cli_result, workspace.path)
+        return cli_result, valid
+
+    @staticmethod
+    async def _cancel_racers(tasks: dict[asyncio.Task[Any], Any]) -> None:
+        """Cancel racing tasks and wait for their subprocesses to die."""
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _select_racers(
+        self,
+        candidates: list[CLIAgentPort],
+        cost_cap: float | None,
+    ) -> list[CLIAgentPort]:
+        """Pick the agents to race, in priority order.
+
+        The top agent always runs; others join while race_max_agents and the
+        cost cap allow.
+
+        Args:
+            candidates: Capable, available agents sorted by priority.
+            cost_cap: Maximum summed cost of racing agents (None = no cap).
+
+        Returns:
+            Agents to race.
+        """
+        racers: list[CLIAgentPort] = []
+        spent = 0.0
+        for agent in candidates:
+            if len(racers) >= max(1, self.race_max_agents):
+                break
+            cost = self.race_agent_costs.get(agent.name, DEFAULT_RACE_AGENT_COST)
+            if racers and cost_cap is not None and spent + cost > cost_cap:
+                break
+            racers.append(agent)
+            spent += cost
+        return racers
+
+    @staticmethod
+    def _supports_task(agent: CLIAgentPort, task_type: str) -> bool:
+        """Check whether an agent can take a task type."""
+        return task_type in agent.get_capabilities() or task_type == "code_generation"
+
     async def _get_available_agents(self) -> list[CLIAgentPort]:
         """Get available CLI agents sorted by priority.
 
+        All agents are probed concurrently.
+
         Returns:
             List of available agents.
         """
-        available: list[CLIAgentPort] = []
-
-        for agent in self.cli_agents.values():
-            if await agent.is_available():
-                available.append(agent)
+        agents = list(self.cli_agents.values())
+        results = await asyncio.gather(
+            *(self._is_agent_available(agent) for agent in agents)
+        )
+        available = [agent for agent, ok in zip(agents, results, strict=True) if ok]
 
         # Sort by priority (lower = higher priority)
         return sorted(available, key=lambda a: a.priority)
 
+    async def _is_agent_available(self, agent: CLIAgentPort) -> bool:
+        """Check agent availability, consulting the probe cache first.
+
+        A stale cache entry is still used, and refreshed in the background.
+
+        Args:
+            agent: CLI agent to check.
+
+        Returns:
+            True if the agent is available.
+        """
+        cache = self.availability_cache
+        if cache is None:
+            return await agent.is_available()
+
+        cached = cache.get(agent.name, agent.command)
+        if cached is not None:
+            if not cache.is_fresh(cached):
+                cache.refresh_in_background(
+                    agent.name,
+                    lambda: self._probe_agent(agent, asyncio.run(agent.is_available())),
+                )
+            return cached.available
+
+        available = await agent.is_available()
+        cache.put(self._probe_agent(agent, available))
+        return available
+
+    def _probe_agent(self, agent: CLIAgentPort, available: bool) -> AgentProbe:
+        """Build a cache entry for an agent, keeping any known version.
+
+        Args:
+            agent: CLI agent that was probed.
+            available: Probed availability.
+
+        Returns:
+            AgentProbe for the cache.
+        """
+        probe = AgentProbe.for_command(agent.name, agent.command, available=available)
+        previous = None
+        if self.availability_cache is not None:
+            previous = self.availability_cache.get(agent.name, agent.command)
+        if previous is not None and previous.version_checked:
+            probe.version = previous.version
+            probe.version_checked = True
+        return probe
+
     def _select_mode(self, task_type: str) -> OrchestrationMode:
         """Select mode based on task type.
 
@@ -397,9 +677,11 @@ class UnifiedOrchestrator:
         """
         api_available = self.api_selector is not None
 
-        cli_status: dict[str, bool] = {}
-        for name, agent in self.cli_agents.items():
-            cli_status[name] = await agent.is_available()
+        names = list(self.cli_agents)
+        results = await asyncio.gather(
+            *(self._is_agent_available(self.cli_agents[name]) for name in names)
+        )
+        cli_status: dict[str, bool] = dict(zip(names, results, strict=True))
 
         return {
             "api_available": api_available,
@@ -417,6 +699,7 @@ def create_orchestrator_from_config() -> UnifiedOrchestrator:
         Configured UnifiedOrchestrator instance.
     """
     from rice_factor.adapters.llm.cli import (
+        create_agent_cache_from_config,
         create_aider_adapter_from_config,
         create_claude_code_adapter_from_config,
         create_codex_adapter_from_config,
@@ -457,6 +740,7 @@ def create_orchestrator_from_config() -> UnifiedOrchestrator:
         "api": OrchestrationMode.API,
         "cli": OrchestrationMode.CLI,
         "auto": OrchestrationMode.AUTO,
+        "race": OrchestrationMode.RACE,
     }
     default_mode = mode_map.get(mode_str, OrchestrationMode.AUTO)
 
@@ -466,4 +750,8 @@ def create_orchestrator_from_config() -> UnifiedOrchestrator:
         default_mode=default_mode,
         fallback_to_cli=settings.get("orchestration.fallback_to_cli", True),
         fallback_to_api=settings.get("orchestration.fallback_to_api", True),
+        availability_cache=create_agent_cache_from_config(),
+        race_max_agents=int(settings.get("orchestration.race.max_agents", 2)),
+        race_cost_cap=settings.get("orchestration.race.cost_cap", None),
+        race_agent_costs=dict(settings.get("orchestration.race.agent_costs", None) or {}),
     )
@@ -3,25 +3,43 @@
 This module provides the ProviderSelector class that implements intelligent
 provider selection with automatic fallback when providers fail.
 
-Supports three selection strategies:
+Supports four selection strategies:
 - PRIORITY: Always try highest priority provider first
 - ROUND_ROBIN: Distribute load across providers
 - COST_BASED: Select cheapest available provider
+- PROMPT_FIT: Select the cheapest, fastest provider whose model's context
+  window fits the prompt
 """
 
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
+import copy
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from rice_factor.adapters.llm.single_flight import SingleFlight, request_key
+
 if TYPE_CHECKING:
     from rice_factor.domain.artifacts.compiler_types import (
         CompilerContext,
         CompilerPassType,
         CompilerResult,
     )
+    from rice_factor.domain.prompts import PromptManager
+    from rice_factor.domain.services.model_registry import ModelInfo, ModelRegistry
+
+# Estimates prompt tokens for a request (pass type, context, schema)
+TokenEstimator = Callable[
+    ["CompilerPassType", "CompilerContext", dict[str, object]], int
+]
+
+# Weight of the newest sample in the per-provider latency average
+LATENCY_SMOOTHING = 0.3
 
 
 class SelectionStrategy(Enum):
@@ -30,6 +48,7 @@ class SelectionStrategy(Enum):
     PRIORITY = "priority"
     ROUND_ROBIN = "round_robin"
     COST_BASED = "cost_based"
+    PROMPT_FIT = "prompt_fit"
 
 
 class AllProvidersFailedError(Exception):
@@ -46,6 +65,23 @@ class AllProvidersFailedError(Exception):
         super().__init__(message)
 
 
+class ContextOverflowError(AllProvidersFailedError):
+    """Exception raised when no provider's context window fits the prompt.
+
+    Raised by the PROMPT_FIT strategy before any request is sent.
+    """
+
+    def __init__(self, errors: list[str], estimated_tokens: int) -> None:
+        """Initialize with the per-provider reasons and the prompt size.
+
+        Args:
+            errors: Why each provider was ruled out.
+            estimated_tokens: Estimated input tokens of the prompt.
+        """
+        self.estimated_tokens = estimated_tokens
+        super().__init__(errors)
+
+
 @dataclass
 class ProviderConfig:
     """Configuration for a single LLM provider in the fallback chain.
@@ -57,6 +93,12 @@ class ProviderConfig:
         enabled: Whether this provider is currently enabled.
         cost_per_1k_input: Cost in USD per 1000 input tokens.
         cost_per_1k_output: Cost in USD per 1000 output tokens.
+        model: ModelRegistry id of the model behind the adapter. Defaults
+            to the adapter's model attribute.
+        context_length: Context window in tokens. Defaults to the model's
+            ModelRegistry entry.
+        max_output_tokens: Tokens reserved for the response when checking
+            that a prompt fits the context window.
     """
 
     name: str
@@ -65,6 +107,9 @@ class ProviderConfig:
     enabled: bool = True
     cost_per_1k_input: float = 0.0
     cost_per_1k_output: float = 0.0
+    model: str | None = None
+    context_length: int | None = None
+    max_output_tokens: int = 4096
 
 
 @dataclass
@@ -76,12 +121,39 @@ class SelectionResult:
         provider_name: Name of the provider that succeeded.
         attempts: Number of attempts made before success.
         all_errors: List of errors from failed attempts.
+        shared: True if the result came from an identical request that
+            was already in flight.
+        estimated_input_tokens: Estimated prompt size, when the strategy
+            needed it (PROMPT_FIT).
     """
 
     result: CompilerResult
     provider_name: str
     attempts: int = 1
     all_errors: list[str] = field(default_factory=list)
+    shared: bool = False
+    estimated_input_tokens: int | None = None
+
+
+def _own_copy(selection: SelectionResult, shared: bool) -> SelectionResult:
+    """Give a coalesced caller its own copy of a shared selection.
+
+    The leader and every waiter receive the same SelectionResult, so each
+    gets a deep copy of the mutable result rather than a shared payload.
+
+    Args:
+        selection: The selection produced by the shared call.
+        shared: Whether the caller waited on another caller's call.
+
+    Returns:
+        A SelectionResult the caller may modify freely.
+    """
+    return replace(
+        selection,
+        result=copy.deepcopy(selection.result),
+        all_errors=list(selection.all_errors),
+        shared=shared,
+    )
 
 
 class ProviderSelector:
@@ -106,15 +178,33 @@ class ProviderSelector:
         max_retries: int = 3,
         timeout_seconds: float = 120.0,
         retry_delay_seconds: float = 1.0,
+        coalesce_requests: bool = True,
+        coalesce_timeout_seconds: float | None = None,
+        model_registry: ModelRegistry | None = None,
+        token_estimator: TokenEstimator | None = None,
+        fit_margin: float = 0.1,
     ) -> None:
         """Initialize the provider selector.
 
         Args:
             providers: List of provider configurations.
-            strategy: Selection strategy (PRIORITY, ROUND_ROBIN, COST_BASED).
+            strategy: Selection strategy (PRIORITY, ROUND_ROBIN, COST_BASED,
+                PROMPT_FIT).
             max_retries: Maximum number of retry attempts across all providers.
             timeout_seconds: Timeout for each provider attempt.
             retry_delay_seconds: Delay between retry attempts.
+            coalesce_requests: Share one provider call between concurrent
+                identical requests (same pass, context and schema).
+            coalesce_timeout_seconds: Deadline of each coalesced request key,
+                counted from when its call started; requests joining it later
+                give up at the same deadline. Defaults to the worst case of
+                the fallback chain (timeout_seconds * max_retries).
+            model_registry: Registry providing context windows and costs for
+                PROMPT_FIT. Defaults to the global registry.
+            token_estimator: Estimates a request's prompt tokens. Defaults to
+                ~4 characters per token of the rendered prompt.
+            fit_margin: Fraction added to the token estimate before checking
+                that it fits, to absorb estimation error.
         """
         # Filter enabled providers and sort by priority
         self._all_providers = providers
@@ -133,6 +223,23 @@ class ProviderSelector:
         # Availability cache
         self._availability_cache: dict[str, bool] = {}
 
+        # Coalescing of identical in-flight requests
+        self._single_flight: SingleFlight[SelectionResult] | None = (
+            SingleFlight() if coalesce_requests else None
+        )
+        self._coalesce_timeout_seconds = (
+            coalesce_timeout_seconds
+            if coalesce_timeout_seconds is not None
+            else timeout_seconds * max(1, max_retries)
+        )
+
+        # Prompt-fit routing
+        self._model_registry = model_registry
+        self._token_estimator = token_estimator
+        self._fit_margin = fit_margin
+        self._prompt_manager: PromptManager | None = None
+        self._latency_ms: dict[str, float] = {}
+
     @property
     def strategy(self) -> SelectionStrategy:
         """Return the current selection strategy."""
@@ -148,6 +255,11 @@ class ProviderSelector:
         """Return all providers including disabled ones."""
         return self._all_providers.copy()
 
+    @property
+    def observed_latency_ms(self) -> dict[str, float]:
+        """Return the smoothed latency of successful calls, by provider."""
+        return dict(self._latency_ms)
+
     def set_strategy(self, strategy: SelectionStrategy) -> None:
         """Change the selection strategy.
 
@@ -293,6 +405,148 @@ class ProviderSelector:
 
         return self._providers.copy()
 
+    def estimate_input_tokens(
+        self,
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        schema: dict[str, object],
+    ) -> int:
+        """Estimate the prompt tokens of a request.
+
+        Args:
+            pass_type: The compiler pass type.
+            context: The compilation context.
+            schema: JSON Schema for the expected output.
+
+        Returns:
+            Estimated input token count.
+        """
+        if self._token_estimator is not None:
+            return self._token_estimator(pass_type, context, schema)
+
+        from rice_factor.domain.services.context_packer import ContextPacker
+
+        if self._prompt_manager is None:
+            from rice_factor.domain.prompts import PromptManager
+
+            self._prompt_manager = PromptManager()
+        prompt = self._prompt_manager.get_full_prompt(
+            pass_type, context, include_schema=False
+        )
+        return ContextPacker.estimate_tokens(prompt + json.dumps(schema))
+
+    def _context_length(self, provider: ProviderConfig) -> int | None:
+        """Return a provider's context window, or None if unknown."""
+        if provider.context_length is not None:
+            return provider.context_length
+        info = self._model_info(provider)
+        return info.context_length if info else None
+
+    def _model_info(self, provider: ProviderConfig) -> ModelInfo | None:
+        """Return the ModelRegistry entry for a provider's model, if any."""
+        model_id = provider.model or getattr(provider.adapter, "model", None)
+        if not isinstance(model_id, str):
+            return None
+        if self._model_registry is None:
+            from rice_factor.domain.services.model_registry import (
+                get_model_registry,
+            )
+
+            self._model_registry = get_model_registry()
+        return self._model_registry.get(model_id)
+
+    def _request_cost(self, provider: ProviderConfig, input_tokens: int) -> float:
+        """Estimate the worst-case cost of a request on a provider.
+
+        Uses the model's ModelRegistry prices when it has an entry, and the
+        provider's configured prices otherwise.
+        """
+        info = self._model_info(provider)
+        cost_in = info.cost_per_1k_input if info else provider.cost_per_1k_input
+        cost_out = info.cost_per_1k_output if info else provider.cost_per_1k_output
+        return (
+            input_tokens * cost_in + provider.max_output_tokens * cost_out
+        ) / 1000
+
+    def _get_fit_order(
+        self,
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        schema: dict[str, object],
+    ) -> tuple[list[ProviderConfig], int]:
+        """Order the providers whose context window fits a request.
+
+        Providers are ranked by estimated cost, then observed latency, then
+        context window (smaller models are usually faster), then priority.
+        Providers with an unknown context window are assumed to fit.
+
+        Args:
+            pass_type: The compiler pass type.
+            context: The compilation context.
+            schema: JSON Schema for the expected output.
+
+        Returns:
+            Tuple of (fitting providers in try order, estimated input tokens).
+
+        Raises:
+            ContextOverflowError: If no provider's context window fits.
+        """
+        input_tokens = self.estimate_input_tokens(pass_type, context, schema)
+        padded = int(input_tokens * (1 + self._fit_margin))
+
+        fitting: list[tuple[tuple[float, float, float, int], ProviderConfig]] = []
+        errors: list[str] = []
+        for provider in self._providers:
+            window = self._context_length(provider)
+            needed = padded + provider.max_output_tokens
+            if window is not None and needed > window:
+                errors.append(
+                    f"{provider.name}: needs ~{needed} tokens "
+                    f"({input_tokens} input + {provider.max_output_tokens} output), "
+                    f"context window is {window}"
+                )
+                continue
+            rank = (
+                self._request_cost(provider, input_tokens),
+                # Untried providers rank as fast so they get measured
+                self._latency_ms.get(provider.name, 0.0),
+                float(window) if window is not None else float("inf"),
+                provider.priority,
+            )
+            fitting.append((rank, provider))
+
+        if not fitting:
+            raise ContextOverflowError(errors, input_tokens)
+
+        fitting.sort(key=lambda item: item[0])
+        return [provider for _, provider in fitting], input_tokens
+
+    def _get_request_order(
+        self,
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        schema: dict[str, object],
+    ) -> tuple[list[ProviderConfig], int | None]:
+        """Return the providers to try for a request, in order.
+
+        Returns:
+            Tuple of (providers, estimated input tokens if computed).
+        """
+        if self._strategy == SelectionStrategy.PROMPT_FIT:
+            return self._get_fit_order(pass_type, context, schema)
+        start_provider = self._select_provider()
+        return self._get_fallback_order(start_provider), None
+
+    def _record_latency(self, provider: ProviderConfig, started: float) -> None:
+        """Fold a successful call's latency into the provider's average."""
+        latency_ms = (time.perf_counter() - started) * 1000
+        previous = self._latency_ms.get(provider.name)
+        self._latency_ms[provider.name] = (
+            latency_ms
+            if previous is None
+            else previous + LATENCY_SMOOTHING * (latency_ms - previous)
+        )
+
     def generate(
         self,
         pass_type: CompilerPassType,
@@ -302,7 +556,9 @@ class ProviderSelector:
         """Generate an artifact with automatic fallback.
 
         Tries providers in order based on the selection strategy.
-        Falls back to the next provider if one fails.
+        Falls back to the next provider if one fails. Concurrent identical
+        requests share one call (see coalesce_requests); each caller gets
+        its own copy of the result.
 
         Args:
             pass_type: The compiler pass type.
@@ -314,20 +570,42 @@ class ProviderSelector:
 
         Raises:
             AllProvidersFailedError: If all providers fail.
+            SingleFlightTimeoutError: If waiting on an identical request
+                timed out.
         """
+        if self._single_flight is None:
+            return self._generate(pass_type, context, schema)
+
+        selection, shared = self._single_flight.do(
+            request_key(pass_type, context, schema),
+            lambda: self._generate(pass_type, context, schema),
+            timeout=self._coalesce_timeout_seconds,
+        )
+        return _own_copy(selection, shared)
+
+    def _generate(
+        self,
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        schema: dict[str, object],
+    ) -> SelectionResult:
+        """Generate with fallback, without request coalescing."""
         if not self._providers:
             raise AllProvidersFailedError(["No enabled providers available"])
 
         errors: list[str] = []
-        start_provider = self._select_provider()
-        fallback_order = self._get_fallback_order(start_provider)
+        fallback_order, input_tokens = self._get_request_order(
+            pass_type, context, schema
+        )
 
         for attempt, provider in enumerate(fallback_order, start=1):
             if attempt > self._max_retries:
                 break
 
             try:
+                started = time.perf_counter()
                 result = provider.adapter.generate(pass_type, context, schema)
+                self._record_latency(provider, started)
 
                 # Advance round-robin on success
                 if self._strategy == SelectionStrategy.ROUND_ROBIN:
@@ -338,6 +616,7 @@ class ProviderSelector:
                     provider_name=provider.name,
                     attempts=attempt,
                     all_errors=errors,
+                    estimated_input_tokens=input_tokens,
                 )
 
             except Exception as e:
@@ -366,19 +645,40 @@ class ProviderSelector:
 
         Raises:
             AllProvidersFailedError: If all providers fail.
+            SingleFlightTimeoutError: If waiting on an identical request
+                timed out.
         """
+        if self._single_flight is None:
+            return await self._generate_async(pass_type, context, schema)
+
+        selection, shared = await self._single_flight.do_async(
+            request_key(pass_type, context, schema),
+            lambda: self._generate_async(pass_type, context, schema),
+            timeout=self._coalesce_timeout_seconds,
+        )
+        return _own_copy(selection, shared)
+
+    async def _generate_async(
+        self,
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        schema: dict[str, object],
+    ) -> SelectionResult:
+        """Generate with fallback (async), without request coalescing."""
         if not self._providers:
             raise AllProvidersFailedError(["No enabled providers available"])
 
         errors: list[str] = []
-        start_provider = self._select_provider()
-        fallback_order = self._get_fallback_order(start_provider)
+        fallback_order, input_tokens = self._get_request_order(
+            pass_type, context, schema
+        )
 
         for attempt, provider in enumerate(fallback_order, start=1):
             if attempt > self._max_retries:
                 break
 
             try:
+                started = time.perf_counter()
                 # Check if adapter has async generate method
                 if hasattr(provider.adapter, "generate_async"):
                     coro = provider.adapter.generate_async(pass_type, context, schema)
@@ -389,6 +689,7 @@ class ProviderSelector:
                 else:
                     # Fall back to sync generate
                     result = provider.adapter.generate(pass_type, context, schema)
+                self._record_latency(provider, started)
 
                 # Advance round-robin on success
                 if self._strategy == SelectionStrategy.ROUND_ROBIN:
@@ -399,6 +700,7 @@ class ProviderSelector:
                     provider_name=provider.name,
                     attempts=attempt,
                     all_errors=errors,
+                    estimated_input_tokens=input_tokens,
                 )
 
             except TimeoutError:
@@ -460,12 +762,16 @@ def create_provider_selector_from_config() -> ProviderSelector:
     strategy_str = fallback_config.get("strategy", "priority")
     max_retries = fallback_config.get("max_retries", 3)
     timeout = fallback_config.get("timeout_seconds", 120.0)
+    coalesce = fallback_config.get("coalesce_requests", True)
+    fit_margin = fallback_config.get("fit_margin", 0.1)
+    max_output_tokens = settings.get("llm.max_tokens", 4096)
 
     # Map strategy string to enum
     strategy_map = {
         "priority": SelectionStrategy.PRIORITY,
         "round_robin": SelectionStrategy.ROUND_ROBIN,
         "cost_based": SelectionStrategy.COST_BASED,
+        "prompt_fit": SelectionStrategy.PROMPT_FIT,
     }
     strategy = strategy_map.get(strategy_str, SelectionStrategy.PRIORITY)
 
@@ -487,6 +793,7 @@ def create_provider_selector_from_config() -> ProviderSelector:
                     enabled=True,
                     cost_per_1k_input=costs["input"],
                     cost_per_1k_output=costs["output"],
+                    max_output_tokens=max_output_tokens,
                 )
             )
         except Exception:
@@ -498,4 +805,6 @@ def create_provider_selector_from_config() -> ProviderSelector:
         strategy=strategy,
         max_retries=max_retries,
         timeout_seconds=timeout,
+        coalesce_requests=coalesce,
+        fit_margin=fit_margin,
     )
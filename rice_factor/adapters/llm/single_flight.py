@@ -0,0 +1,261 @@
+"""Single-flight coalescing of identical in-flight LLM requests.
+
+When the web UI, the TUI and batch commands trigger the same compilation at
+the same time, each would otherwise issue its own provider call. SingleFlight
+lets concurrent callers with the same request key share one underlying call:
+the first caller (the leader) runs it, later callers wait for and receive
+the same result, or the same exception.
+
+Only calls that are in flight are shared; nothing is cached once a call
+completes. Each key has its own deadline, fixed by the caller that started
+its call: callers joining later give up at that same deadline rather than
+getting a fresh wait window. The sync (thread) and async (event loop) paths
+keep separate in-flight tables.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from rice_factor.domain.artifacts.compiler_types import (
+        CompilerContext,
+        CompilerPassType,
+    )
+
+T = TypeVar("T")
+
+
+class SingleFlightTimeoutError(TimeoutError):
+    """Raised when a waiter gives up on a shared in-flight call."""
+
+    def __init__(self, key: str, timeout: float) -> None:
+        """Initialize the error.
+
+        Args:
+            key: The request key that was waited on.
+            timeout: Seconds waited before giving up.
+        """
+        self.key = key
+        self.timeout = timeout
+        super().__init__(f"Timed out after {timeout}s waiting for request {key[:12]}")
+
+
+def request_key(
+    pass_type: CompilerPassType,
+    context: CompilerContext,
+    schema: dict[str, Any],
+) -> str:
+    """Compute the canonical hash of a generation request.
+
+    Args:
+        pass_type: The compiler pass type.
+        context: The compilation context.
+        schema: JSON Schema for the expected output.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding of the request.
+    """
+    canonical = json.dumps(
+        {
+            "pass_type": pass_type.value,
+            "project_files": context.project_files,
+            "artifacts": context.artifacts,
+            "target_file": context.target_file,
+            "schema": schema,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _deadline(timeout: float | None) -> float | None:
+    """Return the monotonic deadline for a timeout (None if unbounded)."""
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _wait_time(deadline: float | None, timeout: float | None) -> float | None:
+    """Return how long a caller may wait, bounded by the key's deadline.
+
+    Args:
+        deadline: Monotonic deadline of the key's call, or None.
+        timeout: The caller's own timeout, or None.
+
+    Returns:
+        Seconds to wait, or None to wait without limit.
+    """
+    remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+    if timeout is None:
+        return remaining
+    if remaining is None:
+        return timeout
+    return min(timeout, remaining)
+
+
+@dataclass
+class _Call(Generic[T]):
+    """An in-flight synchronous call shared by its waiters."""
+
+    deadline: float | None = None
+    done: threading.Event = field(default_factory=threading.Event)
+    result: T | None = None
+    error: BaseException | None = None
+
+
+@dataclass
+class _AsyncCall(Generic[T]):
+    """An in-flight asynchronous call shared by its waiters."""
+
+    task: asyncio.Task[T]
+    deadline: float | None = None
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces concurrent calls that share a key into one call.
+
+    Example:
+        >>> flight: SingleFlight[str] = SingleFlight()
+        >>> value, shared = flight.do("key", expensive_call, timeout=30.0)
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call[T]] = {}
+        self._tasks: dict[str, _AsyncCall[T]] = {}
+        self._coalesced_count = 0
+
+    @property
+    def coalesced_count(self) -> int:
+        """Number of callers that were served by another caller's call."""
+        return self._coalesced_count
+
+    def in_flight(self) -> int:
+        """Return the number of distinct calls currently in flight."""
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        timeout: float | None = None,
+    ) -> tuple[T, bool]:
+        """Run fn, or wait for an identical call already in flight.
+
+        Args:
+            key: Request key identifying identical calls.
+            fn: The call to run if none is in flight for key.
+            timeout: Maximum seconds a waiter waits for the shared call.
+                The leader's timeout sets the key's deadline, which also
+                bounds later waiters. The leader's call itself is bounded
+                by fn.
+
+        Returns:
+            Tuple of (result, shared), shared being True for waiters.
+
+        Raises:
+            SingleFlightTimeoutError: If a waiter times out.
+            Exception: Whatever fn raised, for the leader and all waiters.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call(deadline=_deadline(timeout))
+                self._calls[key] = call
+            else:
+                self._coalesced_count += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call.done.set()
+        else:
+            wait = _wait_time(call.deadline, timeout)
+            if not call.done.wait(wait):
+                raise SingleFlightTimeoutError(key, wait or 0.0)
+
+        if call.error is not None:
+            raise call.error
+        return call.result, not leader  # type: ignore[return-value]
+
+    async def do_async(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        timeout: float | None = None,
+    ) -> tuple[T, bool]:
+        """Await fn, or an identical call already in flight.
+
+        The shared call runs as its own task, so a caller timing out or
+        being cancelled does not cancel it for the other waiters.
+
+        Args:
+            key: Request key identifying identical calls.
+            fn: Coroutine function to run if none is in flight for key.
+            timeout: Maximum seconds any caller waits for the shared call.
+                The leader's timeout sets the key's deadline, which also
+                bounds later waiters.
+
+        Returns:
+            Tuple of (result, shared), shared being True for waiters.
+
+        Raises:
+            SingleFlightTimeoutError: If the caller times out.
+            Exception: Whatever fn raised, for the leader and all waiters.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            existing = self._tasks.get(key)
+            leader = existing is None or existing.task.get_loop() is not loop
+            if existing is not None and not leader:
+                call = existing
+                self._coalesced_count += 1
+            else:
+                call = _AsyncCall(
+                    task=loop.create_task(self._run_async(fn)),
+                    deadline=_deadline(timeout),
+                )
+                self._tasks[key] = call
+                call.task.add_done_callback(lambda t: self._forget_task(key, t))
+
+        task = call.task
+        wait = _wait_time(call.deadline, timeout)
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task), timeout=wait)
+        except TimeoutError:
+            if task.done() and not task.cancelled():
+                raise
+            raise SingleFlightTimeoutError(key, wait or 0.0) from None
+        return result, not leader
+
+    @staticmethod
+    async def _run_async(fn: Callable[[], Awaitable[T]]) -> T:
+        """Await the coroutine produced by fn."""
+        return await fn()
+
+    def _forget_task(self, key: str, task: asyncio.Task[T]) -> None:
+        """Remove a finished task from the in-flight table."""
+        with self._lock:
+            call = self._tasks.get(key)
+            if call is not None and call.task is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved if every waiter gave up
+            task.exception()
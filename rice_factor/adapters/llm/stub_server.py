@@ -0,0 +1,605 @@
+"""Deterministic local LLM server for offline load testing.
+
+StubLLMServer implements enough of the OpenAI (/v1/completions,
+/v1/chat/completions, /v1/models), vLLM (/health), Ollama (/api/generate,
+/api/chat, /api/tags) and Anthropic (/v1/messages) HTTP APIs for every LLM
+adapter to run against it without network access.
+
+Time to first token, token rate and error rate are configurable. Errors are
+drawn from a seeded generator and completions come from a responder
+function, so two runs with the same configuration behave the same. Every
+API can stream (server-sent events, or NDJSON for Ollama). The server keeps
+connections alive and counts them, so clients that fail to reuse
+connections show up in its statistics.
+
+Example:
+    >>> config = StubServerConfig(latency=0.05, token_rate=200.0)
+    >>> with StubLLMServer(config, responder=plan_responder) as server:
+    ...     adapter = VLLMAdapter(base_url=f"{server.base_url}/v1")
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+# Turns the prompt text of one request into the completion text
+Responder = Callable[[str], str]
+
+# Characters per token, matching the estimate used elsewhere in Rice-Factor
+CHARS_PER_TOKEN = 4
+
+
+def echo_responder(prompt: str) -> str:
+    """Answer with a JSON object echoing the last line of the prompt.
+
+    Args:
+        prompt: Prompt text of the request.
+
+    Returns:
+        Completion text.
+    """
+    return json.dumps({"echo": prompt.rstrip().rsplit("\n", 1)[-1]})
+
+
+def plan_responder(prompt: str) -> str:
+    """Answer with a valid plan for the compiler pass named in the prompt.
+
+    The pass is recognized from its "PASS: ..." prompt header and the plan
+    comes from StubLLMAdapter, so responses pass schema validation. The
+    implementation pass uses the prompt's TARGET FILE.
+
+    Args:
+        prompt: Prompt text of the request.
+
+    Returns:
+        Plan payload as JSON, or "{}" if no pass is recognized.
+    """
+    from rice_factor.adapters.llm.stub import StubLLMAdapter
+    from rice_factor.domain.artifacts.compiler_types import CompilerPassType
+    from rice_factor.domain.prompts import PASS_PROMPTS
+
+    headers = {text.splitlines()[0]: pass_type for pass_type, text in PASS_PROMPTS.items()}
+    pass_type = next((pt for header, pt in headers.items() if header in prompt), None)
+    target = re.search(r"^TARGET FILE: (.+)$", prompt, re.MULTILINE)
+
+    stub = StubLLMAdapter()
+    generators: dict[CompilerPassType, Callable[[], Any]] = {
+        CompilerPassType.PROJECT: stub.generate_project_plan,
+        CompilerPassType.ARCHITECTURE: stub.generate_architecture_plan,
+        CompilerPassType.SCAFFOLD: stub.generate_scaffold_plan,
+        CompilerPassType.TEST: stub.generate_test_plan,
+        CompilerPassType.IMPLEMENTATION: lambda: stub.generate_implementation_plan(
+            target.group(1).strip() if target else "src/main.py"
+        ),
+        CompilerPassType.REFACTOR: lambda: stub.generate_refactor_plan("Stub refactor"),
+    }
+    if pass_type is None or pass_type not in generators:
+        return "{}"
+    return json.dumps(generators[pass_type]().model_dump(mode="json"))
+
+
+@dataclass
+class StubServerConfig:
+    """Behavior of a StubLLMServer.
+
+    Attributes:
+        latency: Seconds before the first token of every response.
+        token_rate: Generated tokens per second (0 for no generation delay).
+        error_rate: Fraction of generation requests answered with HTTP 500.
+        seed: Seed for the error draw, so failures are reproducible.
+        model: Model name reported by the server.
+    """
+
+    latency: float = 0.0
+    token_rate: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 0
+    model: str = "stub"
+
+    def __post_init__(self) -> None:
+        """Validate the configuration."""
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        if self.latency < 0 or self.token_rate < 0:
+            raise ValueError("latency and token_rate must not be negative")
+
+
+@dataclass
+class StubServerStats:
+    """Counters of a StubLLMServer.
+
+    Attributes:
+        requests: HTTP requests served.
+        connections: TCP connections accepted.
+        errors: Requests answered with an injected error.
+        streamed: Responses sent as a stream.
+        max_in_flight: Most generation requests served at once.
+        by_path: Requests per URL path.
+    """
+
+    requests: int = 0
+    connections: int = 0
+    errors: int = 0
+    streamed: int = 0
+    max_in_flight: int = 0
+    by_path: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def connection_reuse(self) -> float:
+        """Fraction of requests that reused an open connection."""
+        if not self.requests:
+            return 0.0
+        return max(0, self.requests - self.connections) / self.requests
+
+
+class StubLLMServer(ThreadingHTTPServer):
+    """Local HTTP server imitating the LLM provider APIs.
+
+    Use as a context manager, or call start() and stop().
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        config: StubServerConfig | None = None,
+        responder: Responder = echo_responder,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Bind the server (port 0 picks a free port).
+
+        Args:
+            config: Server behavior. Defaults to no delays and no errors.
+            responder: Produces the completion text for a prompt.
+            host: Interface to listen on.
+            port: Port to listen on.
+        """
+        super().__init__((host, port), _StubLLMHandler)
+        self.config = config or StubServerConfig()
+        self.responder = responder
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._stats = StubServerStats()
+        self._in_flight = 0
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the server, without an API prefix."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def stats(self) -> StubServerStats:
+        """Return a snapshot of the server counters."""
+        with self._lock:
+            return replace(self._stats, by_path=dict(self._stats.by_path))
+
+    def reset_stats(self) -> None:
+        """Zero the counters and reseed the error draw."""
+        with self._lock:
+            self._stats = StubServerStats()
+            self._random = random.Random(self.config.seed)
+
+    def start(self) -> StubLLMServer:
+        """Serve requests on a background thread.
+
+        Returns:
+            The server, for chaining.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.serve_forever, name="stub-llm-server", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self) -> StubLLMServer:
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def _connection_opened(self) -> None:
+        with self._lock:
+            self._stats.connections += 1
+
+    def _request_started(self, path: str, generation: bool) -> bool:
+        """Count a request and decide whether it fails.
+
+        Returns:
+            True if an error should be injected.
+        """
+        with self._lock:
+            self._stats.requests += 1
+            self._stats.by_path[path] = self._stats.by_path.get(path, 0) + 1
+            if not generation:
+                return False
+            self._in_flight += 1
+            self._stats.max_in_flight = max(self._stats.max_in_flight, self._in_flight)
+            # Always draw so the error sequence only depends on request order
+            fail = self._random.random() < self.config.error_rate
+            if fail:
+                self._stats.errors += 1
+            return fail
+
+    def _request_finished(self, streamed: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if streamed:
+                self._stats.streamed += 1
+
+
+def _tokens(text: str) -> list[str]:
+    """Split text into pseudo-tokens of CHARS_PER_TOKEN characters."""
+    return [text[i : i + CHARS_PER_TOKEN] for i in range(0, len(text), CHARS_PER_TOKEN)]
+
+
+def _count_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+def _content_text(content: Any) -> str:
+    """Flatten message content given as a string or a list of blocks."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(
+            block.get("text", "") for block in content if isinstance(block, dict)
+        )
+    return ""
+
+
+class _StubLLMHandler(BaseHTTPRequestHandler):
+    server: StubLLMServer
+    # Keep-alive, so connection reuse can be observed
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the server quiet."""
+
+    def setup(self) -> None:
+        """Count the new connection."""
+        super().setup()
+        self.server._connection_opened()
+
+    def do_GET(self) -> None:
+        """Serve health and model listing endpoints."""
+        path = self.path.split("?", 1)[0]
+        self.server._request_started(path, generation=False)
+        model = self.server.config.model
+        if path == "/":
+            self._send_bytes(200, b"Ollama is running", "text/plain")
+        elif path == "/health":
+            self._send_bytes(200, b"", "text/plain")
+        elif path == "/api/tags":
+            self._send_json(200, {"models": [{"name": model, "model": model}]})
+        elif path in ("/v1/models", "/models"):
+            self._send_json(
+                200,
+                {"object": "list", "data": [{"id": model, "object": "model"}]},
+            )
+        else:
+            self._send_json(404, {"error": f"Unknown path: {path}"})
+
+    def do_POST(self) -> None:
+        """Serve the generation endpoints."""
+        path = self.path.split("?", 1)[0]
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self.server._request_started(path, generation=False)
+            self._send_json(400, {"error": {"message": "Invalid JSON body"}})
+            return
+
+        api = _route(path)
+        if api is None:
+            self.server._request_started(path, generation=False)
+            self._send_json(404, {"error": f"Unknown path: {path}"})
+            return
+
+        # Ollama streams unless told otherwise; the other APIs do not
+        stream = bool(body.get("stream", api.startswith("ollama")))
+        fail = self.server._request_started(path, generation=True)
+        try:
+            if fail:
+                self._send_error(api)
+                return
+            prompts = _prompts(api, body)
+            texts = [self.server.responder(p) for p in prompts]
+            if stream:
+                self._stream(api, prompts, texts)
+            else:
+                self._respond(api, prompts, texts)
+        finally:
+            self.server._request_finished(stream and not fail)
+
+    def _respond(self, api: str, prompts: list[str], texts: list[str]) -> None:
+        """Wait for the simulated generation and send one JSON response."""
+        config = self.server.config
+        # Prompts in one request are generated together, as in a batch
+        longest = max((len(_tokens(t)) for t in texts), default=0)
+        delay = config.latency
+        if config.token_rate:
+            delay += longest / config.token_rate
+        time.sleep(delay)
+
+        prompt_tokens = sum(_count_tokens(p) for p in prompts)
+        completion_tokens = sum(len(_tokens(t)) for t in texts)
+        model = config.model
+        if api == "completions":
+            payload: dict[str, Any] = {
+                "id": "cmpl-stub",
+                "object": "text_completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {"index": i, "text": text, "finish_reason": "stop"}
+                    for i, text in enumerate(texts)
+                ],
+                "usage": _openai_usage(prompt_tokens, completion_tokens),
+            }
+        elif api == "chat":
+            payload = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": texts[0]},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": _openai_usage(prompt_tokens, completion_tokens),
+            }
+        elif api == "anthropic":
+            payload = {
+                "id": "msg_stub",
+                "type": "message",
+                "role": "assistant",
+                "model": model,
+                "content": [{"type": "text", "text": texts[0]}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {
+                    "input_tokens": prompt_tokens,
+                    "output_tokens": completion_tokens,
+                },
+            }
+        else:
+            payload = {
+                **_ollama_chunk(api, model, texts[0], done=True),
+                "total_duration": int(delay * 1e9),
+                "load_duration": 0,
+                "prompt_eval_count": prompt_tokens,
+                "eval_count": completion_tokens,
+                "eval_duration": int(delay * 1e9),
+            }
+        self._send_json(200, payload)
+
+    def _stream(self, api: str, prompts: list[str], texts: list[str]) -> None:
+        """Send the completion token by token at the configured rate."""
+        config = self.server.config
+        self.send_response(200)
+        content_type = "application/x-ndjson" if api.startswith("ollama") else "text/event-stream"
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        time.sleep(config.latency)
+
+        model = config.model
+        completion_tokens = 0
+        if api == "anthropic":
+            self._write_event(
+                "message_start",
+                {
+                    "type": "message_start",
+                    "message": {
+                        "id": "msg_stub",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": model,
+                        "content": [],
+                        "stop_reason": None,
+                        "stop_sequence": None,
+                        "usage": {
+                            "input_tokens": _count_tokens(prompts[0]),
+                            "output_tokens": 0,
+                        },
+                    },
+                },
+            )
+            self._write_event(
+                "content_block_start",
+                {
+                    "type": "content_block_start",
+                    "index": 0,
+                    "content_block": {"type": "text", "text": ""},
+                },
+            )
+
+        for index, text in enumerate(texts):
+            for token in _tokens(text):
+                if config.token_rate:
+                    time.sleep(1 / config.token_rate)
+                completion_tokens += 1
+                if api == "completions":
+                    self._write_event(
+                        None,
+                        {
+                            "id": "cmpl-stub",
+                            "object": "text_completion",
+                            "model": model,
+                            "choices": [
+                                {"index": index, "text": token, "finish_reason": None}
+                            ],
+                        },
+                    )
+                elif api == "chat":
+                    self._write_event(
+                        None,
+                        {
+                            "id": "chatcmpl-stub",
+                            "object": "chat.completion.chunk",
+                            "model": model,
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "delta": {"content": token},
+                                    "finish_reason": None,
+                                }
+                            ],
+                        },
+                    )
+                elif api == "anthropic":
+                    self._write_event(
+                        "content_block_delta",
+                        {
+                            "type": "content_block_delta",
+                            "index": 0,
+                            "delta": {"type": "text_delta", "text": token},
+                        },
+                    )
+                else:
+                    self._write_line(_ollama_chunk(api, model, token, done=False))
+
+        if api in ("completions", "chat"):
+            self._write_chunk(b"data: [DONE]\n\n")
+        elif api == "anthropic":
+            self._write_event(
+                "content_block_stop", {"type": "content_block_stop", "index": 0}
+            )
+            self._write_event(
+                "message_delta",
+                {
+                    "type": "message_delta",
+                    "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                    "usage": {"output_tokens": completion_tokens},
+                },
+            )
+            self._write_event("message_stop", {"type": "message_stop"})
+        else:
+            self._write_line(
+                {
+                    **_ollama_chunk(api, model, "", done=True),
+                    "prompt_eval_count": _count_tokens(prompts[0]),
+                    "eval_count": completion_tokens,
+                }
+            )
+        self._write_chunk(b"")
+
+    def _send_error(self, api: str) -> None:
+        """Send an injected server error in the API's error format."""
+        message = "Injected stub server error"
+        if api == "anthropic":
+            payload: dict[str, Any] = {
+                "type": "error",
+                "error": {"type": "api_error", "message": message},
+            }
+        elif api.startswith("ollama"):
+            payload = {"error": message}
+        else:
+            payload = {"error": {"message": message, "type": "server_error", "code": None}}
+        self._send_json(500, payload)
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        self._send_bytes(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _send_bytes(self, status: int, data: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, data: bytes) -> None:
+        """Write one chunk of a chunked response (empty data ends it)."""
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _write_event(self, event: str | None, payload: dict[str, Any]) -> None:
+        """Write one server-sent event."""
+        prefix = f"event: {event}\n" if event else ""
+        self._write_chunk(f"{prefix}data: {json.dumps(payload)}\n\n".encode())
+
+    def _write_line(self, payload: dict[str, Any]) -> None:
+        """Write one NDJSON line."""
+        self._write_chunk(json.dumps(payload).encode("utf-8") + b"\n")
+
+
+def _route(path: str) -> str | None:
+    """Map a POST path to the API it belongs to."""
+    if path == "/api/generate":
+        return "ollama"
+    if path == "/api/chat":
+        return "ollama_chat"
+    if path == "/v1/messages":
+        return "anthropic"
+    if path.endswith("/chat/completions"):
+        return "chat"
+    if path.endswith("/completions"):
+        return "completions"
+    return None
+
+
+def _prompts(api: str, body: dict[str, Any]) -> list[str]:
+    """Extract the prompt text of each completion a request asks for."""
+    if api == "completions":
+        prompt = body.get("prompt", "")
+        return [str(p) for p in prompt] if isinstance(prompt, list) else [str(prompt)]
+    if api == "ollama":
+        system = body.get("system")
+        prompt = str(body.get("prompt", ""))
+        return [f"{system}\n\n{prompt}" if system else prompt]
+
+    parts: list[str] = []
+    if api == "anthropic" and body.get("system"):
+        parts.append(_content_text(body["system"]))
+    parts.extend(_content_text(m.get("content")) for m in body.get("messages", []))
+    return ["\n\n".join(parts)]
+
+
+def _openai_usage(prompt_tokens: int, completion_tokens: int) -> dict[str, int]:
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def _ollama_chunk(api: str, model: str, text: str, done: bool) -> dict[str, Any]:
+    """Build an Ollama response object for /api/generate or /api/chat."""
+    chunk: dict[str, Any] = {
+        "model": model,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "done": done,
+    }
+    if api == "ollama_chat":
+        chunk["message"] = {"role": "assistant", "content": text}
+    else:
+        chunk["response"] = text
+    if done:
+        chunk["done_reason"] = "stop"
+    return chunk
@@ -25,6 +25,8 @@ class UsageRecord:
         cost_usd: Calculated cost in USD.
         success: Whether the request succeeded.
         error: Error message if request failed.
+        cache_read_tokens: Input tokens served from the provider prompt cache.
+        cache_write_tokens: Input tokens written to the provider prompt cache.
     """
 
     timestamp: datetime
@@ -36,6 +38,8 @@ class UsageRecord:
     cost_usd: float
     success: bool = True
     error: str | None = None
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 @dataclass
@@ -52,6 +56,8 @@ class ProviderStats:
         avg_latency_ms: Average latency in milliseconds.
         min_latency_ms: Minimum latency.
         max_latency_ms: Maximum latency.
+        total_cache_read_tokens: Total input tokens read from prompt cache.
+        total_cache_write_tokens: Total input tokens written to prompt cache.
     """
 
     provider: str
@@ -63,6 +69,16 @@ class ProviderStats:
     avg_latency_ms: float = 0.0
     min_latency_ms: float = float("inf")
     max_latency_ms: float = 0.0
+    total_cache_read_tokens: int = 0
+    total_cache_write_tokens: int = 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of cacheable input tokens that were served from cache."""
+        cacheable = self.total_cache_read_tokens + self.total_cache_write_tokens
+        if cacheable == 0:
+            return 0.0
+        return self.total_cache_read_tokens / cacheable
 
 
 class UsageTracker:
@@ -85,6 +101,11 @@ class UsageTracker:
         >>> print(tracker.total_cost())
     """
 
+    # Default prompt cache pricing relative to the base input token price
+    # (Anthropic bills cache reads at 10% and cache writes at 125%).
+    CACHE_READ_COST_FACTOR = 0.1
+    CACHE_WRITE_COST_FACTOR = 1.25
+
     def __init__(self) -> None:
         """Initialize the usage tracker."""
         self._records: list[UsageRecord] = []
@@ -151,28 +172,47 @@ class UsageTracker:
         cost_per_1k_output: float = 0.0,
         success: bool = True,
         error: str | None = None,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        cost_per_1k_cache_read: float | None = None,
+        cost_per_1k_cache_write: float | None = None,
     ) -> UsageRecord:
         """Record an LLM request with known token counts.
 
         Use this when token counts are already available from the provider.
+        Cached input tokens are reported separately from ``input_tokens``
+        (which only counts uncached input), matching the Anthropic usage format.
 
         Args:
             provider: Provider name.
             model: Model identifier.
-            input_tokens: Number of input tokens.
+            input_tokens: Number of uncached input tokens.
             output_tokens: Number of output tokens.
             latency_ms: Request latency in milliseconds.
             cost_per_1k_input: Cost per 1000 input tokens.
             cost_per_1k_output: Cost per 1000 output tokens.
             success: Whether the request succeeded.
             error: Error message if failed.
+            cache_read_tokens: Input tokens read from the prompt cache.
+            cache_write_tokens: Input tokens written to the prompt cache.
+            cost_per_1k_cache_read: Cost per 1000 cache-read tokens. Defaults
+                to CACHE_READ_COST_FACTOR times the input price.
+            cost_per_1k_cache_write: Cost per 1000 cache-write tokens. Defaults
+                to CACHE_WRITE_COST_FACTOR times the input price.
 
         Returns:
             The recorded UsageRecord.
         """
+        if cost_per_1k_cache_read is None:
+            cost_per_1k_cache_read = cost_per_1k_input * self.CACHE_READ_COST_FACTOR
+        if cost_per_1k_cache_write is None:
+            cost_per_1k_cache_write = cost_per_1k_input * self.CACHE_WRITE_COST_FACTOR
+
         cost = (
             (input_tokens / 1000) * cost_per_1k_input
             + (output_tokens / 1000) * cost_per_1k_output
+            + (cache_read_tokens / 1000) * cost_per_1k_cache_read
+            + (cache_write_tokens / 1000) * cost_per_1k_cache_write
         )
 
         record = UsageRecord(
@@ -185,6 +225,8 @@ class UsageTracker:
             cost_usd=cost,
             success=success,
             error=error,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
         )
 
         self._records.append(record)
@@ -224,6 +266,16 @@ class UsageTracker:
         output_total = sum(r.output_tokens for r in self._records)
         return input_total, output_total
 
+    def total_cache_tokens(self) -> tuple[int, int]:
+        """Get total prompt cache read and write tokens.
+
+        Returns:
+            Tuple of (total_cache_read_tokens, total_cache_write_tokens).
+        """
+        read_total = sum(r.cache_read_tokens for r in self._records)
+        write_total = sum(r.cache_write_tokens for r in self._records)
+        return read_total, write_total
+
     def by_provider(self) -> dict[str, ProviderStats]:
         """Get usage statistics grouped by provider.
 
@@ -242,6 +294,8 @@ class UsageTracker:
                 s.successful_requests += 1
             s.total_input_tokens += record.input_tokens
             s.total_output_tokens += record.output_tokens
+            s.total_cache_read_tokens += record.cache_read_tokens
+            s.total_cache_write_tokens += record.cache_write_tokens
             s.total_cost_usd += record.cost_usd
             s.min_latency_ms = min(s.min_latency_ms, record.latency_ms)
             s.max_latency_ms = max(s.max_latency_ms, record.latency_ms)
@@ -332,6 +386,12 @@ class UsageTracker:
             lines.append(
                 f'llm_tokens_total{{provider="{provider}",type="output"}} {stats.total_output_tokens}'
             )
+            lines.append(
+                f'llm_tokens_total{{provider="{provider}",type="cache_read"}} {stats.total_cache_read_tokens}'
+            )
+            lines.append(
+                f'llm_tokens_total{{provider="{provider}",type="cache_write"}} {stats.total_cache_write_tokens}'
+            )
 
         # Request metrics
         lines.append("# HELP llm_requests_total Total requests by provider")
@@ -367,12 +427,16 @@ class UsageTracker:
             "total_cost_usd": self.total_cost(),
             "total_input_tokens": self.total_tokens()[0],
             "total_output_tokens": self.total_tokens()[1],
+            "total_cache_read_tokens": self.total_cache_tokens()[0],
+            "total_cache_write_tokens": self.total_cache_tokens()[1],
             "by_provider": {
                 p: {
                     "total_requests": s.total_requests,
                     "successful_requests": s.successful_requests,
                     "total_input_tokens": s.total_input_tokens,
                     "total_output_tokens": s.total_output_tokens,
+                    "total_cache_read_tokens": s.total_cache_read_tokens,
+                    "total_cache_write_tokens": s.total_cache_write_tokens,
                     "total_cost_usd": s.total_cost_usd,
                     "avg_latency_ms": s.avg_latency_ms,
                 }
@@ -10,8 +10,15 @@ OpenAI-compatible API for model inference.
 from __future__ import annotations
 
 import json
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
+from rice_factor.adapters.llm.batching import (
+    DEFAULT_MAX_IN_FLIGHT,
+    BatchGenerationResult,
+    run_in_flight,
+    split_choices,
+)
 from rice_factor.domain.artifacts.compiler_types import (
     CompilerContext,
     CompilerPassType,
@@ -22,11 +29,21 @@ from rice_factor.domain.failures.llm_errors import (
     LLMError,
     LLMTimeoutError,
 )
-from rice_factor.domain.prompts import PromptManager
+from rice_factor.domain.prompts import (
+    PromptManager,
+    SchemaRenderMode,
+    render_schema,
+    schema_fence_language,
+)
 from rice_factor.domain.services.json_extractor import JSONExtractor
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Sequence
+
+    import httpx
+    import requests
+
+    from rice_factor.adapters.llm.batching import GenerationRequest
 
 
 class VLLMClientError(Exception):
@@ -118,20 +135,108 @@ class VLLMClient:
         else:
             return self._generate_requests(payload)
 
-    def _generate_httpx(self, payload: dict[str, Any]) -> dict[str, Any]:
-        """Generate using httpx."""
+    def generate_batch(
+        self,
+        model: str,
+        prompts: Sequence[str],
+        temperature: float = 0.1,
+        max_tokens: int = 4096,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        multi_prompt: bool = False,
+    ) -> list[BatchGenerationResult]:
+        """Generate completions for several prompts at once.
+
+        By default the prompts are sent as concurrent requests over one
+        connection pool, at most max_in_flight at a time, which vLLM's
+        continuous batching schedules together. With multi_prompt, they
+        are sent as a single /completions request with a prompt list;
+        that saves round-trips, but a failed request fails every prompt.
+
+        Args:
+            model: Model name served by vLLM.
+            prompts: The prompts to send.
+            temperature: Temperature for generation.
+            max_tokens: Maximum tokens to generate per prompt.
+            max_in_flight: Maximum concurrent requests.
+            multi_prompt: Send all prompts in one request.
+
+        Returns:
+            One result per prompt, in prompt order, each holding either
+            the response (in single-prompt format) or the error.
+        """
+        if not prompts:
+            return []
+
+        def payload(prompt: str | list[str]) -> dict[str, Any]:
+            return {
+                "model": model,
+                "prompt": prompt,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": False,
+            }
+
+        if multi_prompt:
+            try:
+                if self._httpx_available:
+                    response = self._generate_httpx(payload(list(prompts)))
+                else:
+                    response = self._generate_requests(payload(list(prompts)))
+            except Exception as e:
+                return [
+                    BatchGenerationResult(index=i, error=e) for i in range(len(prompts))
+                ]
+            return split_choices(response, len(prompts))
+
+        if self._httpx_available:
+            import httpx
+
+            limits = httpx.Limits(max_connections=max_in_flight)
+            with httpx.Client(timeout=self.timeout, limits=limits) as client:
+                return run_in_flight(
+                    [
+                        partial(self._generate_httpx, payload(prompt), client)
+                        for prompt in prompts
+                    ],
+                    max_in_flight,
+                )
+
+        try:
+            import requests
+        except ImportError:
+            # Every prompt reports the missing-dependency error
+            return run_in_flight(
+                [partial(self._generate_requests, payload(p)) for p in prompts],
+                max_in_flight,
+            )
+        with requests.Session() as session:
+            return run_in_flight(
+                [
+                    partial(self._generate_requests, payload(prompt), session)
+                    for prompt in prompts
+                ],
+                max_in_flight,
+            )
+
+    def _generate_httpx(
+        self, payload: dict[str, Any], client: httpx.Client | None = None
+    ) -> dict[str, Any]:
+        """Generate using httpx, on a shared client if one is given."""
         import httpx
 
+        if client is None:
+            with httpx.Client(timeout=self.timeout) as own_client:
+                return self._generate_httpx(payload, own_client)
+
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    f"{self.base_url}/completions",
-                    headers=self._get_headers(),
-                    json=payload,
-                )
-                response.raise_for_status()
-                result: dict[str, Any] = response.json()
-                return result
+            response = client.post(
+                f"{self.base_url}/completions",
+                headers=self._get_headers(),
+                json=payload,
+            )
+            response.raise_for_status()
+            result: dict[str, Any] = response.json()
+            return result
         except httpx.TimeoutException as e:
             raise LLMTimeoutError(f"vLLM request timed out: {e}") from e
         except httpx.HTTPStatusError as e:
@@ -139,8 +244,10 @@ class VLLMClient:
         except httpx.RequestError as e:
             raise VLLMClientError(f"vLLM request failed: {e}") from e
 
-    def _generate_requests(self, payload: dict[str, Any]) -> dict[str, Any]:
-        """Generate using requests (fallback)."""
+    def _generate_requests(
+        self, payload: dict[str, Any], session: requests.Session | None = None
+    ) -> dict[str, Any]:
+        """Generate using requests (fallback), on a shared session if given."""
         try:
             import requests
         except ImportError as e:
@@ -150,7 +257,7 @@ class VLLMClient:
             ) from e
 
         try:
-            response = requests.post(
+            response = (session or requests).post(
                 f"{self.base_url}/completions",
                 headers=self._get_headers(),
                 json=payload,
@@ -420,6 +527,9 @@ class VLLMAdapter:
     Enforces determinism controls:
     - Temperature: 0.0-0.2
 
+    generate_batch() sends many requests at once so the server can batch
+    them instead of serving one round-trip at a time.
+
     Attributes:
         model: The vLLM model to use.
         max_tokens: Maximum tokens per response.
@@ -438,6 +548,9 @@ class VLLMAdapter:
         max_tokens: int = 4096,
         temperature: float = 0.0,
         timeout: float = 120.0,
+        schema_mode: SchemaRenderMode = SchemaRenderMode.COMPACT,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        multi_prompt: bool = False,
     ) -> None:
         """Initialize the vLLM adapter.
 
@@ -448,18 +561,24 @@ class VLLMAdapter:
             max_tokens: Maximum tokens in response.
             temperature: Temperature for generation (capped at 0.2).
             timeout: Request timeout in seconds.
+            schema_mode: How the output schema is rendered into the prompt.
+            max_in_flight: Maximum concurrent requests in generate_batch().
+            multi_prompt: Send batches as one multi-prompt request.
         """
         self._model = model
         self._max_tokens = max_tokens
         self._temperature = min(temperature, self.MAX_TEMPERATURE)
         self._timeout = timeout
+        self._max_in_flight = max_in_flight
+        self._multi_prompt = multi_prompt
 
         self._client = VLLMClient(
             base_url=base_url,
             api_key=api_key,
             timeout=timeout,
         )
-        self._prompt_manager = PromptManager()
+        self._schema_mode = schema_mode
+        self._prompt_manager = PromptManager(schema_mode=schema_mode)
         self._json_extractor = JSONExtractor()
 
     @property
@@ -493,16 +612,41 @@ class VLLMAdapter:
         Returns:
             CompilerResult with payload on success or error details on failure.
         """
-        try:
-            # Build prompt
-            user_prompt = self._build_prompt(pass_type, context, schema)
+        return self._complete(self._build_full_prompt(pass_type, context, schema))
 
-            # Get system prompt
-            system_prompt = self._prompt_manager.get_system_prompt(pass_type)
+    def repair(
+        self,
+        pass_type: CompilerPassType,  # noqa: ARG002
+        request: CompilerContext,
+        schema: dict[str, object],
+    ) -> CompilerResult:
+        """Patch invalid sub-trees of an artifact using vLLM.
 
-            # Combine system and user prompts for completion API
-            full_prompt = f"{system_prompt}\n\n{user_prompt}"
+        Sends only the repair system prompt and the patch schema, not the
+        pass prompt or the artifact schema.
 
+        Args:
+            pass_type: The pass that produced the invalid artifact.
+            request: Repair context built by the OutputRepairer.
+            schema: JSON Schema of the expected patch object.
+
+        Returns:
+            CompilerResult with the patch on success or error details on failure.
+        """
+        user_prompt = self._prompt_manager.get_repair_prompt(request, schema)
+        system_prompt = self._prompt_manager.get_repair_system_prompt()
+        return self._complete(f"{system_prompt}\n\n{user_prompt}")
+
+    def _complete(self, full_prompt: str) -> CompilerResult:
+        """Send a combined prompt and parse the JSON payload.
+
+        Args:
+            full_prompt: Combined system and user prompt.
+
+        Returns:
+            CompilerResult with payload on success or error details on failure.
+        """
+        try:
             # Call vLLM API
             response = self._client.generate(
                 model=self._model,
@@ -510,7 +654,76 @@ class VLLMAdapter:
                 temperature=self._temperature,
                 max_tokens=self._max_tokens,
             )
+            return self._parse_response(response)
+
+        except LLMTimeoutError:
+            raise
+
+        except LLMAPIError:
+            raise
+
+        except Exception as e:
+            return self._error_result(e)
+
+    def generate_batch(
+        self, requests: Sequence[GenerationRequest]
+    ) -> list[CompilerResult]:
+        """Generate several artifacts with concurrent requests.
+
+        Args:
+            requests: (pass_type, context, schema) per artifact.
+
+        Returns:
+            One CompilerResult per request, in request order. A failed
+            request (including a timeout) becomes a failed result instead
+            of aborting the batch.
+        """
+        results: list[CompilerResult | None] = [None] * len(requests)
+        prompts: list[str] = []
+        positions: list[int] = []
+        for index, (pass_type, context, schema) in enumerate(requests):
+            try:
+                prompts.append(self._build_full_prompt(pass_type, context, schema))
+                positions.append(index)
+            except Exception as e:
+                results[index] = self._error_result(e)
+
+        generations = self._client.generate_batch(
+            model=self._model,
+            prompts=prompts,
+            temperature=self._temperature,
+            max_tokens=self._max_tokens,
+            max_in_flight=self._max_in_flight,
+            multi_prompt=self._multi_prompt,
+        )
+        for index, generation in zip(positions, generations, strict=True):
+            if generation.error is not None:
+                results[index] = self._error_result(generation.error)
+            else:
+                results[index] = self._parse_response(generation.response or {})
+        return [result for result in results if result is not None]
+
+    def _build_full_prompt(
+        self,
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        schema: dict[str, object],
+    ) -> str:
+        """Build the combined system and user prompt for the completion API."""
+        user_prompt = self._build_prompt(pass_type, context, schema)
+        system_prompt = self._prompt_manager.get_system_prompt(pass_type)
+        return f"{system_prompt}\n\n{user_prompt}"
+
+    def _parse_response(self, response: dict[str, Any]) -> CompilerResult:
+        """Turn a completion response into a CompilerResult.
 
+        Args:
+            response: The vLLM API response dict (OpenAI format).
+
+        Returns:
+            CompilerResult with the parsed payload or error details.
+        """
+        try:
             # Extract response text from OpenAI format
             response_text = self._extract_response_text(response)
 
@@ -530,39 +743,35 @@ class VLLMAdapter:
 
             return CompilerResult(success=True, payload=payload)
 
-        except LLMTimeoutError:
-            raise
-
-        except LLMAPIError:
-            raise
+        except Exception as e:
+            return self._error_result(e)
 
-        except json.JSONDecodeError as e:
+    @staticmethod
+    def _error_result(error: Exception) -> CompilerResult:
+        """Convert an exception into a failed CompilerResult."""
+        if isinstance(error, json.JSONDecodeError):
             return CompilerResult(
                 success=False,
                 error_type="invalid_json",
-                error_details=f"Failed to parse JSON from response: {e}",
+                error_details=f"Failed to parse JSON from response: {error}",
             )
-
-        except LLMError as e:
+        if isinstance(error, LLMError):
             return CompilerResult(
                 success=False,
-                error_type=e.__class__.__name__,
-                error_details=str(e),
+                error_type=error.__class__.__name__,
+                error_details=str(error),
             )
-
-        except VLLMClientError as e:
+        if isinstance(error, VLLMClientError):
             return CompilerResult(
                 success=False,
                 error_type="client_error",
-                error_details=str(e),
-            )
-
-        except Exception as e:
-            return CompilerResult(
-                success=False,
-                error_type="unexpected_error",
-                error_details=f"Unexpected error: {e}",
+                error_details=str(error),
             )
+        return CompilerResult(
+            success=False,
+            error_type="unexpected_error",
+            error_details=f"Unexpected error: {error}",
+        )
 
     def _build_prompt(
         self,
@@ -586,9 +795,10 @@ class VLLMAdapter:
         )
 
         # Add schema details if not already included
-        schema_json = json.dumps(schema, indent=2)
         if "JSON SCHEMA" not in user_prompt:
-            user_prompt += f"\n\n## Required Output Schema\n\n```json\n{schema_json}\n```"
+            schema_text = render_schema(schema, self._schema_mode)
+            fence = schema_fence_language(self._schema_mode)
+            user_prompt += f"\n\n## Required Output Schema\n\n```{fence}\n{schema_text}\n```"
 
         return user_prompt
 
@@ -662,4 +872,7 @@ def create_vllm_adapter_from_config() -> VLLMAdapter:
         max_tokens=settings.get("llm.vllm.max_tokens", 4096),
         temperature=settings.get("llm.vllm.temperature", 0.0),
         timeout=settings.get("llm.vllm.timeout", 120.0),
+        schema_mode=SchemaRenderMode(settings.get("llm.schema_mode", "compact")),
+        max_in_flight=settings.get("llm.vllm.max_in_flight", DEFAULT_MAX_IN_FLIGHT),
+        multi_prompt=settings.get("llm.vllm.multi_prompt", False),
     )
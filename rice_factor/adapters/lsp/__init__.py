@@ -4,7 +4,67 @@ Provides memory-safe LSP integration for language server operations
 like rename, find references, and other semantic operations.
 """
 
+from pathlib import Path
+
 from rice_factor.adapters.lsp.client import LSPClient
-from rice_factor.adapters.lsp.memory_manager import MemoryManager
+from rice_factor.adapters.lsp.daemon import LSPDaemon, LSPDaemonClient
+from rice_factor.adapters.lsp.memory_manager import LSPMemoryManager, MemoryManager
+from rice_factor.domain.ports.lsp import LSPPort, LSPServerConfig, MemoryExceedAction
+
+
+def create_lsp_client_from_config(server_name: str, project_root: Path) -> LSPPort:
+    """Create an LSP client for a configured server.
+
+    Reads lsp.servers.<server_name> from application configuration. With
+    lsp.one_shot_mode (the default) the client starts its own server;
+    otherwise it attaches to the project's LSP daemon, which keeps the
+    server warm between commands.
+
+    Args:
+        server_name: Key of the server under lsp.servers.
+        project_root: Root directory of the project.
+
+    Returns:
+        LSPClient or LSPDaemonClient.
+
+    Raises:
+        ValueError: If the server is not configured.
+    """
+    from rice_factor.config.settings import settings
+
+    options = settings.get(f"lsp.servers.{server_name}", None)
+    if not options:
+        raise ValueError(f"Unknown LSP server: {server_name}")
+
+    command = options["command"]
+    config = LSPServerConfig(
+        name=server_name,
+        command=[command] if isinstance(command, str) else list(command),
+        languages=list(options.get("languages", [])),
+        memory_limit_mb=options.get("memory_limit_mb", 2048),
+        on_memory_exceed=MemoryExceedAction(options.get("on_memory_exceed", "kill")),
+        timeout_seconds=options.get("timeout_seconds", settings.get("lsp.default_timeout", 60)),
+        initialization_timeout=options.get("initialization_timeout", 30),
+        install_hint=options.get("install_hint"),
+        initialization_options=options.get("initialization_options"),
+    )
+    config.command.extend(options.get("args", []))
+
+    if settings.get("lsp.one_shot_mode", True):
+        return LSPClient(config, project_root)
+    return LSPDaemonClient(
+        config,
+        project_root,
+        idle_timeout=float(settings.get("lsp.daemon.idle_timeout_seconds", 600)),
+        memory_limit_mb=float(settings.get("lsp.daemon.memory_limit_mb", 8192)),
+    )
+
 
-__all__ = ["LSPClient", "MemoryManager"]
+__all__ = [
+    "LSPClient",
+    "LSPDaemon",
+    "LSPDaemonClient",
+    "LSPMemoryManager",
+    "MemoryManager",
+    "create_lsp_client_from_config",
+]
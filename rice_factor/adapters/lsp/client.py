@@ -2,17 +2,21 @@
 
 Provides a one-shot LSP client that starts a language server,
 executes operations, and shuts down. Includes memory management
-and timeout handling.
+and timeout handling. The same client backs the long-lived servers
+of the LSP daemon (see daemon.py), so it tracks open documents and
+sends changes to them as versioned didChange notifications.
 """
 
 import contextlib
+import itertools
 import json
 import logging
 import subprocess
 import threading
 import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from rice_factor.adapters.lsp.memory_manager import MemoryManager, MemoryStatus
 from rice_factor.domain.ports.lsp import (
@@ -20,12 +24,66 @@ from rice_factor.domain.ports.lsp import (
     LSPPort,
     LSPResult,
     LSPServerConfig,
+    LSPServerStatus,
     MemoryExceedAction,
     TextEdit,
 )
 
 logger = logging.getLogger(__name__)
 
+# TextDocumentSyncKind values
+SYNC_FULL = 1
+SYNC_INCREMENTAL = 2
+
+
+def _position_at(text: str, offset: int) -> dict[str, int]:
+    """Return the LSP position of a string offset.
+
+    Characters are counted in UTF-16 code units, the LSP default.
+
+    Args:
+        text: Document text.
+        offset: Offset into text.
+
+    Returns:
+        LSP Position with line and character.
+    """
+    line = text.count("\n", 0, offset)
+    line_start = text.rfind("\n", 0, offset) + 1
+    character = len(text[line_start:offset].encode("utf-16-le")) // 2
+    return {"line": line, "character": character}
+
+
+def text_change(old: str, new: str) -> dict[str, Any]:
+    """Describe how old became new as one incremental content change.
+
+    The change replaces everything between the common prefix and the
+    common suffix of the two versions.
+
+    Args:
+        old: Text the server has.
+        new: Current text.
+
+    Returns:
+        TextDocumentContentChangeEvent with a range and its new text.
+    """
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+
+    suffix = 0
+    while suffix < limit - start and old[len(old) - 1 - suffix] == new[len(new) - 1 - suffix]:
+        suffix += 1
+
+    return {
+        "range": {
+            "start": _position_at(old, start),
+            "end": _position_at(old, len(old) - suffix),
+        },
+        "text": new[start : len(new) - suffix],
+    }
+
 
 class LSPClient(LSPPort):
     """One-shot LSP client with memory management.
@@ -34,6 +92,10 @@ class LSPClient(LSPPort):
     operation, and shuts down. Memory usage is monitored and
     the server is killed if limits are exceeded.
 
+    Each request gets a future that the reader thread resolves when the
+    response with its ID arrives, so any number of requests can be in
+    flight at once (see send_requests() and find_references_many()).
+
     Attributes:
         config: Server configuration.
         project_root: Root directory of the project.
@@ -55,12 +117,19 @@ class LSPClient(LSPPort):
 
         self._process: subprocess.Popen[bytes] | None = None
         self._memory_manager: MemoryManager | None = None
-        self._request_id = 0
-        self._responses: dict[int, Any] = {}
-        self._response_lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._pending: dict[int, Future[dict[str, Any]]] = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
         self._reader_thread: threading.Thread | None = None
+        self._reading = False
         self._running = False
         self._memory_exceeded = False
+        self._started_at: float | None = None
+        self._last_operation: str | None = None
+        self._documents: dict[str, tuple[int, str]] = {}
+        self._documents_lock = threading.Lock()
+        self._sync_kind = SYNC_FULL
 
     def start(self) -> bool:
         """Start the LSP server process.
@@ -78,12 +147,14 @@ class LSPClient(LSPPort):
                 self.config.command,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                # Never read, so a chatty long-lived server would fill the pipe
+                stderr=subprocess.DEVNULL,
                 cwd=str(self.project_root),
             )
 
             self._running = True
             self._memory_exceeded = False
+            self._started_at = time.time()
 
             # Start memory monitoring
             self._memory_manager = MemoryManager(
@@ -94,6 +165,7 @@ class LSPClient(LSPPort):
             self._memory_manager.start_monitoring(self._process)
 
             # Start response reader thread
+            self._reading = True
             self._reader_thread = threading.Thread(
                 target=self._read_responses,
                 daemon=True,
@@ -151,7 +223,10 @@ class LSPClient(LSPPort):
             self._reader_thread.join(timeout=1.0)
 
         self._reader_thread = None
-        self._responses.clear()
+        self._started_at = None
+        with self._documents_lock:
+            self._documents.clear()
+        self._fail_pending(ConnectionError(f"LSP server '{self.config.name}' stopped"))
 
         logger.info(f"LSP server '{self.config.name}' stopped")
 
@@ -162,6 +237,7 @@ class LSPClient(LSPPort):
             status: Current memory status.
         """
         self._memory_exceeded = True
+        self._fail_pending(MemoryError("LSP request aborted - memory limit exceeded"))
 
         if self.config.on_memory_exceed == MemoryExceedAction.KILL:
             logger.warning(
@@ -211,6 +287,10 @@ class LSPClient(LSPPort):
             logger.error("LSP initialization failed - no response")
             return False
 
+        # Incremental didChange only if the server asks for it
+        sync = result.get("capabilities", {}).get("textDocumentSync", SYNC_FULL)
+        self._sync_kind = sync.get("change", SYNC_FULL) if isinstance(sync, dict) else sync
+
         # Send initialized notification
         self._send_notification("initialized", {})
 
@@ -233,11 +313,63 @@ class LSPClient(LSPPort):
         Returns:
             Response result or None on error/timeout.
         """
+        return self.send_requests([(method, params)], timeout)[0]
+
+    def send_requests(
+        self,
+        requests: list[tuple[str, dict[str, Any]]],
+        timeout: float | None = None,
+    ) -> list[Any | None]:
+        """Send several LSP requests at once and wait for all responses.
+
+        Every request is written before any response is awaited, so the
+        server can work on them together instead of one round-trip at a
+        time.
+
+        Args:
+            requests: (method, params) pairs.
+            timeout: Optional timeout in seconds for the whole batch.
+
+        Returns:
+            Response result for each request, in order (None on error or
+            timeout).
+        """
+        in_flight = [self._start_request(method, params) for method, params in requests]
+        deadline = time.monotonic() + (timeout or self.config.timeout_seconds)
+        return [
+            None if started is None else self._await_response(*started, deadline)
+            for started in in_flight
+        ]
+
+    def _start_request(
+        self,
+        method: str,
+        params: dict[str, Any],
+    ) -> tuple[int, Future[dict[str, Any]]] | None:
+        """Send an LSP request without waiting for its response.
+
+        Args:
+            method: LSP method name.
+            params: Request parameters.
+
+        Returns:
+            The request ID and the future its response will resolve, or
+            None if the request could not be sent.
+        """
         if not self._process or not self._process.stdin:
             return None
+        if self._memory_exceeded:
+            logger.error("LSP request aborted - memory limit exceeded")
+            return None
 
-        self._request_id += 1
-        request_id = self._request_id
+        request_id = next(self._request_ids)
+        future: Future[dict[str, Any]] = Future()
+        with self._pending_lock:
+            # Nothing would resolve the future once the reader has exited
+            if not self._reading:
+                logger.error(f"LSP server '{self.config.name}' closed the connection")
+                return None
+            self._pending[request_id] = future
 
         message = {
             "jsonrpc": "2.0",
@@ -247,38 +379,61 @@ class LSPClient(LSPPort):
         }
 
         try:
-            content = json.dumps(message)
-            header = f"Content-Length: {len(content)}\r\n\r\n"
-            self._process.stdin.write((header + content).encode("utf-8"))
-            self._process.stdin.flush()
-
+            self._write_message(message)
             logger.debug(f"LSP request [{request_id}]: {method}")
-
         except Exception as e:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
             logger.error(f"Failed to send LSP request: {e}")
             return None
 
-        # Wait for response
-        timeout = timeout or self.config.timeout_seconds
-        start_time = time.time()
+        self._last_operation = method
+        return request_id, future
 
-        while time.time() - start_time < timeout:
-            if self._memory_exceeded:
-                logger.error("LSP request aborted - memory limit exceeded")
-                return None
+    def _await_response(
+        self,
+        request_id: int,
+        future: Future[dict[str, Any]],
+        deadline: float,
+    ) -> Any | None:
+        """Wait for the response to a sent request.
 
-            with self._response_lock:
-                if request_id in self._responses:
-                    response = self._responses.pop(request_id)
-                    if "error" in response:
-                        logger.error(f"LSP error: {response['error']}")
-                        return None
-                    return response.get("result")
+        Args:
+            request_id: ID of the request.
+            future: Future resolved with the response message.
+            deadline: time.monotonic() value to give up at.
+
+        Returns:
+            Response result or None on error/timeout.
+        """
+        try:
+            response = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except TimeoutError:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            logger.warning(f"LSP request [{request_id}] timed out")
+            return None
+        except Exception as e:
+            logger.error(f"LSP request [{request_id}] failed: {e}")
+            return None
 
-            time.sleep(0.05)
+        if "error" in response:
+            logger.error(f"LSP error: {response['error']}")
+            return None
+        return response.get("result")
 
-        logger.warning(f"LSP request [{request_id}] timed out after {timeout}s")
-        return None
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every request still waiting for a response.
+
+        Args:
+            error: Exception to raise in the waiting callers.
+        """
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
 
     def _send_notification(self, method: str, params: dict[str, Any]) -> None:
         """Send an LSP notification (no response expected).
@@ -297,71 +452,110 @@ class LSPClient(LSPPort):
         }
 
         try:
-            content = json.dumps(message)
-            header = f"Content-Length: {len(content)}\r\n\r\n"
-            self._process.stdin.write((header + content).encode("utf-8"))
-            self._process.stdin.flush()
+            self._write_message(message)
         except Exception as e:
             logger.debug(f"Failed to send notification: {e}")
 
+    def _write_message(self, message: dict[str, Any]) -> None:
+        """Frame a JSON-RPC message and write it to the server.
+
+        Content-Length counts the UTF-8 encoded body, not characters, so
+        non-ASCII content does not throw the server off the stream.
+
+        Args:
+            message: JSON-RPC message.
+
+        Raises:
+            OSError: If the server's stdin is closed.
+        """
+        if not self._process or not self._process.stdin:
+            raise OSError(f"LSP server '{self.config.name}' not running")
+
+        body = json.dumps(message).encode("utf-8")
+        header = f"Content-Length: {len(body)}\r\n\r\n".encode("ascii")
+        with self._write_lock:
+            self._process.stdin.write(header + body)
+            self._process.stdin.flush()
+
     def _read_responses(self) -> None:
-        """Background thread to read LSP responses."""
+        """Background thread to read LSP messages and resolve requests."""
         if not self._process or not self._process.stdout:
             return
 
-        buffer = b""
+        stdout = self._process.stdout
 
-        while self._running and self._process.poll() is None:
-            try:
-                # Read available data
-                data = self._process.stdout.read(4096)
-                if not data:
+        try:
+            while self._running:
+                message = self._read_message(stdout)
+                if message is None:
                     break
-                buffer += data
-
-                # Parse messages from buffer
-                while True:
-                    # Look for Content-Length header
-                    header_end = buffer.find(b"\r\n\r\n")
-                    if header_end == -1:
-                        break
-
-                    header = buffer[:header_end].decode("utf-8")
-                    content_length = None
+                self._dispatch(message)
+        except Exception as e:
+            if self._running:
+                logger.debug(f"Error reading LSP response: {e}")
+        finally:
+            with self._pending_lock:
+                self._reading = False
+            self._fail_pending(
+                ConnectionError(f"LSP server '{self.config.name}' closed the connection")
+            )
 
-                    for line in header.split("\r\n"):
-                        if line.lower().startswith("content-length:"):
-                            content_length = int(line.split(":")[1].strip())
-                            break
+    def _read_message(self, stream: IO[bytes]) -> dict[str, Any] | None:
+        """Read one framed message from the server.
 
-                    if content_length is None:
-                        logger.warning("Missing Content-Length header")
-                        buffer = buffer[header_end + 4 :]
-                        continue
+        Args:
+            stream: Server's stdout.
 
-                    content_start = header_end + 4
-                    content_end = content_start + content_length
+        Returns:
+            The decoded message ({} if it is not valid JSON), or None at
+            end of stream.
+        """
+        content_length = None
 
-                    if len(buffer) < content_end:
-                        break  # Need more data
+        while True:
+            line = stream.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if line:
+                name, _, value = line.decode("ascii", errors="replace").partition(":")
+                if name.strip().lower() == "content-length":
+                    content_length = int(value.strip())
+            elif content_length is not None:
+                break
+            else:
+                logger.warning("Missing Content-Length header")
 
-                    content = buffer[content_start:content_end]
-                    buffer = buffer[content_end:]
+        content = stream.read(content_length)
+        if len(content) < content_length:
+            return None
 
-                    try:
-                        message = json.loads(content.decode("utf-8"))
+        try:
+            message = json.loads(content.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to parse LSP message: {e}")
+            return {}
+        return message if isinstance(message, dict) else {}
 
-                        if "id" in message:
-                            with self._response_lock:
-                                self._responses[message["id"]] = message
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        """Route a message from the server.
 
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse LSP message: {e}")
+        Args:
+            message: Decoded JSON-RPC message.
+        """
+        if "method" in message:
+            # Server requests (e.g. workspace/configuration) get an empty
+            # reply so the server does not wait on us; notifications are
+            # ignored
+            if "id" in message:
+                with contextlib.suppress(Exception):
+                    self._write_message({"jsonrpc": "2.0", "id": message["id"], "result": None})
+            return
 
-            except Exception as e:
-                if self._running:
-                    logger.debug(f"Error reading LSP response: {e}")
-                break
+        with self._pending_lock:
+            future = self._pending.pop(message.get("id"), None)  # type: ignore[arg-type]
+        if future is not None and not future.done():
+            future.set_result(message)
 
     def rename(
         self,
@@ -381,53 +575,75 @@ class LSPClient(LSPPort):
         Returns:
             LSPResult with text edits.
         """
-        if not self._process:
-            return LSPResult(
-                success=False,
-                edits=[],
-                locations=[],
-                errors=[f"LSP server '{self.config.name}' not running"],
-                memory_used_mb=0,
-            )
+        return self.rename_many([(file_path, line, column, new_name)])[0]
 
-        # Open the file in the server
-        file_uri = Path(file_path).as_uri()
-        self._open_document(file_path)
+    def rename_many(
+        self,
+        renames: list[tuple[str, int, int, str]],
+    ) -> list[LSPResult]:
+        """Rename many symbols with all requests in flight at once.
 
-        # Send rename request
-        params = {
-            "textDocument": {"uri": file_uri},
-            "position": {"line": line, "character": column},
-            "newName": new_name,
-        }
+        The server computes every rename against the same document
+        versions, so the returned edits can be merged and applied together.
 
-        result = self._send_request("textDocument/rename", params)
+        Args:
+            renames: (file path, line, column, new name) of each symbol,
+                0-indexed.
 
-        memory_used = (
-            self._memory_manager.get_current_memory_mb()
-            if self._memory_manager
-            else 0.0
+        Returns:
+            LSPResult with text edits for each rename, in order.
+        """
+        if not self._process:
+            return [
+                LSPResult(
+                    success=False,
+                    edits=[],
+                    locations=[],
+                    errors=[f"LSP server '{self.config.name}' not running"],
+                    memory_used_mb=0,
+                )
+                for _ in renames
+            ]
+
+        # Open each file in the server once
+        for file_path in dict.fromkeys(path for path, _, _, _ in renames):
+            self._open_document(file_path)
+
+        # Send rename requests
+        results = self.send_requests(
+            [
+                (
+                    "textDocument/rename",
+                    {
+                        "textDocument": {"uri": Path(file_path).as_uri()},
+                        "position": {"line": line, "character": column},
+                        "newName": new_name,
+                    },
+                )
+                for file_path, line, column, new_name in renames
+            ]
         )
 
-        if result is None:
-            return LSPResult(
+        memory_used = self.get_memory_usage_mb()
+
+        return [
+            LSPResult(
                 success=False,
                 edits=[],
                 locations=[],
                 errors=["Rename request failed or timed out"],
                 memory_used_mb=memory_used,
             )
-
-        # Parse workspace edit
-        edits = self._parse_workspace_edit(result)
-
-        return LSPResult(
-            success=True,
-            edits=edits,
-            locations=[],
-            errors=[],
-            memory_used_mb=memory_used,
-        )
+            if result is None
+            else LSPResult(
+                success=True,
+                edits=self._parse_workspace_edit(result),
+                locations=[],
+                errors=[],
+                memory_used_mb=memory_used,
+            )
+            for result in results
+        ]
 
     def find_references(
         self,
@@ -447,56 +663,209 @@ class LSPClient(LSPPort):
         Returns:
             LSPResult with locations.
         """
+        return self.find_references_many([(file_path, line, column)], include_declaration)[0]
+
+    def find_references_many(
+        self,
+        positions: list[tuple[str, int, int]],
+        include_declaration: bool = True,
+    ) -> list[LSPResult]:
+        """Find references to many symbols with all requests in flight at once.
+
+        Args:
+            positions: (file path, line, column) of each symbol, 0-indexed.
+            include_declaration: Whether to include the declarations.
+
+        Returns:
+            LSPResult with locations for each position, in order.
+        """
         if not self._process:
-            return LSPResult(
+            return [
+                LSPResult(
+                    success=False,
+                    edits=[],
+                    locations=[],
+                    errors=[f"LSP server '{self.config.name}' not running"],
+                    memory_used_mb=0,
+                )
+                for _ in positions
+            ]
+
+        # Open each file in the server once
+        for file_path in dict.fromkeys(path for path, _, _ in positions):
+            self._open_document(file_path)
+
+        # Send references requests
+        results = self.send_requests(
+            [
+                (
+                    "textDocument/references",
+                    {
+                        "textDocument": {"uri": Path(file_path).as_uri()},
+                        "position": {"line": line, "character": column},
+                        "context": {"includeDeclaration": include_declaration},
+                    },
+                )
+                for file_path, line, column in positions
+            ]
+        )
+
+        memory_used = self.get_memory_usage_mb()
+
+        return [
+            LSPResult(
                 success=False,
                 edits=[],
                 locations=[],
+                errors=["Find references request failed or timed out"],
+                memory_used_mb=memory_used,
+            )
+            if result is None
+            else LSPResult(
+                success=True,
+                edits=[],
+                locations=self._parse_locations(result),
+                errors=[],
+                memory_used_mb=memory_used,
+            )
+            for result in results
+        ]
+
+    def find_definition(
+        self,
+        file_path: str,
+        line: int,
+        column: int,
+    ) -> LSPResult:
+        """Find the definition of a symbol.
+
+        Args:
+            file_path: Path to the file containing the symbol.
+            line: Line number (0-indexed).
+            column: Column number (0-indexed).
+
+        Returns:
+            LSPResult with the definition's locations.
+        """
+        if not self._process:
+            return LSPResult(
+                success=False,
                 errors=[f"LSP server '{self.config.name}' not running"],
-                memory_used_mb=0,
             )
 
-        # Open the file in the server
-        file_uri = Path(file_path).as_uri()
         self._open_document(file_path)
+        result = self._send_request(
+            "textDocument/definition",
+            {
+                "textDocument": {"uri": Path(file_path).as_uri()},
+                "position": {"line": line, "character": column},
+            },
+        )
 
-        # Send references request
-        params = {
-            "textDocument": {"uri": file_uri},
-            "position": {"line": line, "character": column},
-            "context": {"includeDeclaration": include_declaration},
-        }
+        memory_used = self.get_memory_usage_mb()
+
+        if result is None:
+            return LSPResult(
+                success=False,
+                errors=["Find definition request failed or timed out"],
+                memory_used_mb=memory_used,
+            )
+
+        # Location | Location[] | LocationLink[]
+        if isinstance(result, dict):
+            result = [result]
+        locations = [
+            {
+                "uri": loc["targetUri"],
+                "range": loc.get("targetSelectionRange", loc.get("targetRange", {})),
+            }
+            if "targetUri" in loc
+            else loc
+            for loc in result
+        ]
+
+        return LSPResult(
+            success=True,
+            locations=self._parse_locations(locations),
+            memory_used_mb=memory_used,
+        )
+
+    def code_action(
+        self,
+        file_path: str,
+        start_line: int,
+        start_column: int,
+        end_line: int,
+        end_column: int,
+        action_kind: str | None = None,
+    ) -> LSPResult:
+        """Request code actions for a range.
 
-        result = self._send_request("textDocument/references", params)
+        Args:
+            file_path: Path to the file.
+            start_line: Starting line (0-indexed).
+            start_column: Starting column (0-indexed).
+            end_line: Ending line (0-indexed).
+            end_column: Ending column (0-indexed).
+            action_kind: Optional filter for action kind.
 
-        memory_used = (
-            self._memory_manager.get_current_memory_mb()
-            if self._memory_manager
-            else 0.0
+        Returns:
+            LSPResult with the edits of the first action that carries a
+            workspace edit; the titles of the others are warnings.
+        """
+        if not self._process:
+            return LSPResult(
+                success=False,
+                errors=[f"LSP server '{self.config.name}' not running"],
+            )
+
+        self._open_document(file_path)
+        context: dict[str, Any] = {"diagnostics": []}
+        if action_kind:
+            context["only"] = [action_kind]
+        result = self._send_request(
+            "textDocument/codeAction",
+            {
+                "textDocument": {"uri": Path(file_path).as_uri()},
+                "range": {
+                    "start": {"line": start_line, "character": start_column},
+                    "end": {"line": end_line, "character": end_column},
+                },
+                "context": context,
+            },
         )
 
+        memory_used = self.get_memory_usage_mb()
+
         if result is None:
             return LSPResult(
                 success=False,
-                edits=[],
-                locations=[],
-                errors=["Find references request failed or timed out"],
+                errors=["Code action request failed or timed out"],
                 memory_used_mb=memory_used,
             )
 
-        # Parse locations
-        locations = self._parse_locations(result)
+        edits: list[TextEdit] = []
+        warnings: list[str] = []
+        for action in result:
+            if not edits and action.get("edit"):
+                edits = self._parse_workspace_edit(action["edit"])
+            else:
+                warnings.append(f"Other code action: {action.get('title', '')}")
 
         return LSPResult(
             success=True,
-            edits=[],
-            locations=locations,
-            errors=[],
+            edits=edits,
+            warnings=warnings,
             memory_used_mb=memory_used,
         )
 
     def _open_document(self, file_path: str) -> None:
-        """Notify server that a document is open.
+        """Make the server's copy of a document match the file.
+
+        The first call sends didOpen with version 1. Later calls send a
+        didChange with the next version if the file changed since, so a
+        long-lived server keeps its analysis instead of reopening the
+        document.
 
         Args:
             file_path: Path to the file.
@@ -505,37 +874,93 @@ class LSPClient(LSPPort):
             content = Path(file_path).read_text(encoding="utf-8")
             file_uri = Path(file_path).as_uri()
 
-            # Detect language from extension
-            ext = Path(file_path).suffix.lower()
-            language_id = {
-                ".py": "python",
-                ".go": "go",
-                ".rs": "rust",
-                ".java": "java",
-                ".kt": "kotlin",
-                ".ts": "typescript",
-                ".tsx": "typescript",
-                ".js": "javascript",
-                ".jsx": "javascript",
-                ".rb": "ruby",
-                ".cs": "csharp",
-                ".php": "php",
-            }.get(ext, "plaintext")
-
-            self._send_notification(
-                "textDocument/didOpen",
-                {
-                    "textDocument": {
-                        "uri": file_uri,
-                        "languageId": language_id,
-                        "version": 1,
-                        "text": content,
-                    }
-                },
-            )
+            with self._documents_lock:
+                opened = self._documents.get(file_uri)
+                if opened is None:
+                    self._documents[file_uri] = (1, content)
+                    self._send_notification(
+                        "textDocument/didOpen",
+                        {
+                            "textDocument": {
+                                "uri": file_uri,
+                                "languageId": self._language_id(file_path),
+                                "version": 1,
+                                "text": content,
+                            }
+                        },
+                    )
+                    return
+
+                version, text = opened
+                if text == content:
+                    return
+                self._documents[file_uri] = (version + 1, content)
+                change = (
+                    text_change(text, content)
+                    if self._sync_kind == SYNC_INCREMENTAL
+                    else {"text": content}
+                )
+                self._send_notification(
+                    "textDocument/didChange",
+                    {
+                        "textDocument": {"uri": file_uri, "version": version + 1},
+                        "contentChanges": [change],
+                    },
+                )
         except Exception as e:
             logger.warning(f"Failed to open document in LSP: {e}")
 
+    def close_document(self, file_path: str) -> None:
+        """Tell the server a document is no longer open.
+
+        Args:
+            file_path: Path to the file.
+        """
+        file_uri = Path(file_path).as_uri()
+        with self._documents_lock:
+            if self._documents.pop(file_uri, None) is not None:
+                self._send_notification(
+                    "textDocument/didClose", {"textDocument": {"uri": file_uri}}
+                )
+
+    def get_document_version(self, file_path: str) -> int | None:
+        """Get the version the server has of a document.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            Version last sent, or None if the document is not open.
+        """
+        opened = self._documents.get(Path(file_path).as_uri())
+        return opened[0] if opened else None
+
+    @staticmethod
+    def _language_id(file_path: str) -> str:
+        """Detect the LSP language identifier from a file extension.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            Language identifier, or "plaintext" if unknown.
+        """
+        ext = Path(file_path).suffix.lower()
+        return {
+            ".py": "python",
+            ".go": "go",
+            ".rs": "rust",
+            ".java": "java",
+            ".kt": "kotlin",
+            ".ts": "typescript",
+            ".tsx": "typescript",
+            ".js": "javascript",
+            ".jsx": "javascript",
+            ".rb": "ruby",
+            ".cs": "csharp",
+            ".php": "php",
+        }.get(ext, "plaintext")
+
     def _parse_workspace_edit(self, result: dict[str, Any]) -> list[TextEdit]:
         """Parse a WorkspaceEdit into TextEdit list.
 
@@ -662,10 +1087,34 @@ class LSPClient(LSPPort):
 
         return shutil.which(self.config.command[0]) is not None
 
+    def get_status(self) -> LSPServerStatus:
+        """Get current status of the LSP server.
+
+        Returns:
+            LSPServerStatus with runtime information.
+        """
+        running = self._process is not None and self._process.poll() is None
+        return LSPServerStatus(
+            name=self.config.name,
+            is_running=running,
+            pid=self._process.pid if self._process else None,
+            memory_mb=self.get_memory_usage_mb(),
+            uptime_seconds=time.time() - self._started_at if self._started_at else 0.0,
+            last_operation=self._last_operation,
+        )
+
+    def get_config(self) -> LSPServerConfig:
+        """Get the configuration for this LSP client.
+
+        Returns:
+            LSPServerConfig with all settings.
+        """
+        return self.config
+
     def get_supported_operations(self) -> list[str]:
         """Return list of supported LSP operations.
 
         Returns:
             List of operation names.
         """
-        return ["rename", "find_references"]
+        return ["rename", "find_references", "find_definition", "code_action"]
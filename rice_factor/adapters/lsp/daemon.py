@@ -0,0 +1,658 @@
+"""Per-workspace LSP daemon that keeps language servers warm.
+
+Starting a language server and waiting for it to index the workspace
+dominates one-shot LSP operations, especially for JVM servers and
+rust-analyzer. The daemon runs in the background for one project and
+keeps an LSPClient per server running between CLI invocations, so
+repeated renames and reference lookups only pay for the request itself.
+The clients track open documents, so a file changed between operations
+is sent as a versioned didChange instead of being reopened.
+
+CLI processes attach through LSPDaemonClient, an LSPPort that forwards
+each operation over a loopback socket. The daemon's port and an access
+token are kept in a state file readable only by the user
+(.project/lsp/daemon.json). Idle servers are stopped by an
+LSPMemoryManager, and the daemon exits once it has had no servers for
+the idle timeout.
+
+Protocol: one JSON object per line in each direction. A request is
+{"token", "op", "config", "args"}; a response is {"ok": true, "result"}
+or {"ok": false, "error"}.
+
+Run directly with:
+    python -m rice_factor.adapters.lsp.daemon --root PROJECT_DIR
+"""
+
+import argparse
+import contextlib
+import hmac
+import io
+import json
+import logging
+import os
+import secrets
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from rice_factor.adapters.lsp.client import LSPClient
+from rice_factor.adapters.lsp.memory_manager import LSPMemoryManager
+from rice_factor.domain.ports.lsp import (
+    Location,
+    LSPPort,
+    LSPResult,
+    LSPServerConfig,
+    LSPServerStatus,
+    MemoryExceedAction,
+    TextEdit,
+)
+
+logger = logging.getLogger(__name__)
+
+# State file, relative to the project root
+DEFAULT_STATE_FILE = Path(".project") / "lsp" / "daemon.json"
+
+# Seconds an unused server stays warm
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+# Memory budget for all servers of one daemon
+DEFAULT_MEMORY_LIMIT_MB = 8192
+
+# LSPClient operations a daemon client may call
+OPERATIONS = frozenset(
+    {
+        "rename",
+        "rename_many",
+        "find_references",
+        "find_references_many",
+        "find_definition",
+        "code_action",
+        "get_status",
+    }
+)
+
+
+def config_to_dict(config: LSPServerConfig) -> dict[str, Any]:
+    """Convert a server configuration to JSON-compatible data.
+
+    Args:
+        config: Server configuration.
+
+    Returns:
+        Dictionary accepted by config_from_dict().
+    """
+    return {**asdict(config), "on_memory_exceed": config.on_memory_exceed.value}
+
+
+def config_from_dict(data: dict[str, Any]) -> LSPServerConfig:
+    """Rebuild a server configuration sent by config_to_dict().
+
+    Args:
+        data: Configuration data.
+
+    Returns:
+        LSPServerConfig.
+    """
+    return LSPServerConfig(
+        **{**data, "on_memory_exceed": MemoryExceedAction(data["on_memory_exceed"])}
+    )
+
+
+def result_from_dict(data: dict[str, Any]) -> LSPResult:
+    """Rebuild an LSPResult sent by the daemon.
+
+    Args:
+        data: asdict() of an LSPResult.
+
+    Returns:
+        LSPResult with its edits and locations.
+    """
+    return LSPResult(
+        **{
+            **data,
+            "edits": [TextEdit(**edit) for edit in data.get("edits", [])],
+            "locations": [Location(**loc) for loc in data.get("locations", [])],
+        }
+    )
+
+
+class _DaemonServer(socketserver.ThreadingTCPServer):
+    """TCP server that hands requests to its LSPDaemon."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, lsp_daemon: "LSPDaemon") -> None:
+        self.lsp_daemon = lsp_daemon
+        super().__init__(("127.0.0.1", 0), _RequestHandler)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serves the requests of one attached client."""
+
+    server: _DaemonServer
+
+    def handle(self) -> None:
+        """Answer each request line until the client disconnects."""
+        for line in self.rfile:
+            try:
+                response = self.server.lsp_daemon.handle(json.loads(line))
+            except Exception as e:
+                response = {"ok": False, "error": f"Invalid request: {e}"}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class LSPDaemon:
+    """Background process keeping LSP servers warm for one project.
+
+    Attributes:
+        project_root: Root directory of the project.
+        state_file: File holding the daemon's port and access token.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        state_file: Path | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        memory_limit_mb: float = DEFAULT_MEMORY_LIMIT_MB,
+        check_interval: float = 30.0,
+    ) -> None:
+        """Initialize the daemon.
+
+        Args:
+            project_root: Root directory of the project.
+            state_file: State file (defaults to .project/lsp/daemon.json).
+            idle_timeout: Seconds an unused server stays warm; the daemon
+                exits after this long without servers.
+            memory_limit_mb: Memory budget for all servers together.
+            check_interval: Seconds between eviction checks.
+        """
+        self.project_root = project_root.resolve()
+        self.state_file = state_file or self.project_root / DEFAULT_STATE_FILE
+        self.check_interval = check_interval
+
+        self._pool = LSPMemoryManager(limit_mb=memory_limit_mb, idle_timeout=idle_timeout)
+        self._token = secrets.token_hex(16)
+        self._server: _DaemonServer | None = None
+        self._server_locks: dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self._busy: set[str] = set()
+        self._last_request = time.monotonic()
+        self._stopped = threading.Event()
+
+    def serve_forever(self) -> bool:
+        """Serve attached clients until shut down or idle.
+
+        Returns:
+            False if another daemon already serves the project.
+        """
+        existing = _connect(self.state_file, timeout=1.0)
+        if existing is not None:
+            existing[1].close()
+            existing[0].close()
+            logger.info(f"LSP daemon already running for {self.project_root}")
+            return False
+
+        self._server = _DaemonServer(self)
+        self._write_state(self._server.server_address[1])
+        evictor = threading.Thread(target=self._evict_loop, daemon=True, name="lsp-daemon-evictor")
+        evictor.start()
+        logger.info(
+            f"LSP daemon serving {self.project_root} on port {self._server.server_address[1]}"
+        )
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._stopped.set()
+            self._server.server_close()
+            self._pool.stop_all()
+            self._remove_state()
+            logger.info("LSP daemon stopped")
+        return True
+
+    def shutdown(self) -> None:
+        """Stop serving (call from another thread than serve_forever)."""
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Run one client request.
+
+        Args:
+            request: Decoded request.
+
+        Returns:
+            Response to send back.
+        """
+        if not hmac.compare_digest(str(request.get("token", "")), self._token):
+            return {"ok": False, "error": "Invalid LSP daemon token"}
+        self._last_request = time.monotonic()
+
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "result": {"pid": os.getpid(), "servers": self._pool.names()}}
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True, "result": None}
+        if op not in OPERATIONS:
+            return {"ok": False, "error": f"Unknown LSP daemon operation: {op}"}
+
+        config = config_from_dict(request["config"])
+        with self._lock_for(config.name):
+            self._busy.add(config.name)
+            try:
+                server = self._get_server(config)
+                if server is None:
+                    return {
+                        "ok": False,
+                        "error": f"LSP server '{config.name}' failed to start",
+                    }
+                result = getattr(server, op)(**request.get("args", {}))
+            except Exception as e:
+                logger.exception(f"LSP daemon operation {op} failed")
+                return {"ok": False, "error": str(e)}
+            finally:
+                self._busy.discard(config.name)
+
+        if isinstance(result, list):
+            return {"ok": True, "result": [asdict(item) for item in result]}
+        return {"ok": True, "result": asdict(result)}
+
+    def _lock_for(self, name: str) -> threading.Lock:
+        """Get the lock serializing operations on one server."""
+        with self._locks_lock:
+            return self._server_locks.setdefault(name, threading.Lock())
+
+    def _get_server(self, config: LSPServerConfig) -> LSPPort | None:
+        """Get the warm server for a configuration, starting it if needed.
+
+        Must be called with the server's lock held.
+        """
+        server = self._pool.get(config.name)
+        if server is not None and server.get_status().is_running:
+            return server
+        if server is not None:
+            # Exited or was killed for exceeding its own memory limit
+            server.stop()
+
+        server = LSPClient(config, self.project_root)
+        if not server.start():
+            return None
+        self._pool.register(config.name, server)
+        return server
+
+    def _evict_loop(self) -> None:
+        """Stop idle servers, and the daemon once it has none."""
+        while not self._stopped.wait(self.check_interval):
+            self._pool.evict(busy=set(self._busy))
+            idle = time.monotonic() - self._last_request
+            if not self._pool.names() and not self._busy and idle >= self._pool.idle_timeout:
+                logger.info("LSP daemon idle, shutting down")
+                self.shutdown()
+
+    def _write_state(self, port: int) -> None:
+        """Publish the port and token for clients, readable by the user only."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_file.with_name(f"{self.state_file.name}.{os.getpid()}.tmp")
+        tmp.touch(mode=0o600)
+        tmp.write_text(
+            json.dumps({"port": port, "pid": os.getpid(), "token": self._token}),
+            encoding="utf-8",
+        )
+        tmp.replace(self.state_file)
+
+    def _remove_state(self) -> None:
+        """Delete the state file unless another daemon has replaced it."""
+        with contextlib.suppress(OSError, ValueError):
+            state = json.loads(self.state_file.read_text(encoding="utf-8"))
+            if state.get("token") == self._token:
+                self.state_file.unlink()
+
+
+def _connect(
+    state_file: Path,
+    timeout: float,
+) -> tuple[socket.socket, io.BufferedIOBase, str] | None:
+    """Connect to the daemon described by a state file.
+
+    Args:
+        state_file: Daemon state file.
+        timeout: Seconds to wait for the connection and the ping.
+
+    Returns:
+        The socket, a buffered stream over it and the token, or None if
+        no daemon answers.
+    """
+    try:
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+        sock = socket.create_connection(("127.0.0.1", state["port"]), timeout=timeout)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    stream = sock.makefile("rwb")
+    try:
+        stream.write(json.dumps({"token": state["token"], "op": "ping"}).encode() + b"\n")
+        stream.flush()
+        if json.loads(stream.readline()).get("ok"):
+            return sock, stream, state["token"]
+    except (OSError, ValueError):
+        pass
+    stream.close()
+    sock.close()
+    return None
+
+
+class LSPDaemonClient(LSPPort):
+    """LSPPort that runs operations on a server kept warm by the daemon.
+
+    start() attaches to the project's daemon, spawning it if needed, and
+    makes sure the server is running; stop() detaches and leaves the
+    server warm for the next command.
+
+    Attributes:
+        config: Server configuration.
+        project_root: Root directory of the project.
+    """
+
+    def __init__(
+        self,
+        config: LSPServerConfig,
+        project_root: Path,
+        state_file: Path | None = None,
+        spawn: bool = True,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        memory_limit_mb: float = DEFAULT_MEMORY_LIMIT_MB,
+        connect_timeout: float = 10.0,
+    ) -> None:
+        """Initialize the daemon client.
+
+        Args:
+            config: Server configuration.
+            project_root: Root directory of the project.
+            state_file: State file (defaults to .project/lsp/daemon.json).
+            spawn: Start a daemon if none is running.
+            idle_timeout: Idle timeout for a spawned daemon.
+            memory_limit_mb: Memory budget for a spawned daemon.
+            connect_timeout: Seconds to wait for a spawned daemon.
+        """
+        self.config = config
+        self.project_root = project_root.resolve()
+        self.state_file = state_file or self.project_root / DEFAULT_STATE_FILE
+        self.spawn = spawn
+        self.idle_timeout = idle_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.connect_timeout = connect_timeout
+
+        self._connection: tuple[socket.socket, io.BufferedIOBase, str] | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """Attach to the daemon and make sure the server is running.
+
+        Returns:
+            True if the server is running in the daemon.
+        """
+        if self._connection is None:
+            self._connection = _connect(self.state_file, timeout=1.0)
+        if self._connection is None and self.spawn:
+            self._spawn_daemon()
+            deadline = time.monotonic() + self.connect_timeout
+            while self._connection is None and time.monotonic() < deadline:
+                time.sleep(0.05)
+                self._connection = _connect(self.state_file, timeout=1.0)
+        if self._connection is None:
+            logger.error(f"LSP daemon not reachable for {self.project_root}")
+            return False
+
+        # Allow for the server starting and initializing on first use
+        self._connection[0].settimeout(
+            self.config.timeout_seconds + self.config.initialization_timeout
+        )
+        return self.get_status().is_running
+
+    def stop(self) -> None:
+        """Detach from the daemon, leaving the server warm."""
+        with self._lock:
+            if self._connection is not None:
+                sock, stream, _ = self._connection
+                with contextlib.suppress(OSError):
+                    stream.close()
+                    sock.close()
+                self._connection = None
+
+    def shutdown_daemon(self) -> None:
+        """Stop the daemon and all of its servers."""
+        self._call("shutdown", {})
+        self.stop()
+
+    def _spawn_daemon(self) -> None:
+        """Start a daemon process for the project in the background."""
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "rice_factor.adapters.lsp.daemon",
+                "--root",
+                str(self.project_root),
+                "--state-file",
+                str(self.state_file),
+                "--idle-timeout",
+                str(self.idle_timeout),
+                "--memory-limit-mb",
+                str(self.memory_limit_mb),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=str(self.project_root),
+            start_new_session=True,
+        )
+
+    def _call(self, op: str, args: dict[str, Any]) -> Any:
+        """Run an operation in the daemon.
+
+        Args:
+            op: Operation name.
+            args: Keyword arguments for the operation.
+
+        Returns:
+            The operation's result data.
+
+        Raises:
+            RuntimeError: If not attached or the daemon reports an error.
+        """
+        with self._lock:
+            if self._connection is None:
+                raise RuntimeError("Not attached to the LSP daemon")
+            _, stream, token = self._connection
+            request = {
+                "token": token,
+                "op": op,
+                "config": config_to_dict(self.config),
+                "args": args,
+            }
+            try:
+                stream.write(json.dumps(request).encode("utf-8") + b"\n")
+                stream.flush()
+                line = stream.readline()
+            except OSError as e:
+                raise RuntimeError(f"LSP daemon connection failed: {e}") from e
+        if not line:
+            raise RuntimeError("LSP daemon closed the connection")
+
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error", "LSP daemon request failed"))
+        return response.get("result")
+
+    def _call_result(self, op: str, args: dict[str, Any]) -> LSPResult:
+        """Run an operation that returns an LSPResult."""
+        try:
+            return result_from_dict(self._call(op, args))
+        except Exception as e:
+            return LSPResult(success=False, errors=[str(e)], server_used=self.config.name)
+
+    def rename(
+        self,
+        file_path: str,
+        line: int,
+        column: int,
+        new_name: str,
+    ) -> LSPResult:
+        """Rename a symbol across the project (see LSPClient.rename)."""
+        return self._call_result(
+            "rename",
+            {"file_path": file_path, "line": line, "column": column, "new_name": new_name},
+        )
+
+    def rename_many(
+        self,
+        renames: list[tuple[str, int, int, str]],
+    ) -> list[LSPResult]:
+        """Rename many symbols in one round-trip (see LSPClient.rename_many)."""
+        try:
+            results = self._call("rename_many", {"renames": renames})
+        except Exception as e:
+            return [
+                LSPResult(success=False, errors=[str(e)], server_used=self.config.name)
+                for _ in renames
+            ]
+        return [result_from_dict(result) for result in results]
+
+    def find_references(
+        self,
+        file_path: str,
+        line: int,
+        column: int,
+        include_declaration: bool = True,
+    ) -> LSPResult:
+        """Find all references to a symbol (see LSPClient.find_references)."""
+        return self._call_result(
+            "find_references",
+            {
+                "file_path": file_path,
+                "line": line,
+                "column": column,
+                "include_declaration": include_declaration,
+            },
+        )
+
+    def find_references_many(
+        self,
+        positions: list[tuple[str, int, int]],
+        include_declaration: bool = True,
+    ) -> list[LSPResult]:
+        """Find references to many symbols (see LSPClient.find_references_many)."""
+        try:
+            results = self._call(
+                "find_references_many",
+                {"positions": positions, "include_declaration": include_declaration},
+            )
+        except Exception as e:
+            return [
+                LSPResult(success=False, errors=[str(e)], server_used=self.config.name)
+                for _ in positions
+            ]
+        return [result_from_dict(result) for result in results]
+
+    def find_definition(
+        self,
+        file_path: str,
+        line: int,
+        column: int,
+    ) -> LSPResult:
+        """Find the definition of a symbol (see LSPClient.find_definition)."""
+        return self._call_result(
+            "find_definition", {"file_path": file_path, "line": line, "column": column}
+        )
+
+    def code_action(
+        self,
+        file_path: str,
+        start_line: int,
+        start_column: int,
+        end_line: int,
+        end_column: int,
+        action_kind: str | None = None,
+    ) -> LSPResult:
+        """Request code actions for a range (see LSPClient.code_action)."""
+        return self._call_result(
+            "code_action",
+            {
+                "file_path": file_path,
+                "start_line": start_line,
+                "start_column": start_column,
+                "end_line": end_line,
+                "end_column": end_column,
+                "action_kind": action_kind,
+            },
+        )
+
+    def get_memory_usage_mb(self) -> float:
+        """Get current memory usage of the server in the daemon.
+
+        Returns:
+            Memory usage in megabytes, 0.0 if not running.
+        """
+        return self.get_status().memory_mb
+
+    def get_status(self) -> LSPServerStatus:
+        """Get the status of the server in the daemon.
+
+        Returns:
+            LSPServerStatus; not running if the daemon is unreachable.
+        """
+        try:
+            return LSPServerStatus(**self._call("get_status", {}))
+        except Exception as e:
+            logger.debug(f"LSP daemon status failed: {e}")
+            return LSPServerStatus(name=self.config.name)
+
+    def get_config(self) -> LSPServerConfig:
+        """Get the configuration for this LSP client.
+
+        Returns:
+            LSPServerConfig with all settings.
+        """
+        return self.config
+
+    def is_available(self) -> bool:
+        """Check if the LSP server command is available.
+
+        Returns:
+            True if the server command exists.
+        """
+        return shutil.which(self.config.command[0]) is not None
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the LSP daemon for a project until it is idle or shut down."""
+    parser = argparse.ArgumentParser(description="Rice-Factor LSP daemon")
+    parser.add_argument("--root", type=Path, required=True, help="Project root")
+    parser.add_argument("--state-file", type=Path, help="Daemon state file")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    parser.add_argument("--memory-limit-mb", type=float, default=DEFAULT_MEMORY_LIMIT_MB)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    LSPDaemon(
+        args.root,
+        state_file=args.state_file,
+        idle_timeout=args.idle_timeout,
+        memory_limit_mb=args.memory_limit_mb,
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 """Memory management for LSP servers.
 
 Monitors memory usage of LSP server processes and takes
-action when configured limits are exceeded.
+action when configured limits are exceeded. LSPMemoryManager
+does the same for a pool of long-lived servers, stopping idle
+ones when they have been unused too long or the pool uses too
+much memory.
 """
 
 import logging
@@ -10,6 +13,10 @@ import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rice_factor.domain.ports.lsp import LSPPort
 
 logger = logging.getLogger(__name__)
 
@@ -266,3 +273,127 @@ class MemoryManager:
             return self.kill_process()
         finally:
             self.stop_monitoring()
+
+
+class LSPMemoryManager:
+    """Keeps a pool of warm LSP servers within an idle and memory budget.
+
+    Servers are registered under a name and touched whenever they are
+    used. evict() stops servers that have been idle longer than
+    idle_timeout, then stops the least recently used ones while the
+    pool's total memory exceeds limit_mb. Memory is only known when
+    psutil is installed.
+
+    Attributes:
+        limit_mb: Memory budget for all servers together.
+        idle_timeout: Seconds a server may stay unused.
+    """
+
+    def __init__(self, limit_mb: float = 8192, idle_timeout: float = 600.0) -> None:
+        """Initialize the pool.
+
+        Args:
+            limit_mb: Memory budget for all servers together.
+            idle_timeout: Seconds a server may stay unused.
+        """
+        self.limit_mb = limit_mb
+        self.idle_timeout = idle_timeout
+
+        self._servers: dict[str, LSPPort] = {}
+        self._last_used: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, server: "LSPPort") -> None:
+        """Add a running server to the pool.
+
+        Args:
+            name: Name to look the server up by.
+            server: The started server.
+        """
+        with self._lock:
+            self._servers[name] = server
+            self._last_used[name] = time.monotonic()
+
+    def get(self, name: str) -> "LSPPort | None":
+        """Get a server and mark it as used.
+
+        Args:
+            name: Name the server was registered under.
+
+        Returns:
+            The server, or None if it is not in the pool.
+        """
+        with self._lock:
+            server = self._servers.get(name)
+            if server is not None:
+                self._last_used[name] = time.monotonic()
+            return server
+
+    def names(self) -> list[str]:
+        """Get the names of the pooled servers, least recently used first.
+
+        Returns:
+            Server names.
+        """
+        with self._lock:
+            return sorted(self._servers, key=self._last_used.__getitem__)
+
+    def total_memory_mb(self) -> float:
+        """Get the memory used by all pooled servers.
+
+        Returns:
+            Total memory in megabytes.
+        """
+        with self._lock:
+            servers = list(self._servers.values())
+        return sum(server.get_memory_usage_mb() for server in servers)
+
+    def evict(self, busy: set[str] | None = None) -> list[str]:
+        """Stop idle servers that are over the idle or memory budget.
+
+        Args:
+            busy: Names of servers in use, which are never evicted.
+
+        Returns:
+            Names of the stopped servers.
+        """
+        busy = busy or set()
+        now = time.monotonic()
+        evicted: list[str] = []
+
+        with self._lock:
+            idle = [
+                name
+                for name in sorted(self._servers, key=self._last_used.__getitem__)
+                if name not in busy
+            ]
+            memory = {name: self._servers[name].get_memory_usage_mb() for name in idle}
+            total = sum(memory.values())
+
+            for name in idle:
+                over_memory = total > self.limit_mb
+                if not over_memory and now - self._last_used[name] < self.idle_timeout:
+                    continue
+                logger.info(
+                    f"Evicting LSP server '{name}' "
+                    f"({'memory limit' if over_memory else 'idle'}, {memory[name]:.0f}MB)"
+                )
+                total -= memory[name]
+                evicted.append(name)
+
+            servers = [self._servers.pop(name) for name in evicted]
+            for name in evicted:
+                del self._last_used[name]
+
+        for server in servers:
+            server.stop()
+        return evicted
+
+    def stop_all(self) -> None:
+        """Stop every pooled server."""
+        with self._lock:
+            servers = list(self._servers.values())
+            self._servers.clear()
+            self._last_used.clear()
+        for server in servers:
+            server.stop()
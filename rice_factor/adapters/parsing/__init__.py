@@ -3,6 +3,24 @@
 Provides language-agnostic AST parsing using tree-sitter.
 """
 
-from rice_factor.adapters.parsing.treesitter_adapter import TreeSitterAdapter
+from rice_factor.adapters.parsing.parse_cache import (
+    ParseCache,
+    ParseCacheStats,
+    get_parse_cache,
+    reset_parse_cache,
+)
+from rice_factor.adapters.parsing.treesitter_adapter import (
+    TreeSitterAdapter,
+    parse_source_file,
+    preload_parsers,
+)
 
-__all__ = ["TreeSitterAdapter"]
+__all__ = [
+    "ParseCache",
+    "ParseCacheStats",
+    "TreeSitterAdapter",
+    "get_parse_cache",
+    "parse_source_file",
+    "preload_parsers",
+    "reset_parse_cache",
+]
@@ -0,0 +1,460 @@
+"""Cache of parsed tree-sitter trees with incremental reparsing.
+
+Every ASTPort query (get_methods, get_imports, find_symbol, ...) parses the
+file it is given, so several queries on one file used to parse it several
+times. ParseCache keeps the parsed tree of each file together with a hash
+of the content it was parsed from. An unchanged file is served from the
+cache; a changed file has its cached tree edited to match and is reparsed
+incrementally, so tree-sitter only re-lexes the changed region.
+
+Memory is bounded by a byte budget on the cached sources and an estimate
+of their trees; the least recently used files are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import tree_sitter
+
+# Default budget for cached sources and trees
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Estimated tree memory per source byte. The bindings do not report tree
+# sizes; tree-sitter allocates about 20 bytes per byte of Python source.
+TREE_BYTES_PER_SOURCE_BYTE = 20
+
+# Block size for comparing file versions in compute_edit()
+_COMPARE_CHUNK = 4096
+
+
+def content_hash(source: bytes) -> str:
+    """Hash file content for cache validation.
+
+    Args:
+        source: File content.
+
+    Returns:
+        Hex digest of the content.
+    """
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class SourceEdit:
+    """A single contiguous edit between two versions of a file.
+
+    Attributes:
+        start_byte: Offset where the versions start to differ.
+        old_end_byte: End of the changed region in the old version.
+        new_end_byte: End of the changed region in the new version.
+        start_point: (row, column) of start_byte.
+        old_end_point: (row, column) of old_end_byte in the old version.
+        new_end_point: (row, column) of new_end_byte in the new version.
+    """
+
+    start_byte: int
+    old_end_byte: int
+    new_end_byte: int
+    start_point: tuple[int, int]
+    old_end_point: tuple[int, int]
+    new_end_point: tuple[int, int]
+
+    def apply(self, tree: tree_sitter.Tree) -> None:
+        """Record the edit on a tree so it can be reparsed incrementally."""
+        tree.edit(
+            start_byte=self.start_byte,
+            old_end_byte=self.old_end_byte,
+            new_end_byte=self.new_end_byte,
+            start_point=self.start_point,
+            old_end_point=self.old_end_point,
+            new_end_point=self.new_end_point,
+        )
+
+
+def _point_at(source: bytes, offset: int) -> tuple[int, int]:
+    """Return the (row, byte column) of an offset in source."""
+    row = source.count(b"\n", 0, offset)
+    line_start = source.rfind(b"\n", 0, offset) + 1
+    return row, offset - line_start
+
+
+def _common_prefix_length(a: bytes, b: bytes, limit: int) -> int:
+    """Return the length of the common prefix of a and b, at most limit.
+
+    Whole blocks are compared at once and the first differing block is
+    narrowed down by bisection, rather than comparing byte by byte.
+    """
+    start = 0
+    while start < limit:
+        end = min(start + _COMPARE_CHUNK, limit)
+        if a[start:end] == b[start:end]:
+            start = end
+            continue
+        # a[start:end] differs: keep a[:start] equal and a[start:end] not
+        while end - start > 1:
+            middle = (start + end) // 2
+            if a[start:middle] == b[start:middle]:
+                start = middle
+            else:
+                end = middle
+        return start
+    return limit
+
+
+def compute_edit(old: bytes, new: bytes) -> SourceEdit | None:
+    """Describe how old became new as one edit spanning all changes.
+
+    The edit covers everything between the common prefix and the common
+    suffix of the two versions.
+
+    Args:
+        old: Previous content.
+        new: Current content.
+
+    Returns:
+        The edit, or None if the contents are equal.
+    """
+    if old == new:
+        return None
+
+    limit = min(len(old), len(new))
+    start = _common_prefix_length(old, new, limit)
+    suffix = _common_prefix_length(old[::-1], new[::-1], limit - start)
+
+    old_end = len(old) - suffix
+    new_end = len(new) - suffix
+    return SourceEdit(
+        start_byte=start,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point_at(old, start),
+        old_end_point=_point_at(old, old_end),
+        new_end_point=_point_at(new, new_end),
+    )
+
+
+@dataclass
+class CachedParse:
+    """A parsed file held by the cache.
+
+    Attributes:
+        file_path: Path the file was parsed from.
+        language: Language identifier the file was parsed as.
+        content_hash: Hash of source.
+        source: Content the tree was parsed from (empty without a tree).
+        tree: The parsed tree, or None for a result parsed elsewhere (such
+            as in a worker process).
+        mtime_ns: Modification time of the file when it was read, if the
+            content came from disk.
+        size: File size when it was read, if the content came from disk.
+        result: Extraction result for this tree, memoized by the adapter.
+    """
+
+    file_path: str
+    language: str
+    content_hash: str
+    source: bytes
+    tree: tree_sitter.Tree | None
+    mtime_ns: int | None = None
+    size: int | None = None
+    result: Any = None
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes counted against the cache budget (source plus tree)."""
+        if self.tree is None:
+            return self.size or 0
+        return len(self.source) * (1 + TREE_BYTES_PER_SOURCE_BYTE)
+
+
+@dataclass
+class ParseCacheStats:
+    """Statistics for the parse cache.
+
+    Attributes:
+        hits: Lookups served without parsing.
+        misses: Lookups that needed a parse.
+        full_parses: Parses from scratch.
+        incremental_parses: Reparses reusing the previous tree.
+        evictions: Entries evicted to stay within the byte budget.
+        parse_seconds: Total time spent in full parses.
+        reparse_seconds: Total time spent in incremental reparses.
+        entries: Files currently cached.
+        bytes: Source and estimated tree bytes currently cached.
+        max_bytes: Byte budget.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    full_parses: int = 0
+    incremental_parses: int = 0
+    evictions: int = 0
+    parse_seconds: float = 0.0
+    reparse_seconds: float = 0.0
+    entries: int = 0
+    bytes: int = 0
+    max_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get cache hit rate as percentage."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits / total) * 100
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "full_parses": self.full_parses,
+            "incremental_parses": self.incremental_parses,
+            "evictions": self.evictions,
+            "parse_seconds": round(self.parse_seconds, 6),
+            "reparse_seconds": round(self.reparse_seconds, 6),
+            "entries": self.entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": round(self.hit_rate, 2),
+        }
+
+
+class ParseCache:
+    """LRU cache of parsed trees, one per file, bounded by memory.
+
+    The cache lock is only held to look up and insert entries. Parsing
+    happens outside it, under a lock per language, because tree-sitter
+    parsers are not thread-safe.
+
+    Example:
+        >>> cache = ParseCache(max_bytes=8 * 1024 * 1024)
+        >>> entry = cache.parse("main.go", "go", source, parser)
+        >>> entry.tree.root_node
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Budget for cached source and tree bytes.
+
+        Raises:
+            ValueError: If max_bytes is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, CachedParse] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._parse_locks: dict[str, threading.Lock] = {}
+        self._stats = ParseCacheStats(max_bytes=max_bytes)
+
+    @property
+    def stats(self) -> ParseCacheStats:
+        """Return a snapshot of the cache statistics."""
+        with self._lock:
+            return ParseCacheStats(
+                **{
+                    **vars(self._stats),
+                    "entries": len(self._entries),
+                    "bytes": self._bytes,
+                }
+            )
+
+    def lookup(self, file_path: str, mtime_ns: int, size: int) -> CachedParse | None:
+        """Get a file's entry if it is unchanged on disk.
+
+        Lets callers skip reading a file whose modification time and size
+        match the ones recorded when it was cached.
+
+        Args:
+            file_path: Path of the file.
+            mtime_ns: Current modification time of the file.
+            size: Current size of the file.
+
+        Returns:
+            The cached entry, or None if the file is not cached or changed.
+        """
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is None or (entry.mtime_ns, entry.size) != (mtime_ns, size):
+                return None
+            self._entries.move_to_end(file_path)
+            self._stats.hits += 1
+            return entry
+
+    def parse(
+        self,
+        file_path: str,
+        language: str,
+        source: bytes,
+        parser: tree_sitter.Parser,
+        mtime_ns: int | None = None,
+        size: int | None = None,
+    ) -> CachedParse:
+        """Get the tree for a file's content, parsing only if needed.
+
+        Args:
+            file_path: Path of the file (the cache key).
+            language: Language identifier the parser is for.
+            source: Current content of the file.
+            parser: Parser for the language.
+            mtime_ns: Modification time, if the content was read from disk.
+            size: File size, if the content was read from disk.
+
+        Returns:
+            The cache entry holding the tree for source.
+        """
+        digest = content_hash(source)
+        previous: CachedParse | None = None
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None and entry.language == language:
+                if entry.content_hash == digest:
+                    self._entries.move_to_end(file_path)
+                    entry.mtime_ns, entry.size = mtime_ns, size
+                    self._stats.hits += 1
+                    return entry
+                if entry.tree is not None:
+                    # Claim the superseded tree, which is edited in place,
+                    # so no other caller reparses from it concurrently
+                    previous = entry
+                    self.invalidate(file_path)
+            self._stats.misses += 1
+            parse_lock = self._parse_locks.setdefault(language, threading.Lock())
+
+        old_tree = previous.tree if previous is not None else None
+        edit = compute_edit(previous.source, source) if previous is not None else None
+        with parse_lock:
+            start = time.perf_counter()
+            if old_tree is not None and edit is not None:
+                edit.apply(old_tree)
+                tree = parser.parse(source, old_tree)
+            else:
+                tree = parser.parse(source)
+            elapsed = time.perf_counter() - start
+
+        new_entry = CachedParse(
+            file_path=file_path,
+            language=language,
+            content_hash=digest,
+            source=source,
+            tree=tree,
+            mtime_ns=mtime_ns,
+            size=size,
+        )
+        with self._lock:
+            if edit is not None:
+                self._stats.incremental_parses += 1
+                self._stats.reparse_seconds += elapsed
+            else:
+                self._stats.full_parses += 1
+                self._stats.parse_seconds += elapsed
+            self._store(new_entry)
+        return new_entry
+
+    def store_result(
+        self,
+        file_path: str,
+        language: str,
+        digest: str,
+        result: Any,
+        mtime_ns: int | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Cache a result that was parsed elsewhere, without its tree.
+
+        Later lookups of the same content return the result; a change to
+        the file is then parsed from scratch.
+
+        Args:
+            file_path: Path of the file (the cache key).
+            language: Language identifier the file was parsed as.
+            digest: content_hash() of the parsed content.
+            result: Extraction result for the content.
+            mtime_ns: Modification time, if the content was read from disk.
+            size: Size of the parsed content in bytes.
+        """
+        with self._lock:
+            self._store(
+                CachedParse(
+                    file_path=file_path,
+                    language=language,
+                    content_hash=digest,
+                    source=b"",
+                    tree=None,
+                    mtime_ns=mtime_ns,
+                    size=size,
+                    result=result,
+                )
+            )
+
+    def invalidate(self, file_path: str) -> bool:
+        """Drop a file from the cache.
+
+        Args:
+            file_path: Path of the file.
+
+        Returns:
+            True if the file was cached.
+        """
+        with self._lock:
+            entry = self._entries.pop(file_path, None)
+            if entry is None:
+                return False
+            self._bytes -= entry.nbytes
+            return True
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._stats = ParseCacheStats(max_bytes=self._max_bytes)
+
+    def _store(self, entry: CachedParse) -> None:
+        """Insert an entry and evict the least recently used over budget.
+
+        Must be called with the lock held.
+        """
+        self.invalidate(entry.file_path)
+        # A file larger than the whole budget is returned but not kept
+        if entry.nbytes > self._max_bytes:
+            return
+        self._entries[entry.file_path] = entry
+        self._bytes += entry.nbytes
+        while self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self._stats.evictions += 1
+
+
+# Global cache shared by TreeSitterAdapter instances
+_cache: ParseCache | None = None
+
+
+def get_parse_cache() -> ParseCache:
+    """Get the global parse cache instance.
+
+    Returns:
+        The global ParseCache instance.
+    """
+    global _cache
+    if _cache is None:
+        _cache = ParseCache()
+    return _cache
+
+
+def reset_parse_cache() -> None:
+    """Reset the global parse cache (useful for testing)."""
+    global _cache
+    _cache = None
@@ -0,0 +1,543 @@
+"""Persistent project-wide symbol index.
+
+Symbol usage checks and cross-file renames used to read and scan every
+source file on each call. SymbolIndex keeps, in a SQLite database under
+``.project/``, where each symbol is defined (from tree-sitter extraction,
+or Python's ast module for Python files) and where each identifier is
+referenced, with file, line and column. Lookups are B-tree index range
+scans, so they cost O(log n) in the size of the index.
+
+The index is brought up to date by update(): files whose mtime and size
+are unchanged are skipped without being read, and files whose content
+hash is unchanged are not re-extracted. Callers that query on every
+operation use refresh(), which scans the project once per index, and pass
+the files they write to update(paths).
+
+References are identifier occurrences (whole-word matches), the same
+matches a word-boundary text search finds, including those in comments
+and strings.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from rice_factor.adapters.parsing.parse_cache import ParseCache, content_hash
+from rice_factor.domain.ports.ast import SymbolKind
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from rice_factor.domain.ports.ast import ASTPort
+
+# Default index location, relative to the project root
+DEFAULT_INDEX_PATH = Path(".project") / "symbol_index.db"
+
+# Newlines and runs of word characters (identifiers are the runs not
+# starting with a digit)
+_TOKEN = re.compile(r"\n|\w+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS definitions (
+    name TEXT NOT NULL,
+    file_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    column INTEGER NOT NULL,
+    parent_name TEXT
+);
+CREATE INDEX IF NOT EXISTS definitions_name ON definitions (name);
+CREATE INDEX IF NOT EXISTS definitions_file ON definitions (file_id);
+CREATE TABLE IF NOT EXISTS refs (
+    name TEXT NOT NULL,
+    file_id INTEGER NOT NULL,
+    positions TEXT NOT NULL,
+    PRIMARY KEY (name, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS refs_file ON refs (file_id);
+"""
+
+
+@dataclass(frozen=True)
+class SymbolLocation:
+    """A definition or reference of a symbol.
+
+    Attributes:
+        name: Symbol name.
+        file_path: File path relative to the project root (POSIX style).
+        line: Line number (1-indexed).
+        column: Column (0-indexed).
+        kind: Kind of symbol, for definitions.
+        parent_name: Name of the containing class, for definitions.
+    """
+
+    name: str
+    file_path: str
+    line: int
+    column: int
+    kind: SymbolKind | None = None
+    parent_name: str | None = None
+
+
+@dataclass
+class IndexUpdateStats:
+    """Result of bringing the index up to date.
+
+    Attributes:
+        scanned: Files checked.
+        indexed: Files (re)extracted because they are new or changed.
+        unchanged: Files skipped because their mtime/size or hash matched.
+        removed: Files dropped because they no longer exist.
+        elapsed_seconds: Time taken.
+    """
+
+    scanned: int = 0
+    indexed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "scanned": self.scanned,
+            "indexed": self.indexed,
+            "unchanged": self.unchanged,
+            "removed": self.removed,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+        }
+
+
+class SymbolIndex:
+    """SQLite-backed index of symbol definitions and references.
+
+    Example:
+        >>> index = SymbolIndex(project_root)
+        >>> index.refresh()
+        >>> index.find_definitions("UserService")
+        >>> index.reference_lines("UserService")
+    """
+
+    # Source file extensions that are indexed
+    EXTENSIONS: ClassVar[frozenset[str]] = frozenset(
+        {
+            ".py",
+            ".go",
+            ".rs",
+            ".java",
+            ".kt",
+            ".kts",
+            ".ts",
+            ".tsx",
+            ".js",
+            ".jsx",
+            ".mjs",
+            ".cjs",
+            ".rb",
+            ".cs",
+            ".php",
+            ".c",
+            ".cpp",
+            ".h",
+            ".hpp",
+            ".swift",
+            ".scala",
+            ".clj",
+            ".ex",
+            ".exs",
+        }
+    )
+
+    # Directories that are never indexed
+    EXCLUDE_DIRS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "node_modules",
+            ".git",
+            ".project",
+            "__pycache__",
+            ".venv",
+            "venv",
+            "dist",
+            "build",
+            "target",
+            ".next",
+            ".nuxt",
+        }
+    )
+
+    def __init__(
+        self,
+        project_root: Path,
+        db_path: Path | None = None,
+        ast_port: ASTPort | None = None,
+    ) -> None:
+        """Open (or create) the index for a project.
+
+        Args:
+            project_root: Root directory of the project.
+            db_path: Database file. Defaults to .project/symbol_index.db.
+            ast_port: Parser for definitions in non-Python files. Defaults
+                to a TreeSitterAdapter that does not cache trees.
+        """
+        self.project_root = project_root.resolve()
+        self.db_path = db_path or self.project_root / DEFAULT_INDEX_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if ast_port is None:
+            from rice_factor.adapters.parsing.treesitter_adapter import (
+                TreeSitterAdapter,
+            )
+
+            # Each changed file is parsed once, so keeping trees is wasted memory
+            ast_port = TreeSitterAdapter(parse_cache=ParseCache(max_bytes=0))
+        self._ast_port = ast_port
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._scanned = False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> SymbolIndex:
+        """Use the index as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the index."""
+        self.close()
+
+    def update(self, paths: Iterable[Path] | None = None) -> IndexUpdateStats:
+        """Bring the index up to date with the files on disk.
+
+        Args:
+            paths: Files to check. If None, the whole project is scanned
+                and files that no longer exist are dropped.
+
+        Returns:
+            Statistics for the update.
+        """
+        start = time.perf_counter()
+        stats = IndexUpdateStats()
+        candidates = self._iter_source_files() if paths is None else self._resolve_paths(paths)
+        seen: set[str] = set()
+
+        with self._lock, self._conn:
+            known = {
+                path: (file_id, mtime_ns, size, digest)
+                for file_id, path, mtime_ns, size, digest in self._conn.execute(
+                    "SELECT id, path, mtime_ns, size, hash FROM files"
+                )
+            }
+            for rel, absolute in candidates:
+                seen.add(rel)
+                try:
+                    stat = absolute.stat()
+                except OSError:
+                    if rel in known:
+                        self._delete_file(known[rel][0])
+                        stats.removed += 1
+                    continue
+
+                stats.scanned += 1
+                row = known.get(rel)
+                if row is not None and row[1:3] == (stat.st_mtime_ns, stat.st_size):
+                    stats.unchanged += 1
+                    continue
+
+                try:
+                    source = absolute.read_bytes()
+                except OSError:
+                    continue
+                digest = content_hash(source)
+                if row is not None and row[3] == digest:
+                    self._conn.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                        (stat.st_mtime_ns, stat.st_size, row[0]),
+                    )
+                    stats.unchanged += 1
+                    continue
+
+                self._index_file(rel, source, digest, stat.st_mtime_ns, stat.st_size)
+                stats.indexed += 1
+
+            if paths is None:
+                for rel in known.keys() - seen:
+                    self._delete_file(known[rel][0])
+                    stats.removed += 1
+
+        if paths is None:
+            self._scanned = True
+        stats.elapsed_seconds = time.perf_counter() - start
+        return stats
+
+    def refresh(self) -> IndexUpdateStats | None:
+        """Scan the whole project, unless this index has already done so.
+
+        Returns:
+            Statistics for the scan, or None if it was skipped.
+        """
+        if self._scanned:
+            return None
+        return self.update()
+
+    def clear(self) -> None:
+        """Drop every indexed file."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM refs")
+            self._conn.execute("DELETE FROM definitions")
+            self._conn.execute("DELETE FROM files")
+
+    def find_definitions(self, name: str) -> list[SymbolLocation]:
+        """Find where a symbol is defined.
+
+        Args:
+            name: Symbol name.
+
+        Returns:
+            Definitions ordered by file and line.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT f.path, d.kind, d.line, d.column, d.parent_name "
+                "FROM definitions d JOIN files f ON f.id = d.file_id "
+                "WHERE d.name = ? ORDER BY f.path, d.line, d.column",
+                (name,),
+            ).fetchall()
+        return [
+            SymbolLocation(
+                name=name,
+                file_path=path,
+                line=line,
+                column=column,
+                kind=SymbolKind(kind),
+                parent_name=parent_name,
+            )
+            for path, kind, line, column, parent_name in rows
+        ]
+
+    def find_references(self, name: str) -> list[SymbolLocation]:
+        """Find every occurrence of a symbol, definitions included.
+
+        Args:
+            name: Symbol name.
+
+        Returns:
+            Occurrences ordered by file, line and column.
+        """
+        return [
+            SymbolLocation(name=name, file_path=path, line=line, column=column)
+            for path, positions in self._reference_rows(name)
+            for line, column in positions
+        ]
+
+    def reference_lines(self, name: str) -> dict[str, list[int]]:
+        """Get the lines on which a symbol occurs, by file.
+
+        Args:
+            name: Symbol name.
+
+        Returns:
+            Sorted distinct line numbers keyed by relative file path.
+        """
+        return {
+            path: sorted({line for line, _ in positions})
+            for path, positions in self._reference_rows(name)
+        }
+
+    def files_referencing(self, name: str) -> list[str]:
+        """Get the files in which a symbol occurs.
+
+        Args:
+            name: Symbol name.
+
+        Returns:
+            Sorted file paths relative to the project root.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT f.path FROM refs r JOIN files f ON f.id = r.file_id "
+                "WHERE r.name = ? ORDER BY f.path",
+                (name,),
+            ).fetchall()
+        return [path for (path,) in rows]
+
+    def _reference_rows(self, name: str) -> Iterator[tuple[str, list[tuple[int, int]]]]:
+        """Yield (relative path, [(line, column), ...]) for a symbol."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT f.path, r.positions FROM refs r "
+                "JOIN files f ON f.id = r.file_id "
+                "WHERE r.name = ? ORDER BY f.path",
+                (name,),
+            ).fetchall()
+        for path, positions in rows:
+            yield (
+                path,
+                [
+                    (int(line), int(column))
+                    for line, column in (p.split(":") for p in positions.split(","))
+                ],
+            )
+
+    def _iter_source_files(self) -> Iterator[tuple[str, Path]]:
+        """Yield (relative path, absolute path) of indexable project files."""
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = [d for d in dirnames if d not in self.EXCLUDE_DIRS]
+            directory = Path(dirpath)
+            prefix = directory.relative_to(self.project_root).as_posix()
+            prefix = "" if prefix == "." else f"{prefix}/"
+            for filename in filenames:
+                if filename[filename.rfind(".") :] in self.EXTENSIONS:
+                    yield f"{prefix}{filename}", directory / filename
+
+    def _resolve_paths(self, paths: Iterable[Path]) -> Iterator[tuple[str, Path]]:
+        """Yield (relative path, absolute path) of the indexable given paths."""
+        for path in paths:
+            absolute = (self.project_root / path).resolve()
+            if absolute.suffix not in self.EXTENSIONS:
+                continue
+            try:
+                rel = absolute.relative_to(self.project_root).as_posix()
+            except ValueError:
+                continue
+            yield rel, absolute
+
+    def _delete_file(self, file_id: int) -> None:
+        """Remove a file and its rows. Must be called in a transaction."""
+        self._conn.execute("DELETE FROM refs WHERE file_id = ?", (file_id,))
+        self._conn.execute("DELETE FROM definitions WHERE file_id = ?", (file_id,))
+        self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def _index_file(self, rel: str, source: bytes, digest: str, mtime_ns: int, size: int) -> None:
+        """Extract and store a file's definitions and references.
+
+        Must be called in a transaction.
+        """
+        content = source.decode("utf-8", errors="ignore")
+        row = self._conn.execute("SELECT id FROM files WHERE path = ?", (rel,)).fetchone()
+        if row is not None:
+            self._delete_file(row[0])
+        file_id = self._conn.execute(
+            "INSERT INTO files (path, mtime_ns, size, hash) VALUES (?, ?, ?, ?)",
+            (rel, mtime_ns, size, digest),
+        ).lastrowid
+
+        self._conn.executemany(
+            "INSERT INTO definitions "
+            "(name, file_id, kind, line, column, parent_name) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (d.name, file_id, d.kind.value if d.kind else "", d.line, d.column, d.parent_name)
+                for d in self._extract_definitions(rel, content)
+            ],
+        )
+
+        positions: dict[str, list[str]] = {}
+        line_number, line_start = 1, 0
+        for match in _TOKEN.finditer(content):
+            word = match.group()
+            if word == "\n":
+                line_number, line_start = line_number + 1, match.end()
+            elif not word[0].isdigit():
+                positions.setdefault(word, []).append(f"{line_number}:{match.start() - line_start}")
+        self._conn.executemany(
+            "INSERT INTO refs (name, file_id, positions) VALUES (?, ?, ?)",
+            [(name, file_id, ",".join(p)) for name, p in positions.items()],
+        )
+
+    def _extract_definitions(self, rel: str, content: str) -> list[SymbolLocation]:
+        """Extract the symbols a file defines.
+
+        Args:
+            rel: File path relative to the project root.
+            content: File content.
+
+        Returns:
+            Definitions found (empty for unsupported languages).
+        """
+        if rel.endswith(".py"):
+            return self._extract_python_definitions(rel, content)
+
+        if self._ast_port.detect_language(rel) is None:
+            return []
+        result = self._ast_port.parse_file(str(self.project_root / rel), content)
+        if not result.success:
+            return []
+        return [
+            SymbolLocation(
+                name=symbol.name,
+                file_path=rel,
+                line=symbol.line_start,
+                column=symbol.column_start,
+                kind=symbol.kind,
+                parent_name=symbol.parent_name,
+            )
+            for symbol in result.symbols
+        ]
+
+    def _extract_python_definitions(self, rel: str, content: str) -> list[SymbolLocation]:
+        """Extract class and function definitions from Python source.
+
+        Args:
+            rel: File path relative to the project root.
+            content: File content.
+
+        Returns:
+            Definitions found (empty if the file does not parse).
+        """
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return []
+
+        lines = content.split("\n")
+        definitions: list[SymbolLocation] = []
+        definition_types = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+        # Definitions are statements, so only statement blocks are walked
+        def visit(nodes: list[Any], parent: ast.AST | None) -> None:
+            for node in nodes:
+                if not isinstance(node, definition_types):
+                    for block in ("body", "orelse", "finalbody", "handlers", "cases"):
+                        children = getattr(node, block, None)
+                        if children:
+                            visit(children, parent)
+                    continue
+                if isinstance(node, ast.ClassDef):
+                    kind = SymbolKind.CLASS
+                elif isinstance(parent, ast.ClassDef):
+                    kind = SymbolKind.METHOD
+                else:
+                    kind = SymbolKind.FUNCTION
+                line = lines[node.lineno - 1]
+                definitions.append(
+                    SymbolLocation(
+                        name=node.name,
+                        file_path=rel,
+                        line=node.lineno,
+                        column=max(line.find(node.name, node.col_offset), 0),
+                        kind=kind,
+                        parent_name=getattr(parent, "name", None),
+                    )
+                )
+                visit(node.body, node)
+
+        visit(tree.body, None)
+        return definitions
@@ -8,9 +8,17 @@ Python uses its native ast module (handled by RopeAdapter).
 """
 
 import logging
+import os
+import threading
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+from rice_factor.adapters.parsing.parse_cache import (
+    ParseCache,
+    content_hash,
+    get_parse_cache,
+)
 from rice_factor.domain.ports.ast import (
     ASTPort,
     ImportInfo,
@@ -21,12 +29,33 @@ from rice_factor.domain.ports.ast import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     import tree_sitter
 
     from rice_factor.adapters.parsing.languages.base import LanguageExtractor
+    from rice_factor.domain.services.parallel_executor import ExecutionTask
 
 logger = logging.getLogger(__name__)
 
+# Adapter created by preload_parsers() for parse_source_file()
+_worker_adapter: "TreeSitterAdapter | None" = None
+
+
+@dataclass(frozen=True)
+class LanguageQueries:
+    """Compiled tree-sitter queries for one language.
+
+    Attributes:
+        classes: Query for class/struct/interface definitions.
+        methods: Query for method/function definitions.
+        imports: Query for import statements.
+    """
+
+    classes: "tree_sitter.Query | None" = None
+    methods: "tree_sitter.Query | None" = None
+    imports: "tree_sitter.Query | None" = None
+
 
 class TreeSitterAdapter(ASTPort):
     """AST parser using tree-sitter.
@@ -34,10 +63,17 @@ class TreeSitterAdapter(ASTPort):
     Provides language-agnostic AST parsing for extract_interface
     and enforce_dependency operations.
 
+    Parsed trees and their extracted symbols are kept in a ParseCache
+    (shared by all adapters by default), so repeated queries on an
+    unchanged file do not parse it again and edited files are reparsed
+    incrementally.
+
     Attributes:
         _parsers: Cache of tree-sitter parsers by language.
         _extractors: Language-specific extractor instances.
         _available: Whether tree-sitter is available.
+        _parse_cache: Cache of parsed trees by file.
+        _queries: Compiled queries by language, shared across instances.
     """
 
     # Language to tree-sitter grammar name mapping
@@ -71,12 +107,29 @@ class TreeSitterAdapter(ASTPort):
         ".php": "php",
     }
 
-    def __init__(self) -> None:
-        """Initialize the tree-sitter adapter."""
+    # Fewer files than this are parsed in-process by parse_many()
+    PARALLEL_MIN_FILES: ClassVar[int] = 32
+
+    # Compiled queries by language, shared by all instances and threads
+    _queries: ClassVar[dict[str, LanguageQueries]] = {}
+    _queries_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, parse_cache: ParseCache | None = None) -> None:
+        """Initialize the tree-sitter adapter.
+
+        Args:
+            parse_cache: Cache of parsed trees. Defaults to the global cache.
+        """
         self._parsers: dict[str, tree_sitter.Parser] = {}
         self._extractors: dict[str, LanguageExtractor] = {}
         self._available: bool | None = None
         self._ts_module: object | None = None
+        self._parse_cache = parse_cache if parse_cache is not None else get_parse_cache()
+
+    @property
+    def parse_cache(self) -> ParseCache:
+        """Get the cache of parsed trees (see its stats for hit rates)."""
+        return self._parse_cache
 
     def _get_tree_sitter(self) -> object | None:
         """Get the tree-sitter module.
@@ -259,9 +312,16 @@ class TreeSitterAdapter(ASTPort):
                 file_path=file_path,
             )
 
-        # Get content
+        # Get content, skipping the read if the file is cached and unchanged
+        mtime_ns: int | None = None
+        size: int | None = None
         if content is None:
             try:
+                stat = Path(file_path).stat()
+                mtime_ns, size = stat.st_mtime_ns, stat.st_size
+                cached = self._parse_cache.lookup(file_path, mtime_ns, size)
+                if cached is not None and cached.result is not None:
+                    return self._copy_result(cached.result)
                 content = Path(file_path).read_text(encoding="utf-8")
             except Exception as e:
                 return ParseResult(
@@ -300,10 +360,12 @@ class TreeSitterAdapter(ASTPort):
                 file_path=file_path,
             )
 
-        # Parse
+        # Parse (or reuse / incrementally reparse the cached tree)
         try:
             source = content.encode("utf-8")
-            tree = parser.parse(source)
+            entry = self._parse_cache.parse(
+                file_path, language, source, parser, mtime_ns=mtime_ns, size=size
+            )
         except Exception as e:
             return ParseResult(
                 success=False,
@@ -314,14 +376,22 @@ class TreeSitterAdapter(ASTPort):
                 file_path=file_path,
             )
 
+        if entry.result is not None:
+            return self._copy_result(entry.result)
+
+        # Entries without a tree always carry a result
+        tree = entry.tree
+        assert tree is not None
+
         # Check for errors
         has_errors = tree.root_node.has_error
 
         # Extract symbols and imports
-        symbols = self._extract_symbols(tree, extractor, source)
-        imports = self._extract_imports(tree, extractor, source)
+        queries = self._get_queries(extractor)
+        symbols = self._extract_symbols(tree, extractor, source, queries)
+        imports = self._extract_imports(tree, extractor, source, queries)
 
-        return ParseResult(
+        result = ParseResult(
             success=True,
             symbols=symbols,
             imports=imports,
@@ -330,12 +400,215 @@ class TreeSitterAdapter(ASTPort):
             has_syntax_errors=has_errors,
             file_path=file_path,
         )
+        entry.result = result
+        return self._copy_result(result)
+
+    @staticmethod
+    def _copy_result(result: ParseResult) -> ParseResult:
+        """Copy a cached result so callers cannot modify the cached lists.
+
+        Args:
+            result: Cached parse result.
+
+        Returns:
+            Copy with its own symbol, import and error lists.
+        """
+        return replace(
+            result,
+            symbols=list(result.symbols),
+            imports=list(result.imports),
+            errors=list(result.errors),
+        )
+
+    def parse_many(
+        self,
+        file_paths: "Iterable[str]",
+        max_workers: int | None = None,
+    ) -> "Iterator[ParseResult]":
+        """Parse many files, spreading the work over a process pool.
+
+        Files cached and unchanged on disk are served first. The rest are
+        parsed by worker processes, each holding one parser per language,
+        and their results are stored in the parse cache (without trees)
+        as they arrive. Small batches, or max_workers=1, are parsed
+        in-process instead.
+
+        Args:
+            file_paths: Files to parse; duplicates are parsed once.
+            max_workers: Worker processes (defaults to the CPU count).
+
+        Yields:
+            ParseResult for every file, in completion order.
+        """
+        pending: list[str] = []
+        for file_path in dict.fromkeys(file_paths):
+            language = self.detect_language(file_path)
+            if language not in self.LANGUAGE_MAP:
+                # Reports the unknown or unsupported language
+                yield self.parse_file(file_path)
+                continue
+            try:
+                stat = Path(file_path).stat()
+            except OSError:
+                pending.append(file_path)
+                continue
+            cached = self._parse_cache.lookup(file_path, stat.st_mtime_ns, stat.st_size)
+            if cached is not None and cached.result is not None:
+                yield self._copy_result(cached.result)
+            else:
+                pending.append(file_path)
+
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        if workers <= 1 or len(pending) < self.PARALLEL_MIN_FILES:
+            for file_path in pending:
+                yield self.parse_file(file_path)
+            return
+
+        from rice_factor.domain.services.parallel_executor import (
+            ExecutionBackend,
+            ExecutionStatus,
+            ExecutionTask,
+            ParallelExecutor,
+            ParallelismConfig,
+        )
+
+        languages = sorted({self.EXTENSION_MAP[Path(p).suffix.lower()] for p in pending})
+        executor = ParallelExecutor(
+            config=ParallelismConfig(
+                max_workers=workers,
+                backend=ExecutionBackend.PROCESS,
+                initializer=preload_parsers,
+                initargs=(languages,),
+            )
+        )
+        tasks = [ExecutionTask.for_file(file_path, "source_file") for file_path in pending]
+        for outcome in executor.execute_stream(tasks, parse_source_file):
+            file_path = outcome.task_id
+            if outcome.status != ExecutionStatus.COMPLETED:
+                yield ParseResult(
+                    success=False,
+                    symbols=[],
+                    imports=[],
+                    errors=[f"Parse error: {outcome.error}"],
+                    language=self.detect_language(file_path) or "unknown",
+                    file_path=file_path,
+                )
+                continue
+            result, digest, mtime_ns, size = outcome.result
+            if digest is not None and result.success:
+                self._parse_cache.store_result(
+                    file_path, result.language, digest, result, mtime_ns, size
+                )
+            yield self._copy_result(result)
+
+    def extract_symbols_many(
+        self,
+        file_paths: "Iterable[str]",
+        max_workers: int | None = None,
+    ) -> "Iterator[tuple[str, list[SymbolInfo]]]":
+        """Extract the symbols of many files (see parse_many()).
+
+        Args:
+            file_paths: Files to parse.
+            max_workers: Worker processes (defaults to the CPU count).
+
+        Yields:
+            (file path, symbols) for every file, in completion order. A
+            file that failed to parse has no symbols.
+        """
+        for result in self.parse_many(file_paths, max_workers):
+            yield result.file_path or "", result.symbols
+
+    def _get_queries(self, extractor: "LanguageExtractor") -> LanguageQueries:
+        """Get the compiled queries for an extractor's language.
+
+        Queries are compiled the first time a language is used and shared
+        by all adapter instances and threads.
+
+        Args:
+            extractor: Language-specific extractor.
+
+        Returns:
+            Compiled queries (None for any that failed to compile).
+        """
+        language = extractor.language_id
+        queries = self._queries.get(language)
+        if queries is not None:
+            return queries
+
+        with self._queries_lock:
+            queries = self._queries.get(language)
+            if queries is None:
+                queries = self._compile_queries(extractor)
+                self._queries[language] = queries
+        return queries
+
+    def _compile_queries(self, extractor: "LanguageExtractor") -> LanguageQueries:
+        """Compile the class, method and import queries of an extractor.
+
+        Args:
+            extractor: Language-specific extractor.
+
+        Returns:
+            Compiled queries (None for any that failed to compile).
+        """
+        try:
+            import tree_sitter
+            import tree_sitter_language_pack as ts_pack
+
+            lang = ts_pack.get_language(
+                self.LANGUAGE_MAP.get(extractor.language_id, extractor.language_id)
+            )
+        except Exception as e:
+            logger.error(f"Failed to load grammar for {extractor.language_id}: {e}")
+            return LanguageQueries()
+
+        def compile_query(kind: str, source: str) -> "tree_sitter.Query | None":
+            try:
+                return tree_sitter.Query(lang, source)
+            except Exception as e:
+                logger.debug(f"Error compiling {extractor.language_id} {kind} query: {e}")
+                return None
+
+        return LanguageQueries(
+            classes=compile_query("class", extractor.get_class_query()),
+            methods=compile_query("method", extractor.get_method_query()),
+            imports=compile_query("import", extractor.get_import_query()),
+        )
+
+    @classmethod
+    def clear_query_cache(cls) -> None:
+        """Drop all compiled queries (useful for testing and benchmarks)."""
+        with cls._queries_lock:
+            cls._queries.clear()
+
+    @staticmethod
+    def _iter_matches(
+        query: "tree_sitter.Query", tree: "tree_sitter.Tree"
+    ) -> "Iterator[tuple[tree_sitter.Node, dict[str, list[tree_sitter.Node]]]]":
+        """Run a query and yield each match's node and captures.
+
+        Args:
+            query: Compiled query.
+            tree: Parsed tree.
+
+        Yields:
+            Tuple of (first captured node, capture name to nodes).
+        """
+        for _, match_captures in query.matches(tree.root_node):
+            captures = {
+                name: nodes if isinstance(nodes, list) else [nodes]
+                for name, nodes in match_captures.items()
+            }
+            node = next(iter(captures.values()))[0] if captures else tree.root_node
+            yield node, captures
 
     def _extract_symbols(
         self,
         tree: "tree_sitter.Tree",
         extractor: "LanguageExtractor",
         source: bytes,
+        queries: LanguageQueries,
     ) -> list[SymbolInfo]:
         """Extract all symbols from the parse tree.
 
@@ -343,60 +616,29 @@ class TreeSitterAdapter(ASTPort):
             tree: Parsed tree.
             extractor: Language-specific extractor.
             source: Source code bytes.
+            queries: Compiled queries for the language.
 
         Returns:
             List of extracted symbols.
         """
         symbols: list[SymbolInfo] = []
 
-        # Extract classes
-        try:
-            import tree_sitter_language_pack as ts_pack
-
-            lang = ts_pack.get_language(
-                self.LANGUAGE_MAP.get(extractor.language_id, extractor.language_id)
-            )
-            class_query = lang.query(extractor.get_class_query())
-
-            for match in class_query.matches(tree.root_node):
-                captures: dict[str, list[tree_sitter.Node]] = {}
-                for name, node in match[1]:
-                    if name not in captures:
-                        captures[name] = []
-                    captures[name].append(node)
-
-                symbol = extractor.extract_symbol_from_match(
-                    match[1][0][1] if match[1] else tree.root_node,
-                    captures,
-                    source,
-                    SymbolKind.CLASS,
-                )
-                if symbol:
-                    symbols.append(symbol)
-        except Exception as e:
-            logger.debug(f"Error extracting classes: {e}")
-
-        # Extract methods/functions
-        try:
-            method_query = lang.query(extractor.get_method_query())
-
-            for match in method_query.matches(tree.root_node):
-                method_captures: dict[str, list[tree_sitter.Node]] = {}
-                for name, node in match[1]:
-                    if name not in method_captures:
-                        method_captures[name] = []
-                    method_captures[name].append(node)
-
-                symbol = extractor.extract_symbol_from_match(
-                    match[1][0][1] if match[1] else tree.root_node,
-                    method_captures,
-                    source,
-                    SymbolKind.METHOD,
-                )
-                if symbol:
-                    symbols.append(symbol)
-        except Exception as e:
-            logger.debug(f"Error extracting methods: {e}")
+        # Extract classes, then methods/functions
+        for query, kind in (
+            (queries.classes, SymbolKind.CLASS),
+            (queries.methods, SymbolKind.METHOD),
+        ):
+            if query is None:
+                continue
+            try:
+                for node, captures in self._iter_matches(query, tree):
+                    symbol = extractor.extract_symbol_from_match(
+                        node, captures, source, kind
+                    )
+                    if symbol:
+                        symbols.append(symbol)
+            except Exception as e:
+                logger.debug(f"Error extracting {kind.value} symbols: {e}")
 
         return symbols
 
@@ -405,6 +647,7 @@ class TreeSitterAdapter(ASTPort):
         tree: "tree_sitter.Tree",
         extractor: "LanguageExtractor",
         source: bytes,
+        queries: LanguageQueries,
     ) -> list[ImportInfo]:
         """Extract all imports from the parse tree.
 
@@ -412,32 +655,18 @@ class TreeSitterAdapter(ASTPort):
             tree: Parsed tree.
             extractor: Language-specific extractor.
             source: Source code bytes.
+            queries: Compiled queries for the language.
 
         Returns:
             List of extracted imports.
         """
         imports: list[ImportInfo] = []
+        if queries.imports is None:
+            return imports
 
         try:
-            import tree_sitter_language_pack as ts_pack
-
-            lang = ts_pack.get_language(
-                self.LANGUAGE_MAP.get(extractor.language_id, extractor.language_id)
-            )
-            import_query = lang.query(extractor.get_import_query())
-
-            for match in import_query.matches(tree.root_node):
-                captures: dict[str, list[tree_sitter.Node]] = {}
-                for name, node in match[1]:
-                    if name not in captures:
-                        captures[name] = []
-                    captures[name].append(node)
-
-                imp = extractor.extract_import_from_match(
-                    match[1][0][1] if match[1] else tree.root_node,
-                    captures,
-                    source,
-                )
+            for node, captures in self._iter_matches(queries.imports, tree):
+                imp = extractor.extract_import_from_match(node, captures, source)
                 if imp:
                     imports.append(imp)
         except Exception as e:
@@ -556,3 +785,57 @@ class TreeSitterAdapter(ASTPort):
                 SymbolKind.TRAIT,
             )
         ]
+
+
+def preload_parsers(languages: list[str] | None = None) -> None:
+    """Create a worker's adapter and its parsers and queries up front.
+
+    Intended as a ParallelExecutor worker initializer, so each worker
+    process creates one parser per language rather than one per file.
+    The worker adapter caches nothing; results are cached by the caller.
+
+    Args:
+        languages: Languages to prepare (defaults to all supported).
+    """
+    global _worker_adapter
+    _worker_adapter = TreeSitterAdapter(parse_cache=ParseCache(max_bytes=0))
+    for language in languages or _worker_adapter.get_supported_languages():
+        extractor = _worker_adapter._get_extractor(language)
+        if _worker_adapter._get_parser(language) and extractor:
+            _worker_adapter._get_queries(extractor)
+
+
+def parse_source_file(
+    task: "ExecutionTask",
+) -> tuple[ParseResult, str | None, int | None, int | None]:
+    """Parse the source file a task points to.
+
+    A ParallelExecutor handler: the worker reads task.source_path itself,
+    so only the path is pickled.
+
+    Args:
+        task: Task whose source_path is a source file.
+
+    Returns:
+        The parse result, plus the hash, modification time and size of
+        the parsed content (None if the file could not be read).
+
+    Raises:
+        ValueError: If the task has no source_path.
+    """
+    global _worker_adapter
+    if task.source_path is None:
+        raise ValueError(f"Task '{task.task_id}' has no source_path")
+    if _worker_adapter is None:
+        _worker_adapter = TreeSitterAdapter(parse_cache=ParseCache(max_bytes=0))
+
+    path = Path(task.source_path)
+    try:
+        stat = path.stat()
+        source = path.read_bytes()
+        content = source.decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        # parse_file() reports the read error
+        return _worker_adapter.parse_file(task.source_path), None, None, None
+    result = _worker_adapter.parse_file(task.source_path, content)
+    return result, content_hash(source), stat.st_mtime_ns, stat.st_size
@@ -6,7 +6,7 @@ It serves as a fallback when no language-specific tool is available.
 
 import subprocess
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from rice_factor.domain.ports.refactor import (
     RefactorChange,
@@ -16,6 +16,11 @@ from rice_factor.domain.ports.refactor import (
     RefactorToolPort,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from rice_factor.adapters.parsing.symbol_index import SymbolIndex
+
 
 class DiffPatchAdapter(RefactorToolPort):
     """Fallback adapter using basic text operations.
@@ -26,6 +31,8 @@ class DiffPatchAdapter(RefactorToolPort):
 
     Attributes:
         project_root: Root directory of the project.
+        symbol_index: Optional symbol index used to find the files that
+            reference a renamed identifier.
     """
 
     # Supports all languages as fallback
@@ -36,13 +43,19 @@ class DiffPatchAdapter(RefactorToolPort):
         RefactorOperation.MOVE,
     ]
 
-    def __init__(self, project_root: Path) -> None:
+    def __init__(
+        self,
+        project_root: Path,
+        symbol_index: "SymbolIndex | None" = None,
+    ) -> None:
         """Initialize the adapter.
 
         Args:
             project_root: Root directory of the project.
+            symbol_index: Optional symbol index for locating references.
         """
         self.project_root = project_root
+        self.symbol_index = symbol_index
 
     def get_supported_languages(self) -> list[str]:
         """Return supported languages (all as fallback)."""
@@ -157,6 +170,9 @@ class DiffPatchAdapter(RefactorToolPort):
             except OSError as e:
                 errors.append(f"Error processing {file_path}: {e}")
 
+        if changes and not dry_run:
+            self._reindex(self.project_root / c.file_path for c in changes)
+
         warnings = []
         if changes:
             warnings.append(
@@ -266,6 +282,7 @@ class DiffPatchAdapter(RefactorToolPort):
                     tool_used="diff-patch",
                     dry_run=dry_run,
                 )
+            self._reindex([source, dest])
 
         return RefactorResult(
             success=True,
@@ -279,6 +296,15 @@ class DiffPatchAdapter(RefactorToolPort):
             ],
         )
 
+    def _reindex(self, paths: "Iterable[Path]") -> None:
+        """Bring the symbol index up to date for files this adapter wrote.
+
+        Args:
+            paths: Files that were written, created or removed.
+        """
+        if self.symbol_index is not None:
+            self.symbol_index.update(paths)
+
     def _find_files_containing(self, text: str) -> list[Path]:
         """Find files containing the given text.
 
@@ -288,6 +314,14 @@ class DiffPatchAdapter(RefactorToolPort):
         Returns:
             List of file paths containing the text.
         """
+        # Renames only change whole-word matches, which the index records
+        if self.symbol_index is not None and text.isidentifier():
+            self.symbol_index.refresh()
+            return [
+                self.project_root / path
+                for path in self.symbol_index.files_referencing(text)
+            ]
+
         files: list[Path] = []
 
         # Common source code extensions
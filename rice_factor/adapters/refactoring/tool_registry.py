@@ -70,6 +70,13 @@ class RefactoringToolRegistry:
             RustAnalyzerAdapter,
         )
 
+        # Keep a symbol index for initialized projects (.project/ exists)
+        symbol_index = None
+        if (self.project_root / ".project").is_dir():
+            from rice_factor.adapters.parsing.symbol_index import SymbolIndex
+
+            symbol_index = SymbolIndex(self.project_root)
+
         # Register in priority order (most specific first)
         self.register(RopeAdapter(self.project_root))  # Python
         self.register(OpenRewriteAdapter(self.project_root))  # Java/Kotlin
@@ -80,7 +87,7 @@ class RefactoringToolRegistry:
         self.register(RustAnalyzerAdapter(self.project_root))  # Rust
         self.register(JscodeshiftAdapter(self.project_root))  # JS/TS
         # Fallback last
-        self.register(DiffPatchAdapter(self.project_root))
+        self.register(DiffPatchAdapter(self.project_root, symbol_index=symbol_index))
 
     def register(self, tool: RefactorToolPort) -> None:
         """Register a refactoring tool.
@@ -7,10 +7,12 @@ artifacts to various backends.
 from rice_factor.adapters.storage.approvals import ApprovalsTracker
 from rice_factor.adapters.storage.filesystem import FilesystemStorageAdapter
 from rice_factor.adapters.storage.lock_manager import LockFile, LockManager, LockVerificationResult
+from rice_factor.adapters.storage.metadata import ArtifactMetadataStore
 from rice_factor.adapters.storage.registry import ArtifactRegistry
 
 __all__ = [
     "ApprovalsTracker",
+    "ArtifactMetadataStore",
     "ArtifactRegistry",
     "FilesystemStorageAdapter",
     "LockFile",
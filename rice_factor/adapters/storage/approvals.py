@@ -4,6 +4,8 @@ This module provides persistence for artifact approvals in a JSON file.
 """
 
 import json
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -31,6 +33,8 @@ class ApprovalsTracker:
         self._meta_dir = artifacts_dir / "_meta"
         self._approvals_file = self._meta_dir / "approvals.json"
         self._approvals: dict[UUID, Approval] = {}
+        self._batch_depth = 0
+        self._dirty = False
 
         # Load existing approvals
         self._load()
@@ -55,6 +59,37 @@ class ApprovalsTracker:
         self._save()
         return approval
 
+    def restore(self, approval: Approval) -> None:
+        """Put back an existing approval record unchanged.
+
+        Used to undo a revocation while keeping the original timestamp.
+
+        Args:
+            approval: The approval record to restore.
+        """
+        self._approvals[approval.artifact_id] = approval
+        self._save()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group changes into a single write of the approvals file.
+
+        Changes made inside the block are saved once, when the outermost
+        block exits, rather than once per change.
+
+        Example:
+            >>> with tracker.batch():
+            ...     for artifact_id in artifact_ids:
+            ...         tracker.approve(artifact_id, "reviewer")
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._write()
+
     def is_approved(self, artifact_id: UUID) -> bool:
         """Check if an artifact is approved.
 
@@ -123,7 +158,15 @@ class ApprovalsTracker:
             self._approvals = {}
 
     def _save(self) -> None:
-        """Save approvals to the JSON file."""
+        """Save approvals, or defer the write inside a batch."""
+        if self._batch_depth > 0:
+            self._dirty = True
+            return
+        self._write()
+
+    def _write(self) -> None:
+        """Atomically write approvals to the JSON file."""
+        self._dirty = False
         # Ensure meta directory exists
         self._meta_dir.mkdir(parents=True, exist_ok=True)
 
@@ -139,4 +182,6 @@ class ApprovalsTracker:
         }
 
         json_str = json.dumps(data, indent=2)
-        self._approvals_file.write_text(json_str, encoding="utf-8")
+        tmp_file = self._approvals_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json_str, encoding="utf-8")
+        tmp_file.replace(self._approvals_file)
@@ -0,0 +1,141 @@
+"""Metadata store for artifact generation details.
+
+This module persists generation metadata (context packing reports, rebuild
+input hashes) for artifacts in a JSON file next to the approvals file, so
+it survives without changing the artifact envelope.
+"""
+
+import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+
+class ArtifactMetadataStore:
+    """Tracks and persists generation metadata per artifact.
+
+    Stores metadata in a JSON file at `artifacts/_meta/metadata.json`,
+    keyed by artifact ID. Values must be JSON-serializable. The store is
+    safe to share between threads; share one instance per artifacts
+    directory, as each instance writes the whole file.
+
+    Attributes:
+        metadata_file: Path to the metadata JSON file.
+    """
+
+    def __init__(self, artifacts_dir: Path) -> None:
+        """Initialize the metadata store.
+
+        Args:
+            artifacts_dir: Root directory for artifacts.
+        """
+        self._artifacts_dir = artifacts_dir
+        self._meta_dir = artifacts_dir / "_meta"
+        self._metadata_file = self._meta_dir / "metadata.json"
+        self._metadata: dict[str, dict[str, Any]] = {}
+        self._batch_depth = 0
+        self._dirty = False
+        self._lock = threading.RLock()
+
+        # Load existing metadata
+        self._load()
+
+    @property
+    def metadata_file(self) -> Path:
+        """Get the path to the metadata file."""
+        return self._metadata_file
+
+    def get(self, artifact_id: UUID) -> dict[str, Any]:
+        """Get the metadata recorded for an artifact.
+
+        Args:
+            artifact_id: UUID of the artifact.
+
+        Returns:
+            Copy of the artifact's metadata (empty if none was recorded).
+        """
+        with self._lock:
+            return dict(self._metadata.get(str(artifact_id), {}))
+
+    def update(self, artifact_id: UUID, values: dict[str, Any]) -> None:
+        """Record metadata for an artifact, keeping its other keys.
+
+        Args:
+            artifact_id: UUID of the artifact.
+            values: Metadata keys and values to set.
+        """
+        if not values:
+            return
+        with self._lock:
+            self._metadata.setdefault(str(artifact_id), {}).update(values)
+            self._save()
+
+    def remove(self, artifact_id: UUID) -> bool:
+        """Forget all metadata of an artifact.
+
+        Args:
+            artifact_id: UUID of the artifact.
+
+        Returns:
+            True if removed, False if not found.
+        """
+        with self._lock:
+            if self._metadata.pop(str(artifact_id), None) is None:
+                return False
+            self._save()
+            return True
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group changes into a single write of the metadata file.
+
+        Changes made inside the block are saved once, when the outermost
+        block exits, rather than once per change.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    self._write()
+
+    def _load(self) -> None:
+        """Load metadata from the JSON file."""
+        if not self._metadata_file.exists():
+            self._metadata = {}
+            return
+
+        try:
+            data = json.loads(self._metadata_file.read_text(encoding="utf-8"))
+            artifacts = data.get("artifacts", {})
+            self._metadata = {
+                artifact_id: dict(values)
+                for artifact_id, values in artifacts.items()
+                if isinstance(values, dict)
+            }
+        except (json.JSONDecodeError, AttributeError):
+            # If file is corrupted, start fresh
+            self._metadata = {}
+
+    def _save(self) -> None:
+        """Save metadata, or defer the write inside a batch."""
+        if self._batch_depth > 0:
+            self._dirty = True
+            return
+        self._write()
+
+    def _write(self) -> None:
+        """Atomically write metadata to the JSON file."""
+        self._dirty = False
+        self._meta_dir.mkdir(parents=True, exist_ok=True)
+
+        json_str = json.dumps({"artifacts": self._metadata}, indent=2)
+        tmp_file = self._metadata_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json_str, encoding="utf-8")
+        tmp_file.replace(self._metadata_file)
@@ -5,6 +5,8 @@ and enables quick lookup by ID, type, or status.
 """
 
 import json
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -38,6 +40,8 @@ class ArtifactRegistry:
         self._meta_dir = artifacts_dir / "_meta"
         self._index_file = self._meta_dir / "index.json"
         self._entries: dict[UUID, RegistryEntry] = {}
+        self._batch_depth = 0
+        self._dirty = False
 
         # Load existing index
         self._load()
@@ -111,6 +115,35 @@ class ArtifactRegistry:
             return True
         return False
 
+    def restore(self, entry: RegistryEntry) -> None:
+        """Put back an existing registry entry unchanged.
+
+        Args:
+            entry: The entry to restore.
+        """
+        self._entries[entry.id] = entry
+        self._save()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group changes into a single write of the index file.
+
+        Changes made inside the block are saved once, when the outermost
+        block exits, rather than once per change.
+
+        Example:
+            >>> with registry.batch():
+            ...     for artifact_id in artifact_ids:
+            ...         registry.update_status(artifact_id, ArtifactStatus.APPROVED)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._write()
+
     def lookup(self, artifact_id: UUID) -> RegistryEntry | None:
         """Look up an artifact by ID.
 
@@ -211,7 +244,15 @@ class ArtifactRegistry:
             self._entries = {}
 
     def _save(self) -> None:
-        """Save registry to the index file."""
+        """Save the registry, or defer the write inside a batch."""
+        if self._batch_depth > 0:
+            self._dirty = True
+            return
+        self._write()
+
+    def _write(self) -> None:
+        """Atomically write the registry to the index file."""
+        self._dirty = False
         # Ensure meta directory exists
         self._meta_dir.mkdir(parents=True, exist_ok=True)
 
@@ -229,4 +270,6 @@ class ArtifactRegistry:
         }
 
         json_str = json.dumps(data, indent=2)
-        self._index_file.write_text(json_str, encoding="utf-8")
+        tmp_file = self._index_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json_str, encoding="utf-8")
+        tmp_file.replace(self._index_file)
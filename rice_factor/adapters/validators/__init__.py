@@ -14,7 +14,11 @@ from rice_factor.adapters.validators.architecture_validator import (
 )
 from rice_factor.adapters.validators.invariant_checker import InvariantChecker
 from rice_factor.adapters.validators.lint_runner_adapter import LintRunnerAdapter
-from rice_factor.adapters.validators.schema import ArtifactValidator
+from rice_factor.adapters.validators.schema import (
+    ArtifactValidator,
+    preload_schemas,
+    validate_artifact_file,
+)
 from rice_factor.adapters.validators.test_runner_adapter import TestRunnerAdapter
 
 __all__ = [
@@ -24,4 +28,6 @@ __all__ = [
     "InvariantChecker",
     "LintRunnerAdapter",
     "TestRunnerAdapter",
+    "preload_schemas",
+    "validate_artifact_file",
 ]
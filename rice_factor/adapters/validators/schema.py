@@ -2,11 +2,15 @@
 
 This module implements artifact validation using both Pydantic models
 (for Python type safety) and JSON Schema (for language-agnostic validation).
+
+For bulk validation with ParallelExecutor's process backend, use
+preload_schemas as the worker initializer and validate_artifact_file as
+the handler.
 """
 
 import json
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import jsonschema
 from pydantic import BaseModel, ValidationError
@@ -25,9 +29,18 @@ from rice_factor.domain.artifacts.payloads import (
 )
 from rice_factor.domain.failures.errors import ArtifactValidationError
 
+if TYPE_CHECKING:
+    from rice_factor.domain.services.parallel_executor import ExecutionTask
+
 # Module-level schema cache to avoid memory leaks from instance-method caching
 _SCHEMA_CACHE: dict[tuple[str, str], dict[str, Any]] = {}
 
+# Compiled validators, keyed like _SCHEMA_CACHE; building one checks the schema
+_VALIDATOR_CACHE: dict[tuple[str, str], Any] = {}
+
+# Schema directory set by preload_schemas() for validate_artifact_file()
+_WORKER_SCHEMA_DIR: Path | None = None
+
 # Mapping from ArtifactType to payload model class
 PAYLOAD_TYPE_MAP: dict[ArtifactType, type[BaseModel]] = {
     ArtifactType.PROJECT_PLAN: ProjectPlanPayload,
@@ -95,6 +108,26 @@ class ArtifactValidator:
             _SCHEMA_CACHE[cache_key] = schema
             return schema
 
+    def _get_schema_validator(self, schema_file: str) -> Any:
+        """Load and cache a compiled validator for a JSON Schema file.
+
+        Args:
+            schema_file: Name of the schema file.
+
+        Returns:
+            jsonschema validator instance for the schema.
+
+        Raises:
+            FileNotFoundError: If schema file doesn't exist.
+        """
+        cache_key = (str(self._schema_dir), schema_file)
+        if cache_key not in _VALIDATOR_CACHE:
+            schema = self._load_schema(schema_file)
+            validator_class = jsonschema.validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            _VALIDATOR_CACHE[cache_key] = validator_class(schema)
+        return _VALIDATOR_CACHE[cache_key]
+
     def validate(self, data: dict[str, Any]) -> ArtifactEnvelope[BaseModel]:
         """Validate artifact data and return an ArtifactEnvelope.
 
@@ -205,17 +238,17 @@ class ArtifactValidator:
             schema_file = maybe_schema_file
 
         try:
-            schema = self._load_schema(schema_file)
+            validator = self._get_schema_validator(schema_file)
         except FileNotFoundError as e:
             raise ArtifactValidationError(
                 f"Schema file not found: {schema_file}",
                 field_path="$schema",
             ) from e
 
-        try:
-            jsonschema.validate(data, schema)
-        except jsonschema.ValidationError as e:
-            raise self._jsonschema_to_validation_error(e) from e
+        # Same error selection as jsonschema.validate()
+        error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+        if error is not None:
+            raise self._jsonschema_to_validation_error(error)
 
     def _pydantic_to_validation_error(
         self, error: ValidationError, prefix: str = ""
@@ -279,3 +312,47 @@ class ArtifactValidator:
             expected=expected,
             actual=error.instance if error.instance is not None else None,
         )
+
+
+def preload_schemas(schema_dir: str | None = None) -> None:
+    """Load and compile every artifact schema into the module caches.
+
+    Intended as a ParallelExecutor worker initializer, so each worker
+    process parses the schemas once rather than once per artifact.
+
+    Args:
+        schema_dir: Directory containing JSON Schema files (defaults to
+            the project's schemas/ directory).
+    """
+    global _WORKER_SCHEMA_DIR
+    _WORKER_SCHEMA_DIR = Path(schema_dir) if schema_dir else None
+    validator = ArtifactValidator(_WORKER_SCHEMA_DIR)
+    for schema_file in ["artifact.schema.json", *SCHEMA_FILE_MAP.values()]:
+        validator._get_schema_validator(schema_file)
+
+
+def validate_artifact_file(task: "ExecutionTask") -> dict[str, Any]:
+    """Validate the artifact JSON file a task points to.
+
+    A ParallelExecutor handler: the worker reads task.source_path itself,
+    so only the path is pickled, and a small summary is returned.
+
+    Args:
+        task: Task whose source_path is an artifact JSON file.
+
+    Returns:
+        Dict with the artifact's path, ID and type.
+
+    Raises:
+        ArtifactValidationError: If the artifact is invalid.
+        ValueError: If the task has no source_path.
+    """
+    if task.source_path is None:
+        raise ValueError(f"Task '{task.task_id}' has no source_path")
+    data = json.loads(Path(task.source_path).read_text(encoding="utf-8"))
+    envelope = ArtifactValidator(_WORKER_SCHEMA_DIR).validate(data)
+    return {
+        "path": task.source_path,
+        "id": str(envelope.id),
+        "artifact_type": envelope.artifact_type.value,
+    }
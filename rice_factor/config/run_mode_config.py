@@ -71,6 +71,10 @@ class RunModeConfig:
         voting_threshold: Threshold for consensus in voting mode (0.0-1.0).
         max_rounds: Maximum coordination rounds before timeout.
         phase_modes: For hybrid mode, mapping of phases to modes.
+        max_concurrency: Maximum agents working concurrently in a fan-out.
+        agent_timeout_seconds: Time each agent gets for one proposal, vote
+            or subtask before it is treated as timed out.
+        inbox_size: Capacity of each agent's message bus inbox.
     """
 
     mode: RunMode
@@ -82,6 +86,9 @@ class RunModeConfig:
     voting_threshold: float = 0.5
     max_rounds: int = 10
     phase_modes: dict[str, RunMode] = field(default_factory=dict)
+    max_concurrency: int = 4
+    agent_timeout_seconds: float = 120.0
+    inbox_size: int = 100
 
     def __post_init__(self) -> None:
         """Validate configuration."""
@@ -106,6 +113,17 @@ class RunModeConfig:
                 f"Voting threshold must be between 0.0 and 1.0, got {self.voting_threshold}"
             )
 
+        if self.max_concurrency < 1:
+            raise ValueError(
+                f"Max concurrency must be at least 1, got {self.max_concurrency}"
+            )
+        if self.agent_timeout_seconds <= 0:
+            raise ValueError(
+                f"Agent timeout must be positive, got {self.agent_timeout_seconds}"
+            )
+        if self.inbox_size < 1:
+            raise ValueError(f"Inbox size must be at least 1, got {self.inbox_size}")
+
     def get_agent(self, agent_id: str) -> AgentConfig | None:
         """Get an agent configuration by ID.
 
@@ -253,6 +271,9 @@ class RunModeConfig:
             voting_threshold=data.get("voting_threshold", 0.5),
             max_rounds=data.get("max_rounds", 10),
             phase_modes=phase_modes,
+            max_concurrency=data.get("max_concurrency", 4),
+            agent_timeout_seconds=data.get("agent_timeout_seconds", 120.0),
+            inbox_size=data.get("inbox_size", 100),
         )
 
     @classmethod
@@ -334,6 +355,12 @@ class RunModeConfig:
             result["voting_threshold"] = self.voting_threshold
         if self.max_rounds != 10:
             result["max_rounds"] = self.max_rounds
+        if self.max_concurrency != 4:
+            result["max_concurrency"] = self.max_concurrency
+        if self.agent_timeout_seconds != 120.0:
+            result["agent_timeout_seconds"] = self.agent_timeout_seconds
+        if self.inbox_size != 100:
+            result["inbox_size"] = self.inbox_size
         if self.phase_modes:
             result["phase_modes"] = {p: m.value for p, m in self.phase_modes.items()}
 
@@ -29,7 +29,7 @@ class LLMPort(Protocol):
     - Fail explicitly if information is missing
 
     Contract (Non-Negotiable):
-        1. generate() must return valid JSON or explicit error
+        1. generate() and repair() must return valid JSON or explicit error
         2. Temperature must be 0.0-0.2 for determinism
         3. top_p must be <= 0.3
         4. No streaming
@@ -71,3 +71,32 @@ class LLMPort(Protocol):
             {"error": "missing_information", "details": "Domain 'User' not defined"}
         """
         ...
+
+    def repair(
+        self,
+        pass_type: CompilerPassType,
+        request: CompilerContext,
+        schema: dict[str, object],
+    ) -> CompilerResult:
+        """Ask the LLM to patch invalid sub-trees of a generated artifact.
+
+        Unlike generate(), the LLM receives only the repair system prompt,
+        the repair request (invalid values, validator messages and schema
+        fragments) and the schema of the patch object. Neither the pass
+        prompt nor the full artifact schema is sent.
+
+        Args:
+            pass_type: The pass that produced the invalid artifact.
+            request: Repair context built by the OutputRepairer.
+            schema: JSON Schema of the expected patch object.
+
+        Returns:
+            CompilerResult whose payload maps JSON pointers to corrected
+            values on success, or error details on failure.
+
+        Raises:
+            LLMAPIError: Provider API failure (5xx, network errors)
+            LLMTimeoutError: Request timeout
+            LLMRateLimitError: Rate limiting response
+        """
+        ...
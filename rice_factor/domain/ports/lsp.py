@@ -199,6 +199,26 @@ class LSPPort(ABC):
         """
         ...
 
+    def rename_many(
+        self,
+        renames: list[tuple[str, int, int, str]],
+    ) -> list[LSPResult]:
+        """Rename several symbols in one session.
+
+        The default issues one rename per symbol; adapters that can keep
+        several requests in flight should override it.
+
+        Args:
+            renames: (file path, line, column, new name) of each symbol.
+
+        Returns:
+            LSPResult with text edits for each rename, in order.
+        """
+        return [
+            self.rename(file_path, line, column, new_name)
+            for file_path, line, column, new_name in renames
+        ]
+
     @abstractmethod
     def find_references(
         self,
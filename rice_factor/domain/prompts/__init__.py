@@ -19,6 +19,7 @@ from rice_factor.domain.prompts.base import (
 from rice_factor.domain.prompts.implementation_planner import (
     IMPLEMENTATION_PLANNER_PROMPT,
 )
+from rice_factor.domain.prompts.output_repair import OUTPUT_REPAIR_PROMPT
 from rice_factor.domain.prompts.project_planner import PROJECT_PLANNER_PROMPT
 from rice_factor.domain.prompts.refactor_planner import REFACTOR_PLANNER_PROMPT
 from rice_factor.domain.prompts.scaffold_planner import SCAFFOLD_PLANNER_PROMPT
@@ -26,6 +27,11 @@ from rice_factor.domain.prompts.schema_injector import (
     SchemaInjector,
     SchemaNotFoundError,
 )
+from rice_factor.domain.prompts.schema_renderer import (
+    SchemaRenderMode,
+    render_schema,
+    schema_fence_language,
+)
 from rice_factor.domain.prompts.test_designer import TEST_DESIGNER_PROMPT
 
 # Mapping from CompilerPassType to artifact type
@@ -38,6 +44,45 @@ PASS_TO_ARTIFACT: dict[CompilerPassType, ArtifactType] = {
     CompilerPassType.REFACTOR: ArtifactType.REFACTOR_PLAN,
 }
 
+# Prefix of project_files entries packed for one target file. They differ
+# between the targets of a plan, so they are rendered with the
+# per-invocation context instead of the cacheable project files.
+TARGET_CONTEXT_PREFIX = "target:"
+
+
+def target_context_key(name: str) -> str:
+    """Get the project_files key for context packed for one target.
+
+    Args:
+        name: Display name of the entry (e.g. "requirements.md").
+
+    Returns:
+        Key marking the entry as target-specific.
+    """
+    return f"{TARGET_CONTEXT_PREFIX}{name}"
+
+
+def split_project_files(
+    project_files: dict[str, str],
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Split project files into stable and target-specific entries.
+
+    Args:
+        project_files: Dict of filename to content.
+
+    Returns:
+        Tuple of (stable entries, target-specific entries by display name).
+    """
+    stable: dict[str, str] = {}
+    target: dict[str, str] = {}
+    for name, content in project_files.items():
+        if name.startswith(TARGET_CONTEXT_PREFIX):
+            target[name.removeprefix(TARGET_CONTEXT_PREFIX)] = content
+        else:
+            stable[name] = content
+    return stable, target
+
+
 # Mapping from CompilerPassType to pass-specific prompt
 PASS_PROMPTS: dict[CompilerPassType, str] = {
     CompilerPassType.PROJECT: PROJECT_PLANNER_PROMPT,
@@ -55,13 +100,25 @@ class PromptManager:
     Provides methods to access and combine prompts for compiler passes.
     """
 
-    def __init__(self, schemas_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        schemas_dir: Path | None = None,
+        *,
+        schema_mode: SchemaRenderMode = SchemaRenderMode.PRETTY,
+    ) -> None:
         """Initialize the prompt manager.
 
         Args:
             schemas_dir: Path to schemas directory. If None, uses default.
+            schema_mode: How output schemas are rendered into prompts.
         """
         self._schema_injector = SchemaInjector(schemas_dir)
+        self._schema_mode = schema_mode
+
+    @property
+    def schema_mode(self) -> SchemaRenderMode:
+        """Return the schema rendering mode."""
+        return self._schema_mode
 
     def get_base_prompt(self) -> str:
         """Get the canonical base system prompt.
@@ -132,9 +189,10 @@ class PromptManager:
             if artifact_type is not None:
                 try:
                     schema_str = self._schema_injector.format_schema_for_prompt(
-                        artifact_type
+                        artifact_type, self._schema_mode
                     )
-                    prompt = f"{prompt}\n\nJSON SCHEMA:\n```json\n{schema_str}\n```\n\nYour output MUST conform exactly to this schema."
+                    fence = schema_fence_language(self._schema_mode)
+                    prompt = f"{prompt}\n\nJSON SCHEMA:\n```{fence}\n{schema_str}\n```\n\nYour output MUST conform exactly to this schema."
                 except SchemaNotFoundError:
                     # Schema not available - continue without it
                     pass
@@ -145,6 +203,43 @@ class PromptManager:
 
         return prompt
 
+    def get_repair_system_prompt(self) -> str:
+        """Get the system prompt for output repair requests.
+
+        Used instead of the base and pass prompts when asking the model to
+        patch invalid sub-trees of a generated artifact.
+
+        Returns:
+            The output repair system prompt.
+        """
+        return OUTPUT_REPAIR_PROMPT
+
+    def get_repair_prompt(
+        self, context: CompilerContext, schema: dict[str, object]
+    ) -> str:
+        """Get the user prompt for an output repair request.
+
+        Only the patch schema and the repair context are included; the
+        artifact schema and the project files are left out.
+
+        Args:
+            context: Repair context (the errors to fix and target file).
+            schema: JSON Schema of the expected patch object.
+
+        Returns:
+            Repair prompt string.
+        """
+        schema_text = render_schema(schema, self._schema_mode)
+        fence = schema_fence_language(self._schema_mode)
+        prompt = (
+            f"PATCH SCHEMA:\n```{fence}\n{schema_text}\n```\n\n"
+            "Your output MUST conform exactly to this schema."
+        )
+        dynamic = self.format_dynamic_context(context)
+        if dynamic:
+            prompt = f"{prompt}\n\nCONTEXT:{dynamic}"
+        return prompt
+
     def _format_context(self, context: CompilerContext) -> str:
         """Format compilation context for inclusion in prompt.
 
@@ -156,12 +251,53 @@ class PromptManager:
         """
         parts = ["CONTEXT:"]
 
-        # Add project files
-        if context.project_files:
-            parts.append("\nPROJECT FILES:")
-            for filename, content in context.project_files.items():
-                parts.append(f"\n--- {filename} ---")
-                parts.append(content)
+        project_files = self.format_project_files(context.project_files)
+        if project_files:
+            parts.append(project_files)
+
+        dynamic = self.format_dynamic_context(context)
+        if dynamic:
+            parts.append(dynamic)
+
+        return "\n".join(parts)
+
+    def format_project_files(self, project_files: dict[str, str]) -> str:
+        """Format the .project/ files section of the context.
+
+        This section is stable across passes over the same project, which
+        makes it a good candidate for provider-side prompt caching. Entries
+        packed for a single target are left to format_dynamic_context.
+
+        Args:
+            project_files: Dict of filename to content.
+
+        Returns:
+            Formatted project files section, or "" if there are none.
+        """
+        project_files, _ = split_project_files(project_files)
+        if not project_files:
+            return ""
+
+        parts = ["\nPROJECT FILES:"]
+        for filename, content in project_files.items():
+            parts.append(f"\n--- {filename} ---")
+            parts.append(content)
+        return "\n".join(parts)
+
+    def format_dynamic_context(self, context: CompilerContext) -> str:
+        """Format the per-invocation part of the context.
+
+        Covers loaded artifacts, context packed for the target and the
+        target file, which change between invocations and therefore must
+        not be part of a cached prefix.
+
+        Args:
+            context: The compilation context.
+
+        Returns:
+            Formatted artifacts/target section, or "" if there is nothing.
+        """
+        parts: list[str] = []
 
         # Add artifacts
         if context.artifacts:
@@ -175,6 +311,14 @@ class PromptManager:
                 else:
                     parts.append(str(payload))
 
+        # Add context packed for the target
+        _, target_files = split_project_files(context.project_files)
+        if target_files:
+            parts.append("\nTARGET CONTEXT:")
+            for name, content in target_files.items():
+                parts.append(f"\n--- {name} ---")
+                parts.append(content)
+
         # Add target file if present
         if context.target_file:
             parts.append(f"\nTARGET FILE: {context.target_file}")
@@ -229,14 +373,21 @@ __all__ = [
     "FAILURE_FORMAT_MISSING_INFO",
     "HARD_CONTRACT_RULES",
     "IMPLEMENTATION_PLANNER_PROMPT",
+    "OUTPUT_REPAIR_PROMPT",
     "PASS_PROMPTS",
     "PASS_TO_ARTIFACT",
     "PROJECT_PLANNER_PROMPT",
     "REFACTOR_PLANNER_PROMPT",
     "SCAFFOLD_PLANNER_PROMPT",
+    "TARGET_CONTEXT_PREFIX",
     "TEST_DESIGNER_PROMPT",
     "PromptManager",
     "SchemaInjector",
     "SchemaNotFoundError",
+    "SchemaRenderMode",
     "format_context_section",
+    "render_schema",
+    "schema_fence_language",
+    "split_project_files",
+    "target_context_key",
 ]
@@ -4,12 +4,19 @@ This module provides the SchemaInjector class for loading JSON schemas
 and injecting them into prompts.
 """
 
+import hashlib
 import json
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar
 
 from rice_factor.domain.artifacts.enums import ArtifactType
+from rice_factor.domain.prompts.schema_renderer import (
+    SchemaRenderMode,
+    clear_render_cache,
+    render_schema,
+    schema_fence_language,
+)
 
 
 class SchemaNotFoundError(Exception):
@@ -24,7 +31,8 @@ class SchemaNotFoundError(Exception):
 class SchemaInjector:
     """Loads and injects JSON schemas into prompts.
 
-    Schemas are cached for performance after first load.
+    Schemas are cached for performance after first load. Rendered schema
+    text is memoized per (schema file hash, render mode).
     """
 
     # Mapping from ArtifactType to schema filename
@@ -100,12 +108,51 @@ class SchemaInjector:
             result: dict[str, Any] = json.load(f)
             return result
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _schema_file_hash_cached(
+        artifact_type: ArtifactType, schemas_dir: Path
+    ) -> str:
+        """Hash the schema file contents for render memoization.
+
+        Args:
+            artifact_type: The artifact type.
+            schemas_dir: Path to schemas directory.
+
+        Returns:
+            Hex SHA-256 digest of the schema file bytes.
+        """
+        filename = SchemaInjector.SCHEMA_FILENAMES[artifact_type]
+        return hashlib.sha256((schemas_dir / filename).read_bytes()).hexdigest()
+
+    def render_schema(
+        self,
+        artifact_type: ArtifactType,
+        mode: SchemaRenderMode = SchemaRenderMode.PRETTY,
+    ) -> str:
+        """Render the schema for an artifact type in the given mode.
+
+        Args:
+            artifact_type: The type of artifact.
+            mode: Rendering mode (pretty, compact or typescript).
+
+        Returns:
+            The rendered schema text.
+
+        Raises:
+            SchemaNotFoundError: If the schema file doesn't exist.
+        """
+        schema = self.load_schema(artifact_type)
+        content_hash = self._schema_file_hash_cached(artifact_type, self._schemas_dir)
+        return render_schema(schema, mode, content_hash=content_hash)
+
     def inject_schema(
         self,
         prompt: str,
         artifact_type: ArtifactType,
         *,
         placeholder: str = "{{SCHEMA}}",
+        mode: SchemaRenderMode = SchemaRenderMode.PRETTY,
     ) -> str:
         """Inject a schema into a prompt at the placeholder location.
 
@@ -115,17 +162,18 @@ class SchemaInjector:
             prompt: The prompt text to inject into.
             artifact_type: The type of artifact to inject schema for.
             placeholder: The placeholder string to replace with the schema.
+            mode: Schema rendering mode.
 
         Returns:
             The prompt with the schema injected.
         """
-        schema = self.load_schema(artifact_type)
-        schema_json = json.dumps(schema, indent=2)
+        schema_text = self.render_schema(artifact_type, mode)
+        fence = schema_fence_language(mode)
 
         schema_section = f"""
 JSON SCHEMA:
-```json
-{schema_json}
+```{fence}
+{schema_text}
 ```
 
 Your output MUST conform exactly to this schema."""
@@ -135,17 +183,21 @@ Your output MUST conform exactly to this schema."""
         else:
             return f"{prompt}\n{schema_section}"
 
-    def format_schema_for_prompt(self, artifact_type: ArtifactType) -> str:
+    def format_schema_for_prompt(
+        self,
+        artifact_type: ArtifactType,
+        mode: SchemaRenderMode = SchemaRenderMode.PRETTY,
+    ) -> str:
         """Format a schema as a string suitable for including in a prompt.
 
         Args:
             artifact_type: The type of artifact.
+            mode: Schema rendering mode.
 
         Returns:
             Formatted schema string.
         """
-        schema = self.load_schema(artifact_type)
-        return json.dumps(schema, indent=2)
+        return self.render_schema(artifact_type, mode)
 
     def clear_cache(self) -> None:
         """Clear the schema cache.
@@ -153,3 +205,5 @@ Your output MUST conform exactly to this schema."""
         Useful for testing or when schemas are modified at runtime.
         """
         self._load_schema_cached.cache_clear()
+        self._schema_file_hash_cached.cache_clear()
+        clear_render_cache()
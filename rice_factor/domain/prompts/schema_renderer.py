@@ -0,0 +1,309 @@
+"""Compact rendering of JSON schemas for prompt injection.
+
+This module provides render_schema(), which turns an output schema into
+the text embedded in LLM prompts. Besides the original pretty-printed
+JSON, it supports a compact mode (minified, annotations stripped, only
+referenced definitions kept) and a terse TypeScript-like notation.
+
+Renderings are memoized per (schema content hash, mode). Content hashes
+are themselves memoized per schema object, since loaded schemas are cached
+and shared, so repeat renders of the same schema skip the hashing.
+"""
+
+import hashlib
+import json
+import threading
+from enum import Enum
+from typing import Any
+
+
+class SchemaRenderMode(Enum):
+    """How a schema is rendered into a prompt."""
+
+    PRETTY = "pretty"  # json.dumps(indent=2), unchanged schema
+    COMPACT = "compact"  # Minified, pruned JSON Schema
+    TYPESCRIPT = "typescript"  # Terse TypeScript-like type notation
+
+
+# Annotation keywords that do not affect validation
+NON_ESSENTIAL_KEYWORDS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$comment",
+        "title",
+        "description",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+    }
+)
+
+# Keywords whose value is a map of name -> subschema
+_SCHEMA_MAP_KEYWORDS = frozenset(
+    {"properties", "patternProperties", "$defs", "definitions", "dependentSchemas"}
+)
+
+# Keywords whose value is a list of subschemas
+_SCHEMA_LIST_KEYWORDS = frozenset({"allOf", "anyOf", "oneOf", "prefixItems"})
+
+# Keywords whose value is a single subschema
+_SCHEMA_KEYWORDS = frozenset(
+    {
+        "items",
+        "additionalProperties",
+        "unevaluatedProperties",
+        "contains",
+        "propertyNames",
+        "not",
+        "if",
+        "then",
+        "else",
+    }
+)
+
+_render_cache: dict[tuple[str, SchemaRenderMode], str] = {}
+_render_lock = threading.Lock()
+
+# Content hash per schema object, keyed by id(). The schema is kept in the
+# entry so its id cannot be reused while the entry exists. Schemas are
+# treated as immutable once rendered.
+_hash_cache: dict[int, tuple[dict[str, Any], str]] = {}
+_HASH_CACHE_SIZE = 64
+
+
+def schema_hash(schema: dict[str, Any]) -> str:
+    """Compute a stable content hash for a schema.
+
+    Args:
+        schema: The JSON schema.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def render_schema(
+    schema: dict[str, Any],
+    mode: SchemaRenderMode = SchemaRenderMode.PRETTY,
+    *,
+    content_hash: str | None = None,
+) -> str:
+    """Render a schema for inclusion in a prompt.
+
+    Args:
+        schema: The JSON schema.
+        mode: Rendering mode.
+        content_hash: Precomputed content hash (e.g. of the schema file).
+            Computed from the schema if not given.
+
+    Returns:
+        The rendered schema text.
+    """
+    if content_hash is None:
+        content_hash = _identity_hash(schema)
+    key = (content_hash, mode)
+    with _render_lock:
+        cached = _render_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if mode == SchemaRenderMode.PRETTY:
+        rendered = json.dumps(schema, indent=2)
+    elif mode == SchemaRenderMode.COMPACT:
+        rendered = json.dumps(compact_schema(schema), separators=(",", ":"))
+    else:
+        rendered = _TypeScriptRenderer(schema).render()
+
+    with _render_lock:
+        _render_cache[key] = rendered
+    return rendered
+
+
+def _identity_hash(schema: dict[str, Any]) -> str:
+    """Get the content hash of a schema object, hashing it only once."""
+    with _render_lock:
+        entry = _hash_cache.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    content_hash = schema_hash(schema)
+    with _render_lock:
+        if len(_hash_cache) >= _HASH_CACHE_SIZE:
+            _hash_cache.clear()
+        _hash_cache[id(schema)] = (schema, content_hash)
+    return content_hash
+
+
+def schema_fence_language(mode: SchemaRenderMode) -> str:
+    """Return the code fence language for a rendered schema.
+
+    Args:
+        mode: Rendering mode.
+
+    Returns:
+        "typescript" for the TypeScript notation, otherwise "json".
+    """
+    return "typescript" if mode == SchemaRenderMode.TYPESCRIPT else "json"
+
+
+def clear_render_cache() -> None:
+    """Clear memoized schema renderings."""
+    with _render_lock:
+        _render_cache.clear()
+        _hash_cache.clear()
+
+
+def compact_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Strip annotations and inline referenced definitions.
+
+    Local ``$ref``s into ``$defs``/``definitions`` are inlined. Recursive
+    definitions cannot be inlined, so those are kept (and only those) under
+    ``$defs``. Unreferenced definitions are dropped.
+
+    Args:
+        schema: The JSON schema.
+
+    Returns:
+        A new, pruned schema.
+    """
+    definitions: dict[str, Any] = {}
+    for keyword in ("$defs", "definitions"):
+        for name, subschema in schema.get(keyword, {}).items():
+            definitions[f"#/{keyword}/{name}"] = subschema
+
+    kept: dict[str, Any] = {}
+
+    def walk(node: Any, resolving: tuple[str, ...]) -> Any:
+        if not isinstance(node, dict):
+            return node
+
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref in definitions:
+            if ref in resolving:
+                # Recursive reference: keep the definition and point at it
+                name = ref.rsplit("/", 1)[-1]
+                if name not in kept:
+                    kept[name] = None  # Placeholder to stop re-entry
+                    kept[name] = walk(definitions[ref], (ref,))
+                siblings = {k: v for k, v in node.items() if k != "$ref"}
+                pointer = walk(siblings, resolving)
+                pointer["$ref"] = f"#/$defs/{name}"
+                return pointer
+            inlined = walk(definitions[ref], (*resolving, ref))
+            siblings = {k: v for k, v in node.items() if k != "$ref"}
+            if siblings:
+                return {**inlined, **walk(siblings, resolving)}
+            return inlined
+
+        result: dict[str, Any] = {}
+        for key, value in node.items():
+            if key in NON_ESSENTIAL_KEYWORDS or key in ("$defs", "definitions"):
+                continue
+            if key in _SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+                result[key] = {
+                    name: walk(sub, resolving) for name, sub in value.items()
+                }
+            elif key in _SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+                result[key] = [walk(sub, resolving) for sub in value]
+            elif key in _SCHEMA_KEYWORDS:
+                result[key] = walk(value, resolving)
+            else:
+                result[key] = value
+        return result
+
+    compacted: dict[str, Any] = walk(schema, ())
+    if kept:
+        compacted["$defs"] = kept
+    return compacted
+
+
+class _TypeScriptRenderer:
+    """Renders a JSON schema as a terse TypeScript-like type expression.
+
+    The notation is lossy: numeric/length bounds and patterns are dropped,
+    string formats are kept as a trailing comment.
+    """
+
+    def __init__(self, schema: dict[str, Any]) -> None:
+        self._schema = compact_schema(schema)
+        self._defs: dict[str, Any] = self._schema.get("$defs", {})
+
+    def render(self) -> str:
+        lines = [
+            f"type {name} = {self._type(subschema)};"
+            for name, subschema in self._defs.items()
+        ]
+        lines.append(self._type(self._schema))
+        return "\n".join(lines)
+
+    def _type(self, node: Any) -> str:
+        if node is True or node == {}:
+            return "any"
+        if node is False:
+            return "never"
+        if not isinstance(node, dict):
+            return "any"
+
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            return ref.rsplit("/", 1)[-1]
+        if "const" in node:
+            return json.dumps(node["const"])
+        if "enum" in node:
+            return "|".join(json.dumps(v) for v in node["enum"])
+        for keyword in ("oneOf", "anyOf"):
+            if keyword in node:
+                return "|".join(self._type(sub) for sub in node[keyword])
+        if "allOf" in node:
+            return "&".join(self._type(sub) for sub in node["allOf"])
+
+        node_type = node.get("type")
+        if isinstance(node_type, list):
+            return "|".join(
+                self._type({**node, "type": single}) for single in node_type
+            )
+        if node_type == "object" or "properties" in node:
+            return self._object(node)
+        if node_type == "array":
+            item = self._type(node.get("items", {}))
+            return f"({item})[]" if self._is_compound(item) else f"{item}[]"
+        if node_type == "integer":
+            return "int"
+        if node_type == "string" and "format" in node:
+            return f"string/*{node['format']}*/"
+        if isinstance(node_type, str):
+            return node_type
+        return "any"
+
+    @staticmethod
+    def _is_compound(expr: str) -> bool:
+        """Whether a type expression has a top-level union/intersection."""
+        depth = 0
+        in_string = False
+        for char in expr:
+            if char == '"':
+                in_string = not in_string
+            elif in_string:
+                continue
+            elif char in "{(":
+                depth += 1
+            elif char in "})":
+                depth -= 1
+            elif char in "|&" and depth == 0:
+                return True
+        return False
+
+    def _object(self, node: dict[str, Any]) -> str:
+        required = set(node.get("required", []))
+        fields = [
+            f"{name}{'' if name in required else '?'}:{self._type(sub)}"
+            for name, sub in node.get("properties", {}).items()
+        ]
+        extra = node.get("additionalProperties", True)
+        if extra is not False and not (extra is True and fields):
+            fields.append(f"[k:string]:{self._type(extra)}")
+        return "{" + ";".join(fields) + "}"
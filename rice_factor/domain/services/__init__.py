@@ -9,6 +9,11 @@ from rice_factor.domain.services.artifact_builder import (
 )
 from rice_factor.domain.services.artifact_resolver import ArtifactResolver
 from rice_factor.domain.services.artifact_service import ArtifactService
+from rice_factor.domain.services.batch_compiler import (
+    BatchCompiler,
+    BatchCompileResult,
+    TargetCompileResult,
+)
 from rice_factor.domain.services.capability_service import CapabilityService
 from rice_factor.domain.services.code_detector import CodeDetector, detect_code
 from rice_factor.domain.services.compiler_pass import CompilerPass
@@ -18,6 +23,12 @@ from rice_factor.domain.services.context_builder import (
     ContextBuilderError,
     ForbiddenInputError,
     MissingRequiredInputError,
+    PackedContext,
+)
+from rice_factor.domain.services.context_packer import (
+    ContextFragment,
+    ContextPacker,
+    PackingReport,
 )
 from rice_factor.domain.services.diff_service import (
     Diff,
@@ -39,6 +50,12 @@ from rice_factor.domain.services.llm_error_handler import (
     LLMErrorHandler,
     handle_llm_errors,
 )
+from rice_factor.domain.services.output_repairer import (
+    OutputRepairer,
+    RepairStats,
+    RepairTracker,
+    get_repair_tracker,
+)
 from rice_factor.domain.services.output_validator import (
     OutputValidator,
     validate_llm_output,
@@ -97,11 +114,15 @@ __all__ = [
     "ArtifactBuilderError",
     "ArtifactResolver",
     "ArtifactService",
+    "BatchCompileResult",
+    "BatchCompiler",
     "CapabilityService",
     "CodeDetector",
     "CompilerPass",
     "ContextBuilder",
     "ContextBuilderError",
+    "ContextFragment",
+    "ContextPacker",
     "Diff",
     "DiffResult",
     "DiffService",
@@ -115,9 +136,12 @@ __all__ = [
     "LifecycleBlockingError",
     "LifecycleService",
     "MissingRequiredInputError",
+    "OutputRepairer",
     "OutputValidator",
     "Override",
     "OverrideService",
+    "PackedContext",
+    "PackingReport",
     "PassNotFoundError",
     "PassRegistry",
     "Phase",
@@ -129,12 +153,15 @@ __all__ = [
     "RefactorDiff",
     "RefactorExecutor",
     "RefactorResult",
+    "RepairStats",
+    "RepairTracker",
     "ReviewPrompt",
     "SafetyEnforcer",
     "SafetyLockVerificationResult",
     "ScaffoldResult",
     "ScaffoldService",
     "StepResult",
+    "TargetCompileResult",
     "ValidationOrchestrator",
     "ValidationResult",
     "ValidationStep",
@@ -142,6 +169,7 @@ __all__ = [
     "detect_code",
     "extract_json",
     "get_pass",
+    "get_repair_tracker",
     "handle_llm_errors",
     "validate_llm_output",
 ]
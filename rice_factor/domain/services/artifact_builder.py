@@ -7,9 +7,11 @@ creating envelopes, and saving artifacts.
 
 from pathlib import Path
 from typing import Any
+from uuid import UUID
 
 from pydantic import BaseModel
 
+from rice_factor.adapters.storage.metadata import ArtifactMetadataStore
 from rice_factor.domain.artifacts.compiler_types import (
     CompilerContext,
     CompilerPassType,
@@ -21,6 +23,7 @@ from rice_factor.domain.artifacts.payloads.failure_report import FailureReportPa
 from rice_factor.domain.ports.llm import LLMPort
 from rice_factor.domain.ports.storage import StoragePort
 from rice_factor.domain.services.context_builder import ContextBuilder
+from rice_factor.domain.services.context_packer import PackingReport
 from rice_factor.domain.services.failure_service import FailureService
 from rice_factor.domain.services.passes import PassRegistry, get_pass
 
@@ -55,6 +58,7 @@ class ArtifactBuilder:
         storage: Storage adapter for persistence.
         context_builder: Context builder for input gathering.
         failure_service: Service for failure handling.
+        metadata_store: Store for generation metadata (e.g. packing reports).
     """
 
     def __init__(
@@ -63,6 +67,7 @@ class ArtifactBuilder:
         storage: StoragePort,
         context_builder: ContextBuilder | None = None,
         failure_service: FailureService | None = None,
+        metadata_store: ArtifactMetadataStore | None = None,
     ) -> None:
         """Initialize the artifact builder.
 
@@ -71,11 +76,14 @@ class ArtifactBuilder:
             storage: Storage port implementation for persistence.
             context_builder: Context builder (created if not provided).
             failure_service: Failure service (created if not provided).
+            metadata_store: Store for generation metadata. If not provided,
+                packing reports are not persisted.
         """
         self._llm_port = llm_port
         self._storage = storage
         self._context_builder = context_builder or ContextBuilder(storage)
         self._failure_service = failure_service or FailureService()
+        self._metadata_store = metadata_store
         self._registry = PassRegistry.get_instance()
 
     def build(
@@ -111,12 +119,14 @@ class ArtifactBuilder:
         compiler_pass = get_pass(pass_type)
 
         # 2. Build context
-        context = self._context_builder.build_context(
+        packed = self._context_builder.build_packed_context(
             pass_type=pass_type,
             project_root=project_root,
             target_file=target_file,
             artifacts=artifacts,
         )
+        context = packed.context
+        packing_report = packed.packing_report
 
         # 3. Execute pass
         result = compiler_pass.compile(context, self._llm_port)
@@ -128,6 +138,7 @@ class ArtifactBuilder:
 
             # 5. Save to storage
             self._save_artifact(envelope)
+            self._record_metadata(envelope, packing_report)
 
             return envelope
         else:
@@ -137,6 +148,7 @@ class ArtifactBuilder:
                     pass_type=pass_type,
                     result=result,
                     context=context,
+                    packing_report=packing_report,
                 )
             )
 
@@ -149,6 +161,8 @@ class ArtifactBuilder:
         self,
         pass_type: CompilerPassType,
         context: CompilerContext,
+        packing_report: PackingReport | None = None,
+        depends_on: list[UUID] | None = None,
     ) -> ArtifactEnvelope[BaseModel]:
         """Build an artifact using pre-built context.
 
@@ -157,6 +171,8 @@ class ArtifactBuilder:
         Args:
             pass_type: The type of pass to execute.
             context: Pre-built compilation context.
+            packing_report: Packing report of the context, if it was packed.
+            depends_on: IDs of the artifacts the context was built from.
 
         Returns:
             ArtifactEnvelope with the generated artifact (or FailureReport on error).
@@ -167,8 +183,11 @@ class ArtifactBuilder:
 
         # Handle result
         if result.success and result.payload is not None:
-            envelope = self._create_envelope(pass_type, result.payload)
+            envelope = self._create_envelope(
+                pass_type, result.payload, depends_on=depends_on
+            )
             self._save_artifact(envelope)
+            self._record_metadata(envelope, packing_report)
             return envelope
         else:
             failure_envelope: ArtifactEnvelope[BaseModel] = (
@@ -176,6 +195,7 @@ class ArtifactBuilder:
                     pass_type=pass_type,
                     result=result,
                     context=context,
+                    packing_report=packing_report,
                 )
             )
             self._save_artifact(failure_envelope)
@@ -185,12 +205,14 @@ class ArtifactBuilder:
         self,
         pass_type: CompilerPassType,
         payload: dict[str, Any],
+        depends_on: list[UUID] | None = None,
     ) -> ArtifactEnvelope[BaseModel]:
         """Create an artifact envelope for the payload.
 
         Args:
             pass_type: The pass type that produced the artifact.
             payload: The artifact payload.
+            depends_on: IDs of the artifacts this one was built from.
 
         Returns:
             ArtifactEnvelope with DRAFT status.
@@ -202,20 +224,45 @@ class ArtifactBuilder:
         payload_model = self._create_payload_model(artifact_type, payload)
 
         # Create envelope with DRAFT status
+        extra: dict[str, Any] = {}
+        if depends_on:
+            extra["depends_on"] = depends_on
         envelope: ArtifactEnvelope[BaseModel] = ArtifactEnvelope(
             artifact_type=artifact_type,
             status=ArtifactStatus.DRAFT,
             created_by=CreatedBy.LLM,
             payload=payload_model,
+            **extra,
         )
 
         return envelope
 
+    def _record_metadata(
+        self,
+        envelope: ArtifactEnvelope[BaseModel],
+        packing_report: PackingReport | None = None,
+    ) -> None:
+        """Persist generation metadata for a saved artifact.
+
+        Args:
+            envelope: The saved artifact.
+            packing_report: Context packing report, recorded under
+                "context_packing" when context was packed.
+        """
+        if self._metadata_store is None or not isinstance(
+            packing_report, PackingReport
+        ):
+            return
+        self._metadata_store.update(
+            envelope.id, {"context_packing": packing_report.to_dict()}
+        )
+
     def _create_failure_envelope(
         self,
         pass_type: CompilerPassType,
         result: CompilerResult,
         context: CompilerContext,
+        packing_report: PackingReport | None = None,
     ) -> ArtifactEnvelope[BaseModel]:
         """Create a failure report envelope.
 
@@ -223,6 +270,7 @@ class ArtifactBuilder:
             pass_type: The pass type that failed.
             result: The compiler result with error details.
             context: The context used for compilation.
+            packing_report: Context packing report, if context was packed.
 
         Returns:
             ArtifactEnvelope containing FailureReportPayload.
@@ -250,6 +298,9 @@ class ArtifactBuilder:
         }
         if context.target_file:
             details["target_file"] = context.target_file
+        if isinstance(packing_report, PackingReport):
+            # Dropped context is a likely cause of missing_information failures
+            details["context_packing"] = packing_report.to_dict()
 
         # Create payload
         payload = FailureReportPayload(
@@ -0,0 +1,250 @@
+"""Batch compiler for running one compiler pass over many target files.
+
+This module provides the BatchCompiler service used by ``plan impl`` to
+plan many target files in one invocation. Context inputs are loaded once
+and shared, compilations run concurrently with a bounded worker pool, every
+LLM call goes through the RateLimiter, and each target is retried or
+reported on its own without aborting the batch.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from rice_factor.domain.artifacts.enums import ArtifactType
+from rice_factor.domain.failures.llm_errors import LLMError
+from rice_factor.domain.services.rate_limiter import RateLimiter, get_rate_limiter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pydantic import BaseModel
+
+    from rice_factor.domain.artifacts.compiler_types import CompilerPassType
+    from rice_factor.domain.artifacts.envelope import ArtifactEnvelope
+    from rice_factor.domain.services.artifact_builder import ArtifactBuilder
+    from rice_factor.domain.services.context_builder import (
+        ContextBuilder,
+        PackedContext,
+    )
+
+
+@dataclass
+class TargetCompileResult:
+    """Result of compiling a single target file.
+
+    Attributes:
+        target_file: The target file.
+        artifact: Saved artifact (a FailureReport if the pass failed), or
+            None if no artifact was produced.
+        attempts: Number of compilation attempts made.
+        error: Error message if the target failed.
+        duration_ms: Wall-clock time spent on the target.
+    """
+
+    target_file: str
+    artifact: ArtifactEnvelope[BaseModel] | None = None
+    attempts: int = 0
+    error: str | None = None
+    duration_ms: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether a (non-failure) artifact was produced."""
+        return (
+            self.artifact is not None
+            and self.artifact.artifact_type != ArtifactType.FAILURE_REPORT
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "target_file": self.target_file,
+            "succeeded": self.succeeded,
+            "artifact_id": str(self.artifact.id) if self.artifact else None,
+            "attempts": self.attempts,
+            "error": self.error,
+            "duration_ms": self.duration_ms,
+        }
+
+
+@dataclass
+class BatchCompileResult:
+    """Result of compiling a batch of target files.
+
+    Attributes:
+        results: Per-target results in completion order.
+    """
+
+    results: list[TargetCompileResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[TargetCompileResult]:
+        """Targets that produced an artifact."""
+        return [r for r in self.results if r.succeeded]
+
+    @property
+    def failed(self) -> list[TargetCompileResult]:
+        """Targets that did not produce an artifact."""
+        return [r for r in self.results if not r.succeeded]
+
+    @property
+    def all_succeeded(self) -> bool:
+        """Whether every target succeeded."""
+        return all(r.succeeded for r in self.results)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "total": len(self.results),
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
+class BatchCompiler:
+    """Service for compiling many targets with bounded concurrency.
+
+    Attributes:
+        max_concurrency: Maximum number of concurrent compilations.
+        max_retries: Retries per target on recoverable LLM errors.
+    """
+
+    def __init__(
+        self,
+        artifact_builder: ArtifactBuilder,
+        context_builder: ContextBuilder,
+        max_concurrency: int = 4,
+        max_retries: int = 2,
+        rate_limiter: RateLimiter | None = None,
+        provider: str = "default",
+        retry_backoff: float = 1.0,
+    ) -> None:
+        """Initialize the batch compiler.
+
+        Args:
+            artifact_builder: Builder used to compile and save each target.
+            context_builder: Builder used to gather the shared context.
+            max_concurrency: Maximum number of concurrent compilations.
+            max_retries: Retries per target on recoverable LLM errors.
+            rate_limiter: Rate limiter (global limiter if not provided).
+            provider: Provider name used for rate limiting.
+            retry_backoff: Base delay in seconds, doubled per retry.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._artifact_builder = artifact_builder
+        self._context_builder = context_builder
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._provider = provider
+        self._retry_backoff = retry_backoff
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+
+    def compile_targets(
+        self,
+        pass_type: CompilerPassType,
+        project_root: Path,
+        target_files: list[str],
+        artifacts: dict[str, Any] | None = None,
+        on_result: Callable[[TargetCompileResult], None] | None = None,
+    ) -> BatchCompileResult:
+        """Compile a pass for each target file.
+
+        Artifacts are saved by the ArtifactBuilder as each target
+        completes; on_result is called from the calling thread in
+        completion order.
+
+        Args:
+            pass_type: The compiler pass to run.
+            project_root: Root directory of the project.
+            target_files: Target files to compile.
+            artifacts: Pre-loaded artifacts (artifact_id -> payload).
+            on_result: Optional callback for each completed target.
+
+        Returns:
+            BatchCompileResult with one result per target.
+
+        Raises:
+            ContextBuilderError: If the shared context is invalid.
+        """
+        contexts = self._context_builder.build_contexts(
+            pass_type=pass_type,
+            project_root=project_root,
+            target_files=target_files,
+            artifacts=artifacts,
+        )
+
+        batch = BatchCompileResult()
+        if not contexts:
+            return batch
+
+        workers = min(self.max_concurrency, len(contexts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._compile_target, pass_type, target, packed)
+                for target, packed in contexts.items()
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                batch.results.append(result)
+                if on_result is not None:
+                    on_result(result)
+
+        return batch
+
+    def _compile_target(
+        self,
+        pass_type: CompilerPassType,
+        target_file: str,
+        packed: PackedContext,
+    ) -> TargetCompileResult:
+        """Compile one target, retrying recoverable LLM errors.
+
+        Args:
+            pass_type: The compiler pass to run.
+            target_file: The target file.
+            packed: Context built for the target, with its packing report.
+
+        Returns:
+            TargetCompileResult for the target.
+        """
+        result = TargetCompileResult(target_file=target_file)
+        start = time.perf_counter()
+
+        while result.attempts <= self.max_retries:
+            result.attempts += 1
+            self._rate_limiter.acquire(self._provider, block=True)
+            try:
+                result.artifact = self._artifact_builder.build_with_context(
+                    pass_type, packed.context, packing_report=packed.packing_report
+                )
+                result.error = None
+                if not result.succeeded:
+                    payload = result.artifact.payload
+                    result.error = getattr(payload, "summary", "Compilation failed")
+                break
+            except LLMError as e:
+                result.error = str(e)
+                if not e.recoverable or result.attempts > self.max_retries:
+                    break
+                delay = self._retry_backoff * 2 ** (result.attempts - 1)
+                delay = max(delay, getattr(e, "retry_after", None) or 0)
+            except Exception as e:
+                result.error = str(e)
+                break
+            finally:
+                self._rate_limiter.release(self._provider)
+
+            time.sleep(delay)
+
+        result.duration_ms = (time.perf_counter() - start) * 1000
+        return result
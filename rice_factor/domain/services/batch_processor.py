@@ -3,6 +3,13 @@
 This module provides the BatchProcessor service that handles batch
 approval, rejection, and processing of multiple artifacts with
 transaction support and rollback capability.
+
+A batch runs in two phases. The check phase looks up every artifact in
+the registry and validates its status in a single pass. The apply phase
+rewrites each artifact file, then commits all registry and approval
+changes in one write of ``index.json`` and one write of
+``approvals.json``. Prior state is kept in an in-memory undo log, so a
+failure part-way through (or an explicit rollback) restores it.
 """
 
 from __future__ import annotations
@@ -10,10 +17,21 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
+from rice_factor.adapters.storage.approvals import ApprovalsTracker
+from rice_factor.adapters.storage.filesystem import FilesystemStorageAdapter
+from rice_factor.adapters.storage.registry import ArtifactRegistry
 from rice_factor.domain.artifacts.envelope import ArtifactStatus
+from rice_factor.domain.services.artifact_service import ArtifactService
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from rice_factor.domain.artifacts.approval import Approval
+    from rice_factor.domain.artifacts.registry import RegistryEntry
 
 
 class BatchOperationType(Enum):
@@ -131,6 +149,21 @@ class BatchResult:
         }
 
 
+@dataclass
+class UndoEntry:
+    """State of one artifact before a batch changed it.
+
+    Attributes:
+        artifact: The artifact envelope as it was before the batch.
+        registry_entry: Its registry entry, or None if it was unregistered.
+        approval: Its approval record, or None if it was not approved.
+    """
+
+    artifact: Any
+    registry_entry: RegistryEntry | None
+    approval: Approval | None
+
+
 @dataclass
 class BatchProcessor:
     """Service for batch artifact operations.
@@ -140,14 +173,27 @@ class BatchProcessor:
 
     Attributes:
         repo_root: Root directory of the repository.
-        artifact_service: Optional artifact service for operations.
+        artifact_service: Artifact service for operations (created from
+            repo_root/artifacts if not provided).
+        registry: Artifact registry (created alongside the artifact
+            service's storage if not provided).
     """
 
     repo_root: Path
     artifact_service: Any = None
-    _rollback_stack: list[Callable[[], None]] = field(
-        default_factory=list, init=False, repr=False
-    )
+    registry: Any = None
+    _undo_log: list[UndoEntry] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Create default services rooted at the repository."""
+        if self.artifact_service is None:
+            artifacts_dir = self.repo_root / "artifacts"
+            self.artifact_service = ArtifactService(
+                storage=FilesystemStorageAdapter(artifacts_dir=artifacts_dir),
+                approvals=ApprovalsTracker(artifacts_dir=artifacts_dir),
+            )
+        if self.registry is None:
+            self.registry = ArtifactRegistry(self.artifact_service.storage.artifacts_dir)
 
     def approve_batch(
         self,
@@ -161,105 +207,50 @@ class BatchProcessor:
         Args:
             artifact_ids: IDs of artifacts to approve.
             approver: Name of approver.
-            reason: Reason for approval.
-            validate_all: Validate all before approving any.
+            reason: Reason for approval (recorded as review notes).
+            validate_all: Validate all before approving any. If any
+                artifact fails the check, nothing is approved.
 
         Returns:
             BatchResult with details.
         """
         started_at = datetime.now(UTC)
-        self._rollback_stack.clear()
-        results: list[ArtifactResult] = []
-
-        if not artifact_ids:
-            return BatchResult(
-                operation_type=BatchOperationType.APPROVE,
-                status=BatchResultStatus.SUCCESS,
-                total_count=0,
-                success_count=0,
-                failure_count=0,
-                results=[],
+        self._undo_log.clear()
+
+        targets, errors = self._check_batch(artifact_ids, {ArtifactStatus.DRAFT})
+
+        if validate_all and errors:
+            return self._build_result(
+                BatchOperationType.APPROVE,
+                artifact_ids,
+                changes={},
+                errors={
+                    aid: (
+                        f"Pre-validation failed: {errors[aid]}"
+                        if aid in errors
+                        else "Pre-validation failed"
+                    )
+                    for aid in artifact_ids
+                },
                 started_at=started_at,
-                completed_at=datetime.now(UTC),
             )
 
-        # Pre-validation if requested
-        if validate_all:
-            for artifact_id in artifact_ids:
-                if not self._can_approve(artifact_id):
-                    return BatchResult(
-                        operation_type=BatchOperationType.APPROVE,
-                        status=BatchResultStatus.FAILED,
-                        total_count=len(artifact_ids),
-                        success_count=0,
-                        failure_count=len(artifact_ids),
-                        results=[
-                            ArtifactResult(
-                                artifact_id=aid,
-                                success=False,
-                                error="Pre-validation failed",
-                            )
-                            for aid in artifact_ids
-                        ],
-                        started_at=started_at,
-                        completed_at=datetime.now(UTC),
-                    )
-
-        success_count = 0
-        failure_count = 0
-
-        for artifact_id in artifact_ids:
-            try:
-                old_status = self._get_artifact_status(artifact_id)
-                self._approve_artifact(artifact_id, approver, reason)
-                new_status = self._get_artifact_status(artifact_id)
-
-                results.append(
-                    ArtifactResult(
-                        artifact_id=artifact_id,
-                        success=True,
-                        old_status=old_status,
-                        new_status=new_status,
-                    )
-                )
-                success_count += 1
-
-                # Add rollback action
-                self._rollback_stack.append(
-                    lambda aid=artifact_id, old=old_status: self._rollback_status(
-                        aid, old
-                    )
-                )
+        now = datetime.now(UTC)
 
-            except Exception as e:
-                results.append(
-                    ArtifactResult(
-                        artifact_id=artifact_id,
-                        success=False,
-                        error=str(e),
-                    )
-                )
-                failure_count += 1
-
-        status = (
-            BatchResultStatus.SUCCESS
-            if failure_count == 0
-            else (
-                BatchResultStatus.PARTIAL
-                if success_count > 0
-                else BatchResultStatus.FAILED
+        def approve(artifact: Any) -> Any:
+            approved = artifact.approve()
+            return approved.model_copy(
+                update={"last_reviewed_at": now, "review_notes": reason}
             )
-        )
 
-        return BatchResult(
-            operation_type=BatchOperationType.APPROVE,
-            status=status,
-            total_count=len(artifact_ids),
-            success_count=success_count,
-            failure_count=failure_count,
-            results=results,
+        return self._run_batch(
+            BatchOperationType.APPROVE,
+            artifact_ids,
+            targets,
+            errors,
+            transform=lambda _aid, artifact: approve(artifact),
+            approved_by=approver,
             started_at=started_at,
-            completed_at=datetime.now(UTC),
         )
 
     def reject_batch(
@@ -270,6 +261,10 @@ class BatchProcessor:
     ) -> BatchResult:
         """Reject multiple artifacts in a batch.
 
+        Approved artifacts return to DRAFT and lose their approval; draft
+        artifacts stay in DRAFT. The reason is recorded as review notes.
+        Locked artifacts cannot be rejected.
+
         Args:
             artifact_ids: IDs of artifacts to reject.
             reason: Shared reason for rejection.
@@ -279,61 +274,31 @@ class BatchProcessor:
             BatchResult with details.
         """
         started_at = datetime.now(UTC)
-        self._rollback_stack.clear()
-        results: list[ArtifactResult] = []
-        success_count = 0
-        failure_count = 0
+        self._undo_log.clear()
+        reasons = individual_reasons or {}
+        now = datetime.now(UTC)
 
-        for artifact_id in artifact_ids:
-            try:
-                artifact_reason = (
-                    individual_reasons.get(artifact_id, reason)
-                    if individual_reasons
-                    else reason
-                )
-                old_status = self._get_artifact_status(artifact_id)
-                self._reject_artifact(artifact_id, artifact_reason)
-                new_status = self._get_artifact_status(artifact_id)
-
-                results.append(
-                    ArtifactResult(
-                        artifact_id=artifact_id,
-                        success=True,
-                        old_status=old_status,
-                        new_status=new_status,
-                    )
-                )
-                success_count += 1
+        targets, errors = self._check_batch(
+            artifact_ids, {ArtifactStatus.DRAFT, ArtifactStatus.APPROVED}
+        )
 
-            except Exception as e:
-                results.append(
-                    ArtifactResult(
-                        artifact_id=artifact_id,
-                        success=False,
-                        error=str(e),
-                    )
-                )
-                failure_count += 1
-
-        status = (
-            BatchResultStatus.SUCCESS
-            if failure_count == 0
-            else (
-                BatchResultStatus.PARTIAL
-                if success_count > 0
-                else BatchResultStatus.FAILED
+        def reject(artifact_id: str, artifact: Any) -> Any:
+            return artifact.model_copy(
+                update={
+                    "status": ArtifactStatus.DRAFT,
+                    "last_reviewed_at": now,
+                    "review_notes": reasons.get(artifact_id, reason),
+                }
             )
-        )
 
-        return BatchResult(
-            operation_type=BatchOperationType.REJECT,
-            status=status,
-            total_count=len(artifact_ids),
-            success_count=success_count,
-            failure_count=failure_count,
-            results=results,
+        return self._run_batch(
+            BatchOperationType.REJECT,
+            artifact_ids,
+            targets,
+            errors,
+            transform=reject,
+            approved_by=None,
             started_at=started_at,
-            completed_at=datetime.now(UTC),
         )
 
     def execute(self, operation: BatchOperation) -> BatchResult:
@@ -380,76 +345,232 @@ class BatchProcessor:
     def rollback(self) -> int:
         """Rollback the last batch operation.
 
+        Restores every changed artifact file, then writes the registry and
+        approvals back in one commit.
+
         Returns:
-            Number of operations rolled back.
+            Number of artifacts rolled back.
         """
+        storage = self.artifact_service.storage
+        approvals = self.artifact_service.approvals
         count = 0
-        while self._rollback_stack:
-            try:
-                action = self._rollback_stack.pop()
-                action()
+        with approvals.batch(), self.registry.batch():
+            while self._undo_log:
+                entry = self._undo_log.pop()
+                artifact_id = entry.artifact.id
+                try:
+                    storage.save(entry.artifact)
+                except Exception:
+                    continue
+                if entry.registry_entry is None:
+                    self.registry.unregister(artifact_id)
+                else:
+                    self.registry.restore(entry.registry_entry)
+                if entry.approval is None:
+                    approvals.revoke(artifact_id)
+                else:
+                    approvals.restore(entry.approval)
                 count += 1
-            except Exception:
-                pass
         return count
 
-    def _can_approve(self, artifact_id: str) -> bool:
-        """Check if artifact can be approved.
+    def _check_batch(
+        self,
+        artifact_ids: list[str],
+        allowed: set[ArtifactStatus],
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Check every artifact in a batch in one pass.
+
+        The registry is consulted first, so artifacts it already knows to
+        be in the wrong status are rejected without reading their files.
 
         Args:
-            artifact_id: ID of artifact.
+            artifact_ids: IDs of artifacts in the batch.
+            allowed: Statuses the operation accepts.
 
         Returns:
-            True if can be approved.
+            Tuple of (loaded artifacts by ID, error messages by ID).
         """
-        # Stub implementation - always returns True
-        # Real implementation would check artifact status
-        return True
+        storage = self.artifact_service.storage
+        targets: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        seen: set[UUID] = set()
 
-    def _get_artifact_status(self, artifact_id: str) -> str:
-        """Get current artifact status.
+        for artifact_id in artifact_ids:
+            try:
+                uuid = UUID(artifact_id)
+            except ValueError:
+                errors[artifact_id] = f"Invalid artifact ID: {artifact_id}"
+                continue
+            if uuid in seen:
+                errors[artifact_id] = "Duplicate artifact ID in batch"
+                continue
+            seen.add(uuid)
+
+            entry = self.registry.lookup(uuid)
+            if entry is not None and entry.status not in allowed:
+                errors[artifact_id] = self._status_error(entry.status)
+                continue
+            try:
+                artifact = storage.load_by_id(
+                    uuid, entry.artifact_type if entry is not None else None
+                )
+            except Exception as e:
+                errors[artifact_id] = str(e)
+                continue
+            if artifact.status not in allowed:
+                errors[artifact_id] = self._status_error(artifact.status)
+                continue
+            targets[artifact_id] = artifact
+
+        return targets, errors
+
+    def _run_batch(
+        self,
+        operation_type: BatchOperationType,
+        artifact_ids: list[str],
+        targets: dict[str, Any],
+        errors: dict[str, str],
+        transform: Callable[[str, Any], Any],
+        approved_by: str | None,
+        started_at: datetime,
+    ) -> BatchResult:
+        """Apply a transformation to checked artifacts as one transaction.
+
+        Each artifact file is rewritten; the registry and approvals are
+        each written once when the batch commits. If anything fails, the
+        undo log restores every artifact touched so far.
 
         Args:
-            artifact_id: ID of artifact.
+            operation_type: Type of operation being run.
+            artifact_ids: All IDs in the batch, in request order.
+            targets: Artifacts that passed the check, by ID.
+            errors: Check errors, by ID.
+            transform: Returns the updated envelope for (ID, artifact).
+            approved_by: Approver to record, or None to revoke approvals.
+            started_at: When the batch started.
 
         Returns:
-            Status string.
+            BatchResult with details.
         """
-        # Stub implementation
-        return ArtifactStatus.DRAFT.value
+        storage = self.artifact_service.storage
+        approvals = self.artifact_service.approvals
+        changes: dict[str, tuple[str, str]] = {}
+
+        try:
+            with approvals.batch(), self.registry.batch():
+                try:
+                    for artifact_id, artifact in targets.items():
+                        uuid = artifact.id
+                        entry = self.registry.lookup(uuid)
+                        self._undo_log.append(
+                            UndoEntry(
+                                artifact=artifact,
+                                registry_entry=entry,
+                                approval=approvals.get_approval(uuid),
+                            )
+                        )
+                        updated = transform(artifact_id, artifact)
+                        path = storage.save(updated)
 
-    def _approve_artifact(
-        self,
-        artifact_id: str,
-        approver: str,
-        reason: str | None,
-    ) -> None:
-        """Approve a single artifact.
+                        if entry is None:
+                            self.registry.register(
+                                updated, path.relative_to(storage.artifacts_dir).as_posix()
+                            )
+                        else:
+                            self.registry.update_status(uuid, updated.status)
+                        if approved_by is None:
+                            approvals.revoke(uuid)
+                        else:
+                            approvals.approve(uuid, approved_by)
+
+                        changes[artifact_id] = (artifact.status.value, updated.status.value)
+                except Exception:
+                    # Restore in memory so the commit writes the old state
+                    self.rollback()
+                    raise
+        except Exception as e:
+            self.rollback()  # Restores artifact files if the commit failed
+            return self._build_result(
+                operation_type,
+                artifact_ids,
+                changes={},
+                errors={**dict.fromkeys(targets, f"Rolled back: {e}"), **errors},
+                started_at=started_at,
+                status=BatchResultStatus.ROLLED_BACK,
+            )
 
-        Args:
-            artifact_id: ID of artifact.
-            approver: Name of approver.
-            reason: Reason for approval.
-        """
-        # Stub implementation - would use artifact_service
-        pass
+        return self._build_result(
+            operation_type, artifact_ids, changes, errors, started_at
+        )
 
-    def _reject_artifact(self, artifact_id: str, reason: str) -> None:
-        """Reject a single artifact.
+    @staticmethod
+    def _build_result(
+        operation_type: BatchOperationType,
+        artifact_ids: list[str],
+        changes: dict[str, tuple[str, str]],
+        errors: dict[str, str],
+        started_at: datetime,
+        status: BatchResultStatus | None = None,
+    ) -> BatchResult:
+        """Assemble a BatchResult in request order.
 
         Args:
-            artifact_id: ID of artifact.
-            reason: Reason for rejection.
+            operation_type: Type of operation executed.
+            artifact_ids: All IDs in the batch, in request order.
+            changes: (old status, new status) for each successful ID.
+            errors: Error messages for each failed ID.
+            started_at: When the batch started.
+            status: Overall status (derived from the counts if None).
+
+        Returns:
+            BatchResult with details.
         """
-        # Stub implementation - would use artifact_service
-        pass
+        results: list[ArtifactResult] = []
+        for artifact_id in artifact_ids:
+            if artifact_id in changes:
+                old_status, new_status = changes[artifact_id]
+                results.append(
+                    ArtifactResult(
+                        artifact_id=artifact_id,
+                        success=True,
+                        old_status=old_status,
+                        new_status=new_status,
+                    )
+                )
+            else:
+                results.append(
+                    ArtifactResult(
+                        artifact_id=artifact_id,
+                        success=False,
+                        error=errors.get(artifact_id, "Not processed"),
+                    )
+                )
 
-    def _rollback_status(self, artifact_id: str, old_status: str | None) -> None:
-        """Rollback artifact to previous status.
+        success_count = sum(1 for r in results if r.success)
+        failure_count = len(results) - success_count
+        if status is None:
+            status = (
+                BatchResultStatus.SUCCESS
+                if failure_count == 0
+                else (
+                    BatchResultStatus.PARTIAL
+                    if success_count > 0
+                    else BatchResultStatus.FAILED
+                )
+            )
 
-        Args:
-            artifact_id: ID of artifact.
-            old_status: Previous status.
-        """
-        # Stub implementation
-        pass
+        return BatchResult(
+            operation_type=operation_type,
+            status=status,
+            total_count=len(artifact_ids),
+            success_count=success_count,
+            failure_count=failure_count,
+            results=results,
+            started_at=started_at,
+            completed_at=datetime.now(UTC),
+        )
+
+    @staticmethod
+    def _status_error(status: ArtifactStatus) -> str:
+        """Describe an artifact whose status does not allow the operation."""
+        return f"Artifact is {status.value}"
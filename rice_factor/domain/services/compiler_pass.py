@@ -4,6 +4,8 @@ This module provides the abstract base class for all compiler passes.
 Each pass transforms inputs into a specific artifact type.
 """
 
+import json
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
@@ -14,6 +16,10 @@ from rice_factor.domain.artifacts.compiler_types import (
     CompilerResult,
 )
 from rice_factor.domain.artifacts.enums import ArtifactType
+from rice_factor.domain.failures.llm_errors import (
+    CodeInOutputError,
+    SchemaViolationError,
+)
 from rice_factor.domain.ports.llm import LLMPort
 from rice_factor.domain.prompts import PromptManager
 from rice_factor.domain.prompts.schema_injector import SchemaInjector
@@ -21,6 +27,11 @@ from rice_factor.domain.services.context_builder import (
     ContextBuilder,
     ForbiddenInputError,
 )
+from rice_factor.domain.services.context_packer import ContextPacker
+from rice_factor.domain.services.output_repairer import (
+    DEFAULT_REPAIR_ATTEMPTS,
+    OutputRepairer,
+)
 from rice_factor.domain.services.output_validator import OutputValidator
 
 
@@ -35,7 +46,7 @@ class CompilerPass(ABC):
     1. Context validation
     2. Prompt building
     3. LLM invocation
-    4. Output validation
+    4. Output validation (with targeted repair of invalid sub-trees)
     """
 
     def __init__(
@@ -43,17 +54,23 @@ class CompilerPass(ABC):
         schemas_dir: Path | None = None,
         *,
         check_code: bool = True,
+        max_repair_attempts: int = DEFAULT_REPAIR_ATTEMPTS,
     ) -> None:
         """Initialize the compiler pass.
 
         Args:
             schemas_dir: Path to JSON schemas directory.
             check_code: Whether to check for code in output.
+            max_repair_attempts: Maximum targeted repair requests for an
+                invalid output (0 disables repair).
         """
         self._schemas_dir = schemas_dir
         self._prompt_manager = PromptManager(schemas_dir)
         self._schema_injector = SchemaInjector(schemas_dir)
         self._output_validator = OutputValidator(schemas_dir, check_code=check_code)
+        self._output_repairer = OutputRepairer(
+            self._output_validator, max_attempts=max_repair_attempts
+        )
         self._context_builder = ContextBuilder()
 
     @property
@@ -104,7 +121,8 @@ class CompilerPass(ABC):
         2. Build prompt
         3. Get output schema
         4. Invoke LLM
-        5. Validate output (if successful)
+        5. Validate output (if successful), repairing only the invalid
+           sub-trees if validation fails
 
         Args:
             context: The compilation context.
@@ -116,22 +134,46 @@ class CompilerPass(ABC):
         Raises:
             MissingRequiredInputError: If required inputs are missing.
             ForbiddenInputError: If forbidden inputs are detected.
+            SchemaViolationError: If the output is invalid and cannot be repaired.
+            CodeInOutputError: If the output contains code that cannot be repaired.
         """
         # 1. Validate context
         self.validate_context(context)
 
-        # 2. Build prompt (for logging/debugging)
-        _prompt = self.build_prompt(context)
+        # 2. Build prompt (for logging/debugging and cost estimates)
+        prompt = self.build_prompt(context)
 
         # 3. Get output schema
         schema = self.get_output_schema()
 
         # 4. Invoke LLM
+        start = time.perf_counter()
         result = llm_port.generate(self.pass_type, context, schema)
+        elapsed_ms = (time.perf_counter() - start) * 1000
 
         # 5. Validate output if successful
         if result.success and result.payload is not None:
-            self.validate_output(result.payload)
+            try:
+                self.validate_output(result.payload)
+            except (SchemaViolationError, CodeInOutputError) as e:
+                payload = self._output_repairer.repair(
+                    self.pass_type,
+                    self.output_artifact_type,
+                    result.payload,
+                    context,
+                    llm_port,
+                    e,
+                    full_tokens=ContextPacker.estimate_tokens(
+                        prompt + json.dumps(result.payload)
+                    ),
+                    full_ms=elapsed_ms,
+                    overhead_tokens=ContextPacker.estimate_tokens(
+                        self._prompt_manager.get_repair_system_prompt()
+                    ),
+                )
+                result = CompilerResult(
+                    success=True, payload=payload, raw_response=result.raw_response
+                )
 
         return result
 
@@ -188,7 +230,5 @@ class CompilerPass(ABC):
             SchemaViolationError: If payload doesn't match schema.
             CodeInOutputError: If payload contains code.
         """
-        import json
-
         json_str = json.dumps(payload)
         self._output_validator.validate(json_str, self.output_artifact_type)
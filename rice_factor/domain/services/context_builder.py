@@ -5,6 +5,7 @@ appropriate inputs for each compiler pass, validating that required
 inputs are present and forbidden inputs are excluded.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,7 @@ from rice_factor.domain.artifacts.compiler_types import (
     CompilerPassType,
 )
 from rice_factor.domain.artifacts.enums import ArtifactType
+from rice_factor.domain.services.context_packer import ContextPacker, PackingReport
 
 # Define required and forbidden inputs per pass type
 PASS_REQUIREMENTS: dict[CompilerPassType, dict[str, Any]] = {
@@ -79,6 +81,19 @@ class ForbiddenInputError(ContextBuilderError):
         super().__init__(f"Forbidden input detected ({input_type}): {details}")
 
 
+@dataclass
+class PackedContext:
+    """A compilation context with the report of how it was packed.
+
+    Attributes:
+        context: The validated compilation context.
+        packing_report: Packing report, or None if the context was not packed.
+    """
+
+    context: CompilerContext
+    packing_report: PackingReport | None = None
+
+
 class ContextBuilder:
     """Service for building compilation context.
 
@@ -86,14 +101,21 @@ class ContextBuilder:
     and ensures forbidden inputs are excluded.
     """
 
-    def __init__(self, storage_adapter: Any | None = None) -> None:
+    def __init__(
+        self,
+        storage_adapter: Any | None = None,
+        packer: ContextPacker | None = None,
+    ) -> None:
         """Initialize the context builder.
 
         Args:
             storage_adapter: Optional storage adapter for loading artifacts.
                              If None, artifacts must be provided directly.
+            packer: Optional context packer. If set, gathered inputs are
+                    trimmed to its token budget.
         """
         self._storage = storage_adapter
+        self._packer = packer
 
     def build_context(
         self,
@@ -113,6 +135,32 @@ class ContextBuilder:
         Returns:
             CompilerContext with gathered inputs.
 
+        Raises:
+            MissingRequiredInputError: If a required input is missing.
+            ForbiddenInputError: If a forbidden input is detected.
+        """
+        return self.build_packed_context(
+            pass_type, project_root, target_file, artifacts
+        ).context
+
+    def build_packed_context(
+        self,
+        pass_type: CompilerPassType,
+        project_root: Path,
+        target_file: str | None = None,
+        artifacts: dict[str, Any] | None = None,
+    ) -> PackedContext:
+        """Build compilation context for a pass with its packing report.
+
+        Args:
+            pass_type: The type of compiler pass.
+            project_root: Root directory of the project.
+            target_file: Target file for implementation pass.
+            artifacts: Pre-loaded artifacts (artifact_id -> payload).
+
+        Returns:
+            PackedContext with the context and its packing report.
+
         Raises:
             MissingRequiredInputError: If a required input is missing.
             ForbiddenInputError: If a forbidden input is detected.
@@ -122,10 +170,71 @@ class ContextBuilder:
         # Load project files
         project_files = self._load_project_files(project_root, requirements)
 
-        # Handle artifacts
-        if artifacts is None:
-            artifacts = {}
+        context, report = self._assemble_context(
+            pass_type, project_root, project_files, artifacts or {}, target_file
+        )
+        return PackedContext(context=context, packing_report=report)
+
+    def build_contexts(
+        self,
+        pass_type: CompilerPassType,
+        project_root: Path,
+        target_files: list[str],
+        artifacts: dict[str, Any] | None = None,
+    ) -> dict[str, PackedContext]:
+        """Build compilation contexts for several target files.
 
+        Project files are loaded once and shared; only the target (and,
+        with a packer, the packed selection) differs between contexts.
+
+        Args:
+            pass_type: The type of compiler pass.
+            project_root: Root directory of the project.
+            target_files: Target files, one context each.
+            artifacts: Pre-loaded artifacts (artifact_id -> payload).
+
+        Returns:
+            Dict mapping target file to its PackedContext.
+
+        Raises:
+            MissingRequiredInputError: If a required input is missing.
+            ForbiddenInputError: If a forbidden input is detected.
+        """
+        requirements = PASS_REQUIREMENTS[pass_type]
+        project_files = self._load_project_files(project_root, requirements)
+
+        contexts: dict[str, PackedContext] = {}
+        for target_file in target_files:
+            context, report = self._assemble_context(
+                pass_type, project_root, project_files, artifacts or {}, target_file
+            )
+            contexts[target_file] = PackedContext(context=context, packing_report=report)
+        return contexts
+
+    def _assemble_context(
+        self,
+        pass_type: CompilerPassType,
+        project_root: Path,
+        project_files: dict[str, str],
+        artifacts: dict[str, Any],
+        target_file: str | None,
+    ) -> tuple[CompilerContext, PackingReport | None]:
+        """Validate, pack and build a context from loaded inputs.
+
+        Args:
+            pass_type: The type of compiler pass.
+            project_root: Root directory of the project.
+            project_files: Loaded project files.
+            artifacts: Loaded artifacts.
+            target_file: Target file, if any.
+
+        Returns:
+            Tuple of (validated context, packing report or None).
+
+        Raises:
+            MissingRequiredInputError: If a required input is missing.
+            ForbiddenInputError: If a forbidden input is detected.
+        """
         # Build context
         context = CompilerContext(
             pass_type=pass_type,
@@ -134,7 +243,7 @@ class ContextBuilder:
             target_file=target_file,
         )
 
-        # Validate context
+        # Validate context (before packing, which may rename target context)
         self.validate_inputs(pass_type, context)
 
         # Check for forbidden inputs
@@ -142,7 +251,24 @@ class ContextBuilder:
         if forbidden:
             raise ForbiddenInputError(forbidden[0], f"Found in context: {forbidden}")
 
-        return context
+        # Pack inputs into the token budget
+        report: PackingReport | None = None
+        if self._packer is not None:
+            project_files, artifacts, report = self._packer.pack(
+                pass_type,
+                project_files,
+                artifacts,
+                target_file=target_file,
+                project_root=project_root,
+            )
+            context = CompilerContext(
+                pass_type=pass_type,
+                project_files=project_files,
+                artifacts=artifacts,
+                target_file=target_file,
+            )
+
+        return context, report
 
     def _load_project_files(
         self, project_root: Path, requirements: dict[str, Any]
@@ -0,0 +1,493 @@
+"""Token-budgeted context packing for compiler passes.
+
+This module provides the ContextPacker service that trims the inputs
+gathered by the ContextBuilder to a configurable token budget. Inputs are
+split into fragments (project document sections, artifact sections and
+symbols of the target source file), scored by relevance to the pass and
+target, and greedily packed in score order. Whatever does not fit is
+recorded in a PackingReport so it can be surfaced in artifact metadata.
+
+Documents trimmed for a target file, and the target's symbols, depend on
+that target, so they are keyed with target_context_key() and rendered
+outside the cacheable prompt prefix. Documents kept whole keep their name
+and stay in the prefix shared by all targets.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, ClassVar
+
+from rice_factor.domain.artifacts.compiler_types import CompilerPassType
+from rice_factor.domain.ports.ast import ASTPort, SymbolInfo, SymbolKind
+from rice_factor.domain.prompts import target_context_key
+
+# Terms that make a fragment relevant to a pass regardless of the target
+PASS_FOCUS_TERMS: dict[CompilerPassType, frozenset[str]] = {
+    CompilerPassType.PROJECT: frozenset(
+        {"requirement", "constraint", "goal", "domain", "glossary", "milestone"}
+    ),
+    CompilerPassType.ARCHITECTURE: frozenset(
+        {"architecture", "layer", "component", "module", "dependency", "constraint"}
+    ),
+    CompilerPassType.SCAFFOLD: frozenset(
+        {"module", "file", "directory", "component", "layer", "interface"}
+    ),
+    CompilerPassType.TEST: frozenset(
+        {"test", "requirement", "acceptance", "behavior", "invariant", "case"}
+    ),
+    CompilerPassType.IMPLEMENTATION: frozenset(
+        {"interface", "test", "function", "behavior", "step", "file"}
+    ),
+    CompilerPassType.REFACTOR: frozenset(
+        {"refactor", "dependency", "layer", "interface", "test", "rename"}
+    ),
+}
+
+# Payload key telling the model which artifact sections were left out
+TRUNCATED_KEY = "_truncated"
+
+_WORD_PATTERN = re.compile(r"[A-Za-z][a-z]+|[A-Z]+(?![a-z])|\d+")
+_HEADING_PATTERN = re.compile(r"^#{1,6}\s")
+
+
+class FragmentKind(Enum):
+    """Kinds of context fragments."""
+
+    PROJECT_FILE = "project_file"
+    ARTIFACT = "artifact"
+    SYMBOL = "symbol"
+
+
+@dataclass
+class ContextFragment:
+    """A packable piece of compiler context.
+
+    Attributes:
+        kind: What the fragment was taken from.
+        source: Project filename, artifact ID or source file path.
+        section: Heading, payload field or symbol name within the source.
+        text: The fragment text as it appears in the prompt.
+        order: Position of the fragment within its source.
+        tokens: Estimated token count of the text.
+        score: Relevance score (higher is more relevant).
+        required: True if the fragment is kept regardless of the budget.
+        field_name: Artifact payload field the fragment belongs to.
+        item_index: Index within a list-valued payload field.
+        value: Structured value for artifact fragments.
+    """
+
+    kind: FragmentKind
+    source: str
+    section: str
+    text: str
+    order: int
+    tokens: int = 0
+    score: float = 0.0
+    required: bool = False
+    field_name: str | None = None
+    item_index: int | None = None
+    value: Any = None
+
+
+@dataclass
+class PackingReport:
+    """Outcome of packing context into a token budget.
+
+    Attributes:
+        token_budget: The configured budget in estimated tokens.
+        tokens_used: Estimated tokens of the included fragments.
+        included: Included fragments in packing order.
+        dropped: Fragments that did not fit, most relevant first.
+    """
+
+    token_budget: int
+    tokens_used: int = 0
+    included: list[ContextFragment] = field(default_factory=list)
+    dropped: list[ContextFragment] = field(default_factory=list)
+
+    @property
+    def over_budget(self) -> bool:
+        """Whether the required fragments alone exceeded the budget."""
+        return self.tokens_used > self.token_budget
+
+    @property
+    def tokens_dropped(self) -> int:
+        """Estimated tokens of the dropped fragments."""
+        return sum(fragment.tokens for fragment in self.dropped)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary for artifact metadata.
+
+        Returns:
+            Dictionary with budget usage and the dropped fragments.
+        """
+        return {
+            "token_budget": self.token_budget,
+            "tokens_used": self.tokens_used,
+            "tokens_dropped": self.tokens_dropped,
+            "included_count": len(self.included),
+            "dropped": [
+                {
+                    "kind": fragment.kind.value,
+                    "source": fragment.source,
+                    "section": fragment.section,
+                    "tokens": fragment.tokens,
+                    "score": round(fragment.score, 3),
+                }
+                for fragment in self.dropped
+            ],
+        }
+
+
+class ContextPacker:
+    """Service for packing compiler context into a token budget.
+
+    Fragments are scored as ``kind weight + term overlap + position bonus``:
+    the term overlap is the fraction of query terms (pass focus terms, words
+    of the target file path and names of its symbols) found in the fragment,
+    and the position bonus favours the opening sections of each source.
+    The first section of every project file is always kept so required
+    inputs stay present.
+    """
+
+    KIND_WEIGHTS: ClassVar[dict[FragmentKind, float]] = {
+        FragmentKind.PROJECT_FILE: 1.0,
+        FragmentKind.SYMBOL: 0.9,
+        FragmentKind.ARTIFACT: 0.8,
+    }
+
+    POSITION_BONUS = 0.2
+
+    def __init__(
+        self,
+        token_budget: int,
+        ast_port: ASTPort | None = None,
+    ) -> None:
+        """Initialize the context packer.
+
+        Args:
+            token_budget: Maximum estimated tokens of packed context.
+            ast_port: Optional AST parser for target file symbols.
+
+        Raises:
+            ValueError: If token_budget is not positive.
+        """
+        if token_budget <= 0:
+            raise ValueError("token_budget must be positive")
+        self._token_budget = token_budget
+        self._ast_port = ast_port
+
+    @property
+    def token_budget(self) -> int:
+        """Get the token budget."""
+        return self._token_budget
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Estimate the token count of text (~4 characters per token).
+
+        Args:
+            text: Text to estimate.
+
+        Returns:
+            Estimated token count (at least 1 for non-empty text).
+        """
+        if not text:
+            return 0
+        return max(1, len(text) // 4)
+
+    def pack(
+        self,
+        pass_type: CompilerPassType,
+        project_files: dict[str, str],
+        artifacts: dict[str, Any],
+        target_file: str | None = None,
+        project_root: Path | None = None,
+    ) -> tuple[dict[str, str], dict[str, Any], PackingReport]:
+        """Pack project files, artifacts and target symbols into the budget.
+
+        Args:
+            pass_type: The compiler pass the context is for.
+            project_files: Loaded project files (filename -> content).
+            artifacts: Loaded artifacts (artifact_id -> payload).
+            target_file: Target source file, if any.
+            project_root: Root used to resolve target_file.
+
+        Returns:
+            Tuple of (packed project files, packed artifacts, report).
+            Target file symbols are added as a "<target> (symbols)" entry
+            of the packed project files. With a target, the packed project
+            files are keyed with target_context_key(), since their selection
+            depends on the target.
+        """
+        symbols = self._load_symbols(target_file, project_root)
+        query = self._query_terms(pass_type, target_file, symbols)
+
+        fragments: list[ContextFragment] = []
+        for filename, content in project_files.items():
+            fragments.extend(self._split_document(filename, content))
+        for artifact_id, payload in artifacts.items():
+            fragments.extend(self._split_artifact(artifact_id, payload))
+        if target_file and symbols:
+            fragments.extend(self._symbol_fragments(target_file, symbols))
+
+        for fragment in fragments:
+            fragment.tokens = self.estimate_tokens(fragment.text)
+            fragment.score = self._score(fragment, query)
+
+        report = PackingReport(token_budget=self._token_budget)
+        ranked = sorted(fragments, key=lambda f: (not f.required, -f.score))
+        for fragment in ranked:
+            remaining = self._token_budget - report.tokens_used
+            if fragment.required or fragment.tokens <= remaining:
+                report.included.append(fragment)
+                report.tokens_used += fragment.tokens
+            else:
+                report.dropped.append(fragment)
+
+        packed_files, packed_artifacts = self._reassemble(
+            report.included, report.dropped, project_files, artifacts, target_file
+        )
+        return packed_files, packed_artifacts, report
+
+    def _load_symbols(
+        self, target_file: str | None, project_root: Path | None
+    ) -> list[SymbolInfo]:
+        """Parse the target file for symbols, if it exists."""
+        if self._ast_port is None or not target_file:
+            return []
+
+        path = Path(target_file)
+        if project_root is not None and not path.is_absolute():
+            path = project_root / path
+        if not path.is_file():
+            return []
+
+        result = self._ast_port.parse_file(str(path))
+        if not result.success:
+            return []
+        return [s for s in result.symbols if s.kind != SymbolKind.IMPORT]
+
+    def _query_terms(
+        self,
+        pass_type: CompilerPassType,
+        target_file: str | None,
+        symbols: list[SymbolInfo],
+    ) -> frozenset[str]:
+        """Collect the terms fragments are scored against."""
+        terms: set[str] = set(PASS_FOCUS_TERMS.get(pass_type, frozenset()))
+        if target_file:
+            terms |= _terms(target_file)
+        for symbol in symbols:
+            terms |= _terms(symbol.name)
+        return frozenset(terms)
+
+    def _score(self, fragment: ContextFragment, query: frozenset[str]) -> float:
+        """Score a fragment by kind, term overlap and position."""
+        score = self.KIND_WEIGHTS[fragment.kind]
+        if query:
+            score += len(query & _terms(fragment.text)) / len(query)
+        score += self.POSITION_BONUS / (1 + fragment.order)
+        return score
+
+    def _split_document(self, filename: str, content: str) -> list[ContextFragment]:
+        """Split a markdown document into heading sections."""
+        sections: list[list[str]] = [[]]
+        for line in content.splitlines(keepends=True):
+            if _HEADING_PATTERN.match(line) and any(s.strip() for s in sections[-1]):
+                sections.append([])
+            sections[-1].append(line)
+
+        fragments: list[ContextFragment] = []
+        for order, lines in enumerate(sections):
+            text = "".join(lines)
+            heading = lines[0].strip().lstrip("#").strip() if lines else ""
+            fragments.append(
+                ContextFragment(
+                    kind=FragmentKind.PROJECT_FILE,
+                    source=filename,
+                    section=heading or f"section {order + 1}",
+                    text=text,
+                    order=order,
+                    required=order == 0,
+                )
+            )
+        return fragments
+
+    def _split_artifact(self, artifact_id: str, payload: Any) -> list[ContextFragment]:
+        """Split an artifact payload into top-level fields and list items."""
+        if not isinstance(payload, dict):
+            return [
+                ContextFragment(
+                    kind=FragmentKind.ARTIFACT,
+                    source=artifact_id,
+                    section="payload",
+                    text=json.dumps(payload, default=str),
+                    order=0,
+                    value=payload,
+                )
+            ]
+
+        fragments: list[ContextFragment] = []
+        order = 0
+        for field_name, value in payload.items():
+            if isinstance(value, list) and value:
+                for index, item in enumerate(value):
+                    fragments.append(
+                        ContextFragment(
+                            kind=FragmentKind.ARTIFACT,
+                            source=artifact_id,
+                            section=f"{field_name}[{index}]",
+                            text=json.dumps(item, default=str),
+                            order=order,
+                            field_name=field_name,
+                            item_index=index,
+                            value=item,
+                        )
+                    )
+                    order += 1
+            else:
+                fragments.append(
+                    ContextFragment(
+                        kind=FragmentKind.ARTIFACT,
+                        source=artifact_id,
+                        section=field_name,
+                        text=json.dumps({field_name: value}, default=str),
+                        order=order,
+                        field_name=field_name,
+                        value=value,
+                    )
+                )
+                order += 1
+        return fragments
+
+    def _symbol_fragments(
+        self, target_file: str, symbols: list[SymbolInfo]
+    ) -> list[ContextFragment]:
+        """Create one fragment per symbol of the target file."""
+        fragments: list[ContextFragment] = []
+        for order, symbol in enumerate(symbols):
+            name = (
+                f"{symbol.parent_name}.{symbol.name}"
+                if symbol.parent_name
+                else symbol.name
+            )
+            text = f"{symbol.kind.value} {symbol.signature or name}"
+            text += f"  # lines {symbol.line_start}-{symbol.line_end}\n"
+            fragments.append(
+                ContextFragment(
+                    kind=FragmentKind.SYMBOL,
+                    source=target_file,
+                    section=name,
+                    text=text,
+                    order=order,
+                )
+            )
+        return fragments
+
+    def _reassemble(
+        self,
+        included: list[ContextFragment],
+        dropped: list[ContextFragment],
+        project_files: dict[str, str],
+        artifacts: dict[str, Any],
+        target_file: str | None,
+    ) -> tuple[dict[str, str], dict[str, Any]]:
+        """Rebuild project files and artifacts from included fragments.
+
+        Sources keep their original order, as do fragments within a source.
+        Sources that lost fragments say so: documents end with a truncation
+        note and artifact payloads get a TRUNCATED_KEY entry, so the model
+        knows the context is incomplete. Only documents trimmed for a
+        target are keyed as target context.
+        """
+
+        def file_key(name: str, truncated: bool) -> str:
+            return target_context_key(name) if target_file and truncated else name
+
+        by_source: dict[tuple[FragmentKind, str], list[ContextFragment]] = {}
+        for fragment in included:
+            by_source.setdefault((fragment.kind, fragment.source), []).append(fragment)
+        for kept in by_source.values():
+            kept.sort(key=lambda f: f.order)
+
+        omitted: dict[tuple[FragmentKind, str], list[str]] = {}
+        for fragment in sorted(dropped, key=lambda f: f.order):
+            omitted.setdefault((fragment.kind, fragment.source), []).append(
+                fragment.section
+            )
+
+        packed_files: dict[str, str] = {}
+        for filename in project_files:
+            kept = by_source.get((FragmentKind.PROJECT_FILE, filename), [])
+            if kept:
+                text = "".join(f.text for f in kept)
+                sections = omitted.get((FragmentKind.PROJECT_FILE, filename))
+                if sections:
+                    text += (
+                        "\n[Truncated to fit the context budget; omitted sections: "
+                        f"{', '.join(sections)}]\n"
+                    )
+                packed_files[file_key(filename, bool(sections))] = text
+        for (kind, source), kept in by_source.items():
+            if kind == FragmentKind.SYMBOL:
+                packed_files[file_key(f"{source} (symbols)", True)] = "".join(
+                    f.text for f in kept
+                )
+
+        packed_artifacts: dict[str, Any] = {}
+        for artifact_id, payload in artifacts.items():
+            kept = by_source.get((FragmentKind.ARTIFACT, artifact_id), [])
+            sections = omitted.get((FragmentKind.ARTIFACT, artifact_id))
+            if not isinstance(payload, dict):
+                if kept:
+                    packed_artifacts[artifact_id] = payload
+                else:
+                    packed_artifacts[artifact_id] = {
+                        TRUNCATED_KEY: "Omitted to fit the context budget"
+                    }
+                continue
+            packed: dict[str, Any] = {}
+            for fragment in kept:
+                field_name = fragment.field_name or ""
+                if fragment.item_index is None:
+                    packed[field_name] = fragment.value
+                else:
+                    packed.setdefault(field_name, []).append(fragment.value)
+            if sections:
+                packed[TRUNCATED_KEY] = (
+                    f"Omitted to fit the context budget: {', '.join(sections)}"
+                )
+            # An artifact stays present (possibly empty) so required inputs hold
+            packed_artifacts[artifact_id] = packed
+        return packed_files, packed_artifacts
+
+
+def create_context_packer(
+    token_budget: int | None,
+    ast_port: ASTPort | None = None,
+) -> ContextPacker | None:
+    """Create a context packer for a configured budget.
+
+    Args:
+        token_budget: Configured budget; None or 0 disables packing.
+        ast_port: Optional AST parser for target file symbols.
+
+    Returns:
+        ContextPacker, or None if packing is disabled.
+    """
+    if not token_budget:
+        return None
+    return ContextPacker(token_budget=int(token_budget), ast_port=ast_port)
+
+
+def _terms(text: str) -> set[str]:
+    """Split text into lowercase words, splitting camelCase and snake_case."""
+    return {
+        word.lower()
+        for word in _WORD_PATTERN.findall(text)
+        if len(word) >= 3 and not word.isdigit()
+    }
@@ -60,6 +60,8 @@ class CostRecord:
         output_tokens: Number of output tokens.
         cost_usd: Total cost in USD.
         metadata: Additional metadata.
+        cache_read_tokens: Input tokens served from the provider prompt cache.
+        cache_write_tokens: Input tokens written to the provider prompt cache.
     """
 
     timestamp: datetime
@@ -70,6 +72,8 @@ class CostRecord:
     output_tokens: int
     cost_usd: float
     metadata: dict[str, Any] = field(default_factory=dict)
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 @dataclass
@@ -138,6 +142,8 @@ class CostSummary:
         by_model: Cost breakdown by model.
         by_operation: Cost breakdown by operation.
         record_count: Number of records.
+        cache_read_tokens: Total prompt cache read tokens in the period.
+        cache_write_tokens: Total prompt cache write tokens in the period.
     """
 
     period: str
@@ -148,6 +154,8 @@ class CostSummary:
     by_model: dict[str, float]
     by_operation: dict[str, float]
     record_count: int
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 AlertHandler = Callable[[CostAlert], None]
@@ -195,6 +203,8 @@ class CostTracker:
         output_tokens: int,
         cost_usd: float,
         metadata: dict[str, Any] | None = None,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> CostRecord:
         """Record a cost event.
 
@@ -206,6 +216,8 @@ class CostTracker:
             output_tokens: Number of output tokens.
             cost_usd: Cost in USD.
             metadata: Additional metadata.
+            cache_read_tokens: Input tokens read from the prompt cache.
+            cache_write_tokens: Input tokens written to the prompt cache.
 
         Returns:
             The recorded CostRecord.
@@ -226,6 +238,8 @@ class CostTracker:
                 output_tokens=output_tokens,
                 cost_usd=cost_usd,
                 metadata=metadata or {},
+                cache_read_tokens=cache_read_tokens,
+                cache_write_tokens=cache_write_tokens,
             )
 
             self._records.append(record)
@@ -507,6 +521,8 @@ class CostTracker:
                 by_model=by_model,
                 by_operation=by_operation,
                 record_count=len(records),
+                cache_read_tokens=sum(r.cache_read_tokens for r in records),
+                cache_write_tokens=sum(r.cache_write_tokens for r in records),
             )
 
     def export_report(
@@ -536,6 +552,8 @@ class CostTracker:
                     "by_model": summary.by_model,
                     "by_operation": summary.by_operation,
                     "record_count": summary.record_count,
+                    "cache_read_tokens": summary.cache_read_tokens,
+                    "cache_write_tokens": summary.cache_write_tokens,
                 }
 
             elif format == "csv":
@@ -1,7 +1,9 @@
 """Cross-file refactoring service with atomic operations and rollback support.
 
 This module provides the CrossFileRefactorer that enables atomic multi-file
-transformations with transaction-like rollback capabilities.
+transformations with transaction-like rollback capabilities. Batches of
+language-server renames are merged into one conflict-checked change set so
+each file is written once.
 """
 
 from __future__ import annotations
@@ -10,10 +12,16 @@ import shutil
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from itertools import pairwise
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rice_factor.domain.ports.lsp import LSPPort, TextEdit
+
 
 class OperationType(Enum):
     """Type of file operation."""
@@ -152,6 +160,110 @@ class TransactionResult:
         }
 
 
+@dataclass
+class SymbolRename:
+    """A symbol to rename through the language server.
+
+    Attributes:
+        file_path: File containing the symbol.
+        line: Line of the symbol (0-indexed, as in LSP).
+        column: Column of the symbol (0-indexed).
+        new_name: New name for the symbol.
+    """
+
+    file_path: Path
+    line: int
+    column: int
+    new_name: str
+
+
+def merge_text_edits(edits: list[TextEdit]) -> dict[Path, list[TextEdit]]:
+    """Merge text edits from several operations into one change set.
+
+    Identical edits (e.g. two renames touching the same reference the same
+    way) are kept once.
+
+    Args:
+        edits: Edits in LSP positions (0-indexed lines, UTF-16 columns).
+
+    Returns:
+        Edits per file, sorted by position.
+
+    Raises:
+        ValueError: If two edits change overlapping ranges differently.
+    """
+    by_file: dict[Path, list[TextEdit]] = {}
+    seen: set[tuple[Any, ...]] = set()
+    for edit in edits:
+        key = (
+            Path(edit.file_path),
+            edit.start_line,
+            edit.start_column,
+            edit.end_line,
+            edit.end_column,
+            edit.new_text,
+        )
+        if key not in seen:
+            seen.add(key)
+            by_file.setdefault(key[0], []).append(edit)
+
+    for path, file_edits in by_file.items():
+        file_edits.sort(
+            key=lambda e: (e.start_line, e.start_column, e.end_line, e.end_column)
+        )
+        for previous, edit in pairwise(file_edits):
+            start = (edit.start_line, edit.start_column)
+            end = (edit.end_line, edit.end_column)
+            previous_start = (previous.start_line, previous.start_column)
+            previous_end = (previous.end_line, previous.end_column)
+            if start < previous_end or (start, end) == (previous_start, previous_end):
+                raise ValueError(
+                    f"Conflicting edits in {path} at line {edit.start_line + 1}: "
+                    f"{previous.new_text!r} and {edit.new_text!r}"
+                )
+
+    return by_file
+
+
+def apply_text_edits(content: str, edits: list[TextEdit]) -> str:
+    """Apply non-overlapping text edits to a file's content.
+
+    Args:
+        content: Original content.
+        edits: Edits for this file in LSP positions, sorted by position.
+
+    Returns:
+        Content with every edit applied.
+    """
+    lines = content.splitlines(keepends=True)
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line))
+
+    def offset_at(line: int, column: int) -> int:
+        if line >= len(lines):
+            return len(content)
+        # Columns count UTF-16 code units and stop at the line ending
+        text = lines[line].rstrip("\r\n")
+        units = 0
+        for index, char in enumerate(text):
+            if units >= column:
+                return line_starts[line] + index
+            units += 2 if ord(char) > 0xFFFF else 1
+        return line_starts[line] + len(text)
+
+    pieces: list[str] = []
+    cursor = 0
+    for edit in edits:
+        start = offset_at(edit.start_line, edit.start_column)
+        pieces.append(content[cursor:start])
+        pieces.append(edit.new_text)
+        cursor = offset_at(edit.end_line, edit.end_column)
+    pieces.append(content[cursor:])
+
+    return "".join(pieces)
+
+
 @dataclass
 class CrossFileRefactorer:
     """Service for atomic multi-file refactoring operations.
@@ -162,10 +274,12 @@ class CrossFileRefactorer:
     Attributes:
         repo_root: Root directory of the repository.
         backup_root: Root directory for backups.
+        lsp: Language server used for semantic renames.
     """
 
     repo_root: Path
     backup_root: Path | None = None
+    lsp: LSPPort | None = None
     _active_transactions: dict[str, Transaction] = field(
         default_factory=dict, init=False
     )
@@ -664,16 +778,103 @@ class CrossFileRefactorer:
         Returns:
             TransactionResult.
         """
+        return self.rename_symbols_across_files(files, {old_name: new_name})
+
+    def rename_symbols_across_files(
+        self,
+        files: list[Path],
+        renames: dict[str, str],
+    ) -> TransactionResult:
+        """Rename several symbols across multiple files in one pass.
+
+        Each file is read, transformed and written once however many
+        symbols it contains. Names are replaced simultaneously, so swapping
+        two names works.
+
+        Args:
+            files: Files to search.
+            renames: Mapping of old symbol name to new symbol name.
+
+        Returns:
+            TransactionResult.
+        """
+        import re
 
-        def transform(path: Path, content: str) -> str:
-            import re
+        # Longest names first, with word boundaries to avoid partial matches
+        names = sorted(renames, key=len, reverse=True)
+        pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, names)) + r")\b")
 
-            # Use word boundaries to avoid partial matches
-            pattern = r"\b" + re.escape(old_name) + r"\b"
-            return re.sub(pattern, new_name, content)
+        def transform(_path: Path, content: str) -> str:
+            return pattern.sub(lambda match: renames[match.group(0)], content)
 
         return self.refactor_with_callback(files, transform)
 
+    def rename_symbols(self, renames: list[SymbolRename]) -> TransactionResult:
+        """Rename symbols semantically through the language server.
+
+        All renames are sent down one LSP session, their workspace edits are
+        merged and checked for conflicts, and each affected file is written
+        once in a single transaction.
+
+        Args:
+            renames: Symbols to rename.
+
+        Returns:
+            TransactionResult. Nothing is written if any rename fails or
+            two renames conflict.
+        """
+        if self.lsp is None:
+            return TransactionResult(
+                transaction_id="none",
+                success=False,
+                error="Semantic rename requires an LSP client",
+            )
+
+        results = self.lsp.rename_many(
+            [(str(r.file_path), r.line, r.column, r.new_name) for r in renames]
+        )
+
+        errors = [
+            error
+            for rename, result in zip(renames, results, strict=True)
+            if not result.success
+            for error in result.errors or [f"Rename to '{rename.new_name}' failed"]
+        ]
+        if errors:
+            return TransactionResult(
+                transaction_id="none",
+                success=False,
+                error="; ".join(errors),
+            )
+
+        try:
+            changes = merge_text_edits([edit for r in results for edit in r.edits])
+        except ValueError as e:
+            return TransactionResult(
+                transaction_id="none",
+                success=False,
+                error=str(e),
+            )
+
+        missing = next((path for path in changes if not path.exists()), None)
+        if missing is not None:
+            return TransactionResult(
+                transaction_id="none",
+                success=False,
+                error=f"File does not exist: {missing}",
+            )
+
+        transaction = self.begin_transaction()
+
+        for file_path, edits in changes.items():
+            original_content = file_path.read_text(encoding="utf-8")
+            new_content = apply_text_edits(original_content, edits)
+
+            if new_content != original_content:
+                self.add_modify(transaction, file_path, new_content)
+
+        return self.commit(transaction)
+
     def move_class_to_file(
         self,
         source_file: Path,
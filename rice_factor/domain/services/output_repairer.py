@@ -0,0 +1,528 @@
+"""Targeted repair of invalid LLM output.
+
+This module provides the OutputRepairer used by compiler passes when
+OutputValidator rejects a generated payload. Instead of regenerating the
+whole artifact, the repairer sends the model only the invalid sub-trees
+(as JSON pointers), the validator messages and the schema fragment for
+each, merges the returned values back into the payload and re-validates.
+Requests go through LLMPort.repair, which uses the repair system prompt
+and the patch schema instead of the pass prompt and artifact schema.
+
+Token and latency costs of each repair are compared with the cost of the
+original generation and tracked per pass by the RepairTracker.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from rice_factor.domain.artifacts.compiler_types import (
+    CompilerContext,
+    CompilerPassType,
+)
+from rice_factor.domain.failures.llm_errors import (
+    CodeInOutputError,
+    LLMOutputError,
+    SchemaViolationError,
+)
+from rice_factor.domain.services.context_packer import ContextPacker
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from rice_factor.domain.artifacts.enums import ArtifactType
+    from rice_factor.domain.ports.llm import LLMPort
+    from rice_factor.domain.services.output_validator import OutputValidator
+
+DEFAULT_REPAIR_ATTEMPTS = 2
+
+REPAIR_INSTRUCTIONS = (
+    "Your previous output failed validation. Do not regenerate the artifact. "
+    "Return a JSON object whose keys are exactly the JSON pointers listed in "
+    "'errors', each mapped to a corrected value for that location. Each value "
+    "must conform to the schema given for its pointer."
+)
+
+CODE_MESSAGE = "contains source code; describe the intent in prose instead"
+
+_INDEX_PATTERN = re.compile(r"\[(\d+)\]")
+
+
+def json_pointer(parts: Iterable[str | int]) -> str:
+    """Build an RFC 6901 JSON pointer from path parts.
+
+    Args:
+        parts: Object keys and array indices, outermost first.
+
+    Returns:
+        JSON pointer string ("" for the document root).
+    """
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in parts
+    )
+
+
+def pointer_parts(pointer: str) -> list[str]:
+    """Split a JSON pointer into unescaped parts.
+
+    Args:
+        pointer: JSON pointer string.
+
+    Returns:
+        Path parts, empty for the document root.
+    """
+    if not pointer:
+        return []
+    return [p.replace("~1", "/").replace("~0", "~") for p in pointer[1:].split("/")]
+
+
+def code_location_parts(location: str) -> list[str | int]:
+    """Convert a CodeDetector location into path parts.
+
+    Args:
+        location: Dotted path such as "steps[0].description" ("$" is root).
+
+    Returns:
+        Path parts, with array indices as ints.
+    """
+    parts: list[str | int] = []
+    if location in ("", "$"):
+        return parts
+    for segment in location.split("."):
+        name = _INDEX_PATTERN.split(segment)
+        if name[0]:
+            parts.append(name[0])
+        parts.extend(int(index) for index in name[1::2])
+    return parts
+
+
+def get_at_pointer(data: Any, pointer: str) -> Any:
+    """Get the value at a JSON pointer.
+
+    Args:
+        data: Document to read.
+        pointer: JSON pointer string.
+
+    Returns:
+        The value at the pointer.
+
+    Raises:
+        KeyError: If an object key is missing.
+        IndexError: If an array index is out of range.
+    """
+    current = data
+    for part in pointer_parts(pointer):
+        current = current[int(part)] if isinstance(current, list) else current[part]
+    return current
+
+
+def set_at_pointer(data: Any, pointer: str, value: Any) -> None:
+    """Set the value at a JSON pointer in place.
+
+    Args:
+        data: Document to modify.
+        pointer: JSON pointer of an existing value or a new object key.
+        value: Value to store.
+
+    Raises:
+        ValueError: If the pointer is the document root.
+    """
+    parts = pointer_parts(pointer)
+    if not parts:
+        raise ValueError("Cannot replace the document root")
+    parent = get_at_pointer(data, json_pointer(parts[:-1]))
+    if isinstance(parent, list):
+        index = int(parts[-1])
+        if index == len(parent):
+            parent.append(value)
+        else:
+            parent[index] = value
+    else:
+        parent[parts[-1]] = value
+
+
+def subschema_at(schema: dict[str, Any], parts: Iterable[str | int]) -> dict[str, Any]:
+    """Find the schema fragment describing a location.
+
+    Args:
+        schema: Root schema.
+        parts: Path parts of the location.
+
+    Returns:
+        The fragment, or an empty (permissive) schema if it cannot be found.
+    """
+    current = schema
+    for part in parts:
+        properties = current.get("properties", {})
+        items = current.get("items")
+        additional = current.get("additionalProperties")
+        if isinstance(part, str) and part in properties:
+            current = properties[part]
+        elif isinstance(items, dict) and (isinstance(part, int) or part.isdigit()):
+            current = items
+        elif isinstance(additional, dict):
+            current = additional
+        else:
+            return {}
+    return current
+
+
+@dataclass
+class RepairTarget:
+    """An invalid sub-tree of a payload.
+
+    Attributes:
+        pointer: JSON pointer of the sub-tree.
+        messages: Validator messages for the sub-tree.
+        schema: Schema fragment the replacement must conform to.
+        current: Current value, or None if the value is missing.
+    """
+
+    pointer: str
+    messages: list[str]
+    schema: dict[str, Any]
+    current: Any = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the form sent to the model."""
+        return {
+            "pointer": self.pointer,
+            "messages": self.messages,
+            "current_value": self.current,
+        }
+
+
+@dataclass
+class RepairStats:
+    """Repair statistics for one compiler pass.
+
+    Attributes:
+        repairs: Number of invalid outputs the repairer tried to fix.
+        repaired: Number of outputs fixed without full regeneration.
+        failed: Number of outputs that could not be fixed.
+        llm_calls: Number of repair requests sent to the model.
+        repair_tokens: Estimated tokens spent on repair requests.
+        repair_ms: Time spent on repairs.
+        tokens_saved: Estimated tokens saved versus full regeneration.
+        latency_saved_ms: Latency saved versus full regeneration.
+    """
+
+    repairs: int = 0
+    repaired: int = 0
+    failed: int = 0
+    llm_calls: int = 0
+    repair_tokens: int = 0
+    repair_ms: float = 0.0
+    tokens_saved: int = 0
+    latency_saved_ms: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        """Fraction of repairs that produced a valid payload."""
+        return self.repaired / self.repairs if self.repairs else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "repairs": self.repairs,
+            "repaired": self.repaired,
+            "failed": self.failed,
+            "llm_calls": self.llm_calls,
+            "repair_tokens": self.repair_tokens,
+            "repair_ms": round(self.repair_ms, 2),
+            "tokens_saved": self.tokens_saved,
+            "latency_saved_ms": round(self.latency_saved_ms, 2),
+            "success_rate": round(self.success_rate, 4),
+        }
+
+
+@dataclass
+class RepairTracker:
+    """Thread-safe repair statistics per compiler pass."""
+
+    _stats: dict[str, RepairStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(
+        self,
+        pass_type: CompilerPassType,
+        repaired: bool,
+        llm_calls: int,
+        repair_tokens: int,
+        repair_ms: float,
+        full_tokens: int,
+        full_ms: float,
+    ) -> None:
+        """Record one repair.
+
+        Savings are only counted for successful repairs; a failed repair
+        is pure overhead on top of the failed generation.
+
+        Args:
+            pass_type: Pass whose output was repaired.
+            repaired: Whether the repair produced a valid payload.
+            llm_calls: Repair requests sent to the model.
+            repair_tokens: Estimated tokens of the repair requests.
+            repair_ms: Time spent repairing.
+            full_tokens: Estimated tokens of the full generation.
+            full_ms: Latency of the full generation.
+        """
+        with self._lock:
+            stats = self._stats.setdefault(pass_type.value, RepairStats())
+            stats.repairs += 1
+            stats.llm_calls += llm_calls
+            stats.repair_tokens += repair_tokens
+            stats.repair_ms += repair_ms
+            if repaired:
+                stats.repaired += 1
+                stats.tokens_saved += full_tokens - repair_tokens
+                stats.latency_saved_ms += full_ms - repair_ms
+            else:
+                stats.failed += 1
+
+    def get_stats(self, pass_type: CompilerPassType) -> RepairStats:
+        """Get a copy of the statistics for a pass."""
+        with self._lock:
+            return copy.copy(self._stats.get(pass_type.value, RepairStats()))
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Get statistics for every pass, keyed by pass type value."""
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        with self._lock:
+            self._stats.clear()
+
+
+class OutputRepairer:
+    """Repairs invalid payloads by regenerating only the invalid sub-trees."""
+
+    def __init__(
+        self,
+        validator: OutputValidator,
+        max_attempts: int = DEFAULT_REPAIR_ATTEMPTS,
+        tracker: RepairTracker | None = None,
+    ) -> None:
+        """Initialize the repairer.
+
+        Args:
+            validator: Validator used to locate and re-check errors.
+            max_attempts: Maximum repair requests per payload (0 disables).
+            tracker: Statistics tracker (global tracker if not provided).
+        """
+        self._validator = validator
+        self.max_attempts = max_attempts
+        self._tracker = tracker or get_repair_tracker()
+
+    def find_targets(
+        self,
+        payload: dict[str, Any],
+        artifact_type: ArtifactType,
+    ) -> list[RepairTarget] | None:
+        """Locate the invalid sub-trees of a payload.
+
+        Missing required properties become targets for the property
+        itself. Schema errors are reported before code, as the validator
+        does. Nested targets are folded into their enclosing target.
+
+        Args:
+            payload: The payload to check.
+            artifact_type: The artifact type to check against.
+
+        Returns:
+            Targets to repair (empty if the payload is valid), or None if
+            an error concerns the whole payload and cannot be targeted.
+        """
+        targets: dict[str, RepairTarget] = {}
+
+        def add(parts: list[str | int], message: str, schema: dict[str, Any]) -> None:
+            pointer = json_pointer(parts)
+            target = targets.get(pointer)
+            if target is None:
+                try:
+                    current = get_at_pointer(payload, pointer)
+                except (KeyError, IndexError, TypeError):
+                    current = None
+                target = targets[pointer] = RepairTarget(pointer, [], schema, current)
+            target.messages.append(message)
+
+        for error in self._validator.schema_errors(payload, artifact_type):
+            path = list(error.absolute_path)
+            if error.validator == "required" and isinstance(error.instance, dict):
+                properties = error.schema.get("properties", {})
+                for name in error.validator_value:
+                    if name not in error.instance:
+                        add([*path, name], error.message, properties.get(name, {}))
+            elif path:
+                add(path, error.message, error.schema)
+            else:
+                return None
+
+        if not targets:
+            location = self._validator.code_location(payload)
+            if location is not None:
+                parts = code_location_parts(location)
+                if not parts:
+                    return None
+                schema = self._validator.get_schema(artifact_type)
+                add(parts, CODE_MESSAGE, subschema_at(schema, parts))
+
+        repairs: list[RepairTarget] = []
+        for pointer in sorted(targets):
+            enclosing = next(
+                (t for t in repairs if pointer.startswith(t.pointer + "/")), None
+            )
+            if enclosing is None:
+                repairs.append(targets[pointer])
+            else:
+                enclosing.messages.extend(
+                    f"{pointer}: {message}" for message in targets[pointer].messages
+                )
+        return repairs
+
+    def repair(
+        self,
+        pass_type: CompilerPassType,
+        artifact_type: ArtifactType,
+        payload: dict[str, Any],
+        context: CompilerContext,
+        llm_port: LLMPort,
+        error: LLMOutputError,
+        full_tokens: int = 0,
+        full_ms: float = 0.0,
+        overhead_tokens: int = 0,
+    ) -> dict[str, Any]:
+        """Repair an invalid payload with targeted requests.
+
+        Args:
+            pass_type: The pass that produced the payload.
+            artifact_type: The artifact type the payload must conform to.
+            payload: The invalid payload (not modified).
+            context: The context the payload was generated from.
+            llm_port: LLM used for repair requests.
+            error: The validation error raised for the payload.
+            full_tokens: Estimated tokens of the original generation.
+            full_ms: Latency of the original generation.
+            overhead_tokens: Estimated tokens every request pays regardless
+                of content (e.g. the repair system prompt).
+
+        Returns:
+            The repaired, valid payload.
+
+        Raises:
+            LLMOutputError: The last validation error if the payload could
+                not be repaired.
+        """
+        if self.max_attempts <= 0:
+            raise error
+
+        start = time.perf_counter()
+        patched = copy.deepcopy(payload)
+        llm_calls = 0
+        tokens = 0
+        repaired = False
+        try:
+            for _ in range(self.max_attempts):
+                targets = self.find_targets(patched, artifact_type)
+                if not targets:
+                    break
+
+                request, schema = self.build_request(pass_type, context, targets)
+                result = llm_port.repair(pass_type, request, schema)
+                llm_calls += 1
+                tokens += overhead_tokens + ContextPacker.estimate_tokens(
+                    json.dumps(request.artifacts) + json.dumps(schema)
+                )
+                if not result.success or not isinstance(result.payload, dict):
+                    break
+                tokens += ContextPacker.estimate_tokens(json.dumps(result.payload))
+
+                for target in targets:
+                    if target.pointer in result.payload:
+                        set_at_pointer(patched, target.pointer, result.payload[target.pointer])
+
+                try:
+                    self._validator.validate(json.dumps(patched), artifact_type)
+                except (SchemaViolationError, CodeInOutputError) as e:
+                    error = e
+                    continue
+                repaired = True
+                return patched
+        finally:
+            self._tracker.record(
+                pass_type,
+                repaired=repaired,
+                llm_calls=llm_calls,
+                repair_tokens=tokens,
+                repair_ms=(time.perf_counter() - start) * 1000,
+                full_tokens=full_tokens,
+                full_ms=full_ms,
+            )
+        raise error
+
+    @staticmethod
+    def build_request(
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        targets: list[RepairTarget],
+    ) -> tuple[CompilerContext, dict[str, Any]]:
+        """Build the repair request for a set of targets.
+
+        Project files are left out; the model only sees the invalid
+        sub-trees, their validator messages and their schema fragments.
+
+        Args:
+            pass_type: The pass that produced the payload.
+            context: The original context (for the target file).
+            targets: Sub-trees to repair.
+
+        Returns:
+            Tuple of (repair context, schema of the expected patch object).
+        """
+        request = CompilerContext(
+            pass_type=pass_type,
+            project_files={},
+            artifacts={
+                "repair_request": {
+                    "instructions": REPAIR_INSTRUCTIONS,
+                    "errors": [target.to_dict() for target in targets],
+                }
+            },
+            target_file=context.target_file,
+        )
+        schema = {
+            "type": "object",
+            "properties": {target.pointer: target.schema for target in targets},
+            "required": [target.pointer for target in targets],
+            "additionalProperties": False,
+        }
+        return request, schema
+
+
+_repair_tracker: RepairTracker | None = None
+
+
+def get_repair_tracker() -> RepairTracker:
+    """Get the global repair tracker instance.
+
+    Returns:
+        The global RepairTracker instance.
+    """
+    global _repair_tracker
+    if _repair_tracker is None:
+        _repair_tracker = RepairTracker()
+    return _repair_tracker
+
+
+def reset_repair_tracker() -> None:
+    """Reset the global repair tracker (useful for testing)."""
+    global _repair_tracker
+    _repair_tracker = None
@@ -136,6 +136,57 @@ class OutputValidator:
 
         return data
 
+    def get_schema(self, artifact_type: ArtifactType) -> dict[str, Any]:
+        """Get the JSON schema for an artifact type.
+
+        Args:
+            artifact_type: The artifact type.
+
+        Returns:
+            The parsed schema.
+
+        Raises:
+            SchemaViolationError: If no schema is defined or found.
+        """
+        schema_file = SCHEMA_FILE_MAP.get(artifact_type)
+        if schema_file is None:
+            raise SchemaViolationError(
+                f"No schema defined for artifact type: {artifact_type.value}",
+            )
+        return self._load_schema(schema_file)
+
+    def schema_errors(
+        self,
+        data: dict[str, Any],
+        artifact_type: ArtifactType,
+    ) -> list[jsonschema.ValidationError]:
+        """Collect every schema violation in data without raising.
+
+        Args:
+            data: The data to validate.
+            artifact_type: The artifact type.
+
+        Returns:
+            All validation errors, empty if data is valid.
+        """
+        validator = jsonschema.Draft7Validator(self.get_schema(artifact_type))
+        return list(validator.iter_errors(data))
+
+    def code_location(self, data: dict[str, Any]) -> str | None:
+        """Find the first location containing code.
+
+        Args:
+            data: Data to check.
+
+        Returns:
+            Path of the value containing code (e.g. "steps[0]"), or None
+            if no code was found or code checking is disabled.
+        """
+        if self._code_detector is None:
+            return None
+        found, location = self._code_detector.contains_code(data)
+        return location if found else None
+
     def _parse_json(self, json_str: str) -> dict[str, Any]:
         """Parse JSON string to dictionary.
 
@@ -176,14 +227,7 @@ class OutputValidator:
         Raises:
             SchemaViolationError: If validation fails.
         """
-        schema_file = SCHEMA_FILE_MAP.get(artifact_type)
-        if schema_file is None:
-            raise SchemaViolationError(
-                f"No schema defined for artifact type: {artifact_type.value}",
-            )
-
-        schema = self._load_schema(schema_file)
-        self._run_validation(data, schema)
+        self._run_validation(data, self.get_schema(artifact_type))
 
     def _validate_envelope_schema(self, data: dict[str, Any]) -> None:
         """Validate data against envelope schema.
@@ -2,22 +2,52 @@
 
 This module provides the ParallelExecutor service that executes multiple
 implementation plans or other artifact operations in parallel using
-configurable worker pools.
+configurable worker pools. Tasks may depend on other tasks, so pipelines
+such as impl -> apply -> test over many artifacts can overlap safely.
+
+Handlers run on threads by default. CPU-bound work (schema validation,
+parsing) can use the process backend instead; its handler and initializer
+must be picklable module-level functions, and tasks should carry a
+source_path rather than file contents so little data is pickled.
+
+Work that is cheaper in bulk, such as LLM generation against a server that
+batches requests, can use execute_batched(): each worker receives a list
+of ready tasks and returns one result per task.
 """
 
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import heapq
+import math
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from pathlib import Path
-from typing import Any, Callable, TypeVar
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
 
 T = TypeVar("T")
 
 
+class ExecutionBackend(Enum):
+    """Worker pool that runs task handlers."""
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
 class ExecutionStatus(Enum):
     """Status of an execution task."""
 
@@ -38,6 +68,9 @@ class ExecutionTask:
         artifact_type: Type of the artifact.
         payload: Data to be processed.
         priority: Task priority (lower = higher priority).
+        depends_on: IDs of tasks that must complete before this one starts.
+        source_path: File the handler should read itself, so only the path
+            is sent to process-pool workers.
     """
 
     task_id: str
@@ -45,6 +78,35 @@ class ExecutionTask:
     artifact_type: str
     payload: dict[str, Any]
     priority: int = 0
+    depends_on: list[str] = field(default_factory=list)
+    source_path: str | None = None
+
+    @classmethod
+    def for_file(
+        cls,
+        path: Path | str,
+        artifact_type: str,
+        priority: int = 0,
+    ) -> ExecutionTask:
+        """Create a task that processes a file by path.
+
+        Args:
+            path: File to process.
+            artifact_type: Type of the artifact in the file.
+            priority: Task priority (lower = higher priority).
+
+        Returns:
+            ExecutionTask identified by the path, with an empty payload.
+        """
+        source_path = str(path)
+        return cls(
+            task_id=source_path,
+            artifact_id=source_path,
+            artifact_type=artifact_type,
+            payload={},
+            priority=priority,
+            source_path=source_path,
+        )
 
 
 @dataclass
@@ -160,12 +222,22 @@ class ParallelismConfig:
         timeout_seconds: Timeout for each task in seconds.
         fail_fast: Stop all tasks on first failure.
         ordered_results: Return results in task order.
+        backend: Worker pool to run handlers on.
+        chunk_size: Tasks sent to a worker at once (None picks 1 for
+            threads and about four chunks per worker for processes).
+        initializer: Called once in every worker before it runs tasks,
+            e.g. to preload schemas or parsers.
+        initargs: Arguments for initializer.
     """
 
     max_workers: int = 4
     timeout_seconds: float = 300.0
     fail_fast: bool = False
     ordered_results: bool = False
+    backend: ExecutionBackend = ExecutionBackend.THREAD
+    chunk_size: int | None = None
+    initializer: Callable[..., None] | None = None
+    initargs: tuple[Any, ...] = ()
 
 
 @dataclass
@@ -180,101 +252,226 @@ class ParallelExecutor:
     """
 
     config: ParallelismConfig = field(default_factory=ParallelismConfig)
-    _executor: ThreadPoolExecutor | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize the executor."""
         self._cancelled = False
 
+    def execute_stream(
+        self,
+        tasks: list[ExecutionTask],
+        handler: Callable[[ExecutionTask], Any],
+        backend: ExecutionBackend | None = None,
+    ) -> Iterator[ExecutionResult]:
+        """Execute tasks, yielding each result as soon as it is known.
+
+        Tasks wait in a ready queue until everything in their depends_on
+        has completed, and are dispatched from it by priority (lower
+        first, then input order) whenever a worker frees up. When a task
+        fails, its dependents are cancelled; with fail_fast, every task
+        that has not started yet is cancelled too. Tasks that are already
+        running always finish.
+
+        Ready tasks are sent to workers in chunks (see
+        ParallelismConfig.chunk_size); a chunk that has started runs to
+        the end even under fail_fast.
+
+        Args:
+            tasks: List of tasks to execute.
+            handler: Function to call for each task.
+            backend: Worker pool to use (defaults to config.backend).
+
+        Yields:
+            ExecutionResult for every task, in completion order.
+
+        Raises:
+            ValueError: If task IDs are not unique, a dependency is
+                unknown, or the dependencies form a cycle.
+        """
+        backend = backend or self.config.backend
+        yield from self._stream(
+            tasks,
+            partial(_run_chunk, handler=handler),
+            backend,
+            self._chunk_size(len(tasks), backend),
+        )
+
+    def _stream(
+        self,
+        tasks: list[ExecutionTask],
+        run_chunk: Callable[[list[ExecutionTask]], list[ExecutionResult]],
+        backend: ExecutionBackend,
+        chunk_size: int,
+    ) -> Iterator[ExecutionResult]:
+        """Schedule tasks onto workers, chunk_size ready tasks at a time.
+
+        Args:
+            tasks: List of tasks to execute.
+            run_chunk: Runs a chunk of tasks in a worker.
+            backend: Worker pool to use.
+            chunk_size: Maximum tasks per chunk.
+
+        Yields:
+            ExecutionResult for every task, in completion order.
+        """
+        by_id, dependents, unmet = self._build_graph(tasks)
+        order = {task.task_id: i for i, task in enumerate(tasks)}
+        self._cancelled = False
+
+        ready: list[tuple[int, int, str]] = []
+        finished: set[str] = set()
+
+        def make_ready(task_id: str) -> None:
+            if task_id not in finished:
+                heapq.heappush(ready, (by_id[task_id].priority, order[task_id], task_id))
+
+        def cancelled(task_id: str, error: str | None = None) -> ExecutionResult:
+            finished.add(task_id)
+            return ExecutionResult(
+                task_id=task_id,
+                artifact_id=by_id[task_id].artifact_id,
+                status=ExecutionStatus.CANCELLED,
+                error=error,
+            )
+
+        for task_id, count in unmet.items():
+            if count == 0:
+                make_ready(task_id)
+
+        stopping = False
+        running: dict[Future[list[ExecutionResult]], list[str]] = {}
+        executor = self._create_pool(backend)
+        try:
+            while ready or running:
+                stopping = stopping or self._cancelled
+                while ready and not stopping and len(running) < self.config.max_workers:
+                    chunk = [
+                        heapq.heappop(ready)[2]
+                        for _ in range(min(chunk_size, len(ready)))
+                    ]
+                    future = executor.submit(
+                        run_chunk, [by_id[task_id] for task_id in chunk]
+                    )
+                    running[future] = chunk
+                while ready and stopping:
+                    yield cancelled(heapq.heappop(ready)[2])
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: order[running[f][0]]):
+                    chunk = running.pop(future)
+                    for result in self._chunk_results(future, chunk, by_id):
+                        task_id = result.task_id
+                        finished.add(task_id)
+                        yield result
+
+                        if result.status == ExecutionStatus.COMPLETED:
+                            for dependent in dependents[task_id]:
+                                unmet[dependent] -= 1
+                                if unmet[dependent] == 0:
+                                    make_ready(dependent)
+                            continue
+
+                        for dependent in self._descendants(task_id, dependents):
+                            if dependent not in finished:
+                                yield cancelled(dependent, f"Dependency '{task_id}' failed")
+                        if self.config.fail_fast:
+                            stopping = True
+
+            # Tasks still waiting on dependencies that will never run
+            for task in tasks:
+                if task.task_id not in finished:
+                    yield cancelled(task.task_id)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def execute_sync(
         self,
         tasks: list[ExecutionTask],
         handler: Callable[[ExecutionTask], Any],
+        backend: ExecutionBackend | None = None,
     ) -> BatchExecutionResult:
-        """Execute tasks synchronously using thread pool.
+        """Execute tasks using a worker pool and wait for all of them.
+
+        See execute_stream() for scheduling and cancellation rules.
 
         Args:
             tasks: List of tasks to execute.
             handler: Function to call for each task.
+            backend: Worker pool to use (defaults to config.backend).
 
         Returns:
             BatchExecutionResult with all results.
+
+        Raises:
+            ValueError: If the task dependencies are invalid.
         """
         started_at = datetime.now(UTC)
-        results: list[ExecutionResult] = []
-        completed_count = 0
-        failed_count = 0
-        cancelled_count = 0
-        self._cancelled = False
+        results = list(self.execute_stream(tasks, handler, backend))
+        return self._collect(tasks, results, started_at)
 
-        if not tasks:
-            return BatchExecutionResult(
-                total_tasks=0,
-                completed_count=0,
-                failed_count=0,
-                cancelled_count=0,
-                results=[],
-                started_at=started_at,
-                completed_at=datetime.now(UTC),
-            )
+    def execute_batched(
+        self,
+        tasks: list[ExecutionTask],
+        batch_handler: Callable[[list[ExecutionTask]], list[Any]],
+        batch_size: int | None = None,
+        backend: ExecutionBackend | None = None,
+    ) -> BatchExecutionResult:
+        """Execute tasks by handing each worker a batch of ready tasks.
 
-        # Sort by priority (lower = higher priority)
-        sorted_tasks = sorted(tasks, key=lambda t: t.priority)
-
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            future_to_task = {
-                executor.submit(self._execute_task, task, handler): task
-                for task in sorted_tasks
-            }
-
-            for future in as_completed(future_to_task):
-                if self._cancelled:
-                    cancelled_count += 1
-                    task = future_to_task[future]
-                    results.append(
-                        ExecutionResult(
-                            task_id=task.task_id,
-                            artifact_id=task.artifact_id,
-                            status=ExecutionStatus.CANCELLED,
-                        )
-                    )
-                    continue
-
-                result = future.result()
-                results.append(result)
-
-                if result.status == ExecutionStatus.COMPLETED:
-                    completed_count += 1
-                elif result.status == ExecutionStatus.FAILED:
-                    failed_count += 1
-                    if self.config.fail_fast:
-                        self._cancelled = True
-
-        # Cancel remaining futures if fail_fast triggered
-        if self._cancelled:
-            for future in future_to_task:
-                if not future.done():
-                    future.cancel()
-                    cancelled_count += 1
-                    task = future_to_task[future]
-                    results.append(
-                        ExecutionResult(
-                            task_id=task.task_id,
-                            artifact_id=task.artifact_id,
-                            status=ExecutionStatus.CANCELLED,
-                        )
-                    )
+        The batch handler receives a list of tasks and must return one
+        result per task, in the same order; a result that is an Exception
+        marks its task as failed. This suits handlers that do one bulk
+        call per batch, such as an LLM adapter's generate_batch().
+        Scheduling and cancellation otherwise follow execute_stream().
+
+        Args:
+            tasks: List of tasks to execute.
+            batch_handler: Function to call for each batch of tasks.
+            batch_size: Maximum tasks per batch (None splits the tasks
+                evenly across the workers).
+            backend: Worker pool to use (defaults to config.backend).
 
-        # Sort by original order if requested
+        Returns:
+            BatchExecutionResult with all results.
+
+        Raises:
+            ValueError: If the task dependencies are invalid.
+        """
+        started_at = datetime.now(UTC)
+        backend = backend or self.config.backend
+        if batch_size is None:
+            batch_size = math.ceil(len(tasks) / self.config.max_workers)
+        results = list(
+            self._stream(
+                tasks,
+                partial(_run_batch, batch_handler=batch_handler),
+                backend,
+                max(1, batch_size),
+            )
+        )
+        return self._collect(tasks, results, started_at)
+
+    def _collect(
+        self,
+        tasks: list[ExecutionTask],
+        results: list[ExecutionResult],
+        started_at: datetime,
+    ) -> BatchExecutionResult:
+        """Summarize the results of a run."""
+        # Sort by priority order if requested
         if self.config.ordered_results:
+            sorted_tasks = sorted(tasks, key=lambda t: t.priority)
             task_order = {t.task_id: i for i, t in enumerate(sorted_tasks)}
             results.sort(key=lambda r: task_order.get(r.task_id, 0))
 
+        statuses = [r.status for r in results]
         return BatchExecutionResult(
             total_tasks=len(tasks),
-            completed_count=completed_count,
-            failed_count=failed_count,
-            cancelled_count=cancelled_count,
+            completed_count=statuses.count(ExecutionStatus.COMPLETED),
+            failed_count=statuses.count(ExecutionStatus.FAILED),
+            cancelled_count=statuses.count(ExecutionStatus.CANCELLED),
             results=results,
             started_at=started_at,
             completed_at=datetime.now(UTC),
@@ -284,92 +481,134 @@ class ParallelExecutor:
         self,
         tasks: list[ExecutionTask],
         handler: Callable[[ExecutionTask], Any],
+        backend: ExecutionBackend | None = None,
     ) -> BatchExecutionResult:
-        """Execute tasks asynchronously.
+        """Execute tasks without blocking the event loop.
+
+        The scheduler runs on a worker thread; see execute_stream().
 
         Args:
             tasks: List of tasks to execute.
             handler: Function to call for each task.
+            backend: Worker pool to use (defaults to config.backend).
 
         Returns:
             BatchExecutionResult with all results.
-        """
-        started_at = datetime.now(UTC)
-        results: list[ExecutionResult] = []
-        completed_count = 0
-        failed_count = 0
-        cancelled_count = 0
-        self._cancelled = False
 
-        if not tasks:
-            return BatchExecutionResult(
-                total_tasks=0,
-                completed_count=0,
-                failed_count=0,
-                cancelled_count=0,
-                results=[],
-                started_at=started_at,
-                completed_at=datetime.now(UTC),
+        Raises:
+            ValueError: If the task dependencies are invalid.
+        """
+        return await asyncio.to_thread(self.execute_sync, tasks, handler, backend)
+
+    def _create_pool(self, backend: ExecutionBackend) -> Executor:
+        """Create the worker pool for a backend."""
+        if backend == ExecutionBackend.PROCESS:
+            return ProcessPoolExecutor(
+                max_workers=self.config.max_workers,
+                initializer=self.config.initializer,
+                initargs=self.config.initargs,
             )
+        return ThreadPoolExecutor(
+            max_workers=self.config.max_workers,
+            initializer=self.config.initializer,
+            initargs=self.config.initargs,
+        )
 
-        # Sort by priority
-        sorted_tasks = sorted(tasks, key=lambda t: t.priority)
-
-        # Create semaphore for concurrency limiting
-        semaphore = asyncio.Semaphore(self.config.max_workers)
-
-        async def run_task(task: ExecutionTask) -> ExecutionResult:
-            async with semaphore:
-                if self._cancelled:
-                    return ExecutionResult(
-                        task_id=task.task_id,
-                        artifact_id=task.artifact_id,
-                        status=ExecutionStatus.CANCELLED,
-                    )
-                return await asyncio.get_event_loop().run_in_executor(
-                    None, self._execute_task, task, handler
+    def _chunk_size(self, task_count: int, backend: ExecutionBackend) -> int:
+        """Return how many tasks to send to a worker at once."""
+        if self.config.chunk_size is not None:
+            return max(1, self.config.chunk_size)
+        if backend == ExecutionBackend.PROCESS:
+            # About four chunks per worker balances load against IPC overhead
+            return max(1, math.ceil(task_count / (self.config.max_workers * 4)))
+        return 1
+
+    @staticmethod
+    def _chunk_results(
+        future: Future[list[ExecutionResult]],
+        chunk: list[str],
+        by_id: dict[str, ExecutionTask],
+    ) -> list[ExecutionResult]:
+        """Get a chunk's results, failing every task if the worker broke."""
+        try:
+            return future.result()
+        except Exception as e:
+            now = datetime.now(UTC)
+            return [
+                ExecutionResult(
+                    task_id=task_id,
+                    artifact_id=by_id[task_id].artifact_id,
+                    status=ExecutionStatus.FAILED,
+                    error=f"Worker failed: {e}",
+                    completed_at=now,
                 )
+                for task_id in chunk
+            ]
 
-        # Execute all tasks concurrently
-        task_futures = [run_task(task) for task in sorted_tasks]
-        async_results = await asyncio.gather(*task_futures, return_exceptions=True)
+    @staticmethod
+    def _build_graph(
+        tasks: list[ExecutionTask],
+    ) -> tuple[dict[str, ExecutionTask], dict[str, list[str]], dict[str, int]]:
+        """Index tasks and their dependencies.
 
-        for i, result_or_exc in enumerate(async_results):
-            if isinstance(result_or_exc, Exception):
-                task = sorted_tasks[i]
-                result = ExecutionResult(
-                    task_id=task.task_id,
-                    artifact_id=task.artifact_id,
-                    status=ExecutionStatus.FAILED,
-                    error=str(result_or_exc),
-                )
-                failed_count += 1
-            else:
-                result = result_or_exc
-                if result.status == ExecutionStatus.COMPLETED:
-                    completed_count += 1
-                elif result.status == ExecutionStatus.FAILED:
-                    failed_count += 1
-                    if self.config.fail_fast:
-                        self._cancelled = True
-                elif result.status == ExecutionStatus.CANCELLED:
-                    cancelled_count += 1
-
-            results.append(result)
+        Args:
+            tasks: Tasks to index.
 
-        if self.config.ordered_results:
-            task_order = {t.task_id: i for i, t in enumerate(sorted_tasks)}
-            results.sort(key=lambda r: task_order.get(r.task_id, 0))
+        Returns:
+            Tuple of (tasks by ID, dependents of each task, number of
+            unmet dependencies of each task).
 
-        return BatchExecutionResult(
-            total_tasks=len(tasks),
-            completed_count=completed_count,
-            failed_count=failed_count,
-            cancelled_count=cancelled_count,
-            results=results,
-            started_at=started_at,
-            completed_at=datetime.now(UTC),
-        )
+        Raises:
+            ValueError: If task IDs are not unique, a dependency is
+                unknown, or the dependencies form a cycle.
+        """
+        by_id = {task.task_id: task for task in tasks}
+        if len(by_id) != len(tasks):
+            raise ValueError("Task IDs must be unique")
+
+        dependents: dict[str, list[str]] = {task_id: [] for task_id in by_id}
+        unmet: dict[str, int] = {}
+        for task in tasks:
+            dependencies = set(task.depends_on)
+            for dependency in sorted(dependencies):
+                if dependency not in by_id:
+                    raise ValueError(
+                        f"Task '{task.task_id}' depends on unknown task '{dependency}'"
+                    )
+                dependents[dependency].append(task.task_id)
+            unmet[task.task_id] = len(dependencies)
+
+        # Kahn's algorithm: every task is reachable only if there is no cycle
+        remaining = dict(unmet)
+        queue = [task_id for task_id, count in remaining.items() if count == 0]
+        visited = 0
+        while queue:
+            task_id = queue.pop()
+            visited += 1
+            for dependent in dependents[task_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    queue.append(dependent)
+        if visited != len(tasks):
+            cyclic = sorted(t for t, count in remaining.items() if count > 0)
+            raise ValueError(f"Task dependencies form a cycle: {', '.join(cyclic)}")
+
+        return by_id, dependents, unmet
+
+    @staticmethod
+    def _descendants(task_id: str, dependents: dict[str, list[str]]) -> list[str]:
+        """Return every task that directly or transitively depends on task_id."""
+        found: list[str] = []
+        seen = {task_id}
+        stack = list(dependents[task_id])
+        while stack:
+            dependent = stack.pop(0)
+            if dependent in seen:
+                continue
+            seen.add(dependent)
+            found.append(dependent)
+            stack.extend(dependents[dependent])
+        return found
 
     def _execute_task(
         self,
@@ -385,27 +624,7 @@ class ParallelExecutor:
         Returns:
             ExecutionResult for the task.
         """
-        started_at = datetime.now(UTC)
-
-        try:
-            result = handler(task)
-            return ExecutionResult(
-                task_id=task.task_id,
-                artifact_id=task.artifact_id,
-                status=ExecutionStatus.COMPLETED,
-                result=result,
-                started_at=started_at,
-                completed_at=datetime.now(UTC),
-            )
-        except Exception as e:
-            return ExecutionResult(
-                task_id=task.task_id,
-                artifact_id=task.artifact_id,
-                status=ExecutionStatus.FAILED,
-                error=str(e),
-                started_at=started_at,
-                completed_at=datetime.now(UTC),
-            )
+        return _run_task(task, handler)
 
     def cancel(self) -> None:
         """Cancel all running and pending tasks."""
@@ -424,10 +643,109 @@ class ParallelExecutor:
         self.config.max_workers = value
 
 
+def _run_task(
+    task: ExecutionTask,
+    handler: Callable[[ExecutionTask], Any],
+) -> ExecutionResult:
+    """Run a handler on one task and capture the outcome.
+
+    Args:
+        task: Task to execute.
+        handler: Handler function.
+
+    Returns:
+        ExecutionResult for the task.
+    """
+    started_at = datetime.now(UTC)
+
+    try:
+        result = handler(task)
+        return ExecutionResult(
+            task_id=task.task_id,
+            artifact_id=task.artifact_id,
+            status=ExecutionStatus.COMPLETED,
+            result=result,
+            started_at=started_at,
+            completed_at=datetime.now(UTC),
+        )
+    except Exception as e:
+        return ExecutionResult(
+            task_id=task.task_id,
+            artifact_id=task.artifact_id,
+            status=ExecutionStatus.FAILED,
+            error=str(e),
+            started_at=started_at,
+            completed_at=datetime.now(UTC),
+        )
+
+
+def _run_batch(
+    tasks: list[ExecutionTask],
+    batch_handler: Callable[[list[ExecutionTask]], list[Any]],
+) -> list[ExecutionResult]:
+    """Run a batch handler on a chunk of tasks inside one worker.
+
+    Module-level so it can be pickled for process-pool workers.
+
+    Args:
+        tasks: Tasks to execute as one batch.
+        batch_handler: Returns one result (or Exception) per task.
+
+    Returns:
+        ExecutionResult for each task.
+    """
+    started_at = datetime.now(UTC)
+    try:
+        outputs = batch_handler(tasks)
+        if len(outputs) != len(tasks):
+            raise ValueError(
+                f"Batch handler returned {len(outputs)} results for {len(tasks)} tasks"
+            )
+    except Exception as e:
+        outputs = [e] * len(tasks)
+    completed_at = datetime.now(UTC)
+
+    return [
+        ExecutionResult(
+            task_id=task.task_id,
+            artifact_id=task.artifact_id,
+            status=(
+                ExecutionStatus.FAILED
+                if isinstance(output, Exception)
+                else ExecutionStatus.COMPLETED
+            ),
+            result=None if isinstance(output, Exception) else output,
+            error=str(output) if isinstance(output, Exception) else None,
+            started_at=started_at,
+            completed_at=completed_at,
+        )
+        for task, output in zip(tasks, outputs, strict=True)
+    ]
+
+
+def _run_chunk(
+    tasks: list[ExecutionTask],
+    handler: Callable[[ExecutionTask], Any],
+) -> list[ExecutionResult]:
+    """Run a handler on a chunk of tasks inside one worker.
+
+    Module-level so it can be pickled for process-pool workers.
+
+    Args:
+        tasks: Tasks to execute in order.
+        handler: Handler function.
+
+    Returns:
+        ExecutionResult for each task.
+    """
+    return [_run_task(task, handler) for task in tasks]
+
+
 def create_executor(
     max_workers: int = 4,
     timeout_seconds: float = 300.0,
     fail_fast: bool = False,
+    backend: ExecutionBackend = ExecutionBackend.THREAD,
 ) -> ParallelExecutor:
     """Create a ParallelExecutor with configuration.
 
@@ -435,6 +753,7 @@ def create_executor(
         max_workers: Maximum parallel workers.
         timeout_seconds: Task timeout.
         fail_fast: Stop on first failure.
+        backend: Worker pool to run handlers on.
 
     Returns:
         Configured ParallelExecutor.
@@ -444,5 +763,6 @@ def create_executor(
             max_workers=max_workers,
             timeout_seconds=timeout_seconds,
             fail_fast=fail_fast,
+            backend=backend,
         )
     )
@@ -0,0 +1,642 @@
+"""Dependency-ordered rebuild of stale artifacts.
+
+This module provides the RebuildService used by ``rice-factor rebuild``.
+The current artifact of each planning type (and of each ImplementationPlan
+target) is a node in a graph. Edges come from explicit ``depends_on``
+links plus the artifacts each compiler pass requires as input.
+
+Every node gets an input hash: a hash of the payloads of its inputs and
+the intake files its pass reads. Rebuilt artifacts record this hash in
+the artifact metadata store. An artifact is stale when its recorded hash no longer
+matches, and artifacts downstream of a stale one are re-checked once it
+has been rebuilt. Stale artifacts are recompiled level by level in
+topological order, each level concurrently under the RateLimiter. An
+artifact whose inputs hash to its recorded value is skipped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from rice_factor.adapters.storage.metadata import ArtifactMetadataStore
+from rice_factor.domain.artifacts.compiler_types import CompilerPassType
+from rice_factor.domain.artifacts.enums import ArtifactStatus, ArtifactType
+from rice_factor.domain.services.context_builder import PASS_REQUIREMENTS
+from rice_factor.domain.services.rate_limiter import RateLimiter, get_rate_limiter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pydantic import BaseModel
+
+    from rice_factor.domain.artifacts.envelope import ArtifactEnvelope
+    from rice_factor.domain.services.artifact_builder import ArtifactBuilder
+    from rice_factor.domain.services.context_builder import ContextBuilder
+
+# Compiler pass that produces each rebuildable artifact type
+ARTIFACT_PASS_MAP: dict[ArtifactType, CompilerPassType] = {
+    ArtifactType.PROJECT_PLAN: CompilerPassType.PROJECT,
+    ArtifactType.ARCHITECTURE_PLAN: CompilerPassType.ARCHITECTURE,
+    ArtifactType.SCAFFOLD_PLAN: CompilerPassType.SCAFFOLD,
+    ArtifactType.TEST_PLAN: CompilerPassType.TEST,
+    ArtifactType.IMPLEMENTATION_PLAN: CompilerPassType.IMPLEMENTATION,
+    ArtifactType.REFACTOR_PLAN: CompilerPassType.REFACTOR,
+}
+
+INPUT_HASH_KEY = "input_hash"
+
+
+def compute_input_hash(
+    project_files: dict[str, str],
+    inputs: dict[str, Any],
+    target_file: str | None = None,
+) -> str:
+    """Hash the inputs of a compilation.
+
+    Inputs are keyed by node key rather than artifact ID, so an upstream
+    artifact rebuilt with identical content hashes the same.
+
+    Args:
+        project_files: Intake files read by the pass (name -> content).
+        inputs: Payloads of input artifacts (node key -> payload dict).
+        target_file: Target file, for implementation plans.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    canonical = json.dumps(
+        {"files": project_files, "artifacts": inputs, "target": target_file},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def node_key(artifact: ArtifactEnvelope[BaseModel]) -> str:
+    """Get the rebuild graph key of an artifact.
+
+    ImplementationPlans are keyed per target file; every other type has a
+    single current artifact.
+    """
+    if artifact.artifact_type == ArtifactType.IMPLEMENTATION_PLAN:
+        return f"{artifact.artifact_type.value}:{getattr(artifact.payload, 'target', '')}"
+    return str(artifact.artifact_type.value)
+
+
+def topological_levels(graph: dict[str, set[str]]) -> list[list[str]]:
+    """Group nodes into levels whose dependencies are all in earlier levels.
+
+    Args:
+        graph: Mapping of node to the nodes it depends on.
+
+    Returns:
+        Levels of node keys, each sorted.
+
+    Raises:
+        ValueError: If the graph contains a cycle.
+    """
+    remaining = {key: set(deps) & graph.keys() for key, deps in graph.items()}
+    levels: list[list[str]] = []
+    while remaining:
+        ready = sorted(key for key, deps in remaining.items() if not deps)
+        if not ready:
+            raise ValueError(
+                f"Dependency cycle between artifacts: {', '.join(sorted(remaining))}"
+            )
+        levels.append(ready)
+        for key in ready:
+            del remaining[key]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return levels
+
+
+class RebuildAction(Enum):
+    """What a rebuild will do with an artifact."""
+
+    BUILD = "build"
+    CHECK = "check"
+    UP_TO_DATE = "up_to_date"
+    LOCKED = "locked"
+
+
+_STALE_ACTIONS = (RebuildAction.BUILD, RebuildAction.CHECK)
+
+
+class RebuildStatus(Enum):
+    """Outcome of one artifact in a rebuild."""
+
+    REBUILT = "rebuilt"
+    UNCHANGED = "unchanged"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class RebuildNode:
+    """One artifact in the rebuild graph.
+
+    Attributes:
+        key: Graph key (artifact type, plus target for ImplementationPlans).
+        artifact: The current artifact.
+        pass_type: Compiler pass that produces it.
+        dependencies: Keys of the nodes it is built from.
+        input_hash: Hash of its current inputs.
+        recorded_hash: Hash it was built from, if recorded.
+        action: What the rebuild will do with it.
+        reason: Why that action was chosen.
+    """
+
+    key: str
+    artifact: ArtifactEnvelope[BaseModel]
+    pass_type: CompilerPassType
+    dependencies: list[str]
+    input_hash: str
+    recorded_hash: str | None
+    action: RebuildAction
+    reason: str
+
+    @property
+    def target_file(self) -> str | None:
+        """Target file of an ImplementationPlan node."""
+        if self.pass_type != CompilerPassType.IMPLEMENTATION:
+            return None
+        return getattr(self.artifact.payload, "target", None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "key": self.key,
+            "artifact_id": str(self.artifact.id),
+            "artifact_type": self.artifact.artifact_type.value,
+            "dependencies": self.dependencies,
+            "action": self.action.value,
+            "reason": self.reason,
+        }
+
+
+@dataclass
+class RebuildPlan:
+    """Build plan computed before a rebuild runs.
+
+    Attributes:
+        levels: Nodes grouped by topological level.
+    """
+
+    levels: list[list[RebuildNode]] = field(default_factory=list)
+
+    @property
+    def nodes(self) -> list[RebuildNode]:
+        """All nodes in topological order."""
+        return [node for level in self.levels for node in level]
+
+    @property
+    def stale(self) -> list[RebuildNode]:
+        """Nodes the rebuild will recompile or re-check."""
+        return [node for node in self.nodes if node.action in _STALE_ACTIONS]
+
+    @property
+    def is_up_to_date(self) -> bool:
+        """Whether there is nothing to rebuild."""
+        return not self.stale
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "stale": len(self.stale),
+            "levels": [[node.to_dict() for node in level] for level in self.levels],
+        }
+
+
+@dataclass
+class RebuildOutcome:
+    """Result of rebuilding one artifact.
+
+    Attributes:
+        key: Graph key of the node.
+        status: What happened.
+        artifact: The new artifact (a FailureReport if the pass failed).
+        error: Error message if the rebuild failed or was skipped.
+        duration_ms: Wall-clock time spent on the node.
+    """
+
+    key: str
+    status: RebuildStatus
+    artifact: ArtifactEnvelope[BaseModel] | None = None
+    error: str | None = None
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "key": self.key,
+            "status": self.status.value,
+            "artifact_id": str(self.artifact.id) if self.artifact else None,
+            "error": self.error,
+            "duration_ms": self.duration_ms,
+        }
+
+
+@dataclass
+class RebuildResult:
+    """Result of a rebuild.
+
+    Attributes:
+        outcomes: Per-node outcomes in completion order.
+    """
+
+    outcomes: list[RebuildOutcome] = field(default_factory=list)
+
+    def by_status(self, status: RebuildStatus) -> list[RebuildOutcome]:
+        """Outcomes with the given status."""
+        return [o for o in self.outcomes if o.status == status]
+
+    @property
+    def all_succeeded(self) -> bool:
+        """Whether no node failed or was skipped."""
+        return not self.by_status(RebuildStatus.FAILED) and not self.by_status(
+            RebuildStatus.SKIPPED
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        data: dict[str, Any] = {
+            status.value: len(self.by_status(status)) for status in RebuildStatus
+        }
+        data["outcomes"] = [o.to_dict() for o in self.outcomes]
+        return data
+
+
+class RebuildService:
+    """Service for planning and running dependency-ordered rebuilds.
+
+    Attributes:
+        max_concurrency: Maximum concurrent compilations per level.
+    """
+
+    def __init__(
+        self,
+        storage: Any,
+        project_root: Path,
+        artifact_builder: ArtifactBuilder | None = None,
+        context_builder: ContextBuilder | None = None,
+        max_concurrency: int = 4,
+        rate_limiter: RateLimiter | None = None,
+        provider: str = "default",
+        metadata_store: ArtifactMetadataStore | None = None,
+    ) -> None:
+        """Initialize the rebuild service.
+
+        Args:
+            storage: Storage adapter to read artifacts from.
+            project_root: Root directory of the project.
+            artifact_builder: Builder used to recompile (needed for rebuild).
+            context_builder: Builder used to gather inputs (needed for rebuild).
+            max_concurrency: Maximum concurrent compilations per level.
+            rate_limiter: Rate limiter (global limiter if not provided).
+            provider: Provider name used for rate limiting.
+            metadata_store: Store the input hashes are recorded in. Defaults
+                to the store next to the storage adapter's artifacts; share
+                one instance with the artifact builder.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._storage = storage
+        self._project_root = project_root
+        self._artifact_builder = artifact_builder
+        self._context_builder = context_builder
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._provider = provider
+        self._metadata_store = metadata_store or ArtifactMetadataStore(
+            storage.artifacts_dir
+        )
+        self.max_concurrency = max_concurrency
+
+    def plan(self) -> RebuildPlan:
+        """Compute the build plan for the current artifacts.
+
+        Returns:
+            RebuildPlan with every current artifact and its action.
+
+        Raises:
+            ValueError: If the artifacts' dependencies form a cycle.
+        """
+        current, ids = self._load_current()
+        graph = self._build_graph(current, ids)
+        project_files = self._project_files()
+
+        plan = RebuildPlan()
+        actions: dict[str, RebuildAction] = {}
+        for level_keys in topological_levels(graph):
+            level: list[RebuildNode] = []
+            for key in level_keys:
+                artifact = current[key]
+                dependencies = sorted(graph[key])
+                pass_type = ARTIFACT_PASS_MAP[artifact.artifact_type]
+                input_hash = self._input_hash(
+                    pass_type, artifact, dependencies, current, project_files
+                )
+                recorded = self._recorded_input_hash(artifact)
+                upstream = [d for d in dependencies if actions[d] in _STALE_ACTIONS]
+
+                if artifact.status == ArtifactStatus.LOCKED:
+                    action, reason = RebuildAction.LOCKED, "locked artifacts are never rebuilt"
+                elif recorded is None:
+                    action, reason = RebuildAction.BUILD, "no recorded input hash"
+                elif recorded != input_hash:
+                    action, reason = RebuildAction.BUILD, "inputs changed"
+                elif upstream:
+                    action = RebuildAction.CHECK
+                    reason = f"upstream {', '.join(upstream)} will be rebuilt"
+                else:
+                    action, reason = RebuildAction.UP_TO_DATE, "up to date"
+
+                actions[key] = action
+                level.append(
+                    RebuildNode(
+                        key=key,
+                        artifact=artifact,
+                        pass_type=pass_type,
+                        dependencies=dependencies,
+                        input_hash=input_hash,
+                        recorded_hash=recorded,
+                        action=action,
+                        reason=reason,
+                    )
+                )
+            plan.levels.append(level)
+        return plan
+
+    def rebuild(
+        self,
+        plan: RebuildPlan | None = None,
+        on_result: Callable[[RebuildOutcome], None] | None = None,
+    ) -> RebuildResult:
+        """Recompile the stale artifacts of a plan, level by level.
+
+        Before each compilation the node's input hash is recomputed from
+        the (possibly rebuilt) upstream artifacts; if it matches the hash
+        the artifact was built from, the artifact is left alone. Nodes
+        downstream of a failure are skipped.
+
+        Args:
+            plan: Plan to run (computed if not provided).
+            on_result: Optional callback for each finished node, called
+                from the calling thread.
+
+        Returns:
+            RebuildResult with one outcome per stale node.
+
+        Raises:
+            ValueError: If no artifact or context builder was configured.
+        """
+        builder = self._artifact_builder
+        context_builder = self._context_builder
+        if builder is None or context_builder is None:
+            raise ValueError("RebuildService needs an artifact and context builder")
+        plan = plan or self.plan()
+        current = {node.key: node.artifact for node in plan.nodes}
+        project_files = self._project_files()
+        failed: set[str] = set()
+        result = RebuildResult()
+
+        for level in plan.levels:
+            stale = [node for node in level if node.action in _STALE_ACTIONS]
+            if not stale:
+                continue
+            workers = min(self.max_concurrency, len(stale))
+            outcomes: list[RebuildOutcome] = []
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._rebuild_node,
+                        node,
+                        builder,
+                        context_builder,
+                        current,
+                        project_files,
+                        failed,
+                    )
+                    for node in stale
+                ]
+                for future in as_completed(futures):
+                    outcome = future.result()
+                    outcomes.append(outcome)
+                    result.outcomes.append(outcome)
+                    if on_result is not None:
+                        on_result(outcome)
+
+            # Update shared state only between levels, while no worker runs
+            for outcome in outcomes:
+                if outcome.status == RebuildStatus.REBUILT and outcome.artifact:
+                    current[outcome.key] = outcome.artifact
+                elif outcome.status in (RebuildStatus.FAILED, RebuildStatus.SKIPPED):
+                    failed.add(outcome.key)
+
+        return result
+
+    def touch(self, plan: RebuildPlan | None = None) -> list[str]:
+        """Record current input hashes without recompiling.
+
+        Marks every unlocked artifact as built from its current inputs,
+        like ``make -t``.
+
+        Args:
+            plan: Plan whose nodes to stamp (computed if not provided).
+
+        Returns:
+            Keys of the artifacts that were stamped.
+        """
+        plan = plan or self.plan()
+        stamped: list[str] = []
+        with self._metadata_store.batch():
+            for node in plan.nodes:
+                if node.action == RebuildAction.LOCKED:
+                    continue
+                if node.recorded_hash == node.input_hash:
+                    continue
+                self._metadata_store.update(
+                    node.artifact.id, {INPUT_HASH_KEY: node.input_hash}
+                )
+                stamped.append(node.key)
+        return stamped
+
+    def _recorded_input_hash(self, artifact: ArtifactEnvelope[BaseModel]) -> str | None:
+        """Get the input hash an artifact was built from, if recorded."""
+        value = self._metadata_store.get(artifact.id).get(INPUT_HASH_KEY)
+        return str(value) if value else None
+
+    def _rebuild_node(
+        self,
+        node: RebuildNode,
+        builder: ArtifactBuilder,
+        context_builder: ContextBuilder,
+        current: dict[str, ArtifactEnvelope[BaseModel]],
+        project_files: dict[str, dict[str, str]],
+        failed: set[str],
+    ) -> RebuildOutcome:
+        """Recompile one node if its inputs changed.
+
+        Args:
+            node: The node to rebuild.
+            builder: Builder used to compile and save the artifact.
+            context_builder: Builder used to gather the inputs.
+            current: Current artifact per key (read only during a level).
+            project_files: Intake files per pass type value.
+            failed: Keys that failed or were skipped in earlier levels.
+
+        Returns:
+            RebuildOutcome for the node.
+        """
+        start = time.perf_counter()
+        outcome = RebuildOutcome(key=node.key, status=RebuildStatus.SKIPPED)
+
+        blocked = [d for d in node.dependencies if d in failed]
+        if blocked:
+            outcome.error = f"upstream {', '.join(blocked)} failed"
+            return outcome
+
+        input_hash = self._input_hash(
+            node.pass_type, node.artifact, node.dependencies, current, project_files
+        )
+        if input_hash == node.recorded_hash:
+            outcome.status = RebuildStatus.UNCHANGED
+            outcome.duration_ms = (time.perf_counter() - start) * 1000
+            return outcome
+
+        inputs = [current[d] for d in node.dependencies]
+        try:
+            packed = context_builder.build_packed_context(
+                pass_type=node.pass_type,
+                project_root=self._project_root,
+                target_file=node.target_file,
+                artifacts={str(a.id): a.payload.model_dump(mode="json") for a in inputs},
+            )
+
+            self._rate_limiter.acquire(self._provider, block=True)
+            try:
+                outcome.artifact = builder.build_with_context(
+                    node.pass_type,
+                    packed.context,
+                    packing_report=packed.packing_report,
+                    depends_on=[a.id for a in inputs],
+                )
+            finally:
+                self._rate_limiter.release(self._provider)
+        except Exception as e:
+            outcome.status = RebuildStatus.FAILED
+            outcome.error = str(e)
+        else:
+            if outcome.artifact.artifact_type == ArtifactType.FAILURE_REPORT:
+                outcome.status = RebuildStatus.FAILED
+                outcome.error = getattr(
+                    outcome.artifact.payload, "summary", "Compilation failed"
+                )
+            else:
+                self._metadata_store.update(
+                    outcome.artifact.id, {INPUT_HASH_KEY: input_hash}
+                )
+                outcome.status = RebuildStatus.REBUILT
+
+        outcome.duration_ms = (time.perf_counter() - start) * 1000
+        return outcome
+
+    def _load_current(
+        self,
+    ) -> tuple[dict[str, ArtifactEnvelope[BaseModel]], dict[str, str]]:
+        """Load the current artifact of every node.
+
+        Returns:
+            Tuple of (current artifact per key, node key per artifact ID
+            for every version, so links to superseded versions resolve to
+            the current one).
+        """
+        current: dict[str, ArtifactEnvelope[BaseModel]] = {}
+        ids: dict[str, str] = {}
+        for artifact_type in ARTIFACT_PASS_MAP:
+            for artifact in self._storage.list_by_type(artifact_type):
+                key = node_key(artifact)
+                ids[str(artifact.id)] = key
+                latest = current.get(key)
+                if latest is None or artifact.created_at > latest.created_at:
+                    current[key] = artifact
+        return current, ids
+
+    @staticmethod
+    def _build_graph(
+        current: dict[str, ArtifactEnvelope[BaseModel]],
+        ids: dict[str, str],
+    ) -> dict[str, set[str]]:
+        """Build the dependency graph between current artifacts.
+
+        Args:
+            current: Current artifact per key.
+            ids: Node key per artifact ID.
+
+        Returns:
+            Mapping of node key to the keys it depends on.
+        """
+        keys_by_type: dict[ArtifactType, list[str]] = {}
+        for key, artifact in current.items():
+            keys_by_type.setdefault(artifact.artifact_type, []).append(key)
+
+        graph: dict[str, set[str]] = {}
+        for key, artifact in current.items():
+            pass_type = ARTIFACT_PASS_MAP[artifact.artifact_type]
+            deps: set[str] = set()
+            for required in PASS_REQUIREMENTS[pass_type].get("required_artifacts", []):
+                deps.update(keys_by_type.get(required, []))
+            for dep_id in artifact.depends_on:
+                dep_key = ids.get(str(dep_id))
+                if dep_key is not None:
+                    deps.add(dep_key)
+            deps.discard(key)
+            graph[key] = deps
+        return graph
+
+    def _project_files(self) -> dict[str, dict[str, str]]:
+        """Read the intake files each pass depends on.
+
+        Returns:
+            Mapping of pass type value to its files (name -> content).
+        """
+        project_dir = self._project_root / ".project"
+        files: dict[str, dict[str, str]] = {}
+        for pass_type in ARTIFACT_PASS_MAP.values():
+            files[pass_type.value] = {
+                name: (project_dir / name).read_text(encoding="utf-8")
+                for name in PASS_REQUIREMENTS[pass_type].get("required_files", [])
+                if (project_dir / name).exists()
+            }
+        return files
+
+    @staticmethod
+    def _input_hash(
+        pass_type: CompilerPassType,
+        artifact: ArtifactEnvelope[BaseModel],
+        dependencies: list[str],
+        current: dict[str, ArtifactEnvelope[BaseModel]],
+        project_files: dict[str, dict[str, str]],
+    ) -> str:
+        """Compute a node's input hash from the current upstream artifacts."""
+        return compute_input_hash(
+            project_files[pass_type.value],
+            {d: current[d].payload.model_dump(mode="json") for d in dependencies},
+            target_file=(
+                getattr(artifact.payload, "target", None)
+                if pass_type == CompilerPassType.IMPLEMENTATION
+                else None
+            ),
+        )
+
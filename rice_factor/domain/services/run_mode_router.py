@@ -154,6 +154,15 @@ class RunModeRouter:
         coordinator = self.get_coordinator()
         return await coordinator.coordinate(context)
 
+    async def close(self) -> None:
+        """Close the coordinator (and its message bus) if one was created.
+
+        A later coordinate() call creates a fresh coordinator.
+        """
+        if self._coordinator is not None:
+            await self._coordinator.close()
+            self._coordinator = None
+
     @classmethod
     def from_cli_mode(
         cls,
@@ -12,7 +12,10 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rice_factor.adapters.parsing.symbol_index import SymbolIndex
 
 
 class RiskLevel(Enum):
@@ -198,6 +201,8 @@ class SafetyAnalyzer:
         repo_root: Root directory of the repository.
         test_patterns: Patterns for identifying test files.
         public_patterns: Patterns for identifying public APIs.
+        symbol_index: Optional symbol index used for usage checks instead
+            of scanning every file.
     """
 
     repo_root: Path
@@ -207,6 +212,7 @@ class SafetyAnalyzer:
     public_patterns: list[str] = field(
         default_factory=lambda: ["**/__init__.py", "**/api.py", "**/public.py"]
     )
+    symbol_index: SymbolIndex | None = None
 
     def analyze(self, plan: RefactoringPlan) -> SafetyReport:
         """Analyze a refactoring plan for safety.
@@ -588,7 +594,44 @@ class SafetyAnalyzer:
         if directory is None:
             directory = self.repo_root
 
+        usages = self._indexed_usages(symbol, directory)
+        if usages is None:
+            usages = self._scan_usages(symbol, directory)
+
         impacts: list[FileImpact] = []
+        for file_path, lines_affected in usages:
+            is_test = self._is_test_file(file_path)
+            impacts.append(
+                FileImpact(
+                    file_path=str(file_path),
+                    impact_type=(
+                        ImpactType.TEST_IMPACT
+                        if is_test
+                        else ImpactType.DEPENDENCY_CHANGE
+                    ),
+                    changes_count=len(lines_affected),
+                    lines_affected=lines_affected,
+                    description=f"Symbol '{symbol}' found in {len(lines_affected)} locations",
+                )
+            )
+
+        return impacts
+
+    def _scan_usages(
+        self,
+        symbol: str,
+        directory: Path,
+    ) -> list[tuple[Path, list[int]]]:
+        """Find the lines using a symbol by reading every Python file.
+
+        Args:
+            symbol: Symbol name to search for.
+            directory: Directory to search.
+
+        Returns:
+            List of (file path, line numbers) for files using the symbol.
+        """
+        usages: list[tuple[Path, list[int]]] = []
         pattern = r"\b" + re.escape(symbol) + r"\b"
 
         for file_path in directory.rglob("*.py"):
@@ -603,22 +646,39 @@ class SafetyAnalyzer:
                     lines_affected.append(i)
 
             if lines_affected:
-                is_test = self._is_test_file(file_path)
-                impacts.append(
-                    FileImpact(
-                        file_path=str(file_path),
-                        impact_type=(
-                            ImpactType.TEST_IMPACT
-                            if is_test
-                            else ImpactType.DEPENDENCY_CHANGE
-                        ),
-                        changes_count=len(lines_affected),
-                        lines_affected=lines_affected,
-                        description=f"Symbol '{symbol}' found in {len(lines_affected)} locations",
-                    )
-                )
+                usages.append((file_path, lines_affected))
 
-        return impacts
+        return usages
+
+    def _indexed_usages(
+        self,
+        symbol: str,
+        directory: Path,
+    ) -> list[tuple[Path, list[int]]] | None:
+        """Find the lines using a symbol from the symbol index.
+
+        Args:
+            symbol: Symbol name to search for.
+            directory: Directory to search.
+
+        Returns:
+            List of (file path, line numbers) for Python files using the
+            symbol, or None if there is no index covering directory.
+        """
+        if self.symbol_index is None or not symbol.isidentifier():
+            return None
+        try:
+            prefix = directory.resolve().relative_to(self.symbol_index.project_root)
+        except ValueError:
+            return None
+
+        self.symbol_index.refresh()
+        scope = "" if prefix == Path() else f"{prefix.as_posix()}/"
+        return [
+            (directory / path[len(scope) :], lines)
+            for path, lines in self.symbol_index.reference_lines(symbol).items()
+            if path.endswith(".py") and path.startswith(scope)
+        ]
 
     def estimate_complexity(
         self,
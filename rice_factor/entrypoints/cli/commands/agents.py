@@ -6,15 +6,18 @@ This module provides CLI commands for managing coding agents:
 """
 
 import json
+import time
 
 import typer
 from rich.panel import Panel
 from rich.table import Table
 
+from rice_factor.adapters.llm.cli.availability_cache import (
+    create_agent_cache_from_config,
+)
 from rice_factor.adapters.llm.cli.detector import CLIAgentDetector, DetectedAgent
 from rice_factor.entrypoints.cli.utils import (
     console,
-    handle_errors,
     info,
     success,
     warning,
@@ -27,6 +30,48 @@ app = typer.Typer(
 )
 
 
+def _get_detector(refresh: bool = False) -> CLIAgentDetector:
+    """Create a detector backed by the persistent probe cache.
+
+    Args:
+        refresh: Drop cached probes so every agent is re-detected.
+
+    Returns:
+        CLIAgentDetector instance.
+    """
+    cache = create_agent_cache_from_config()
+    if cache is not None and refresh:
+        cache.clear()
+    return CLIAgentDetector(cache=cache)
+
+
+def _format_age(checked_at: float | None) -> str:
+    """Format how long ago an agent was probed.
+
+    Args:
+        checked_at: Unix time of the probe, or None.
+
+    Returns:
+        Human-readable age such as "5m ago".
+    """
+    if checked_at is None:
+        return "-"
+    age = max(0, int(time.time() - checked_at))
+    if age < 5:
+        return "just now"
+    for unit, seconds in (("d", 86400), ("h", 3600), ("m", 60)):
+        if age >= seconds:
+            return f"{age // seconds}{unit} ago"
+    return f"{age}s ago"
+
+
+def _cache_age_seconds(checked_at: float | None) -> float | None:
+    """Return seconds since a probe, for JSON output."""
+    if checked_at is None:
+        return None
+    return round(max(0.0, time.time() - checked_at), 1)
+
+
 def _create_agents_table(agents: list[DetectedAgent]) -> Table:
     """Create a table showing agent information.
 
@@ -42,6 +87,7 @@ def _create_agents_table(agents: list[DetectedAgent]) -> Table:
     table.add_column("Status")
     table.add_column("Version")
     table.add_column("Path", style="dim")
+    table.add_column("Checked", style="dim")
 
     for agent in sorted(agents, key=lambda a: a.name):
         status = (
@@ -60,6 +106,7 @@ def _create_agents_table(agents: list[DetectedAgent]) -> Table:
             status,
             version,
             path,
+            _format_age(agent.checked_at),
         )
 
     return table
@@ -77,17 +124,19 @@ def detect_agents(
     """Detect available CLI coding agents on the system.
 
     Scans the system PATH for known CLI coding tools (Claude Code, Codex,
-    Gemini CLI, Aider, etc.) and reports their availability.
+    Gemini CLI, Aider, etc.) and reports their availability. Results are
+    cached between runs; the Checked column shows the age of each probe.
 
     Examples:
         rice-factor agents detect
+        rice-factor agents detect --refresh
         rice-factor agents detect --json
     """
-    detector = CLIAgentDetector()
+    detector = _get_detector(refresh=refresh)
     agents = detector.detect_all()
 
     if json_output:
-        output = detector.to_dict()
+        output = detector.to_dict(agents)
         output["summary"] = {
             "total": len(agents),
             "available": sum(1 for a in agents if a.available),
@@ -140,7 +189,7 @@ def list_agents(
         rice-factor agents list
         rice-factor agents list --available
     """
-    detector = CLIAgentDetector()
+    detector = _get_detector()
     agents = detector.detect_all()
 
     if available_only:
@@ -155,6 +204,7 @@ def list_agents(
                     "available": a.available,
                     "version": a.version,
                     "path": a.path,
+                    "cache_age_seconds": _cache_age_seconds(a.checked_at),
                 }
                 for a in agents
             ],
@@ -188,7 +238,7 @@ def check_agent(
         rice-factor agents check claude_code
         rice-factor agents check aider
     """
-    detector = CLIAgentDetector()
+    detector = _get_detector()
 
     if name not in detector.configs:
         warning(f"Unknown agent: {name}")
@@ -204,6 +254,8 @@ def check_agent(
             info(f"Version: {agent.version}")
         if agent.path:
             info(f"Path: {agent.path}")
+        if agent.checked_at is not None:
+            info(f"Checked: {_format_age(agent.checked_at)}")
     else:
         warning(f"{name} is not installed")
         info(f"Expected command: {agent.command}")
@@ -6,14 +6,17 @@ from typing import TYPE_CHECKING, Any, cast
 import typer
 
 from rice_factor.adapters.llm import create_llm_adapter_from_config
+from rice_factor.adapters.llm.batching import BatchingAdapter
 from rice_factor.adapters.llm.stub import StubLLMAdapter
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
 from rice_factor.adapters.executors.audit_logger import AuditLogger
 from rice_factor.adapters.llm import LLMAdapter
+from rice_factor.adapters.parsing import TreeSitterAdapter
 from rice_factor.adapters.storage.approvals import ApprovalsTracker
 from rice_factor.adapters.storage.filesystem import FilesystemStorageAdapter
+from rice_factor.adapters.storage.metadata import ArtifactMetadataStore
 from rice_factor.config.run_mode_config import RunMode
 from rice_factor.config.settings import settings
 from rice_factor.domain.artifacts.compiler_types import CompilerPassType
@@ -21,8 +24,15 @@ from rice_factor.domain.artifacts.enums import ArtifactType
 from rice_factor.domain.artifacts.envelope import ArtifactEnvelope
 from rice_factor.domain.models.lifecycle import ReviewUrgency
 from rice_factor.domain.services.artifact_builder import ArtifactBuilder
+from rice_factor.domain.services.artifact_resolver import ArtifactResolver
 from rice_factor.domain.services.artifact_service import ArtifactService
+from rice_factor.domain.services.batch_compiler import (
+    BatchCompiler,
+    BatchCompileResult,
+    TargetCompileResult,
+)
 from rice_factor.domain.services.context_builder import ContextBuilder, ContextBuilderError
+from rice_factor.domain.services.context_packer import create_context_packer
 from rice_factor.domain.services.intake_validator import IntakeValidator
 from rice_factor.domain.services.phase_service import PhaseService
 from rice_factor.domain.services.run_mode_router import RunModeRouter
@@ -54,26 +64,90 @@ def _get_artifact_service(project_root: Path) -> ArtifactService:
     return ArtifactService(storage=storage, approvals=approvals)
 
 
-def _get_artifact_builder(project_root: Path, use_stub: bool = False) -> ArtifactBuilder:
+def _get_context_builder(project_root: Path) -> ContextBuilder:
+    """Create a context builder for the given project root.
+
+    Args:
+        project_root: Root directory of the project
+
+    Returns:
+        Configured ContextBuilder
+    """
+    storage = FilesystemStorageAdapter(artifacts_dir=project_root / "artifacts")
+    return ContextBuilder(
+        storage_adapter=storage,
+        packer=create_context_packer(
+            settings.get("context.token_budget"), ast_port=TreeSitterAdapter()
+        ),
+    )
+
+
+def _get_artifact_builder(
+    project_root: Path,
+    use_stub: bool = False,
+    context_builder: ContextBuilder | None = None,
+    batch_size: int | None = None,
+) -> ArtifactBuilder:
     """Create an artifact builder with configured LLM.
 
     Args:
         project_root: Root directory of the project
         use_stub: If True, use StubLLMAdapter instead of real LLM
+        context_builder: Context builder to use (created if not provided)
+        batch_size: If set and the LLM adapter supports generate_batch,
+            concurrent generations are coalesced into batches of this size
 
     Returns:
         Configured ArtifactBuilder
     """
     artifacts_dir = project_root / "artifacts"
     storage = FilesystemStorageAdapter(artifacts_dir=artifacts_dir)
-    context_builder = ContextBuilder(storage_adapter=storage)
+    if context_builder is None:
+        context_builder = _get_context_builder(project_root)
 
-    llm: LLMAdapter = StubLLMAdapter() if use_stub else create_llm_adapter_from_config()
+    llm: LLMAdapter | BatchingAdapter = (
+        StubLLMAdapter() if use_stub else create_llm_adapter_from_config()
+    )
+    if batch_size is not None and hasattr(llm, "generate_batch"):
+        llm = BatchingAdapter(llm, max_batch_size=batch_size)  # type: ignore[arg-type]
 
     return ArtifactBuilder(
         llm_port=llm,  # type: ignore[arg-type]  # LLM adapters implement LLMPort
         storage=storage,  # type: ignore[arg-type]  # FilesystemStorageAdapter implements StoragePort
         context_builder=context_builder,
+        metadata_store=ArtifactMetadataStore(artifacts_dir),
+    )
+
+
+def _get_batch_compiler(
+    project_root: Path,
+    use_stub: bool = False,
+    concurrency: int | None = None,
+) -> BatchCompiler:
+    """Create a batch compiler sharing one context builder.
+
+    Args:
+        project_root: Root directory of the project
+        use_stub: If True, use StubLLMAdapter instead of real LLM
+        concurrency: Maximum concurrent compilations (from config if None)
+
+    Returns:
+        Configured BatchCompiler
+    """
+    context_builder = _get_context_builder(project_root)
+    max_concurrency = concurrency or settings.get("execution.max_concurrency", 4)
+    return BatchCompiler(
+        # Concurrent targets share batched requests on servers that support it
+        artifact_builder=_get_artifact_builder(
+            project_root,
+            use_stub=use_stub,
+            context_builder=context_builder,
+            batch_size=max_concurrency,
+        ),
+        context_builder=context_builder,
+        max_concurrency=max_concurrency,
+        max_retries=settings.get("execution.max_retries", 3),
+        provider="stub" if use_stub else settings.get("llm.provider", "claude"),
     )
 
 
@@ -512,7 +586,18 @@ def tests(
 @app.command("impl")
 @handle_errors
 def implementation(
-    target: str = typer.Argument(..., help="Target file to generate implementation for"),
+    targets: list[str] | None = typer.Argument(
+        None, help="Target file(s) or glob patterns to generate implementation plans for"
+    ),
+    all_scaffolded: bool = typer.Option(
+        False, "--all-scaffolded", help="Plan every source file in the latest ScaffoldPlan"
+    ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-j",
+        help="Maximum concurrent compilations (default: execution.max_concurrency)",
+    ),
     path: str = typer.Option(".", "--path", "-p", help="Project root directory"),
     dry_run: bool = typer.Option(
         False, "--dry-run", "-n", help="Show what would be created without saving"
@@ -524,13 +609,18 @@ def implementation(
         None, "--mode", "-m", help=_get_mode_help()
     ),
 ) -> None:
-    """Generate an ImplementationPlan artifact for a specific file.
+    """Generate ImplementationPlan artifacts for one or more files.
 
-    Defines implementation steps for a single target file.
+    Defines implementation steps per target file. Several targets (globs
+    or --all-scaffolded) are compiled concurrently from shared context.
     Requires TestPlan to be locked (Phase: TEST_LOCKED+).
     """
     project_root = Path(path).resolve()
 
+    if not targets and not all_scaffolded:
+        error("Provide a target file, a glob pattern or --all-scaffolded")
+        raise typer.Exit(1)
+
     # Check phase
     _check_phase(project_root, "plan impl")
 
@@ -565,10 +655,25 @@ def implementation(
         error(f"Lock verification failed: {e}")
         raise typer.Exit(1) from None
 
+    target_files = _resolve_impl_targets(project_root, targets or [], all_scaffolded)
+    if not target_files:
+        error("No target files matched")
+        raise typer.Exit(1)
+
+    is_batch = all_scaffolded or len(target_files) > 1 or target_files != targets
+
+    if dry_run and is_batch:
+        info("Dry run mode - artifacts not saved")
+        console.print()
+        console.print(f"[bold]Would create {len(target_files)} ImplementationPlans:[/bold]")
+        for target_file in target_files:
+            console.print(f"    - {target_file}")
+        return
+
     if dry_run:
         # Use stub for dry run to avoid API calls
         llm = StubLLMAdapter()
-        payload = llm.generate_implementation_plan(target)
+        payload = llm.generate_implementation_plan(target_files[0])
         info("Dry run mode - artifact not saved")
         console.print()
         console.print("[bold]Would create ImplementationPlan:[/bold]")
@@ -587,13 +692,17 @@ def implementation(
     if mode:
         _display_mode_info(mode, project_root)
 
+    if is_batch:
+        _plan_impl_batch(project_root, target_files, use_stub, concurrency)
+        return
+
     # Build artifact using ArtifactBuilder
     try:
         builder = _get_artifact_builder(project_root, use_stub=use_stub)
         artifact = builder.build(
             pass_type=CompilerPassType.IMPLEMENTATION,
             project_root=project_root,
-            target_file=target,
+            target_file=target_files[0],
         )
     except ContextBuilderError as e:
         error(f"Context error: {e}")
@@ -616,6 +725,145 @@ def implementation(
     )
 
 
+def _resolve_impl_targets(
+    project_root: Path,
+    patterns: list[str],
+    all_scaffolded: bool,
+) -> list[str]:
+    """Resolve target arguments to a de-duplicated list of files.
+
+    Arguments containing glob characters are matched against files under
+    the project root; plain paths are taken as given (they may not exist
+    yet).
+
+    Args:
+        project_root: Root directory of the project
+        patterns: Target files or glob patterns
+        all_scaffolded: Include all source files of the latest ScaffoldPlan
+
+    Returns:
+        Target file paths relative to the project root
+    """
+    target_files: list[str] = []
+    if all_scaffolded:
+        target_files.extend(_get_scaffolded_source_files(project_root))
+
+    for pattern in patterns:
+        if any(char in pattern for char in "*?["):
+            target_files.extend(
+                sorted(
+                    match.relative_to(project_root).as_posix()
+                    for match in project_root.glob(pattern)
+                    if match.is_file()
+                )
+            )
+        else:
+            target_files.append(pattern)
+
+    return list(dict.fromkeys(target_files))
+
+
+def _get_scaffolded_source_files(project_root: Path) -> list[str]:
+    """Get source file paths from the most recent ScaffoldPlan.
+
+    Args:
+        project_root: Root directory of the project
+
+    Returns:
+        List of source file paths (empty if there is no ScaffoldPlan)
+    """
+    from rice_factor.domain.artifacts.payloads.scaffold_plan import (
+        FileKind,
+        ScaffoldPlanPayload,
+    )
+
+    storage = FilesystemStorageAdapter(artifacts_dir=project_root / "artifacts")
+    scaffold = ArtifactResolver(storage=storage).resolve_latest_by_type(
+        ArtifactType.SCAFFOLD_PLAN
+    )
+    if scaffold is None or not isinstance(scaffold.payload, ScaffoldPlanPayload):
+        return []
+
+    return [
+        file_entry.path
+        for file_entry in scaffold.payload.files
+        if file_entry.kind == FileKind.SOURCE
+    ]
+
+
+def _plan_impl_batch(
+    project_root: Path,
+    target_files: list[str],
+    use_stub: bool,
+    concurrency: int | None,
+) -> BatchCompileResult:
+    """Compile ImplementationPlans for several targets with live progress.
+
+    Args:
+        project_root: Root directory of the project
+        target_files: Target files to plan
+        use_stub: If True, use StubLLMAdapter instead of real LLM
+        concurrency: Maximum concurrent compilations (from config if None)
+
+    Returns:
+        The batch result
+
+    Raises:
+        typer.Exit: If context building fails or any target failed
+    """
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+
+    compiler = _get_batch_compiler(project_root, use_stub=use_stub, concurrency=concurrency)
+    info(
+        f"Planning {len(target_files)} files "
+        f"(concurrency: {compiler.max_concurrency})"
+    )
+
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task("ImplementationPlans", total=len(target_files))
+
+        def on_result(result: TargetCompileResult) -> None:
+            if result.succeeded and result.artifact is not None:
+                progress.console.print(
+                    f"  [green]✓[/green] {result.target_file} [dim]{result.artifact.id}[/dim]"
+                )
+            else:
+                progress.console.print(
+                    f"  [red]✗[/red] {result.target_file}: {result.error}"
+                )
+            progress.advance(task)
+
+        try:
+            batch = compiler.compile_targets(
+                pass_type=CompilerPassType.IMPLEMENTATION,
+                project_root=project_root,
+                target_files=target_files,
+                on_result=on_result,
+            )
+        except ContextBuilderError as e:
+            error(f"Context error: {e}")
+            raise typer.Exit(1) from None
+
+    console.print()
+    if batch.all_succeeded:
+        success(f"Created {len(batch.succeeded)} ImplementationPlan artifacts")
+        info("Run 'rice-factor approve <id>' to approve each artifact")
+        return batch
+
+    warning(
+        f"Created {len(batch.succeeded)} of {len(batch.results)} ImplementationPlans; "
+        f"{len(batch.failed)} failed"
+    )
+    for result in batch.failed:
+        console.print(f"  [red]{result.target_file}[/red] [dim]{result.error}[/dim]")
+    raise typer.Exit(1)
+
+
 @app.command()
 @handle_errors
 def refactor(
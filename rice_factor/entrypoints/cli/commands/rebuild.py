@@ -0,0 +1,248 @@
+"""Rebuild command for recompiling stale artifacts.
+
+This module provides the ``rice-factor rebuild`` command. It prints a
+build plan of the artifacts whose inputs changed, then recompiles them in
+dependency order, one level at a time and concurrently within a level.
+"""
+
+import json
+from pathlib import Path
+
+import typer
+from rich.table import Table
+
+from rice_factor.adapters.llm import create_llm_adapter_from_config
+from rice_factor.adapters.llm.stub import StubLLMAdapter
+from rice_factor.adapters.parsing import TreeSitterAdapter
+from rice_factor.adapters.storage.filesystem import FilesystemStorageAdapter
+from rice_factor.adapters.storage.metadata import ArtifactMetadataStore
+from rice_factor.config.settings import settings
+from rice_factor.domain.services.artifact_builder import ArtifactBuilder
+from rice_factor.domain.services.context_builder import ContextBuilder
+from rice_factor.domain.services.context_packer import create_context_packer
+from rice_factor.domain.services.rebuild_service import (
+    RebuildAction,
+    RebuildOutcome,
+    RebuildPlan,
+    RebuildService,
+    RebuildStatus,
+)
+from rice_factor.entrypoints.cli.utils import (
+    console,
+    error,
+    handle_errors,
+    info,
+    success,
+    warning,
+)
+
+_ACTION_STYLES: dict[RebuildAction, str] = {
+    RebuildAction.BUILD: "yellow",
+    RebuildAction.CHECK: "cyan",
+    RebuildAction.UP_TO_DATE: "green",
+    RebuildAction.LOCKED: "dim",
+}
+
+
+def _get_rebuild_service(
+    project_root: Path,
+    use_stub: bool = False,
+    concurrency: int | None = None,
+    with_builders: bool = True,
+) -> RebuildService:
+    """Create a rebuild service for the given project root.
+
+    Args:
+        project_root: Root directory of the project
+        use_stub: If True, use StubLLMAdapter instead of real LLM
+        concurrency: Maximum concurrent compilations (from config if None)
+        with_builders: Whether to create the builders needed to recompile
+
+    Returns:
+        Configured RebuildService
+    """
+    storage = FilesystemStorageAdapter(artifacts_dir=project_root / "artifacts")
+    # Shared so builder and service never overwrite each other's metadata
+    metadata_store = ArtifactMetadataStore(storage.artifacts_dir)
+    artifact_builder = None
+    context_builder = None
+    if with_builders:
+        context_builder = ContextBuilder(
+            storage_adapter=storage,
+            packer=create_context_packer(
+                settings.get("context.token_budget"), ast_port=TreeSitterAdapter()
+            ),
+        )
+        llm = StubLLMAdapter() if use_stub else create_llm_adapter_from_config()
+        artifact_builder = ArtifactBuilder(
+            llm_port=llm,  # type: ignore[arg-type]  # LLM adapters implement LLMPort
+            storage=storage,  # type: ignore[arg-type]  # FilesystemStorageAdapter implements StoragePort
+            context_builder=context_builder,
+            metadata_store=metadata_store,
+        )
+
+    return RebuildService(
+        storage=storage,
+        project_root=project_root,
+        artifact_builder=artifact_builder,
+        context_builder=context_builder,
+        max_concurrency=concurrency or settings.get("execution.max_concurrency", 4),
+        provider="stub" if use_stub else settings.get("llm.provider", "claude"),
+        metadata_store=metadata_store,
+    )
+
+
+def _display_plan(plan: RebuildPlan, show_all: bool) -> None:
+    """Display the build plan as a table, one row per artifact.
+
+    Args:
+        plan: The plan to display
+        show_all: Include up-to-date and locked artifacts
+    """
+    table = Table(title="Build Plan")
+    table.add_column("Level", justify="right")
+    table.add_column("Artifact", style="cyan")
+    table.add_column("ID", style="dim")
+    table.add_column("Action")
+    table.add_column("Reason")
+
+    for index, level in enumerate(plan.levels, 1):
+        for node in level:
+            if not show_all and node.action not in (
+                RebuildAction.BUILD,
+                RebuildAction.CHECK,
+            ):
+                continue
+            style = _ACTION_STYLES[node.action]
+            table.add_row(
+                str(index),
+                node.key,
+                str(node.artifact.id)[:8],
+                f"[{style}]{node.action.value}[/{style}]",
+                node.reason,
+            )
+
+    console.print(table)
+
+
+def _display_outcome(outcome: RebuildOutcome) -> None:
+    """Print one line for a finished artifact.
+
+    Args:
+        outcome: The rebuild outcome
+    """
+    if outcome.status == RebuildStatus.REBUILT and outcome.artifact is not None:
+        console.print(
+            f"  [green]✓[/green] {outcome.key} [dim]{outcome.artifact.id}[/dim]"
+        )
+    elif outcome.status == RebuildStatus.UNCHANGED:
+        console.print(f"  [dim]= {outcome.key} (inputs unchanged)[/dim]")
+    elif outcome.status == RebuildStatus.SKIPPED:
+        console.print(f"  [yellow]-[/yellow] {outcome.key}: {outcome.error}")
+    else:
+        console.print(f"  [red]✗[/red] {outcome.key}: {outcome.error}")
+
+
+@handle_errors
+def rebuild(
+    path: str = typer.Option(".", "--path", "-p", help="Project root directory"),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Print the build plan without rebuilding"
+    ),
+    touch: bool = typer.Option(
+        False,
+        "--touch",
+        "-t",
+        help="Record current inputs as built, without recompiling",
+    ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-j",
+        help="Maximum concurrent compilations (default: execution.max_concurrency)",
+    ),
+    show_all: bool = typer.Option(
+        False, "--all", "-a", help="Show up-to-date artifacts in the plan"
+    ),
+    use_stub: bool = typer.Option(
+        False, "--stub", help="Use stub LLM for testing (no API calls)"
+    ),
+    output_json: bool = typer.Option(
+        False, "--json", help="Output the plan (and result) as JSON"
+    ),
+) -> None:
+    """Recompile artifacts whose upstream inputs changed.
+
+    Computes the stale set from artifact dependencies and input hashes,
+    prints the build plan, then recompiles each dependency level
+    concurrently. Artifacts whose inputs hash to an unchanged value are
+    skipped. Rebuilt artifacts are new DRAFTs and need approval again.
+
+    Example:
+        rice-factor rebuild -n
+        rice-factor rebuild -j 8
+    """
+    project_root = Path(path).resolve()
+    service = _get_rebuild_service(
+        project_root,
+        use_stub=use_stub,
+        concurrency=concurrency,
+        with_builders=not (dry_run or touch),
+    )
+
+    try:
+        plan = service.plan()
+    except ValueError as e:
+        error(str(e))
+        raise typer.Exit(1) from None
+
+    if output_json and (dry_run or plan.is_up_to_date):
+        console.print(json.dumps(plan.to_dict(), indent=2))
+        return
+
+    if not output_json:
+        _display_plan(plan, show_all)
+
+    if touch:
+        stamped = service.touch(plan)
+        success(f"Recorded inputs of {len(stamped)} artifacts")
+        return
+
+    if plan.is_up_to_date:
+        success("All artifacts are up to date")
+        return
+
+    if dry_run:
+        info(f"Dry run - {len(plan.stale)} artifacts would be rebuilt or checked")
+        return
+
+    if not output_json:
+        info(
+            f"Rebuilding {len(plan.stale)} artifacts "
+            f"(concurrency: {service.max_concurrency})"
+        )
+    result = service.rebuild(
+        plan, on_result=None if output_json else _display_outcome
+    )
+
+    if output_json:
+        console.print(
+            json.dumps({"plan": plan.to_dict(), "result": result.to_dict()}, indent=2)
+        )
+    else:
+        console.print()
+        rebuilt = len(result.by_status(RebuildStatus.REBUILT))
+        unchanged = len(result.by_status(RebuildStatus.UNCHANGED))
+        if result.all_succeeded:
+            success(f"Rebuilt {rebuilt} artifacts ({unchanged} unchanged)")
+            if rebuilt:
+                info("Run 'rice-factor approve <id>' to approve each rebuilt artifact")
+        else:
+            warning(
+                f"Rebuilt {rebuilt} artifacts; "
+                f"{len(result.by_status(RebuildStatus.FAILED))} failed, "
+                f"{len(result.by_status(RebuildStatus.SKIPPED))} skipped"
+            )
+
+    if not result.all_succeeded:
+        raise typer.Exit(1)
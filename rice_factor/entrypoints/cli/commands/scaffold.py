@@ -13,8 +13,10 @@ from rice_factor.adapters.llm.stub import StubLLMAdapter
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
+from rice_factor.adapters.parsing import TreeSitterAdapter
 from rice_factor.adapters.storage.approvals import ApprovalsTracker
 from rice_factor.adapters.storage.filesystem import FilesystemStorageAdapter
+from rice_factor.adapters.storage.metadata import ArtifactMetadataStore
 from rice_factor.config.settings import settings
 from rice_factor.domain.artifacts.compiler_types import CompilerPassType
 from rice_factor.domain.artifacts.enums import ArtifactType
@@ -23,6 +25,7 @@ from rice_factor.domain.artifacts.payloads.scaffold_plan import FileKind, Scaffo
 from rice_factor.domain.services.artifact_builder import ArtifactBuilder
 from rice_factor.domain.services.artifact_service import ArtifactService
 from rice_factor.domain.services.context_builder import ContextBuilder, ContextBuilderError
+from rice_factor.domain.services.context_packer import create_context_packer
 from rice_factor.domain.services.phase_service import PhaseService
 from rice_factor.domain.services.scaffold_service import ScaffoldService
 from rice_factor.entrypoints.cli.utils import (
@@ -74,7 +77,12 @@ def _get_artifact_builder(project_root: Path, use_stub: bool = False) -> Artifac
 
     artifacts_dir = project_root / "artifacts"
     storage = FilesystemStorageAdapter(artifacts_dir=artifacts_dir)
-    context_builder = ContextBuilder(storage_adapter=storage)
+    context_builder = ContextBuilder(
+        storage_adapter=storage,
+        packer=create_context_packer(
+            settings.get("context.token_budget"), ast_port=TreeSitterAdapter()
+        ),
+    )
 
     llm: LLMAdapter = StubLLMAdapter() if use_stub else create_llm_adapter_from_config()
 
@@ -82,6 +90,7 @@ def _get_artifact_builder(project_root: Path, use_stub: bool = False) -> Artifac
         llm_port=llm,  # type: ignore[arg-type]  # LLM adapters implement LLMPort
         storage=storage,  # type: ignore[arg-type]  # FilesystemStorageAdapter implements StoragePort
         context_builder=context_builder,
+        metadata_store=ArtifactMetadataStore(artifacts_dir),
     )
 
 
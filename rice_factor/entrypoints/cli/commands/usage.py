@@ -8,6 +8,7 @@ This module provides CLI commands for viewing and managing LLM usage:
 
 import json
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.panel import Panel
@@ -17,6 +18,7 @@ from rice_factor.adapters.llm.usage_tracker import (
     ProviderStats,
     get_usage_tracker,
 )
+from rice_factor.domain.services.output_repairer import get_repair_tracker
 from rice_factor.entrypoints.cli.utils import console, error, info, success, warning
 
 app = typer.Typer(
@@ -130,6 +132,34 @@ def _create_model_table(by_model: dict[str, float]) -> Table:
     return table
 
 
+def _create_repair_table(summary: dict[str, dict[str, Any]]) -> Table:
+    """Create a table showing targeted output repairs by pass.
+
+    Args:
+        summary: Dictionary of pass type to repair statistics.
+
+    Returns:
+        Rich Table object.
+    """
+    table = Table(title="Output Repairs by Pass")
+    table.add_column("Pass", style="bold cyan")
+    table.add_column("Repaired", justify="right")
+    table.add_column("Repair Tokens", justify="right")
+    table.add_column("Tokens Saved", justify="right")
+    table.add_column("Latency Saved", justify="right")
+
+    for pass_name, stats in sorted(summary.items()):
+        table.add_row(
+            pass_name,
+            f"{stats['repaired']}/{stats['repairs']}",
+            _format_tokens(stats["repair_tokens"]),
+            _format_tokens(stats["tokens_saved"]),
+            _format_latency(stats["latency_saved_ms"]),
+        )
+
+    return table
+
+
 @app.command("show")
 def show_usage(
     provider: str = typer.Option(
@@ -152,6 +182,7 @@ def show_usage(
 
     if json_output:
         data = tracker.export_json()
+        data["repairs"] = get_repair_tracker().summary()
         console.print(json.dumps(data, indent=2))
         return
 
@@ -185,6 +216,12 @@ def show_usage(
         console.print(_create_model_table(by_model))
         console.print()
 
+    # Show targeted repairs of invalid output
+    repairs = get_repair_tracker().summary()
+    if repairs:
+        console.print(_create_repair_table(repairs))
+        console.print()
+
     # Summary
     total_cost = tracker.total_cost()
     input_tokens, output_tokens = tracker.total_tokens()
@@ -86,6 +86,7 @@ from rice_factor.entrypoints.cli.commands import (
     models,
     override,
     plan,
+    rebuild,
     reconcile,
     refactor,
     resume,
@@ -117,6 +118,7 @@ app.add_typer(ci.app, name="ci")
 app.add_typer(audit.app, name="audit")
 app.add_typer(artifact.app, name="artifact")
 app.command(name="reconcile")(reconcile.reconcile)
+app.command(name="rebuild")(rebuild.rebuild)
 app.command(name="capabilities")(capabilities.capabilities)
 app.add_typer(migrate.app, name="migrate")
 app.add_typer(metrics.app, name="metrics")
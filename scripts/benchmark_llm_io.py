@@ -0,0 +1,294 @@
+"""Benchmark the LLM adapters' I/O path against a local stub server.
+
+Starts a StubLLMServer that answers with valid plans, then runs the plan
+and impl workflows through each adapter: one ProjectPlan request followed
+by ImplementationPlan requests for many targets sent concurrently, the way
+`plan impl` sends them (batch-capable adapters are wrapped in
+BatchingAdapter). Reports requests/sec, p50/p99 latency, the share of
+requests that reused a connection, and traced Python memory over the run.
+
+No network access is needed, so this can run in CI. --min-rps and
+--max-p99-ms make it exit non-zero on a regression.
+
+Usage:
+    python scripts/benchmark_llm_io.py [--adapters vllm ollama ...]
+        [--targets N] [--rounds N] [--concurrency N]
+        [--latency S] [--token-rate T] [--error-rate R]
+        [--min-rps N] [--max-p99-ms N] [--json PATH]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from rice_factor.adapters.llm import (
+    BatchingAdapter,
+    ClaudeAdapter,
+    OllamaAdapter,
+    OpenAIAdapter,
+    OpenAICompatAdapter,
+    StubLLMServer,
+    StubServerConfig,
+    VLLMAdapter,
+)
+from rice_factor.adapters.llm.stub_server import plan_responder
+from rice_factor.domain.artifacts.compiler_types import (
+    CompilerContext,
+    CompilerPassType,
+)
+from rice_factor.domain.services.passes import get_pass
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PROJECT_FILES = {
+    "requirements.md": "# Requirements\n\n"
+    + "\n".join(f"- The service handles use case {i}." for i in range(40)),
+    "constraints.md": "# Constraints\n\n- Python 3.11\n- Hexagonal architecture\n",
+    "glossary.md": "# Glossary\n\n"
+    + "\n".join(f"- Term{i}: definition {i}" for i in range(20)),
+}
+
+
+def build_adapter(name: str, base_url: str) -> Any:
+    """Create an adapter pointed at the stub server."""
+    # The SDK-based clients read their endpoint from the environment
+    os.environ["ANTHROPIC_BASE_URL"] = base_url
+    os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+    factories: dict[str, Callable[[], Any]] = {
+        "claude": lambda: ClaudeAdapter(api_key="stub", model="stub"),
+        "openai": lambda: OpenAIAdapter(api_key="stub", model="stub"),
+        "ollama": lambda: OllamaAdapter(base_url=base_url, model="stub"),
+        "vllm": lambda: VLLMAdapter(base_url=f"{base_url}/v1", model="stub"),
+        "openai_compat": lambda: OpenAICompatAdapter(
+            base_url=f"{base_url}/v1", model="stub"
+        ),
+    }
+    return factories[name]()
+
+
+class MemorySampler:
+    """Samples traced Python memory on a background thread."""
+
+    def __init__(self, interval: float = 0.1) -> None:
+        """Prepare a sampler taking a sample every interval seconds."""
+        self.interval = interval
+        self.samples: list[tuple[float, int]] = []
+        self._stop = threading.Event()
+        self._started = 0.0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "MemorySampler":
+        """Start sampling."""
+        tracemalloc.start()
+        self._started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        tracemalloc.stop()
+
+    def _sample(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        self.samples.append((time.perf_counter() - self._started, current))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+
+@dataclass
+class AdapterReport:
+    """Benchmark results for one adapter."""
+
+    adapter: str
+    requests: int
+    failed: int
+    invalid: int
+    elapsed_s: float
+    requests_per_s: float
+    p50_ms: float
+    p99_ms: float
+    http_requests: int
+    connections: int
+    connection_reuse: float
+    memory_start_kb: float
+    memory_peak_kb: float
+    memory_end_kb: float
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def run_workflows(
+    llm: Any, targets: int, rounds: int, concurrency: int
+) -> tuple[list[float], int, int]:
+    """Run the plan and impl workflows through one adapter.
+
+    Returns:
+        Tuple of (latencies in ms, failed requests, invalid payloads).
+    """
+    schemas = {
+        pass_type: get_pass(pass_type).get_output_schema()
+        for pass_type in (CompilerPassType.PROJECT, CompilerPassType.IMPLEMENTATION)
+    }
+    lock = threading.Lock()
+    latencies: list[float] = []
+    counts = {"failed": 0, "invalid": 0}
+
+    def call(pass_type: CompilerPassType, target: str | None = None) -> None:
+        context = CompilerContext(
+            pass_type=pass_type,
+            project_files=PROJECT_FILES,
+            artifacts={},
+            target_file=target,
+        )
+        start = time.perf_counter()
+        try:
+            result = llm.generate(pass_type, context, schemas[pass_type])
+            ok = result.success and result.payload is not None
+            valid = ok
+            if ok:
+                try:
+                    get_pass(pass_type).validate_output(result.payload)
+                except Exception:
+                    valid = False
+        except Exception:
+            ok = valid = False
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed_ms)
+            counts["failed"] += not ok
+            counts["invalid"] += ok and not valid
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(rounds):
+            call(CompilerPassType.PROJECT)
+            names = [f"src/module_{i}.py" for i in range(targets)]
+            list(pool.map(lambda t: call(CompilerPassType.IMPLEMENTATION, t), names))
+    return latencies, counts["failed"], counts["invalid"]
+
+
+def benchmark_adapter(
+    name: str, server: StubLLMServer, args: argparse.Namespace
+) -> AdapterReport:
+    """Benchmark one adapter against a running stub server."""
+    llm = build_adapter(name, server.base_url)
+    if hasattr(llm, "generate_batch"):
+        llm = BatchingAdapter(llm, max_batch_size=args.concurrency)
+    server.reset_stats()
+
+    with MemorySampler() as memory:
+        start = time.perf_counter()
+        latencies, failed, invalid = run_workflows(
+            llm, args.targets, args.rounds, args.concurrency
+        )
+        elapsed = time.perf_counter() - start
+
+    stats = server.stats
+    usage = [current / 1024 for _, current in memory.samples] or [0.0]
+    return AdapterReport(
+        adapter=name,
+        requests=len(latencies),
+        failed=failed,
+        invalid=invalid,
+        elapsed_s=elapsed,
+        requests_per_s=len(latencies) / elapsed if elapsed else 0.0,
+        p50_ms=percentile(latencies, 50),
+        p99_ms=percentile(latencies, 99),
+        http_requests=stats.requests,
+        connections=stats.connections,
+        connection_reuse=stats.connection_reuse,
+        memory_start_kb=usage[0],
+        memory_peak_kb=max(usage),
+        memory_end_kb=usage[-1],
+    )
+
+
+def main() -> int:
+    """Run the benchmark, print a report and check the thresholds."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--adapters",
+        nargs="+",
+        default=["claude", "openai", "ollama", "vllm", "openai_compat"],
+        help="Adapters to benchmark",
+    )
+    parser.add_argument("--targets", type=int, default=32, help="impl targets per round")
+    parser.add_argument("--rounds", type=int, default=3, help="plan + impl rounds")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent requests")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds to first token")
+    parser.add_argument("--token-rate", type=float, default=2000.0, help="Tokens per second")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Injected error rate")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for injected errors")
+    parser.add_argument("--min-rps", type=float, help="Fail below this requests/sec")
+    parser.add_argument("--max-p99-ms", type=float, help="Fail above this p99 latency")
+    parser.add_argument("--json", type=Path, help="Also write the reports to this file")
+    args = parser.parse_args()
+
+    config = StubServerConfig(
+        latency=args.latency,
+        token_rate=args.token_rate,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    reports: list[AdapterReport] = []
+    with StubLLMServer(config, responder=plan_responder) as server:
+        print(
+            f"Stub server {server.base_url}: latency {args.latency}s, "
+            f"{args.token_rate} tokens/s, error rate {args.error_rate}"
+        )
+        for name in args.adapters:
+            try:
+                reports.append(benchmark_adapter(name, server, args))
+            except Exception as e:
+                print(f"  {name:<14} skipped: {type(e).__name__}: {e}")
+
+    print(
+        f"  {'adapter':<14} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'failed':>6} {'invalid':>7} {'conns':>6} {'reuse':>6} {'mem peak':>10}"
+    )
+    for r in reports:
+        print(
+            f"  {r.adapter:<14} {r.requests_per_s:8.1f} {r.p50_ms:8.1f} {r.p99_ms:8.1f} "
+            f"{r.failed:6d} {r.invalid:7d} {r.connections:6d} "
+            f"{r.connection_reuse:6.0%} {r.memory_peak_kb:8.0f}KB"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps([asdict(r) for r in reports], indent=2))
+
+    regressions = [
+        f"{r.adapter}: {r.requests_per_s:.1f} req/s < {args.min_rps}"
+        for r in reports
+        if args.min_rps is not None and r.requests_per_s < args.min_rps
+    ] + [
+        f"{r.adapter}: p99 {r.p99_ms:.1f}ms > {args.max_p99_ms}ms"
+        for r in reports
+        if args.max_p99_ms is not None and r.p99_ms > args.max_p99_ms
+    ]
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Compare thread and process ParallelExecutor backends on artifact validation.
+
+Generates a directory of ImplementationPlan artifacts, then validates them
+with each backend. Workers are initialized with preload_schemas and receive
+file paths only, so the process backend does not pickle artifact contents.
+
+Usage:
+    python scripts/benchmark_parallel_backends.py [--count N] [--workers N]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+from rice_factor.adapters.validators import preload_schemas, validate_artifact_file
+from rice_factor.domain.services.parallel_executor import (
+    ExecutionBackend,
+    ExecutionTask,
+    ParallelExecutor,
+    ParallelismConfig,
+)
+
+
+def write_artifacts(directory: Path, count: int) -> list[Path]:
+    """Write count valid ImplementationPlan artifacts into directory."""
+    paths: list[Path] = []
+    for i in range(count):
+        artifact = {
+            "artifact_type": "ImplementationPlan",
+            "artifact_version": "1.0",
+            "id": str(uuid.uuid4()),
+            "status": "draft",
+            "created_at": datetime.now(UTC).isoformat(),
+            "created_by": "llm",
+            "payload": {
+                "target": f"src/module_{i}.py",
+                "steps": [f"Implement step {n} of module {i}" for n in range(20)],
+                "related_tests": [f"test_module_{i}_{n}" for n in range(10)],
+            },
+        }
+        path = directory / f"implementation_plan_{i}.json"
+        path.write_text(json.dumps(artifact), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def run_backend(
+    backend: ExecutionBackend, paths: list[Path], workers: int
+) -> tuple[float, int]:
+    """Validate every artifact with one backend.
+
+    Returns:
+        Tuple of (elapsed seconds, number of valid artifacts).
+    """
+    executor = ParallelExecutor(
+        config=ParallelismConfig(
+            max_workers=workers,
+            backend=backend,
+            initializer=preload_schemas,
+        )
+    )
+    tasks = [ExecutionTask.for_file(path, "ImplementationPlan") for path in paths]
+    start = time.perf_counter()
+    result = executor.execute_sync(tasks, validate_artifact_file)
+    return time.perf_counter() - start, result.completed_count
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000, help="Artifacts to validate")
+    parser.add_argument("--workers", type=int, default=4, help="Workers per backend")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="rice-factor-bench-") as tmp:
+        paths = write_artifacts(Path(tmp), args.count)
+        print(f"Validating {len(paths)} artifacts with {args.workers} workers")
+        timings: dict[ExecutionBackend, float] = {}
+        for backend in ExecutionBackend:
+            elapsed, valid = run_backend(backend, paths, args.workers)
+            timings[backend] = elapsed
+            rate = len(paths) / elapsed if elapsed else 0.0
+            print(
+                f"  {backend.value:<8} {elapsed:8.3f}s  "
+                f"{rate:10.1f} artifacts/s  ({valid} valid)"
+            )
+
+    speedup = timings[ExecutionBackend.THREAD] / timings[ExecutionBackend.PROCESS]
+    print(f"Process backend speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
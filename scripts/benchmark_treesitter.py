@@ -0,0 +1,170 @@
+"""Measure per-file tree-sitter extraction cost with and without query reuse.
+
+Generates a mixed-language sample tree (or uses --root), then parses every
+file with TreeSitterAdapter twice: once recompiling the language's queries
+for every file, as extraction used to, and once reusing the queries
+compiled on first use. The parse cache is disabled so every call parses.
+
+With --workers, it then times a cold parse_many() of the whole tree for
+each worker count, to show how bulk parsing scales with cores.
+
+Usage:
+    python scripts/benchmark_treesitter.py [--files-per-language N]
+        [--functions N] [--repeat N] [--root DIR] [--workers N ...]
+"""
+
+import argparse
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from rice_factor.adapters.parsing import ParseCache, TreeSitterAdapter
+
+# One file template per language; {i} is the file index, {body} the functions
+TEMPLATES: dict[str, tuple[str, str, str]] = {
+    "go": (
+        ".go",
+        'package m{i}\n\nimport (\n\t"fmt"\n\t"strings"\n)\n\n'
+        "type Service{i} struct {{ name string }}\n\n{body}",
+        "func (s *Service{i}) Op{n}(a int, b string) (int, error) {{\n"
+        '\treturn a + len(strings.TrimSpace(b)), fmt.Errorf("x")\n}}\n\n',
+    ),
+    "rust": (
+        ".rs",
+        "use std::collections::HashMap;\nuse std::io;\n\n"
+        "pub struct Service{i} {{ name: String }}\n\nimpl Service{i} {{\n{body}}}\n",
+        "    pub fn op{n}(&self, a: i32, b: &str) -> i32 {{ a + b.len() as i32 }}\n",
+    ),
+    "java": (
+        ".java",
+        "package m{i};\n\nimport java.util.List;\nimport java.util.Map;\n\n"
+        "public class Service{i} {{\n{body}}}\n",
+        "    public int op{n}(int a, String b) {{ return a + b.length(); }}\n",
+    ),
+    "typescript": (
+        ".ts",
+        'import {{ readFile }} from "fs";\nimport * as path from "path";\n\n'
+        "export class Service{i} {{\n{body}}}\n",
+        "  op{n}(a: number, b: string): number {{ return a + b.length; }}\n",
+    ),
+    "javascript": (
+        ".js",
+        'import fs from "fs";\nimport path from "path";\n\n'
+        "export class Service{i} {{\n{body}}}\n",
+        "  op{n}(a, b) {{ return a + b.length; }}\n",
+    ),
+    "ruby": (
+        ".rb",
+        'require "json"\nrequire "set"\n\nclass Service{i}\n{body}end\n',
+        "  def op{n}(a, b)\n    a + b.length\n  end\n",
+    ),
+}
+
+
+def write_sample_tree(root: Path, files_per_language: int, functions: int) -> None:
+    """Write files_per_language files of each templated language under root."""
+    for language, (extension, file_template, function_template) in TEMPLATES.items():
+        directory = root / language
+        directory.mkdir(parents=True)
+        for i in range(files_per_language):
+            body = "".join(function_template.format(i=i, n=n) for n in range(functions))
+            (directory / f"service_{i}{extension}").write_text(
+                file_template.format(i=i, body=body), encoding="utf-8"
+            )
+
+
+def run(
+    adapter: TreeSitterAdapter, files: list[Path], repeat: int, recompile: bool
+) -> dict[str, list[float]]:
+    """Parse every file repeat times.
+
+    Returns:
+        Seconds per parse_file call, by language.
+    """
+    timings: dict[str, list[float]] = defaultdict(list)
+    for _ in range(repeat):
+        for path in files:
+            if recompile:
+                TreeSitterAdapter.clear_query_cache()
+            start = time.perf_counter()
+            result = adapter.parse_file(str(path))
+            timings[result.language].append(time.perf_counter() - start)
+    return timings
+
+
+def run_many(files: list[Path], workers: int) -> float:
+    """Parse every file once with parse_many() and a cold cache.
+
+    Returns:
+        Wall-clock seconds, including starting the worker pool.
+    """
+    adapter = TreeSitterAdapter(parse_cache=ParseCache())
+    start = time.perf_counter()
+    for _ in adapter.parse_many([str(path) for path in files], max_workers=workers):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print per-language extraction cost."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files-per-language", type=int, default=50, help="Sample files")
+    parser.add_argument("--functions", type=int, default=10, help="Functions per file")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the tree")
+    parser.add_argument("--root", type=Path, help="Benchmark this tree instead")
+    parser.add_argument(
+        "--workers", type=int, nargs="*", default=[], help="parse_many() worker counts"
+    )
+    args = parser.parse_args()
+
+    # A zero budget keeps nothing cached, so every call parses and extracts
+    adapter = TreeSitterAdapter(parse_cache=ParseCache(max_bytes=0))
+    if not adapter.is_available():
+        raise SystemExit("tree-sitter-language-pack is not installed")
+
+    with tempfile.TemporaryDirectory(prefix="rice-factor-bench-") as tmp:
+        root = args.root
+        if root is None:
+            root = Path(tmp)
+            write_sample_tree(root, args.files_per_language, args.functions)
+        files = sorted(
+            path
+            for path in root.rglob("*")
+            if path.is_file() and adapter.detect_language(str(path))
+        )
+        print(f"Parsing {len(files)} files x {args.repeat} under {root}")
+
+        # Warm up parsers and extractors so both runs measure the same work
+        run(adapter, files, 1, recompile=False)
+        before = run(adapter, files, args.repeat, recompile=True)
+        after = run(adapter, files, args.repeat, recompile=False)
+        scaling = {workers: run_many(files, workers) for workers in args.workers}
+
+    print(f"  {'language':<12} {'files':>6} {'recompile':>11} {'reuse':>9} {'speedup':>8}")
+    for language in sorted(before):
+        cold = sum(before[language]) / len(before[language]) * 1e6
+        warm = sum(after[language]) / len(after[language]) * 1e6
+        print(
+            f"  {language:<12} {len(before[language]) // args.repeat:6d} "
+            f"{cold:9.0f}us {warm:7.0f}us {cold / warm:7.2f}x"
+        )
+    total_before = sum(sum(t) for t in before.values())
+    total_after = sum(sum(t) for t in after.values())
+    print(
+        f"Total: {total_before:.3f}s recompiling, {total_after:.3f}s reusing "
+        f"({total_before / total_after:.2f}x)"
+    )
+
+    if scaling:
+        baseline = scaling.get(1, total_after / args.repeat)
+        print("parse_many() on a cold cache:")
+        for workers, seconds in scaling.items():
+            print(
+                f"  {workers:3d} workers {seconds:8.3f}s "
+                f"{len(files) / seconds:9.0f} files/s {baseline / seconds:6.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""Unit tests for the agent message bus."""
+
+import asyncio
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from rice_factor.adapters.agents.message_bus import (
+    InboxFullError,
+    MessageBus,
+    SocketTransport,
+    decode_message,
+    encode_message,
+)
+from rice_factor.adapters.agents.solo_mode import SoloCoordinator
+from rice_factor.adapters.metrics.prometheus_adapter import MetricsRegistry
+from rice_factor.config.run_mode_config import RunModeConfig
+from rice_factor.domain.models.messages import AgentMessage, MessageType
+from rice_factor.domain.ports.coordinator import CoordinationContext
+
+
+def _message(
+    recipient_id: str | None = "agent-a",
+    sender_id: str = "system",
+    correlation_id: str | None = None,
+    message_type: MessageType = MessageType.TASK_ASSIGNMENT,
+) -> AgentMessage:
+    return AgentMessage(
+        message_id=f"msg-{uuid.uuid4().hex[:8]}",
+        message_type=message_type,
+        sender_id=sender_id,
+        recipient_id=recipient_id,
+        content={"task": "review"},
+        correlation_id=correlation_id,
+    )
+
+
+def _reply_to(message: AgentMessage, agent_id: str) -> AgentMessage:
+    return _message(
+        recipient_id=message.sender_id,
+        sender_id=agent_id,
+        correlation_id=message.message_id,
+        message_type=MessageType.TASK_RESULT,
+    )
+
+
+class TestMessageBusRouting:
+    """Tests for inbox and correlation routing."""
+
+    @pytest.mark.asyncio
+    async def test_direct_message_reaches_inbox(self) -> None:
+        """A message is delivered to its recipient's inbox."""
+        bus = MessageBus()
+        bus.register("agent-a")
+        message = _message()
+
+        await bus.publish(message)
+
+        assert bus.queue_depths() == {"agent-a": 1}
+        assert await bus.receive("agent-a", timeout=1.0) == message
+
+    @pytest.mark.asyncio
+    async def test_broadcast_skips_sender(self) -> None:
+        """Broadcasts reach every registered agent except the sender."""
+        bus = MessageBus()
+        for agent_id in ("agent-a", "agent-b", "agent-c"):
+            bus.register(agent_id)
+
+        await bus.publish(_message(recipient_id=None, sender_id="agent-a"))
+
+        assert bus.queue_depths() == {"agent-a": 0, "agent-b": 1, "agent-c": 1}
+
+    @pytest.mark.asyncio
+    async def test_replies_routed_by_correlation_id(self) -> None:
+        """Replies go to the request's channel, not the sender's inbox."""
+        bus = MessageBus()
+        bus.register("system")
+        bus.register("agent-a")
+        request = _message()
+        bus.open_channel(request.message_id)
+
+        await bus.publish(request)
+        await bus.publish(_reply_to(request, "agent-a"))
+
+        replies = await bus.collect(request.message_id, timeout=1.0)
+        assert [r.sender_id for r in replies] == ["agent-a"]
+        assert bus.queue_depths()["system"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_recipient_is_undeliverable(self) -> None:
+        """Messages nobody can receive are counted, not raised."""
+        bus = MessageBus()
+
+        await bus.publish(_message(recipient_id="nobody"))
+
+        assert bus.metrics.undeliverable == 1
+
+    @pytest.mark.asyncio
+    async def test_request_uses_handler_reply(self) -> None:
+        """An agent handler's reply resolves the request."""
+        bus = MessageBus()
+
+        async def handler(message: AgentMessage) -> AgentMessage:
+            return _reply_to(message, "agent-a")
+
+        bus.register("agent-a", handler=handler)
+
+        reply = await bus.request(_message(), timeout=1.0)
+
+        assert reply.sender_id == "agent-a"
+        assert bus.queue_depths() == {"agent-a": 0}
+
+    @pytest.mark.asyncio
+    async def test_request_and_collect_close_channels(self) -> None:
+        """Correlation channels are closed once request/collect return."""
+        bus = MessageBus()
+
+        async def handler(message: AgentMessage) -> AgentMessage:
+            return _reply_to(message, "agent-a")
+
+        bus.register("agent-a", handler=handler)
+
+        await bus.request(_message(), timeout=1.0)
+        message = _message()
+        bus.open_channel(message.message_id)
+        await bus.publish(message)
+        await bus.collect(message.message_id, timeout=1.0)
+
+        assert bus._channels == {}
+        assert bus._channel_events == {}
+        assert bus._expected == {}
+
+    @pytest.mark.asyncio
+    async def test_close_channel_ends_stream(self) -> None:
+        """A stream waiting on a channel stops when the channel is closed."""
+        bus = MessageBus()
+        bus.open_channel("c1")
+
+        async def read() -> list[AgentMessage]:
+            return [reply async for reply in bus.stream("c1", count=2)]
+
+        reader = asyncio.create_task(read())
+        await asyncio.sleep(0)
+        bus.close_channel("c1")
+
+        assert await asyncio.wait_for(reader, 1.0) == []
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_replies_as_they_arrive(self) -> None:
+        """Streaming a broadcast ends after every recipient replied."""
+        bus = MessageBus()
+
+        async def handler(message: AgentMessage) -> AgentMessage:
+            await asyncio.sleep(0.01)
+            return _reply_to(message, "agent-b")
+
+        bus.register("agent-a", handler=handler)
+        bus.register("agent-b", handler=handler)
+        request = _message(recipient_id=None)
+        bus.open_channel(request.message_id)
+        await bus.publish(request)
+
+        seen = [reply async for reply in bus.stream(request.message_id)]
+
+        assert len(seen) == 2
+
+
+class TestMessageBusBackpressure:
+    """Tests for bounded inboxes."""
+
+    @pytest.mark.asyncio
+    async def test_full_inbox_raises_after_timeout(self) -> None:
+        """Publishing to a full inbox fails once put_timeout expires."""
+        bus = MessageBus(max_queue_size=1, put_timeout=0.01)
+        bus.register("agent-a")
+        await bus.publish(_message())
+
+        with pytest.raises(InboxFullError, match="agent-a"):
+            await bus.publish(_message())
+
+    @pytest.mark.asyncio
+    async def test_publisher_waits_for_consumer(self) -> None:
+        """A blocked publish completes once the consumer makes room."""
+        bus = MessageBus(max_queue_size=1, put_timeout=1.0)
+        bus.register("agent-a")
+        await bus.publish(_message())
+
+        publish = asyncio.create_task(bus.publish(_message()))
+        await asyncio.sleep(0.01)
+        assert not publish.done()
+
+        await bus.receive("agent-a")
+        await publish
+        assert bus.metrics.delivered == 2
+        assert bus.metrics.max_queue_depth == 1
+
+    def test_rejects_zero_queue_size(self) -> None:
+        """Inboxes must hold at least one message."""
+        with pytest.raises(ValueError):
+            MessageBus(max_queue_size=0)
+
+
+class TestMessageBusMetrics:
+    """Tests for exported traffic metrics."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_exported_to_registry(self) -> None:
+        """Throughput counters and inbox depth reach the registry."""
+        registry = MetricsRegistry()
+        bus = MessageBus(registry=registry)
+        bus.register("agent-a")
+
+        await bus.publish(_message())
+        await bus.publish(_message())
+
+        assert registry.get_counter(
+            "rice_factor_agent_messages_total", {"event": "published"}
+        ) == 2
+        assert registry.get_gauge(
+            "rice_factor_agent_inbox_depth", {"agent": "agent-a"}
+        ) == 2
+        assert bus.metrics.to_dict()["delivered"] == 2
+
+
+class TestSocketTransport:
+    """Tests for the local socket transport."""
+
+    def test_wire_round_trip(self) -> None:
+        """Messages survive encoding and decoding."""
+        message = _message(correlation_id="task-1")
+
+        assert decode_message(encode_message(message)) == message
+
+    @pytest.mark.asyncio
+    async def test_request_to_agent_in_other_bus(self, tmp_path: Path) -> None:
+        """A remote agent receives the request and its reply comes back."""
+        coordinator_sock = tmp_path / "coordinator.sock"
+        agent_sock = tmp_path / "agent.sock"
+        coordinator_bus = MessageBus(
+            transport=SocketTransport(
+                listen_path=coordinator_sock, peers={"agent-a": agent_sock}
+            )
+        )
+        agent_bus = MessageBus(
+            transport=SocketTransport(
+                listen_path=agent_sock, peers={"system": coordinator_sock}
+            )
+        )
+
+        async def handler(message: AgentMessage) -> AgentMessage:
+            return _reply_to(message, "agent-a")
+
+        agent_bus.register("agent-a", handler=handler)
+        await coordinator_bus.start()
+        await agent_bus.start()
+        try:
+            reply = await coordinator_bus.request(_message(), timeout=2.0)
+        finally:
+            await agent_bus.close()
+            await coordinator_bus.close()
+
+        assert reply.sender_id == "agent-a"
+        assert not coordinator_sock.exists()
+
+
+class TestCoordinatorOnBus:
+    """Tests for coordinators running on the message bus."""
+
+    @pytest.mark.asyncio
+    async def test_collect_responses(self) -> None:
+        """Responses to a sent message are collected from the bus."""
+        coordinator = SoloCoordinator(RunModeConfig.solo_mode())
+        agent_id = coordinator.get_authority_agent().agent_id
+        message = _message(recipient_id=agent_id)
+
+        await coordinator.send_message(message)
+        await coordinator._add_response(message.message_id, _reply_to(message, agent_id))
+
+        responses = await coordinator.collect_responses(message.message_id, timeout_ms=100)
+        assert [r.sender_id for r in responses] == [agent_id]
+
+    @pytest.mark.asyncio
+    async def test_coordinate_routes_task_result(self) -> None:
+        """A solo run delivers its task and routes the result as a reply."""
+        coordinator = SoloCoordinator(RunModeConfig.solo_mode())
+        context = CoordinationContext(task_id="task-1", task_type="plan", goal="Plan")
+
+        result = await coordinator.coordinate(context)
+
+        assert result.success is True
+        assert coordinator.bus.metrics.delivered == 1
+        assert coordinator.bus.metrics.replies == 1
+        assert coordinator.bus.metrics.undeliverable == 0
+        assert coordinator.bus._channels == {}
+
+    @pytest.mark.asyncio
+    async def test_close_stops_private_bus(self) -> None:
+        """Closing a coordinator stops the inbox workers of its own bus."""
+        coordinator = SoloCoordinator(RunModeConfig.solo_mode())
+        await coordinator.coordinate(
+            CoordinationContext(task_id="task-1", task_type="plan", goal="Plan")
+        )
+
+        await coordinator.close()
+
+        assert coordinator.bus._workers == {}
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_shared_bus_running(self) -> None:
+        """A bus passed in by the caller is not closed with the coordinator."""
+        bus = MessageBus()
+        coordinator = SoloCoordinator(RunModeConfig.solo_mode(), bus)
+        bus.transport.close = AsyncMock()  # type: ignore[method-assign]
+
+        await coordinator.close()
+
+        bus.transport.close.assert_not_awaited()
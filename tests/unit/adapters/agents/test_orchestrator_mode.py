@@ -1,10 +1,13 @@
 """Unit tests for orchestrator mode coordinator."""
 
+import asyncio
+
 import pytest
 
 from rice_factor.adapters.agents.orchestrator_mode import OrchestratorCoordinator
 from rice_factor.config.run_mode_config import CoordinationRule, RunMode, RunModeConfig
 from rice_factor.domain.models.agent import AgentConfig, AgentRole
+from rice_factor.domain.models.messages import AgentMessage
 from rice_factor.domain.ports.coordinator import CoordinationContext
 
 
@@ -325,3 +328,48 @@ class TestOrchestratorErrorHandling:
         result = await coordinator.coordinate(context)
         assert result.success is False
         assert len(result.errors) > 0
+
+
+class SlowHelperCoordinator(OrchestratorCoordinator):
+    """Orchestrator coordinator with helpers that never finish."""
+
+    def __init__(self, config: RunModeConfig, slow_helpers: set[str]) -> None:
+        super().__init__(config)
+        self.slow_helpers = slow_helpers
+
+    async def _process_helper_task(
+        self, agent_id: str, task_message: AgentMessage
+    ) -> AgentMessage:
+        if agent_id in self.slow_helpers:
+            await asyncio.sleep(5.0)
+        return await super()._process_helper_task(agent_id, task_message)
+
+
+class TestOrchestratorHelperFanOut:
+    """Tests for concurrent helper delegation."""
+
+    @pytest.mark.asyncio
+    async def test_timed_out_helper_is_skipped(
+        self, context: CoordinationContext
+    ) -> None:
+        """The orchestrator synthesizes without a helper that timed out."""
+        config = RunModeConfig(
+            mode=RunMode.ORCHESTRATOR,
+            authority_agent="orchestrator",
+            agents=(
+                AgentConfig(agent_id="orchestrator", role=AgentRole.ORCHESTRATOR),
+                AgentConfig(agent_id="planner", role=AgentRole.PLANNER),
+                AgentConfig(agent_id="analyst", role=AgentRole.REFACTOR_ANALYST),
+            ),
+            agent_timeout_seconds=0.05,
+        )
+        coordinator = SlowHelperCoordinator(config, slow_helpers={"analyst"})
+
+        result = await coordinator.coordinate(context)
+
+        assert result.success is True
+        assert result.errors == ("Helper 'analyst' timed out",)
+        analyst = coordinator._agents["analyst"]
+        planner = coordinator._agents["planner"]
+        assert analyst.task_count == 0
+        assert planner.task_count == 1
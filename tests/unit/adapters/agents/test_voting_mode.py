@@ -1,10 +1,14 @@
 """Unit tests for voting mode coordinator."""
 
+import asyncio
+import time
+
 import pytest
 
-from rice_factor.adapters.agents.voting_mode import VotingCoordinator
+from rice_factor.adapters.agents.voting_mode import VotingCoordinator, is_vote_decided
 from rice_factor.config.run_mode_config import RunMode, RunModeConfig
-from rice_factor.domain.models.agent import AgentConfig, AgentRole
+from rice_factor.domain.models.agent import Agent, AgentConfig, AgentRole
+from rice_factor.domain.models.messages import Vote
 from rice_factor.domain.ports.coordinator import CoordinationContext
 
 
@@ -364,3 +368,149 @@ class TestVotingCoordinatorReasoning:
         assert result.success is True
         assert result.reasoning is not None
         assert "Winning proposal" in result.reasoning
+
+
+def _votes(*choices: str) -> list[Vote]:
+    return [
+        Vote(agent_id=f"agent-{i}", choice=choice, confidence=0.8)
+        for i, choice in enumerate(choices)
+    ]
+
+
+class SlowVotingCoordinator(VotingCoordinator):
+    """Voting coordinator whose agents all back one proposal, some slowly."""
+
+    def __init__(
+        self,
+        config: RunModeConfig,
+        slow_agents: set[str],
+        delay: float = 5.0,
+        slow_proposals: bool = False,
+    ) -> None:
+        super().__init__(config)
+        self.slow_agents = slow_agents
+        self.delay = delay
+        self.slow_proposals = slow_proposals
+        self.cancelled: list[str] = []
+
+    async def _generate_proposal(
+        self, agent: Agent, context: CoordinationContext
+    ) -> dict[str, object]:
+        if self.slow_proposals and agent.agent_id in self.slow_agents:
+            await asyncio.sleep(self.delay)
+        return await super()._generate_proposal(agent, context)
+
+    async def _cast_vote(
+        self,
+        agent: Agent,
+        proposal_ids: list[str],
+        context: CoordinationContext,  # noqa: ARG002
+    ) -> Vote:
+        if not self.slow_proposals and agent.agent_id in self.slow_agents:
+            try:
+                await asyncio.sleep(self.delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(agent.agent_id)
+                raise
+        return Vote(agent_id=agent.agent_id, choice=proposal_ids[0], confidence=0.9)
+
+
+class TestIsVoteDecided:
+    """Tests for the early quorum check."""
+
+    def test_decided_when_leader_cannot_be_caught(self) -> None:
+        """Three of five for one choice settles a 0.5 threshold."""
+        assert is_vote_decided(_votes("a", "a", "a"), 5, 0.5)
+
+    def test_not_decided_while_tie_possible(self) -> None:
+        """Two of four could still be matched by the remaining votes."""
+        assert not is_vote_decided(_votes("a", "a"), 4, 0.5)
+
+    def test_decided_when_consensus_impossible(self) -> None:
+        """No choice can reach the threshold with the votes left."""
+        assert is_vote_decided(_votes("a", "b", "c"), 4, 0.75)
+
+    def test_decided_when_all_votes_cast(self) -> None:
+        """A complete electorate is always decided."""
+        assert is_vote_decided(_votes("a", "b"), 2, 0.5)
+
+
+class TestVotingCoordinatorFanOut:
+    """Tests for concurrent proposals and votes."""
+
+    @pytest.mark.asyncio
+    async def test_voting_closes_early_on_quorum(
+        self, voting_config: RunModeConfig, context: CoordinationContext
+    ) -> None:
+        """Outstanding votes are cancelled once the majority is decided."""
+        coordinator = SlowVotingCoordinator(voting_config, slow_agents={"agent-c"})
+
+        start = time.monotonic()
+        result = await coordinator.coordinate(context)
+
+        assert time.monotonic() - start < 1.0
+        assert result.success is True
+        assert result.votes is not None
+        assert len(result.votes.votes) == 3
+        assert coordinator.cancelled == ["agent-c"]
+        assert result.errors == ()
+
+    @pytest.mark.asyncio
+    async def test_proposal_timeout_gives_partial_result(
+        self, context: CoordinationContext
+    ) -> None:
+        """A timed-out agent's proposal is dropped and reported."""
+        config = RunModeConfig(
+            mode=RunMode.VOTING,
+            authority_agent="primary",
+            agents=(
+                AgentConfig(agent_id="primary", role=AgentRole.PRIMARY),
+                AgentConfig(agent_id="agent-a", role=AgentRole.GENERIC),
+                AgentConfig(agent_id="agent-b", role=AgentRole.GENERIC),
+            ),
+            voting_threshold=0.5,
+            agent_timeout_seconds=0.05,
+        )
+        coordinator = SlowVotingCoordinator(
+            config, slow_agents={"agent-b"}, slow_proposals=True
+        )
+
+        result = await coordinator.coordinate(context)
+
+        assert result.success is True
+        assert "proposal-agent-b" not in coordinator._proposals
+        assert len(coordinator._proposals) == 2
+        assert len(result.errors) == 1
+        assert "agent-b" in result.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """No more than max_concurrency agents run at once."""
+        config = RunModeConfig(
+            mode=RunMode.VOTING,
+            authority_agent="primary",
+            agents=(
+                AgentConfig(agent_id="primary", role=AgentRole.PRIMARY),
+                AgentConfig(agent_id="agent-a", role=AgentRole.GENERIC),
+                AgentConfig(agent_id="agent-b", role=AgentRole.GENERIC),
+                AgentConfig(agent_id="agent-c", role=AgentRole.GENERIC),
+            ),
+            max_concurrency=2,
+        )
+        coordinator = VotingCoordinator(config)
+        running = 0
+        peak = 0
+
+        async def call(agent: Agent) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return agent.agent_id
+
+        outcome = await coordinator._fan_out(coordinator.get_active_agents(), call)
+
+        assert peak == 2
+        assert outcome.complete
+        assert list(outcome.results) == ["primary", "agent-a", "agent-b", "agent-c"]
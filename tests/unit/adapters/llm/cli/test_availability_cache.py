@@ -0,0 +1,151 @@
+"""Tests for the CLI agent probe cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rice_factor.adapters.llm.cli.availability_cache import (
+    AgentAvailabilityCache,
+    AgentProbe,
+)
+from rice_factor.adapters.llm.cli.detector import AgentConfig, CLIAgentDetector
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+@pytest.fixture
+def binary(tmp_path: Path) -> Path:
+    """Create a fake agent binary."""
+    path = tmp_path / "bin" / "tool"
+    path.parent.mkdir()
+    path.write_text("#!/bin/sh\n")
+    return path
+
+
+def _which(binary: Path) -> Callable[[str], str | None]:
+    return lambda cmd: str(binary) if cmd == "tool" else None
+
+
+class TestAgentAvailabilityCache:
+    """Tests for AgentAvailabilityCache."""
+
+    def test_round_trips_through_file(self, tmp_path: Path, binary: Path) -> None:
+        """Entries written by one cache are read by the next."""
+        cache_file = tmp_path / "agents.json"
+        with patch("shutil.which", side_effect=_which(binary)):
+            AgentAvailabilityCache(cache_file).put(
+                AgentProbe.for_command("tool", "tool", version="1.0", version_checked=True)
+            )
+            probe = AgentAvailabilityCache(cache_file).get("tool", "tool")
+
+        assert probe is not None
+        assert probe.available is True
+        assert probe.version == "1.0"
+        assert "tool" in json.loads(cache_file.read_text())["agents"]
+
+    def test_changed_binary_invalidates_entry(self, tmp_path: Path, binary: Path) -> None:
+        """A new mtime on the binary makes the entry a miss."""
+        cache = AgentAvailabilityCache(tmp_path / "agents.json")
+        with patch("shutil.which", side_effect=_which(binary)):
+            cache.put(AgentProbe.for_command("tool", "tool"))
+            stat = binary.stat()
+            os.utime(binary, (stat.st_atime, stat.st_mtime + 10))
+
+            assert cache.get("tool", "tool") is None
+
+    def test_removed_binary_invalidates_entry(self, binary: Path) -> None:
+        """An agent that disappears from PATH is a miss."""
+        cache = AgentAvailabilityCache(None)
+        with patch("shutil.which", side_effect=_which(binary)):
+            cache.put(AgentProbe.for_command("tool", "tool"))
+        with patch("shutil.which", return_value=None):
+            assert cache.get("tool", "tool") is None
+
+    def test_freshness_uses_ttl(self) -> None:
+        """Entries older than the TTL are stale."""
+        cache = AgentAvailabilityCache(None, ttl_seconds=60)
+        probe = AgentProbe("tool", "tool", available=False, probed_at=time.time())
+
+        assert cache.is_fresh(probe)
+        assert not cache.is_fresh(probe, now=probe.probed_at + 61)
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable cache file starts an empty cache."""
+        cache_file = tmp_path / "agents.json"
+        cache_file.write_text("{not json")
+
+        assert AgentAvailabilityCache(cache_file).get("tool", "tool") is None
+
+    def test_clear_removes_file(self, tmp_path: Path) -> None:
+        """clear() drops the persisted file."""
+        cache_file = tmp_path / "agents.json"
+        cache = AgentAvailabilityCache(cache_file)
+        cache.put(AgentProbe("tool", "tool", available=False))
+
+        cache.clear()
+
+        assert not cache_file.exists()
+
+
+class TestDetectorWithCache:
+    """Tests for CLIAgentDetector with a probe cache."""
+
+    @patch("subprocess.run")
+    def test_fresh_entry_skips_version_probe(
+        self, mock_run: MagicMock, tmp_path: Path, binary: Path
+    ) -> None:
+        """A second detection is served from the cache."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="tool 2.0\n")
+        detector = CLIAgentDetector(
+            configs={"tool": AgentConfig(command="tool")},
+            cache=AgentAvailabilityCache(tmp_path / "agents.json"),
+        )
+
+        with patch("shutil.which", side_effect=_which(binary)):
+            first = detector.detect_all()
+            second = detector.detect_all()
+
+        assert mock_run.call_count == 1
+        assert second[0].version == "tool 2.0"
+        assert second[0].checked_at == first[0].checked_at
+
+    @patch("subprocess.run")
+    def test_stale_entry_served_and_refreshed(
+        self, mock_run: MagicMock, tmp_path: Path, binary: Path
+    ) -> None:
+        """A stale entry is returned while a background refresh runs."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="tool 3.0\n")
+        cache = AgentAvailabilityCache(tmp_path / "agents.json", ttl_seconds=60)
+        detector = CLIAgentDetector(configs={"tool": AgentConfig(command="tool")}, cache=cache)
+
+        with patch("shutil.which", side_effect=_which(binary)):
+            stale = AgentProbe.for_command("tool", "tool", version="tool 2.0", version_checked=True)
+            stale.probed_at -= 120
+            cache.put(stale)
+            with patch.object(cache, "refresh_in_background") as refresh:
+                agent = detector.detect_agent("tool", detector.configs["tool"])
+                refresh.assert_called_once()
+                probe = refresh.call_args.args[1]()
+
+        assert agent.version == "tool 2.0"
+        assert probe.version == "tool 3.0"
+
+    @pytest.mark.asyncio
+    @patch("shutil.which", return_value=None)
+    async def test_agents_probed_concurrently(self, _which_mock: MagicMock) -> None:
+        """detect_all_async returns every agent in configuration order."""
+        detector = CLIAgentDetector(
+            configs={name: AgentConfig(command=name) for name in ("a", "b", "c")}
+        )
+
+        agents = await detector.detect_all_async()
+
+        assert [a.name for a in agents] == ["a", "b", "c"]
@@ -0,0 +1,185 @@
+"""Tests for isolated agent workspaces."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rice_factor.adapters.llm.cli.workspace import IsolatedWorkspace, WorkspaceKind
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a small project directory."""
+    root = tmp_path / "project"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "main.py").write_text("print('hi')\n")
+    (root / "README.md").write_text("# Project\n")
+    return root
+
+
+class TestCopyWorkspace:
+    """Tests for directory-copy workspaces."""
+
+    def test_copy_is_isolated(self, project: Path) -> None:
+        """Edits in the workspace do not touch the source."""
+        workspace = IsolatedWorkspace.create(project, "test")
+        try:
+            assert workspace.kind == WorkspaceKind.COPY
+            (workspace.path / "README.md").write_text("changed\n")
+            assert (project / "README.md").read_text() == "# Project\n"
+        finally:
+            workspace.cleanup()
+
+        assert not workspace.path.exists()
+
+    def test_apply_mirrors_changes(self, project: Path) -> None:
+        """Added, modified and deleted files are applied to the source."""
+        workspace = IsolatedWorkspace.create(project, "test")
+        try:
+            (workspace.path / "src" / "main.py").write_text("print('bye')\n")
+            (workspace.path / "src" / "new.py").write_text("x = 1\n")
+            (workspace.path / "README.md").unlink()
+
+            changed = workspace.apply_to_source()
+        finally:
+            workspace.cleanup()
+
+        assert changed == ["README.md", "src/main.py", "src/new.py"]
+        assert (project / "src" / "main.py").read_text() == "print('bye')\n"
+        assert (project / "src" / "new.py").exists()
+        assert not (project / "README.md").exists()
+
+    def test_apply_keeps_files_created_in_source(self, project: Path) -> None:
+        """Only the agent's own changes are applied back."""
+        workspace = IsolatedWorkspace.create(project, "test")
+        try:
+            (project / "notes.txt").write_text("written during the race\n")
+            (workspace.path / "README.md").write_text("changed\n")
+
+            changed = workspace.apply_to_source()
+        finally:
+            workspace.cleanup()
+
+        assert changed == ["README.md"]
+        assert (project / "notes.txt").read_text() == "written during the race\n"
+
+    def test_copy_skips_vendored_and_ignored_files(self, project: Path) -> None:
+        """node_modules and .gitignore'd files are neither copied nor applied."""
+        (project / ".gitignore").write_text("build/\n*.log\n")
+        (project / "node_modules" / "pkg").mkdir(parents=True)
+        (project / "node_modules" / "pkg" / "index.js").write_text("x\n")
+        (project / "debug.log").write_text("log\n")
+
+        workspace = IsolatedWorkspace.create(project, "test")
+        try:
+            assert not (workspace.path / "node_modules").exists()
+            assert not (workspace.path / "debug.log").exists()
+            (workspace.path / "build").mkdir()
+            (workspace.path / "build" / "out.o").write_text("binary\n")
+            (workspace.path / "src" / "new.py").write_text("x = 1\n")
+
+            changed = workspace.apply_to_source()
+        finally:
+            workspace.cleanup()
+
+        assert changed == ["src/new.py"]
+        assert not (project / "build").exists()
+        assert (project / "debug.log").exists()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestWorktreeWorkspace:
+    """Tests for git worktree workspaces."""
+
+    @pytest.fixture
+    def repo(self, project: Path) -> Path:
+        _git(project, "init", "-q")
+        _git(project, "add", "-A")
+        _git(
+            project,
+            "-c", "user.name=t", "-c", "user.email=t@example.com",
+            "commit", "-q", "-m", "init",
+        )
+        return project
+
+    def test_clean_repo_uses_worktree(self, repo: Path) -> None:
+        """A clean repo gets a worktree whose changes apply back."""
+        workspace = IsolatedWorkspace.create(repo, "test")
+        try:
+            assert workspace.kind == WorkspaceKind.WORKTREE
+            (workspace.path / "src" / "main.py").write_text("print('bye')\n")
+            (workspace.path / "added.txt").write_text("new\n")
+
+            changed = workspace.apply_to_source()
+        finally:
+            workspace.cleanup()
+
+        assert changed == ["added.txt", "src/main.py"]
+        assert (repo / "src" / "main.py").read_text() == "print('bye')\n"
+        assert (repo / "added.txt").read_text() == "new\n"
+
+    def test_apply_includes_agent_commits(self, repo: Path) -> None:
+        """Changes the agent committed in the worktree are applied too."""
+        workspace = IsolatedWorkspace.create(repo, "test")
+        try:
+            (workspace.path / "src" / "main.py").write_text("print('bye')\n")
+            _git(workspace.path, "add", "-A")
+            _git(
+                workspace.path,
+                "-c", "user.name=t", "-c", "user.email=t@example.com",
+                "commit", "-q", "-m", "agent",
+            )
+            (workspace.path / "added.txt").write_text("new\n")
+
+            changed = workspace.apply_to_source()
+        finally:
+            workspace.cleanup()
+
+        assert changed == ["added.txt", "src/main.py"]
+        assert (repo / "src" / "main.py").read_text() == "print('bye')\n"
+        assert (repo / "added.txt").read_text() == "new\n"
+
+    def test_dirty_repo_falls_back_to_copy(self, repo: Path) -> None:
+        """Uncommitted changes are only preserved by a copy."""
+        (repo / "README.md").write_text("dirty\n")
+
+        workspace = IsolatedWorkspace.create(repo, "test")
+        try:
+            assert workspace.kind == WorkspaceKind.COPY
+            assert (workspace.path / "README.md").read_text() == "dirty\n"
+        finally:
+            workspace.cleanup()
+
+    def test_dirty_copy_honours_gitignore(self, repo: Path) -> None:
+        """A copy of a repo leaves out .git and ignored files."""
+        (repo / ".gitignore").write_text("dist/\n")
+        (repo / "dist").mkdir()
+        (repo / "dist" / "bundle.js").write_text("built\n")
+
+        workspace = IsolatedWorkspace.create(repo, "test")
+        try:
+            assert workspace.kind == WorkspaceKind.COPY
+            assert not (workspace.path / ".git").exists()
+            assert not (workspace.path / "dist").exists()
+            assert (workspace.path / ".gitignore").exists()
+            (workspace.path / "dist").mkdir()
+            (workspace.path / "dist" / "bundle.js").write_text("rebuilt\n")
+            (workspace.path / "src" / "main.py").write_text("print('bye')\n")
+
+            changed = workspace.apply_to_source()
+        finally:
+            workspace.cleanup()
+
+        assert changed == ["src/main.py"]
+        assert (repo / "dist" / "bundle.js").read_text() == "built\n"
@@ -0,0 +1,101 @@
+"""Fixtures for LLM adapter tests."""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+
+class StubCompletionServer(ThreadingHTTPServer):
+    """Local OpenAI-compatible server that answers with the prompt it got.
+
+    Each completion's text is a JSON object echoing its prompt, so tests
+    can check that results come back in prompt order. Prompts containing
+    "FAIL" get an HTTP 500. The server records how many requests it
+    served and the highest number it was serving at once.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, delay: float = 0.05) -> None:
+        """Start listening on a free local port."""
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.delay = delay
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the API, including /v1."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}/v1"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: StubCompletionServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep test output quiet."""
+
+    def do_POST(self) -> None:
+        """Serve /completions and /chat/completions."""
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length))
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(
+                self.server.max_in_flight, self.server.in_flight
+            )
+        try:
+            time.sleep(self.server.delay)
+            if self.path.endswith("/chat/completions"):
+                prompts = [body["messages"][-1]["content"]]
+            else:
+                prompt = body["prompt"]
+                prompts = prompt if isinstance(prompt, list) else [prompt]
+
+            if any("FAIL" in p for p in prompts):
+                self._send(500, {"error": {"message": "stub failure"}})
+                return
+            choices: list[dict[str, Any]] = []
+            for index, p in enumerate(prompts):
+                text = json.dumps({"echo": p.rsplit("\n", 1)[-1]})
+                if self.path.endswith("/chat/completions"):
+                    choices.append(
+                        {"index": index, "message": {"role": "assistant", "content": text}}
+                    )
+                else:
+                    choices.append({"index": index, "text": text})
+            # Out of order, as servers may return them
+            self._send(200, {"id": "cmpl-stub", "choices": choices[::-1]})
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _send(self, status: int, payload: dict[str, Any]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubCompletionServer]:
+    """Run a StubCompletionServer for the duration of a test."""
+    server = StubCompletionServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
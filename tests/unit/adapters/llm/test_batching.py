@@ -0,0 +1,169 @@
+"""Unit tests for batched generation helpers."""
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from rice_factor.adapters.llm.batching import (
+    BatchingAdapter,
+    run_in_flight,
+    split_choices,
+)
+from rice_factor.domain.artifacts.compiler_types import (
+    CompilerContext,
+    CompilerPassType,
+    CompilerResult,
+)
+
+
+class TestRunInFlight:
+    """Tests for run_in_flight."""
+
+    def test_results_in_call_order_with_errors(self) -> None:
+        """Each call gets its own result or error, in call order."""
+
+        def call(n: int) -> Any:
+            def run() -> dict[str, Any]:
+                time.sleep(0.01 * (3 - n))
+                if n == 1:
+                    raise ValueError("boom")
+                return {"n": n}
+
+            return run
+
+        results = run_in_flight([call(0), call(1), call(2)], max_in_flight=3)
+
+        assert [r.index for r in results] == [0, 1, 2]
+        assert [r.response for r in results] == [{"n": 0}, None, {"n": 2}]
+        assert not results[1].ok
+        assert str(results[1].error) == "boom"
+
+    def test_respects_in_flight_limit(self) -> None:
+        """No more than max_in_flight calls run at once."""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def call() -> dict[str, Any]:
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+            return {}
+
+        run_in_flight([call] * 8, max_in_flight=2)
+
+        assert state["peak"] == 2
+
+    def test_rejects_zero_limit(self) -> None:
+        """The in-flight limit must be positive."""
+        with pytest.raises(ValueError, match="max_in_flight"):
+            run_in_flight([], max_in_flight=0)
+
+
+class TestSplitChoices:
+    """Tests for split_choices."""
+
+    def test_splits_by_choice_index(self) -> None:
+        """Choices are matched to prompts by index, not position."""
+        response = {
+            "id": "cmpl-1",
+            "choices": [{"index": 1, "text": "b"}, {"index": 0, "text": "a"}],
+            "usage": {"total_tokens": 10},
+        }
+
+        results = split_choices(response, 3)
+
+        assert results[0].response == {
+            "id": "cmpl-1",
+            "choices": [{"index": 0, "text": "a"}],
+        }
+        assert results[1].response is not None
+        assert results[1].response["choices"][0]["text"] == "b"
+        assert isinstance(results[2].error, ValueError)
+
+
+class FakeBatchAdapter:
+    """Adapter recording the batches it is asked to generate."""
+
+    model = "fake"
+
+    def __init__(self) -> None:
+        self.batches: list[list[str | None]] = []
+
+    def generate(
+        self,
+        pass_type: CompilerPassType,
+        context: CompilerContext,
+        schema: dict[str, object],
+    ) -> CompilerResult:
+        return self.generate_batch([(pass_type, context, schema)])[0]
+
+    def generate_batch(self, requests: Any) -> list[CompilerResult]:
+        self.batches.append([context.target_file for _, context, _ in requests])
+        return [
+            CompilerResult(success=True, payload={"target": context.target_file})
+            for _, context, _ in requests
+        ]
+
+
+def _context(target: str) -> CompilerContext:
+    return CompilerContext(
+        pass_type=CompilerPassType.IMPLEMENTATION,
+        project_files={},
+        artifacts={},
+        target_file=target,
+    )
+
+
+class TestBatchingAdapter:
+    """Tests for BatchingAdapter."""
+
+    def test_coalesces_concurrent_calls(self) -> None:
+        """Concurrent callers share batches and each gets its own result."""
+        fake = FakeBatchAdapter()
+        llm = BatchingAdapter(fake, max_batch_size=4, max_wait=1.0)
+        targets = [f"src/m{i}.py" for i in range(8)]
+        results: dict[str, Any] = {}
+
+        def call(target: str) -> None:
+            result = llm.generate(CompilerPassType.IMPLEMENTATION, _context(target), {})
+            results[target] = result.payload
+
+        threads = [threading.Thread(target=call, args=(t,)) for t in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == {t: {"target": t} for t in targets}
+        assert llm.batch_sizes == [4, 4]
+
+    def test_single_call_waits_at_most_max_wait(self) -> None:
+        """A lone caller is sent on its own once max_wait has passed."""
+        fake = FakeBatchAdapter()
+        llm = BatchingAdapter(fake, max_batch_size=4, max_wait=0.01)
+
+        result = llm.generate(CompilerPassType.IMPLEMENTATION, _context("a.py"), {})
+
+        assert result.payload == {"target": "a.py"}
+        assert fake.batches == [["a.py"]]
+
+    def test_batch_errors_reach_every_caller(self) -> None:
+        """An exception from generate_batch is raised to each caller."""
+
+        class FailingAdapter(FakeBatchAdapter):
+            def generate_batch(self, _requests: Any) -> list[CompilerResult]:
+                raise RuntimeError("server down")
+
+        llm = BatchingAdapter(FailingAdapter(), max_wait=0.01)
+
+        with pytest.raises(RuntimeError, match="server down"):
+            llm.generate(CompilerPassType.IMPLEMENTATION, _context("a.py"), {})
+
+    def test_delegates_other_attributes(self) -> None:
+        """Attributes such as model come from the wrapped adapter."""
+        assert BatchingAdapter(FakeBatchAdapter()).model == "fake"
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import copy
 import sys
+import threading
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,7 +19,20 @@ from rice_factor.domain.artifacts.compiler_types import (
     CompilerContext,
     CompilerPassType,
 )
-from rice_factor.domain.failures.llm_errors import LLMTimeoutError
+from rice_factor.domain.artifacts.enums import ArtifactType
+from rice_factor.domain.failures.llm_errors import (
+    LLMTimeoutError,
+    SchemaViolationError,
+)
+from rice_factor.domain.prompts import (
+    BASE_SYSTEM_PROMPT,
+    OUTPUT_REPAIR_PROMPT,
+    PROJECT_PLANNER_PROMPT,
+)
+from rice_factor.domain.services.output_repairer import OutputRepairer, RepairTracker
+from rice_factor.domain.services.output_validator import OutputValidator
+
+SCHEMAS_DIR = Path(__file__).parent.parent.parent.parent.parent / "schemas"
 
 
 class TestOllamaClientInit:
@@ -297,6 +313,186 @@ class TestOllamaAdapterGenerate:
         assert "Connection refused" in str(result.error_details)
 
 
+class TestOllamaAdapterRepair:
+    """Tests for OllamaAdapter repair prompts."""
+
+    @patch.object(OllamaClient, "generate")
+    def test_repair_sends_only_repair_prompt_and_patch_schema(
+        self, mock_generate: MagicMock
+    ) -> None:
+        """A repair through the real adapter leaves out the pass prompt and artifact schema."""
+        mock_generate.return_value = {
+            "response": '{"/constraints/languages": ["python"]}'
+        }
+        payload = {
+            "domains": [{"name": "Billing", "responsibility": "Invoices"}],
+            "modules": [{"name": "billing", "domain": "Billing"}],
+            "constraints": {"architecture": "hexagonal"},
+        }
+        context = CompilerContext(
+            pass_type=CompilerPassType.PROJECT,
+            project_files={"requirements.md": "A billing system."},
+            artifacts={},
+        )
+        repairer = OutputRepairer(
+            OutputValidator(SCHEMAS_DIR), tracker=RepairTracker()
+        )
+
+        repaired = repairer.repair(
+            CompilerPassType.PROJECT,
+            ArtifactType.PROJECT_PLAN,
+            copy.deepcopy(payload),
+            context,
+            OllamaAdapter(),
+            SchemaViolationError("languages is a required property"),
+        )
+
+        assert repaired["constraints"]["languages"] == ["python"]
+        prompt = mock_generate.call_args.kwargs["prompt"]
+        assert prompt.startswith(OUTPUT_REPAIR_PROMPT)
+        assert "PATCH SCHEMA" in prompt
+        assert '"/constraints/languages"' in prompt
+        assert BASE_SYSTEM_PROMPT not in prompt
+        assert PROJECT_PLANNER_PROMPT not in prompt
+        assert "JSON SCHEMA" not in prompt
+        assert "A billing system." not in prompt
+
+
+class TestOllamaAdapterLifecycle:
+    """Tests for OllamaAdapter model lifecycle management."""
+
+    @staticmethod
+    def _context(pass_type: CompilerPassType) -> CompilerContext:
+        return CompilerContext(pass_type=pass_type, project_files={}, artifacts={})
+
+    @patch.object(OllamaClient, "generate")
+    def test_generate_sends_pass_keep_alive(self, mock_generate: MagicMock) -> None:
+        """Requests carry the keep-alive configured for their pass."""
+        mock_generate.return_value = {"response": "{}"}
+        adapter = OllamaAdapter(keep_alive={CompilerPassType.TEST: "1h"})
+
+        adapter.generate(
+            CompilerPassType.TEST, self._context(CompilerPassType.TEST), {}
+        )
+
+        assert mock_generate.call_args.kwargs["keep_alive"] == "1h"
+
+    @patch.object(OllamaClient, "generate")
+    def test_generate_uses_pass_model(self, mock_generate: MagicMock) -> None:
+        """A per-pass model overrides the default model."""
+        mock_generate.return_value = {"response": "{}"}
+        adapter = OllamaAdapter(
+            model="llama3.2",
+            pass_models={CompilerPassType.IMPLEMENTATION: "codestral"},
+        )
+
+        adapter.generate(
+            CompilerPassType.IMPLEMENTATION,
+            self._context(CompilerPassType.IMPLEMENTATION),
+            {},
+        )
+
+        assert mock_generate.call_args.kwargs["model"] == "codestral"
+        assert adapter.lifecycle.resident == ["codestral"]
+
+    @patch.object(OllamaClient, "unload_model")
+    @patch.object(OllamaClient, "generate")
+    def test_model_released_after_failed_request(
+        self, mock_generate: MagicMock, mock_unload: MagicMock
+    ) -> None:
+        """A request that raises still releases its model for eviction."""
+        mock_generate.side_effect = [
+            LLMTimeoutError("timed out", timeout_seconds=120),
+            {"response": "{}"},
+        ]
+        adapter = OllamaAdapter(
+            model="llama3.2",
+            pass_models={CompilerPassType.IMPLEMENTATION: "codestral"},
+        )
+
+        with pytest.raises(LLMTimeoutError):
+            adapter.generate(
+                CompilerPassType.TEST, self._context(CompilerPassType.TEST), {}
+            )
+        adapter.generate(
+            CompilerPassType.IMPLEMENTATION,
+            self._context(CompilerPassType.IMPLEMENTATION),
+            {},
+        )
+
+        mock_unload.assert_called_once_with("llama3.2")
+        assert adapter.lifecycle.resident == ["codestral"]
+
+    @patch.object(OllamaClient, "unload_model")
+    @patch.object(OllamaClient, "generate")
+    def test_generate_batch_groups_by_model(
+        self, mock_generate: MagicMock, mock_unload: MagicMock
+    ) -> None:
+        """Batches run grouped by model and return results in input order."""
+        mock_generate.side_effect = [
+            {"response": '{"n": 1}'},
+            {"response": '{"n": 3}'},
+            LLMTimeoutError("timed out", timeout_seconds=120),
+        ]
+        adapter = OllamaAdapter(
+            model="llama3.2",
+            pass_models={CompilerPassType.IMPLEMENTATION: "codestral"},
+            max_in_flight=1,
+        )
+        requests = [
+            (pass_type, self._context(pass_type), {})
+            for pass_type in (
+                CompilerPassType.TEST,
+                CompilerPassType.IMPLEMENTATION,
+                CompilerPassType.TEST,
+            )
+        ]
+
+        results = adapter.generate_batch(requests)
+
+        models = [c.kwargs["model"] for c in mock_generate.call_args_list]
+        assert models == ["llama3.2", "llama3.2", "codestral"]
+        mock_unload.assert_called_once_with("llama3.2")
+        assert [r.payload for r in results] == [{"n": 1}, None, {"n": 3}]
+        assert results[1].error_type == "LLMTimeoutError"
+
+    @patch.object(OllamaClient, "generate")
+    def test_generate_batch_runs_a_model_group_concurrently(
+        self, mock_generate: MagicMock
+    ) -> None:
+        """Requests for the same model are in flight together."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def generate(**_: object) -> dict[str, str]:
+            barrier.wait()
+            return {"response": '{"ok": true}'}
+
+        mock_generate.side_effect = generate
+        adapter = OllamaAdapter(model="codestral", max_in_flight=3)
+        requests = [
+            (CompilerPassType.TEST, self._context(CompilerPassType.TEST), {})
+        ] * 3
+
+        results = adapter.generate_batch(requests)
+
+        assert [r.payload for r in results] == [{"ok": True}] * 3
+
+    @patch.object(OllamaClient, "load_model")
+    def test_warm_up_preloads_default_model(self, mock_load: MagicMock) -> None:
+        """warm_up loads the default model and reports its load time."""
+        mock_load.return_value = {"load_duration": 2_000_000_000}
+        adapter = OllamaAdapter(model="codestral")
+
+        assert adapter.warm_up() == {"codestral": 2.0}
+
+    @patch.object(OllamaClient, "load_model")
+    def test_warm_up_tolerates_unavailable_server(self, mock_load: MagicMock) -> None:
+        """A failed warm-up is logged, not raised."""
+        mock_load.side_effect = OllamaClientError("connection refused")
+
+        assert OllamaAdapter().warm_up() == {}
+
+
 class TestOllamaAdapterListModels:
     """Tests for OllamaAdapter list_models method."""
 
@@ -0,0 +1,197 @@
+"""Unit tests for OllamaModelManager."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from rice_factor.adapters.llm.ollama_lifecycle import (
+    DEFAULT_KEEP_ALIVE,
+    ModelLifecycleStats,
+    OllamaModelManager,
+)
+from rice_factor.adapters.metrics.prometheus_adapter import MetricsRegistry
+from rice_factor.domain.artifacts.compiler_types import CompilerPassType
+
+
+def _client(load_seconds: float = 3.0) -> MagicMock:
+    client = MagicMock()
+    client.load_model.return_value = {"load_duration": int(load_seconds * 1e9)}
+    return client
+
+
+def _use(manager: OllamaModelManager, *models: str) -> None:
+    for model in models:
+        manager.acquire(model)
+        manager.release(model)
+
+
+class TestKeepAlive:
+    """Tests for per-pass keep-alive."""
+
+    def test_defaults_per_pass(self) -> None:
+        """Passes that fan out keep the model loaded longer."""
+        manager = OllamaModelManager(_client())
+
+        assert manager.keep_alive_for(CompilerPassType.IMPLEMENTATION) == "30m"
+        assert manager.keep_alive_for(CompilerPassType.PROJECT) == "2m"
+        assert manager.keep_alive_for(None) == DEFAULT_KEEP_ALIVE
+
+    def test_overrides_merge_over_defaults(self) -> None:
+        """Configured values replace only the passes they name."""
+        manager = OllamaModelManager(
+            _client(), keep_alive={CompilerPassType.PROJECT: -1}
+        )
+
+        assert manager.keep_alive_for(CompilerPassType.PROJECT) == -1
+        assert manager.keep_alive_for(CompilerPassType.TEST) == "10m"
+
+    def test_rejects_zero_residency(self) -> None:
+        """At least one model must be allowed in memory."""
+        with pytest.raises(ValueError, match="max_resident"):
+            OllamaModelManager(_client(), max_resident=0)
+
+
+class TestResidency:
+    """Tests for preload and acquire."""
+
+    def test_preload_records_load_time(self) -> None:
+        """Preloading loads the model and records its load duration."""
+        client = _client(load_seconds=4.0)
+        manager = OllamaModelManager(client)
+
+        timings = manager.preload(["codestral"])
+
+        assert timings == {"codestral": 4.0}
+        client.load_model.assert_called_once_with("codestral", keep_alive="5m")
+        assert manager.resident == ["codestral"]
+        assert manager.get_stats("codestral").loads == 1
+
+    def test_preload_is_capped_by_residency(self) -> None:
+        """Only the highest-priority models that fit are preloaded."""
+        client = _client()
+        manager = OllamaModelManager(client, max_resident=2)
+
+        timings = manager.preload(["a", "b", "a", "c"])
+
+        assert set(timings) == {"a", "b"}
+        client.unload_model.assert_not_called()
+        assert manager.resident == ["b", "a"]
+
+    def test_acquire_evicts_least_recently_used(self) -> None:
+        """A new model unloads the model used longest ago."""
+        client = _client()
+        manager = OllamaModelManager(client, max_resident=2)
+        _use(manager, "a", "b", "a")
+
+        manager.acquire("c")
+
+        client.unload_model.assert_called_once_with("b")
+        assert manager.resident == ["a", "c"]
+        assert manager.get_stats("b").evictions == 1
+
+    def test_model_in_use_is_not_evicted(self) -> None:
+        """A model serving a request stays loaded until it is released."""
+        client = _client()
+        manager = OllamaModelManager(client, max_resident=1)
+        manager.acquire("a")
+
+        manager.acquire("b")
+
+        client.unload_model.assert_not_called()
+        assert manager.resident == ["a", "b"]
+
+        manager.release("a")
+        manager.release("b")
+        _use(manager, "c")
+
+        assert [c.args[0] for c in client.unload_model.call_args_list] == ["a", "b"]
+        assert manager.resident == ["c"]
+
+    def test_each_acquire_needs_a_release(self) -> None:
+        """A model acquired twice stays in use until released twice."""
+        client = _client()
+        manager = OllamaModelManager(client, max_resident=1)
+        manager.acquire("a")
+        manager.acquire("a")
+        manager.release("a")
+
+        _use(manager, "b")
+
+        client.unload_model.assert_not_called()
+        manager.release("a")
+        _use(manager, "c")
+        assert manager.resident == ["c"]
+
+    def test_unload_failure_is_not_fatal(self) -> None:
+        """The server evicts on its own if an unload request fails."""
+        client = _client()
+        client.unload_model.side_effect = RuntimeError("connection refused")
+        manager = OllamaModelManager(client)
+        _use(manager, "a")
+
+        _use(manager, "b")
+
+        assert manager.resident == ["b"]
+
+
+class TestRecord:
+    """Tests for request timing."""
+
+    def test_cold_request_splits_load_time(self) -> None:
+        """Load time is recorded apart from the request latency."""
+        registry = MetricsRegistry()
+        manager = OllamaModelManager(_client(), registry=registry)
+
+        manager.record("a", {"load_duration": int(6e9)}, elapsed_seconds=8.0)
+
+        stats = manager.get_stats("a")
+        assert (stats.loads, stats.load_seconds) == (1, 6.0)
+        assert (stats.requests, stats.request_seconds) == (1, 2.0)
+        labels = {"provider": "ollama", "model": "a"}
+        load = registry.get_histogram("rice_factor_llm_model_load_seconds", labels)
+        request = registry.get_histogram(
+            "rice_factor_llm_request_duration_seconds", labels
+        )
+        assert load is not None and load.sum == 6.0
+        assert request is not None and request.sum == 2.0
+
+    def test_warm_request_is_not_a_load(self) -> None:
+        """A few milliseconds of load_duration means the model was resident."""
+        manager = OllamaModelManager(_client())
+
+        manager.record("a", {"load_duration": int(5e6)}, elapsed_seconds=1.5)
+
+        stats = manager.get_stats("a")
+        assert stats.loads == 0
+        assert stats.avg_request_seconds == 1.5
+
+    def test_summary(self) -> None:
+        """The summary lists timings per model."""
+        manager = OllamaModelManager(_client())
+        manager.record("a", {}, elapsed_seconds=1.0)
+
+        expected = ModelLifecycleStats(requests=1, request_seconds=1.0)
+        assert manager.summary() == {"a": expected.to_dict()}
+
+
+class TestSchedule:
+    """Tests for request grouping."""
+
+    def test_groups_by_model_keeping_order(self) -> None:
+        """Requests for the same model run back to back."""
+        manager = OllamaModelManager(_client())
+        items = ["a1", "b1", "a2", "c1", "b2"]
+
+        order = manager.schedule(items, lambda item: item[0])
+
+        assert [items[i] for i in order] == ["a1", "a2", "b1", "b2", "c1"]
+
+    def test_resident_models_run_first(self) -> None:
+        """The model already in memory is drained before another loads."""
+        manager = OllamaModelManager(_client(), max_resident=2)
+        _use(manager, "b", "c")
+        items = ["a1", "b1", "c1", "b2"]
+
+        order = manager.schedule(items, lambda item: item[0])
+
+        assert [items[i] for i in order] == ["c1", "b1", "b2", "a1"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,6 +20,9 @@ from rice_factor.domain.artifacts.compiler_types import (
 )
 from rice_factor.domain.failures.llm_errors import LLMTimeoutError
 
+if TYPE_CHECKING:
+    from tests.unit.adapters.llm.conftest import StubCompletionServer
+
 
 class TestKnownProviders:
     """Tests for known provider configurations."""
@@ -122,6 +126,43 @@ class TestOpenAICompatClientGenerate:
         assert result == {"choices": [{"text": "test"}]}
 
 
+class TestOpenAICompatClientGenerateBatch:
+    """Tests for OpenAICompatClient.generate_batch against a local stub server."""
+
+    def test_chat_results_in_order(self, stub_server: StubCompletionServer) -> None:
+        """Chat prompts run concurrently and come back in order."""
+        client = OpenAICompatClient(base_url=stub_server.base_url)
+
+        results = client.generate_batch("m", ["a", "FAIL", "c"], max_in_flight=3)
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[2].response is not None
+        assert results[2].response["choices"][0]["message"]["content"] == '{"echo": "c"}'
+        assert isinstance(results[1].error, OpenAICompatClientError)
+        assert stub_server.max_in_flight > 1
+
+    def test_multi_prompt_when_supported(self, stub_server: StubCompletionServer) -> None:
+        """Providers accepting prompt lists get a single request."""
+        client = OpenAICompatClient(base_url=stub_server.base_url, provider="generic")
+
+        results = client.generate_batch("m", ["a", "b"], multi_prompt=True)
+
+        assert stub_server.requests == 1
+        assert [r.response["choices"][0]["text"] for r in results if r.response] == [
+            '{"echo": "a"}',
+            '{"echo": "b"}',
+        ]
+
+    def test_multi_prompt_falls_back(self, stub_server: StubCompletionServer) -> None:
+        """Providers without prompt lists get one request per prompt."""
+        client = OpenAICompatClient(base_url=stub_server.base_url, provider="lmstudio")
+
+        results = client.generate_batch("m", ["a", "b"], multi_prompt=True)
+
+        assert stub_server.requests == 2
+        assert all(r.ok for r in results)
+
+
 class TestOpenAICompatClientGetHeaders:
     """Tests for OpenAICompatClient _get_headers method."""
 
@@ -310,6 +351,37 @@ class TestOpenAICompatAdapterGenerate:
         assert result.error_type == "client_error"
 
 
+class TestOpenAICompatAdapterGenerateBatch:
+    """Tests for OpenAICompatAdapter.generate_batch."""
+
+    def test_results_in_request_order(self, stub_server: StubCompletionServer) -> None:
+        """Each request gets its parsed payload or its own failure."""
+        adapter = OpenAICompatAdapter(base_url=stub_server.base_url)
+        requests = [
+            (
+                CompilerPassType.TEST,
+                CompilerContext(
+                    pass_type=CompilerPassType.TEST,
+                    project_files={},
+                    artifacts={},
+                    target_file=target,
+                ),
+                {"type": "object"},
+            )
+            for target in ("a.py", "FAIL.py", "c.py")
+        ]
+
+        with patch.object(
+            OpenAICompatAdapter,
+            "_build_full_prompt",
+            side_effect=lambda _pass_type, context, _schema: context.target_file,
+        ):
+            results = adapter.generate_batch(requests)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[2].payload == {"echo": "c.py"}
+
+
 class TestOpenAICompatAdapterExtractResponseText:
     """Tests for OpenAICompatAdapter _extract_response_text method."""
 
@@ -376,7 +448,7 @@ class TestCreateOpenAICompatAdapterFromConfig:
     def test_creates_adapter_with_defaults(self) -> None:
         """create_openai_compat_adapter_from_config should use defaults."""
         with patch("rice_factor.config.settings.settings") as mock_settings:
-            mock_settings.get.side_effect = lambda key, default=None: default
+            mock_settings.get.side_effect = lambda _key, default=None: default
 
             from rice_factor.adapters.llm.openai_compat_adapter import (
                 create_openai_compat_adapter_from_config,
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from rice_factor.adapters.llm.cli.availability_cache import AgentAvailabilityCache
 from rice_factor.adapters.llm.cli.base import CLITaskResult
+from rice_factor.adapters.llm.cli.workspace import IsolatedWorkspace
 from rice_factor.adapters.llm.orchestrator import (
     API_PREFERRED_TASKS,
     CLI_PREFERRED_TASKS,
@@ -430,6 +434,145 @@ class TestUnifiedOrchestratorExecution:
         assert available[1].name == "mid"
         assert available[2].name == "low"
 
+    @pytest.mark.asyncio
+    async def test_get_available_agents_uses_cache(self) -> None:
+        """Cached availability is reused instead of probing again."""
+        agent = MockCLIAgent(name="cached", available=True)
+        agent.is_available = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+        orchestrator = UnifiedOrchestrator(
+            cli_agents={"cached": agent},
+            availability_cache=AgentAvailabilityCache(cache_file=None),
+        )
+
+        with patch("shutil.which", return_value=None):
+            first = await orchestrator._get_available_agents()
+            second = await orchestrator._get_available_agents()
+
+        assert [a.name for a in first] == [a.name for a in second] == ["cached"]
+        agent.is_available.assert_awaited_once()
+
+
+class RacingCLIAgent(MockCLIAgent):
+    """Mock CLI agent that edits its workspace after a delay."""
+
+    def __init__(self, name: str, delay: float, priority: int = 10) -> None:
+        super().__init__(name=name, priority=priority)
+        self._delay = delay
+        self.cancelled = False
+
+    async def execute_task(
+        self,
+        prompt: str,
+        working_dir: Path,
+        timeout_seconds: float = 300.0,
+    ) -> CLITaskResult:
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        (working_dir / "result.txt").write_text(self._name)
+        return await super().execute_task(prompt, working_dir, timeout_seconds)
+
+
+class TestRaceMode:
+    """Tests for RACE orchestration mode."""
+
+    @pytest.mark.asyncio
+    async def test_first_success_wins_and_others_cancelled(self, tmp_path: Path) -> None:
+        """The fastest agent's changes are applied; the slower one is cancelled."""
+        fast = RacingCLIAgent("fast", delay=0.01, priority=20)
+        slow = RacingCLIAgent("slow", delay=5.0, priority=10)
+        orchestrator = UnifiedOrchestrator.from_agents_list(
+            cli_agents=[fast, slow], fallback_to_api=False
+        )
+
+        result = await orchestrator.execute(
+            "task", mode=OrchestrationMode.RACE, working_dir=tmp_path
+        )
+
+        assert result.success is True
+        assert result.mode == OrchestrationMode.RACE
+        assert result.provider_name == "fast"
+        assert slow.cancelled is True
+        assert (tmp_path / "result.txt").read_text() == "fast"
+        assert result.metadata["applied_files"] == ["result.txt"]
+
+    @pytest.mark.asyncio
+    async def test_validator_rejects_result(self, tmp_path: Path) -> None:
+        """A result failing validation does not win the race."""
+        fast = RacingCLIAgent("fast", delay=0.01)
+        slow = RacingCLIAgent("slow", delay=0.05)
+        orchestrator = UnifiedOrchestrator.from_agents_list(
+            cli_agents=[fast, slow],
+            fallback_to_api=False,
+            race_validator=lambda result, _path: result.agent_name != "fast",
+        )
+
+        result = await orchestrator.execute(
+            "task", mode=OrchestrationMode.RACE, working_dir=tmp_path
+        )
+
+        assert result.provider_name == "slow"
+        assert "fast: result failed validation" in result.metadata["errors"]
+        assert (tmp_path / "result.txt").read_text() == "slow"
+
+    @pytest.mark.asyncio
+    async def test_workspaces_created_one_at_a_time(self, tmp_path: Path) -> None:
+        """Racer workspaces are never created concurrently."""
+        active = 0
+        overlapped = False
+        real_create = IsolatedWorkspace.create
+
+        def create(source: Path, label: str = "agent") -> IsolatedWorkspace:
+            nonlocal active, overlapped
+            active += 1
+            overlapped = overlapped or active > 1
+            try:
+                time.sleep(0.01)
+                return real_create(source, label)
+            finally:
+                active -= 1
+
+        orchestrator = UnifiedOrchestrator.from_agents_list(
+            cli_agents=[RacingCLIAgent(n, delay=0.01) for n in ("a", "b", "c")],
+            fallback_to_api=False,
+        )
+        with patch.object(IsolatedWorkspace, "create", side_effect=create):
+            result = await orchestrator.execute(
+                "task", mode=OrchestrationMode.RACE, working_dir=tmp_path
+            )
+
+        assert result.success is True
+        assert overlapped is False
+
+    def test_cost_cap_limits_racers(self) -> None:
+        """Agents join the race only while the cost cap allows."""
+        agents = [MockCLIAgent(name=n, priority=p) for n, p in (("a", 1), ("b", 2), ("c", 3))]
+        orchestrator = UnifiedOrchestrator(
+            race_max_agents=3, race_agent_costs={"a": 1.0, "b": 2.0, "c": 0.5}
+        )
+
+        assert [a.name for a in orchestrator._select_racers(agents, None)] == ["a", "b", "c"]
+        assert [a.name for a in orchestrator._select_racers(agents, 2.0)] == ["a"]
+        assert [a.name for a in orchestrator._select_racers(agents, 0.1)] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_all_racers_fail(self, tmp_path: Path) -> None:
+        """Failures from every racer are reported."""
+        agent = MockCLIAgent(name="bad", success=False)
+        orchestrator = UnifiedOrchestrator.from_agents_list(
+            cli_agents=[agent], fallback_to_api=False
+        )
+
+        result = await orchestrator.execute(
+            "task", mode=OrchestrationMode.RACE, working_dir=tmp_path
+        )
+
+        assert result.success is False
+        assert result.metadata["errors"] == ["bad: Task failed"]
+
 
 class TestCreateOrchestratorFromConfig:
     """Tests for create_orchestrator_from_config."""
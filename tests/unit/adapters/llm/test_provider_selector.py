@@ -8,6 +8,7 @@ import pytest
 
 from rice_factor.adapters.llm.provider_selector import (
     AllProvidersFailedError,
+    ContextOverflowError,
     ProviderConfig,
     ProviderSelector,
     SelectionResult,
@@ -18,6 +19,7 @@ from rice_factor.domain.artifacts.compiler_types import (
     CompilerPassType,
     CompilerResult,
 )
+from rice_factor.domain.services.model_registry import ModelInfo, ModelRegistry
 
 
 def create_mock_adapter(
@@ -65,6 +67,10 @@ class TestSelectionStrategy:
         """SelectionStrategy.COST_BASED should have 'cost_based' value."""
         assert SelectionStrategy.COST_BASED.value == "cost_based"
 
+    def test_prompt_fit_value(self) -> None:
+        """SelectionStrategy.PROMPT_FIT should have 'prompt_fit' value."""
+        assert SelectionStrategy.PROMPT_FIT.value == "prompt_fit"
+
 
 class TestProviderConfig:
     """Tests for ProviderConfig dataclass."""
@@ -226,6 +232,137 @@ class TestProviderSelectorStrategy:
         assert selector.strategy == SelectionStrategy.ROUND_ROBIN
 
 
+def create_fit_registry() -> ModelRegistry:
+    """Create a registry with a small local, a large local and a cloud model."""
+    registry = ModelRegistry(load_defaults=False)
+    registry.register(
+        ModelInfo(id="small", provider="ollama", context_length=8192, is_local=True)
+    )
+    registry.register(
+        ModelInfo(id="large", provider="vllm", context_length=32768, is_local=True)
+    )
+    registry.register(
+        ModelInfo(
+            id="cloud",
+            provider="claude",
+            context_length=200000,
+            cost_per_1k_input=0.003,
+            cost_per_1k_output=0.015,
+        )
+    )
+    return registry
+
+
+def create_fit_selector(input_tokens: int, **kwargs: object) -> ProviderSelector:
+    """Create a PROMPT_FIT selector over the fit registry's models."""
+    providers = [
+        ProviderConfig("cloud", create_mock_adapter(), priority=1, model="cloud"),
+        ProviderConfig("large", create_mock_adapter(), priority=2, model="large"),
+        ProviderConfig("small", create_mock_adapter(), priority=3, model="small"),
+    ]
+    return ProviderSelector(
+        providers,
+        strategy=SelectionStrategy.PROMPT_FIT,
+        model_registry=create_fit_registry(),
+        token_estimator=lambda *_: input_tokens,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class TestProviderSelectorPromptFit:
+    """Tests for the PROMPT_FIT strategy."""
+
+    def test_small_prompt_goes_to_smallest_free_model(self) -> None:
+        """A small prompt should use the smallest zero-cost model."""
+        selector = create_fit_selector(input_tokens=1000)
+
+        result = selector.generate(CompilerPassType.PROJECT, create_context(), {})
+
+        assert result.provider_name == "small"
+        assert result.estimated_input_tokens == 1000
+
+    def test_long_prompt_skips_models_it_overflows(self) -> None:
+        """A prompt too long for a model's context window should skip it."""
+        selector = create_fit_selector(input_tokens=20000)
+        small = selector.get_provider("small")
+        assert small is not None
+
+        result = selector.generate(CompilerPassType.PROJECT, create_context(), {})
+
+        assert result.provider_name == "large"
+        small.adapter.generate.assert_not_called()
+
+    def test_falls_back_only_to_fitting_models(self) -> None:
+        """Fallback should never try a model the prompt overflows."""
+        selector = create_fit_selector(input_tokens=20000)
+        large = selector.get_provider("large")
+        assert large is not None
+        large.adapter.generate.side_effect = RuntimeError("down")
+
+        result = selector.generate(CompilerPassType.PROJECT, create_context(), {})
+
+        assert result.provider_name == "cloud"
+        assert result.attempts == 2
+
+    def test_raises_before_sending_when_nothing_fits(self) -> None:
+        """ContextOverflowError should be raised without calling any adapter."""
+        selector = create_fit_selector(input_tokens=500000)
+
+        with pytest.raises(ContextOverflowError) as exc_info:
+            selector.generate(CompilerPassType.PROJECT, create_context(), {})
+
+        assert exc_info.value.estimated_tokens == 500000
+        assert len(exc_info.value.errors) == 3
+        for provider in selector.all_providers:
+            provider.adapter.generate.assert_not_called()
+
+    def test_margin_and_output_reservation_count_towards_fit(self) -> None:
+        """The margin and reserved output tokens should be part of the check."""
+        # 4000 * 1.1 + 4096 > 8192, although 4000 + 4096 fits
+        selector = create_fit_selector(input_tokens=4000)
+
+        result = selector.generate(CompilerPassType.PROJECT, create_context(), {})
+
+        assert result.provider_name == "large"
+
+    def test_observed_latency_breaks_cost_ties(self) -> None:
+        """Among equally cheap models the faster one should be chosen."""
+        selector = create_fit_selector(input_tokens=1000)
+        selector._latency_ms.update({"small": 900.0, "large": 100.0})
+
+        result = selector.generate(CompilerPassType.PROJECT, create_context(), {})
+
+        assert result.provider_name == "large"
+
+    def test_records_latency_of_successful_calls(self) -> None:
+        """Successful calls should update the provider's observed latency."""
+        selector = create_fit_selector(input_tokens=1000)
+
+        selector.generate(CompilerPassType.PROJECT, create_context(), {})
+
+        assert set(selector.observed_latency_ms) == {"small"}
+
+    def test_explicit_context_length_overrides_registry(self) -> None:
+        """ProviderConfig.context_length should take precedence."""
+        adapter = create_mock_adapter()
+        adapter.model = "unregistered"
+        providers = [
+            ProviderConfig("tiny", adapter, priority=1, context_length=2048),
+            ProviderConfig("unknown", create_mock_adapter(), priority=2),
+        ]
+        selector = ProviderSelector(
+            providers,
+            strategy=SelectionStrategy.PROMPT_FIT,
+            model_registry=create_fit_registry(),
+            token_estimator=lambda *_: 1000,
+        )
+
+        result = selector.generate(CompilerPassType.PROJECT, create_context(), {})
+
+        # Unknown context windows are assumed to fit
+        assert result.provider_name == "unknown"
+
+
 class TestProviderSelectorFallback:
     """Tests for ProviderSelector fallback behavior."""
 
@@ -481,6 +618,24 @@ class TestCreateProviderSelectorFromConfig:
 
         assert selector.strategy == SelectionStrategy.COST_BASED
 
+    def test_creates_selector_with_prompt_fit_strategy(self) -> None:
+        """create_provider_selector_from_config should handle prompt_fit strategy."""
+        with patch("rice_factor.config.settings.settings") as mock_settings:
+            mock_settings.get.side_effect = lambda key, default=None: {
+                "llm.fallback": {
+                    "providers": [],
+                    "strategy": "prompt_fit",
+                },
+            }.get(key, default)
+
+            from rice_factor.adapters.llm.provider_selector import (
+                create_provider_selector_from_config,
+            )
+
+            selector = create_provider_selector_from_config()
+
+        assert selector.strategy == SelectionStrategy.PROMPT_FIT
+
     def test_unknown_strategy_defaults_to_priority(self) -> None:
         """create_provider_selector_from_config should default to priority for unknown strategy."""
         with patch("rice_factor.config.settings.settings") as mock_settings:
@@ -0,0 +1,295 @@
+"""Unit tests for single-flight request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from rice_factor.adapters.llm.provider_selector import (
+    ProviderConfig,
+    ProviderSelector,
+)
+from rice_factor.adapters.llm.single_flight import (
+    SingleFlight,
+    SingleFlightTimeoutError,
+    request_key,
+)
+from rice_factor.domain.artifacts.compiler_types import (
+    CompilerContext,
+    CompilerPassType,
+    CompilerResult,
+)
+
+
+def create_context(target_file: str | None = None) -> CompilerContext:
+    """Create a test CompilerContext."""
+    return CompilerContext(
+        pass_type=CompilerPassType.PROJECT,
+        project_files={"requirements.md": "# Requirements"},
+        artifacts={},
+        target_file=target_file,
+    )
+
+
+class TestRequestKey:
+    """Tests for request_key."""
+
+    def test_identical_requests_share_key(self) -> None:
+        """Equal requests hash the same regardless of dict ordering."""
+        a = request_key(CompilerPassType.PROJECT, create_context(), {"a": 1, "b": 2})
+        b = request_key(CompilerPassType.PROJECT, create_context(), {"b": 2, "a": 1})
+        assert a == b
+
+    def test_different_requests_differ(self) -> None:
+        """Any change to pass, context or schema changes the key."""
+        base = request_key(CompilerPassType.PROJECT, create_context(), {})
+        assert base != request_key(CompilerPassType.TEST, create_context(), {})
+        assert base != request_key(
+            CompilerPassType.PROJECT, create_context("src/a.py"), {}
+        )
+        assert base != request_key(CompilerPassType.PROJECT, create_context(), {"x": 1})
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight.do."""
+
+    def test_concurrent_calls_share_one_call(self) -> None:
+        """Only the leader runs fn; waiters get its result."""
+        flight: SingleFlight[str] = SingleFlight()
+        release = threading.Event()
+        calls = 0
+
+        def fn() -> str:
+            nonlocal calls
+            calls += 1
+            release.wait(2)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flight.do, "k", fn, 2.0) for _ in range(4)]
+            while flight.coalesced_count < 3:
+                time.sleep(0.005)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert calls == 1
+        assert [r for r, _ in results] == ["result"] * 4
+        assert sorted(shared for _, shared in results) == [False, True, True, True]
+        assert flight.in_flight() == 0
+
+    def test_completed_calls_are_not_cached(self) -> None:
+        """Sequential calls each run fn."""
+        flight: SingleFlight[int] = SingleFlight()
+        fn = MagicMock(side_effect=[1, 2])
+
+        assert flight.do("k", fn) == (1, False)
+        assert flight.do("k", fn) == (2, False)
+
+    def test_error_propagates_to_all_callers(self) -> None:
+        """The leader's exception is raised for every waiter."""
+        flight: SingleFlight[str] = SingleFlight()
+        release = threading.Event()
+
+        def fn() -> str:
+            release.wait(2)
+            raise RuntimeError("provider down")
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(flight.do, "k", fn, 2.0) for _ in range(3)]
+            while flight.coalesced_count < 2:
+                time.sleep(0.005)
+            release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError, match="provider down"):
+                    future.result()
+
+    def test_waiter_timeout(self) -> None:
+        """A waiter gives up after its timeout while the leader continues."""
+        flight: SingleFlight[str] = SingleFlight()
+        release = threading.Event()
+        started = threading.Event()
+
+        def fn() -> str:
+            started.set()
+            release.wait(2)
+            return "late"
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(flight.do, "k", fn)
+            started.wait(2)
+            with pytest.raises(SingleFlightTimeoutError):
+                flight.do("k", fn, timeout=0.01)
+            release.set()
+            assert leader.result() == ("late", False)
+
+    def test_waiters_share_the_key_deadline(self) -> None:
+        """A late waiter gives up at the key's deadline, not its own timeout."""
+        flight: SingleFlight[str] = SingleFlight()
+        release = threading.Event()
+        started = threading.Event()
+
+        def fn() -> str:
+            started.set()
+            release.wait(2)
+            return "late"
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(flight.do, "k", fn, 0.05)
+            started.wait(2)
+            start = time.monotonic()
+            with pytest.raises(SingleFlightTimeoutError):
+                flight.do("k", fn, timeout=5.0)
+            assert time.monotonic() - start < 1.0
+            release.set()
+            assert leader.result() == ("late", False)
+
+
+class TestSingleFlightAsync:
+    """Tests for SingleFlight.do_async."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_call(self) -> None:
+        """Concurrent coroutines await a single underlying call."""
+        flight: SingleFlight[str] = SingleFlight()
+        calls = 0
+
+        async def fn() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do_async("k", fn) for _ in range(3)))
+
+        assert calls == 1
+        assert [r for r, _ in results] == ["result"] * 3
+        assert [shared for _, shared in results] == [False, True, True]
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_callers(self) -> None:
+        """The shared exception is raised for every awaiting caller."""
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def fn() -> str:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(
+            *(flight.do_async("k", fn) for _ in range(2)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_timeout_does_not_cancel_shared_call(self) -> None:
+        """A caller timing out leaves the call running for the others."""
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def fn() -> str:
+            await asyncio.sleep(0.05)
+            return "result"
+
+        leader = asyncio.create_task(flight.do_async("k", fn))
+        await asyncio.sleep(0)
+        with pytest.raises(SingleFlightTimeoutError):
+            await flight.do_async("k", fn, timeout=0.01)
+
+        assert await leader == ("result", False)
+        assert flight.coalesced_count == 1
+
+    @pytest.mark.asyncio
+    async def test_waiters_share_the_key_deadline(self) -> None:
+        """A late waiter gives up at the key's deadline, not its own timeout."""
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def fn() -> str:
+            await asyncio.sleep(0.2)
+            return "result"
+
+        leader = asyncio.create_task(flight.do_async("k", fn, timeout=0.02))
+        await asyncio.sleep(0)
+        with pytest.raises(SingleFlightTimeoutError):
+            await asyncio.wait_for(flight.do_async("k", fn, timeout=5.0), 0.1)
+        with pytest.raises(SingleFlightTimeoutError):
+            await leader
+
+
+class TestProviderSelectorCoalescing:
+    """Tests for request coalescing in ProviderSelector."""
+
+    def _selector(self, adapter: MagicMock, **kwargs: object) -> ProviderSelector:
+        return ProviderSelector(
+            [ProviderConfig("claude", adapter, priority=1)], **kwargs  # type: ignore[arg-type]
+        )
+
+    def test_identical_concurrent_requests_call_provider_once(self) -> None:
+        """Concurrent identical generate calls share one provider call."""
+        release = threading.Event()
+        adapter = MagicMock()
+
+        def generate(*_args: object, **_kwargs: object) -> CompilerResult:
+            release.wait(2)
+            return CompilerResult(success=True, payload={"ok": True})
+
+        adapter.generate.side_effect = generate
+        selector = self._selector(adapter)
+        flight = selector._single_flight
+        assert flight is not None
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(selector.generate, CompilerPassType.PROJECT, create_context(), {})
+                for _ in range(3)
+            ]
+            while flight.coalesced_count < 2:
+                time.sleep(0.005)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert adapter.generate.call_count == 1
+        assert sorted(r.shared for r in results) == [False, True, True]
+        assert all(r.result.payload == {"ok": True} for r in results)
+
+    def test_callers_get_their_own_payload(self) -> None:
+        """Changing one caller's payload does not affect the others."""
+        release = threading.Event()
+        adapter = MagicMock()
+
+        def generate(*_args: object, **_kwargs: object) -> CompilerResult:
+            release.wait(2)
+            return CompilerResult(success=True, payload={"items": [1]})
+
+        adapter.generate.side_effect = generate
+        selector = self._selector(adapter)
+        flight = selector._single_flight
+        assert flight is not None
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(selector.generate, CompilerPassType.PROJECT, create_context(), {})
+                for _ in range(2)
+            ]
+            while flight.coalesced_count < 1:
+                time.sleep(0.005)
+            release.set()
+            first, second = (f.result() for f in futures)
+
+        first.result.payload["items"].append(2)
+        assert second.result.payload == {"items": [1]}
+
+    def test_coalescing_can_be_disabled(self) -> None:
+        """With coalescing off every request reaches the provider."""
+        adapter = MagicMock()
+        adapter.generate.return_value = CompilerResult(success=True, payload={})
+        selector = self._selector(adapter, coalesce_requests=False)
+
+        for _ in range(2):
+            selector.generate(CompilerPassType.PROJECT, create_context(), {})
+
+        assert adapter.generate.call_count == 2
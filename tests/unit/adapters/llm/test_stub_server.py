@@ -0,0 +1,226 @@
+"""Unit tests for the stub LLM server."""
+
+import json
+import time
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from rice_factor.adapters.llm.stub_server import (
+    StubLLMServer,
+    StubServerConfig,
+    StubServerStats,
+    echo_responder,
+    plan_responder,
+)
+
+
+@pytest.fixture
+def server() -> Iterator[StubLLMServer]:
+    """Run a StubLLMServer with default settings."""
+    with StubLLMServer() as stub:
+        yield stub
+
+
+def _sse_data(text: str) -> list[str]:
+    return [line[len("data: ") :] for line in text.splitlines() if line.startswith("data: ")]
+
+
+class TestStubServerConfig:
+    """Tests for StubServerConfig."""
+
+    def test_rejects_invalid_error_rate(self) -> None:
+        """error_rate must be a fraction."""
+        with pytest.raises(ValueError, match="error_rate"):
+            StubServerConfig(error_rate=1.5)
+
+    def test_rejects_negative_latency(self) -> None:
+        """Delays cannot be negative."""
+        with pytest.raises(ValueError, match="latency"):
+            StubServerConfig(latency=-1.0)
+
+
+class TestStubServerStats:
+    """Tests for StubServerStats."""
+
+    def test_connection_reuse(self) -> None:
+        """Reuse is the share of requests beyond one per connection."""
+        assert StubServerStats(requests=10, connections=2).connection_reuse == 0.8
+        assert StubServerStats().connection_reuse == 0.0
+
+
+class TestOpenAIEndpoints:
+    """Tests for the OpenAI and vLLM endpoints."""
+
+    def test_completions_answers_each_prompt(self, server: StubLLMServer) -> None:
+        """A prompt list gets one choice per prompt, in order."""
+        response = httpx.post(
+            f"{server.base_url}/v1/completions",
+            json={"model": "stub", "prompt": ["sys\nfirst", "sys\nsecond"]},
+        )
+
+        choices = response.json()["choices"]
+        assert [c["index"] for c in choices] == [0, 1]
+        assert [json.loads(c["text"]) for c in choices] == [
+            {"echo": "first"},
+            {"echo": "second"},
+        ]
+
+    def test_chat_completions_stream(self, server: StubLLMServer) -> None:
+        """Streamed chat chunks reassemble into the completion."""
+        response = httpx.post(
+            f"{server.base_url}/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "hi"}], "stream": True},
+        )
+
+        events = _sse_data(response.text)
+        assert events[-1] == "[DONE]"
+        text = "".join(
+            json.loads(e)["choices"][0]["delta"]["content"] for e in events[:-1]
+        )
+        assert text == echo_responder("hi")
+        assert server.stats.streamed == 1
+
+    def test_models_and_health(self, server: StubLLMServer) -> None:
+        """Model listing and health checks succeed."""
+        models = httpx.get(f"{server.base_url}/v1/models").json()
+        health = httpx.get(f"{server.base_url}/health")
+
+        assert models["data"][0]["id"] == "stub"
+        assert health.status_code == 200
+
+
+class TestOllamaEndpoints:
+    """Tests for the Ollama endpoints."""
+
+    def test_generate_without_stream(self, server: StubLLMServer) -> None:
+        """stream=false returns one object with token counts."""
+        response = httpx.post(
+            f"{server.base_url}/api/generate",
+            json={"model": "stub", "prompt": "x\nhello", "stream": False},
+        )
+
+        body = response.json()
+        assert body["done"] is True
+        assert json.loads(body["response"]) == {"echo": "hello"}
+        assert body["eval_count"] > 0
+
+    def test_generate_streams_by_default(self, server: StubLLMServer) -> None:
+        """Ollama streams NDJSON unless told otherwise."""
+        response = httpx.post(
+            f"{server.base_url}/api/generate", json={"model": "stub", "prompt": "hello"}
+        )
+
+        lines = [json.loads(line) for line in response.text.splitlines() if line]
+        assert lines[-1]["done"] is True
+        assert "".join(line["response"] for line in lines) == echo_responder("hello")
+
+    def test_tags(self, server: StubLLMServer) -> None:
+        """The configured model is listed."""
+        tags = httpx.get(f"{server.base_url}/api/tags").json()
+
+        assert tags["models"][0]["name"] == "stub"
+
+
+class TestAnthropicEndpoint:
+    """Tests for the Anthropic Messages endpoint."""
+
+    def test_messages_include_system_prompt(self) -> None:
+        """The system prompt is part of the prompt given to the responder."""
+        prompts: list[str] = []
+
+        def record(prompt: str) -> str:
+            prompts.append(prompt)
+            return "ok"
+
+        with StubLLMServer(responder=record) as server:
+            response = httpx.post(
+                f"{server.base_url}/v1/messages",
+                json={
+                    "system": [{"type": "text", "text": "SYSTEM"}],
+                    "messages": [{"role": "user", "content": "USER"}],
+                },
+            )
+
+        assert response.json()["content"] == [{"type": "text", "text": "ok"}]
+        assert prompts == ["SYSTEM\n\nUSER"]
+
+    def test_messages_stream_events(self, server: StubLLMServer) -> None:
+        """Streaming sends the Messages event sequence."""
+        response = httpx.post(
+            f"{server.base_url}/v1/messages",
+            json={"messages": [{"role": "user", "content": "hi"}], "stream": True},
+        )
+
+        events = [json.loads(e)["type"] for e in _sse_data(response.text)]
+        assert events[0] == "message_start"
+        assert "content_block_delta" in events
+        assert events[-1] == "message_stop"
+
+
+class TestStubServerBehavior:
+    """Tests for latency, errors and connection tracking."""
+
+    def test_errors_are_reproducible(self) -> None:
+        """The same seed fails the same requests."""
+
+        def statuses() -> list[int]:
+            config = StubServerConfig(error_rate=0.5, seed=7)
+            with StubLLMServer(config) as server, httpx.Client() as client:
+                return [
+                    client.post(
+                        f"{server.base_url}/v1/completions", json={"prompt": "x"}
+                    ).status_code
+                    for _ in range(10)
+                ]
+
+        first = statuses()
+        assert first == statuses()
+        assert set(first) == {200, 500}
+
+    def test_latency_and_token_rate_delay_responses(self) -> None:
+        """A response takes at least latency plus tokens / token_rate."""
+        config = StubServerConfig(latency=0.05, token_rate=100.0)
+        with StubLLMServer(config, responder=lambda _: "x" * 20) as server:
+            start = time.perf_counter()
+            httpx.post(f"{server.base_url}/v1/completions", json={"prompt": "x"})
+            elapsed = time.perf_counter() - start
+
+        # 20 characters are 5 tokens, 0.05s at 100 tokens/s
+        assert elapsed >= 0.1
+
+    def test_counts_connection_reuse(self, server: StubLLMServer) -> None:
+        """Requests on a kept-alive connection count as reused."""
+        with httpx.Client() as client:
+            for _ in range(4):
+                client.post(f"{server.base_url}/v1/completions", json={"prompt": "x"})
+        httpx.post(f"{server.base_url}/v1/completions", json={"prompt": "x"})
+
+        stats = server.stats
+        assert stats.requests == 5
+        assert stats.connections == 2
+        assert stats.by_path == {"/v1/completions": 5}
+
+    def test_unknown_path_is_404(self, server: StubLLMServer) -> None:
+        """Unknown endpoints are rejected."""
+        response = httpx.post(f"{server.base_url}/v2/unknown", json={})
+
+        assert response.status_code == 404
+
+
+class TestPlanResponder:
+    """Tests for plan_responder."""
+
+    def test_implementation_plan_for_target(self) -> None:
+        """The implementation pass gets a plan for the prompt's target file."""
+        prompt = "PASS: Implementation Planner\n\nCONTEXT:\n\nTARGET FILE: src/app.py"
+
+        payload = json.loads(plan_responder(prompt))
+
+        assert payload["target"] == "src/app.py"
+        assert payload["steps"]
+
+    def test_unknown_pass(self) -> None:
+        """Prompts without a known pass get an empty object."""
+        assert plan_responder("hello") == "{}"
@@ -134,6 +134,48 @@ class TestUsageTrackerRecordWithTokens:
         # 1000 * 0.003/1000 + 500 * 0.015/1000 = 0.003 + 0.0075 = 0.0105
         assert abs(record.cost_usd - 0.0105) < 0.0001
 
+    def test_records_cache_tokens_with_default_pricing(self) -> None:
+        """Cache reads/writes should be priced relative to the input price."""
+        tracker = UsageTracker()
+
+        record = tracker.record_with_tokens(
+            provider="claude",
+            model="claude-sonnet",
+            input_tokens=0,
+            output_tokens=0,
+            latency_ms=100.0,
+            cost_per_1k_input=0.003,
+            cache_read_tokens=10000,
+            cache_write_tokens=1000,
+        )
+
+        assert record.cache_read_tokens == 10000
+        assert record.cache_write_tokens == 1000
+        # 10 * 0.0003 + 1 * 0.00375 = 0.003 + 0.00375
+        assert record.cost_usd == pytest.approx(0.00675)
+
+    def test_cache_tokens_aggregate_per_provider(self) -> None:
+        """Cache counters should roll up into totals and provider stats."""
+        tracker = UsageTracker()
+        for read, write in [(0, 800), (800, 0), (800, 0)]:
+            tracker.record_with_tokens(
+                provider="claude",
+                model="claude-sonnet",
+                input_tokens=100,
+                output_tokens=10,
+                latency_ms=10.0,
+                cache_read_tokens=read,
+                cache_write_tokens=write,
+            )
+
+        assert tracker.total_cache_tokens() == (1600, 800)
+        stats = tracker.by_provider()["claude"]
+        assert stats.total_cache_read_tokens == 1600
+        assert stats.total_cache_write_tokens == 800
+        assert stats.cache_hit_rate == pytest.approx(2 / 3)
+        assert tracker.export_json()["total_cache_read_tokens"] == 1600
+        assert 'type="cache_read"} 1600' in tracker.export_prometheus()
+
 
 class TestUsageTrackerCountTokens:
     """Tests for UsageTracker.count_tokens method."""
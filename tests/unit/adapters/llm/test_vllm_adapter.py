@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -17,6 +18,10 @@ from rice_factor.domain.artifacts.compiler_types import (
     CompilerPassType,
 )
 from rice_factor.domain.failures.llm_errors import LLMTimeoutError
+from rice_factor.domain.prompts import OUTPUT_REPAIR_PROMPT, PROJECT_PLANNER_PROMPT
+
+if TYPE_CHECKING:
+    from tests.unit.adapters.llm.conftest import StubCompletionServer
 
 
 class TestVLLMClientInit:
@@ -92,6 +97,41 @@ class TestVLLMClientGenerate:
         assert result == {"choices": [{"text": "test output"}]}
 
 
+class TestVLLMClientGenerateBatch:
+    """Tests for VLLMClient.generate_batch against a local stub server."""
+
+    def test_concurrent_results_in_order(self, stub_server: StubCompletionServer) -> None:
+        """Prompts run concurrently up to the limit and come back in order."""
+        client = VLLMClient(base_url=stub_server.base_url)
+        prompts = [f"p{i}" for i in range(6)]
+
+        results = client.generate_batch("m", prompts, max_in_flight=3)
+
+        texts = [r.response["choices"][0]["text"] for r in results if r.response]
+        assert texts == [f'{{"echo": "p{i}"}}' for i in range(6)]
+        assert stub_server.requests == 6
+        assert stub_server.max_in_flight == 3
+
+    def test_per_item_errors(self, stub_server: StubCompletionServer) -> None:
+        """A failing prompt does not affect the others."""
+        client = VLLMClient(base_url=stub_server.base_url)
+
+        results = client.generate_batch("m", ["a", "FAIL", "c"])
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, VLLMClientError)
+
+    def test_multi_prompt_single_request(self, stub_server: StubCompletionServer) -> None:
+        """multi_prompt sends one request and splits the choices."""
+        client = VLLMClient(base_url=stub_server.base_url)
+
+        results = client.generate_batch("m", ["a", "b", "c"], multi_prompt=True)
+
+        assert stub_server.requests == 1
+        texts = [r.response["choices"][0]["text"] for r in results if r.response]
+        assert texts == ['{"echo": "a"}', '{"echo": "b"}', '{"echo": "c"}']
+
+
 class TestVLLMClientIsAvailable:
     """Tests for VLLMClient is_available method."""
 
@@ -309,6 +349,71 @@ class TestVLLMAdapterGenerate:
         assert "Connection refused" in str(result.error_details)
 
 
+class TestVLLMAdapterRepair:
+    """Tests for VLLMAdapter repair method."""
+
+    @patch.object(VLLMClient, "generate")
+    def test_repair_sends_repair_prompt_and_patch_schema(
+        self, mock_generate: MagicMock
+    ) -> None:
+        """repair sends the repair system prompt and the patch schema only."""
+        mock_generate.return_value = {
+            "choices": [{"text": '{"/modules/0/name": "billing"}'}]
+        }
+        request = CompilerContext(
+            pass_type=CompilerPassType.PROJECT,
+            project_files={},
+            artifacts={"repair_request": {"errors": [{"pointer": "/modules/0/name"}]}},
+        )
+        schema: dict[str, object] = {
+            "type": "object",
+            "properties": {"/modules/0/name": {"type": "string"}},
+            "required": ["/modules/0/name"],
+        }
+
+        result = VLLMAdapter().repair(CompilerPassType.PROJECT, request, schema)
+
+        assert result.payload == {"/modules/0/name": "billing"}
+        prompt = mock_generate.call_args.kwargs["prompt"]
+        assert prompt.startswith(OUTPUT_REPAIR_PROMPT)
+        assert "PATCH SCHEMA" in prompt
+        assert PROJECT_PLANNER_PROMPT not in prompt
+        assert "JSON SCHEMA" not in prompt
+
+
+class TestVLLMAdapterGenerateBatch:
+    """Tests for VLLMAdapter.generate_batch."""
+
+    def test_results_in_request_order(self, stub_server: StubCompletionServer) -> None:
+        """Each request gets its parsed payload or its own failure."""
+        adapter = VLLMAdapter(base_url=stub_server.base_url, max_in_flight=4)
+        requests = [
+            (
+                CompilerPassType.IMPLEMENTATION,
+                CompilerContext(
+                    pass_type=CompilerPassType.IMPLEMENTATION,
+                    project_files={},
+                    artifacts={},
+                    target_file=target,
+                ),
+                {"type": "object"},
+            )
+            for target in ("a.py", "FAIL.py", "c.py")
+        ]
+
+        with patch.object(
+            VLLMAdapter,
+            "_build_full_prompt",
+            side_effect=lambda _pass_type, context, _schema: context.target_file,
+        ):
+            results = adapter.generate_batch(requests)
+
+        assert results[0].payload == {"echo": "a.py"}
+        assert results[1].success is False
+        assert results[1].error_type == "client_error"
+        assert results[2].payload == {"echo": "c.py"}
+
+
 class TestVLLMAdapterListModels:
     """Tests for VLLMAdapter list_models method."""
 
@@ -387,7 +492,7 @@ class TestCreateVLLMAdapterFromConfig:
     def test_creates_adapter_with_defaults(self) -> None:
         """create_vllm_adapter_from_config should use defaults."""
         with patch("rice_factor.config.settings.settings") as mock_settings:
-            mock_settings.get.side_effect = lambda key, default: default
+            mock_settings.get.side_effect = lambda _key, default: default
 
             from rice_factor.adapters.llm.vllm_adapter import (
                 create_vllm_adapter_from_config,
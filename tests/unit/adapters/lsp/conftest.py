@@ -0,0 +1,108 @@
+"""Fixtures for LSP adapter tests."""
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from rice_factor.adapters.lsp.client import LSPClient
+from rice_factor.domain.ports.lsp import LSPServerConfig
+
+# A minimal language server. It asks the client for its configuration
+# before answering initialize, holds references requests until three have
+# arrived and answers them in reverse order, never answers "hang" and
+# exits on "crash". It asks for incremental sync, finds no definitions,
+# renames the character at the position and answers "test/documents" with
+# the document notifications it received.
+FAKE_SERVER = r"""
+import json
+import sys
+
+stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+
+
+def read():
+    length = None
+    while True:
+        line = stdin.readline()
+        if not line:
+            sys.exit(0)
+        if not line.strip():
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return json.loads(stdin.read(length).decode("utf-8"))
+
+
+def write(message):
+    body = json.dumps(message).encode("utf-8")
+    stdout.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stdout.flush()
+
+
+held = []
+documents = []
+while True:
+    message = read()
+    method = message.get("method")
+    if method == "initialize":
+        write({"jsonrpc": "2.0", "id": "cfg", "method": "workspace/configuration"})
+        while read().get("id") != "cfg":
+            pass
+        capabilities = {"textDocumentSync": {"openClose": True, "change": 2}}
+        result = {"capabilities": capabilities}
+        write({"jsonrpc": "2.0", "id": message["id"], "result": result})
+    elif method and method.startswith("textDocument/did"):
+        documents.append(message)
+    elif method == "textDocument/definition":
+        write({"jsonrpc": "2.0", "id": message["id"], "result": []})
+    elif method == "textDocument/rename":
+        params = message["params"]
+        start = params["position"]
+        end = {"line": start["line"], "character": start["character"] + 1}
+        edit = {"range": {"start": start, "end": end}, "newText": params["newName"]}
+        result = {"changes": {params["textDocument"]["uri"]: [edit]}}
+        write({"jsonrpc": "2.0", "id": message["id"], "result": result})
+    elif method == "test/documents":
+        write({"jsonrpc": "2.0", "id": message["id"], "result": documents})
+    elif method == "textDocument/references":
+        held.append(message)
+        if len(held) == 3:
+            for request in reversed(held):
+                params = request["params"]
+                location = {
+                    "uri": params["textDocument"]["uri"],
+                    "range": {"start": params["position"], "end": params["position"]},
+                }
+                write({"jsonrpc": "2.0", "id": request["id"], "result": [location]})
+            held = []
+    elif method == "shutdown":
+        write({"jsonrpc": "2.0", "id": message["id"], "result": None})
+    elif method in ("exit", "crash"):
+        sys.exit(0)
+"""
+
+
+@pytest.fixture
+def fake_server_config(tmp_path: Path) -> LSPServerConfig:
+    """Configuration that runs the fake language server."""
+    script = tmp_path / "fake_server.py"
+    script.write_text(FAKE_SERVER)
+    return LSPServerConfig(
+        name="fake",
+        command=[sys.executable, str(script)],
+        languages=["go"],
+        timeout_seconds=5,
+        initialization_timeout=5,
+    )
+
+
+@pytest.fixture
+def client(fake_server_config: LSPServerConfig, tmp_path: Path) -> Iterator[LSPClient]:
+    """Start an LSPClient against the fake server."""
+    lsp_client = LSPClient(fake_server_config, tmp_path)
+    assert lsp_client.start()
+    yield lsp_client
+    lsp_client.stop()
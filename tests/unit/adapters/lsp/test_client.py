@@ -0,0 +1,120 @@
+"""Unit tests for LSPClient request dispatch."""
+
+import time
+from pathlib import Path
+
+from rice_factor.adapters.lsp.client import LSPClient, text_change
+
+
+class TestLSPClientDispatch:
+    """Tests for future-based request dispatch."""
+
+    def test_requests_are_pipelined(self, client: LSPClient, tmp_path: Path) -> None:
+        """Requests answered out of order all reach their callers."""
+        source = tmp_path / "main.go"
+        source.write_text("package main\n")
+
+        results = client.find_references_many(
+            [(str(source), 0, 0), (str(source), 0, 8), (str(source), 1, 0)]
+        )
+
+        assert all(r.success for r in results)
+        assert [(r.locations[0].start_line, r.locations[0].start_column) for r in results] == [
+            (0, 0),
+            (0, 8),
+            (1, 0),
+        ]
+
+    def test_non_ascii_content(self, client: LSPClient, tmp_path: Path) -> None:
+        """Content-Length counts bytes, so non-ASCII documents do not stall."""
+        source = tmp_path / "main.go"
+        source.write_text('package main\n\n// héllo wörld ✓\nvar s = "日本"\n', encoding="utf-8")
+
+        results = client.find_references_many([(str(source), 3, 4)] * 3)
+
+        assert all(r.success for r in results)
+
+    def test_rename_many(self, client: LSPClient, tmp_path: Path) -> None:
+        """Renames share one session and keep their order."""
+        source = tmp_path / "main.go"
+        source.write_text("package main\n\nvar a, b = 1, 2\n")
+
+        results = client.rename_many([(str(source), 2, 4, "x"), (str(source), 2, 7, "y")])
+
+        assert [r.success for r in results] == [True, True]
+        assert [(e.start_column, e.new_text) for r in results for e in r.edits] == [
+            (4, "x"),
+            (7, "y"),
+        ]
+        assert results[0].edits[0].file_path == str(source)
+
+    def test_timeout(self, client: LSPClient) -> None:
+        """An unanswered request returns None after the timeout."""
+        start = time.monotonic()
+
+        assert client.send_requests([("hang", {})], timeout=0.2) == [None]
+        assert time.monotonic() - start < 2
+
+    def test_server_exit_fails_pending_requests(self, client: LSPClient) -> None:
+        """Waiting requests fail as soon as the server goes away."""
+        start = time.monotonic()
+
+        assert client.send_requests([("hang", {}), ("crash", {})]) == [None, None]
+        assert time.monotonic() - start < 2
+
+    def test_status(self, client: LSPClient) -> None:
+        """Status reports the running server and its last request."""
+        status = client.get_status()
+
+        assert status.is_running
+        assert status.pid is not None
+        assert status.last_operation == "initialize"
+
+
+class TestDocumentVersioning:
+    """Tests for open document tracking."""
+
+    def test_changes_are_sent_as_versioned_did_change(
+        self, client: LSPClient, tmp_path: Path
+    ) -> None:
+        """A document is opened once; later edits are incremental changes."""
+        source = tmp_path / "main.go"
+        source.write_text("package main\n\nfunc a() {}\n")
+        client.find_definition(str(source), 2, 5)
+        client.find_definition(str(source), 2, 5)
+        source.write_text("package main\n\nfunc b() {}\n")
+        client.find_definition(str(source), 2, 5)
+
+        (did_open, did_change) = client.send_requests([("test/documents", {})])[0]
+
+        assert did_open["method"] == "textDocument/didOpen"
+        assert did_open["params"]["textDocument"]["version"] == 1
+        assert did_change["method"] == "textDocument/didChange"
+        assert did_change["params"]["textDocument"]["version"] == 2
+        assert did_change["params"]["contentChanges"] == [
+            {
+                "range": {
+                    "start": {"line": 2, "character": 5},
+                    "end": {"line": 2, "character": 6},
+                },
+                "text": "b",
+            }
+        ]
+        assert client.get_document_version(str(source)) == 2
+
+    def test_close_document(self, client: LSPClient, tmp_path: Path) -> None:
+        """Closing forgets the document, so the next use reopens it."""
+        source = tmp_path / "main.go"
+        source.write_text("package main\n")
+        client.find_definition(str(source), 0, 0)
+
+        client.close_document(str(source))
+
+        assert client.get_document_version(str(source)) is None
+
+    def test_text_change_counts_utf16_units(self) -> None:
+        """Positions count UTF-16 code units, as LSP expects."""
+        change = text_change('s := "😀a"\n', 's := "😀b"\n')
+
+        assert change["range"]["start"] == {"line": 0, "character": 8}
+        assert change["text"] == "b"
@@ -0,0 +1,96 @@
+"""Unit tests for the LSP daemon and its client."""
+
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from rice_factor.adapters.lsp.daemon import LSPDaemon, LSPDaemonClient
+from rice_factor.domain.ports.lsp import LSPServerConfig
+
+
+@pytest.fixture
+def daemon(tmp_path: Path) -> Iterator[LSPDaemon]:
+    """Run a daemon for tmp_path on a background thread."""
+    lsp_daemon = LSPDaemon(tmp_path, check_interval=0.05)
+    thread = threading.Thread(target=lsp_daemon.serve_forever, daemon=True)
+    thread.start()
+    while not lsp_daemon.state_file.exists():
+        thread.join(0.01)
+    yield lsp_daemon
+    lsp_daemon.shutdown()
+    thread.join(5)
+
+
+def attach(config: LSPServerConfig, project_root: Path) -> LSPDaemonClient:
+    """Attach a client to the running daemon."""
+    client = LSPDaemonClient(config, project_root, spawn=False)
+    assert client.start()
+    return client
+
+
+class TestLSPDaemon:
+    """Tests for LSPDaemon and LSPDaemonClient."""
+
+    @pytest.mark.usefixtures("daemon")
+    def test_server_stays_warm_between_clients(
+        self, fake_server_config: LSPServerConfig, tmp_path: Path
+    ) -> None:
+        """A second command reuses the server the first one started."""
+        first = attach(fake_server_config, tmp_path)
+        pid = first.get_status().pid
+        first.stop()
+
+        second = attach(fake_server_config, tmp_path)
+
+        assert second.get_status().pid == pid
+        second.stop()
+
+    @pytest.mark.usefixtures("daemon")
+    def test_forwards_operations(self, fake_server_config: LSPServerConfig, tmp_path: Path) -> None:
+        """Operations and their results cross the socket intact."""
+        source = tmp_path / "main.go"
+        source.write_text("package main\n")
+        client = attach(fake_server_config, tmp_path)
+
+        results = client.find_references_many([(str(source), 0, i) for i in range(3)])
+        definition = client.find_definition(str(source), 0, 0)
+
+        assert [r.locations[0].start_column for r in results] == [0, 1, 2]
+        assert definition.success
+        assert definition.locations == []
+        renames = client.rename_many([(str(source), 0, 0, "P")])
+        assert renames[0].edits[0].new_text == "P"
+        client.stop()
+
+    def test_rejects_wrong_token(self, daemon: LSPDaemon) -> None:
+        """Requests without the state file's token are refused."""
+        response = daemon.handle({"token": "wrong", "op": "ping"})
+
+        assert response == {"ok": False, "error": "Invalid LSP daemon token"}
+
+    def test_unreachable_without_spawn(
+        self, fake_server_config: LSPServerConfig, tmp_path: Path
+    ) -> None:
+        """Without a daemon, start() fails and operations report errors."""
+        client = LSPDaemonClient(fake_server_config, tmp_path, spawn=False)
+
+        assert not client.start()
+        result = client.find_definition(str(tmp_path / "main.go"), 0, 0)
+        assert not result.success
+        assert not client.get_status().is_running
+
+    def test_shutdown_stops_servers(
+        self, daemon: LSPDaemon, fake_server_config: LSPServerConfig, tmp_path: Path
+    ) -> None:
+        """Shutting the daemon down stops its servers and state file."""
+        client = attach(fake_server_config, tmp_path)
+
+        client.shutdown_daemon()
+
+        for _ in range(500):
+            if not daemon.state_file.exists():
+                break
+            threading.Event().wait(0.01)
+        assert not daemon.state_file.exists()
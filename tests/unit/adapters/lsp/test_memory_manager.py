@@ -0,0 +1,55 @@
+"""Unit tests for the LSP server pool."""
+
+from unittest.mock import MagicMock
+
+from rice_factor.adapters.lsp.memory_manager import LSPMemoryManager
+
+
+def make_server(memory_mb: float) -> MagicMock:
+    """Create a server mock using memory_mb."""
+    server = MagicMock()
+    server.get_memory_usage_mb.return_value = memory_mb
+    return server
+
+
+class TestLSPMemoryManager:
+    """Tests for LSPMemoryManager."""
+
+    def test_evicts_idle_servers(self) -> None:
+        """Servers unused for the idle timeout are stopped."""
+        pool = LSPMemoryManager(idle_timeout=0)
+        server = make_server(100)
+        pool.register("gopls", server)
+
+        assert pool.evict() == ["gopls"]
+        server.stop.assert_called_once()
+        assert pool.get("gopls") is None
+
+    def test_keeps_recent_servers_within_budget(self) -> None:
+        """Recently used servers within the memory budget stay warm."""
+        pool = LSPMemoryManager(limit_mb=1000, idle_timeout=600)
+        pool.register("gopls", make_server(400))
+        pool.register("rust-analyzer", make_server(500))
+
+        assert pool.evict() == []
+        assert pool.total_memory_mb() == 900
+
+    def test_evicts_least_recently_used_over_budget(self) -> None:
+        """Over the budget, the least recently used servers go first."""
+        pool = LSPMemoryManager(limit_mb=1000, idle_timeout=600)
+        pool.register("gopls", make_server(600))
+        pool.register("rust-analyzer", make_server(600))
+        pool.register("pylsp", make_server(100))
+        pool.get("gopls")
+
+        assert pool.evict() == ["rust-analyzer"]
+        assert pool.names() == ["pylsp", "gopls"]
+
+    def test_busy_servers_are_kept(self) -> None:
+        """Servers in use are never evicted."""
+        pool = LSPMemoryManager(limit_mb=0, idle_timeout=0)
+        server = make_server(100)
+        pool.register("gopls", server)
+
+        assert pool.evict(busy={"gopls"}) == []
+        server.stop.assert_not_called()
@@ -0,0 +1 @@
+# Parsing adapter tests
@@ -0,0 +1,180 @@
+"""Unit tests for ParseCache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rice_factor.adapters.parsing.parse_cache import (
+    TREE_BYTES_PER_SOURCE_BYTE,
+    ParseCache,
+    compute_edit,
+)
+
+if TYPE_CHECKING:
+    import tree_sitter
+
+ts_pack = pytest.importorskip("tree_sitter_language_pack")
+
+V1 = b"def first():\n    return 1\n\n\ndef second():\n    return 2\n"
+V2 = b"def first():\n    return 1\n\n\ndef inserted(x):\n    return x\n\n\ndef second():\n    return 2\n"
+
+
+def _entry_bytes(source: bytes) -> int:
+    return len(source) * (1 + TREE_BYTES_PER_SOURCE_BYTE)
+
+
+@pytest.fixture
+def parser() -> tree_sitter.Parser:
+    """Create a Python parser."""
+    python_parser: tree_sitter.Parser = ts_pack.get_parser("python")
+    return python_parser
+
+
+class TestComputeEdit:
+    """Tests for compute_edit."""
+
+    def test_equal_contents(self) -> None:
+        """Equal contents need no edit."""
+        assert compute_edit(b"same", b"same") is None
+
+    def test_replacement_between_prefix_and_suffix(self) -> None:
+        """The edit spans only the bytes between common prefix and suffix."""
+        edit = compute_edit(b"a = 1\nb = 2\n", b"a = 1\nb = 42\n")
+
+        assert edit is not None
+        assert (edit.start_byte, edit.old_end_byte, edit.new_end_byte) == (10, 10, 11)
+        assert edit.start_point == (1, 4)
+        assert edit.new_end_point == (1, 5)
+
+    def test_insert(self) -> None:
+        """An insertion has an empty old range."""
+        edit = compute_edit(b"ab\ncd\n", b"ab\nxy\ncd\n")
+
+        assert edit is not None
+        assert (edit.start_byte, edit.old_end_byte, edit.new_end_byte) == (3, 3, 6)
+        assert edit.old_end_point == (1, 0)
+        assert edit.new_end_point == (2, 0)
+
+    def test_delete(self) -> None:
+        """A deletion has an empty new range."""
+        edit = compute_edit(b"ab\nxy\ncd\n", b"ab\ncd\n")
+
+        assert edit is not None
+        assert (edit.start_byte, edit.old_end_byte, edit.new_end_byte) == (3, 6, 3)
+        assert edit.old_end_point == (2, 0)
+
+    def test_multibyte_columns_are_bytes(self) -> None:
+        """Points count bytes, so multibyte characters widen columns."""
+        old = "s = 'héllo'\n".encode()
+        new = "s = 'héllø'\n".encode()
+
+        edit = compute_edit(old, new)
+
+        assert edit is not None
+        assert edit.start_byte == old.index(b"o")
+        assert edit.start_point == (0, 10)
+        assert new[edit.start_byte : edit.new_end_byte] == "ø".encode()
+
+    def test_change_beyond_first_block(self) -> None:
+        """Changes past the first compared block are located exactly."""
+        old = b"x" * 10000 + b"\n" + b"y" * 10000
+        new = b"x" * 10000 + b"\nz" + b"y" * 10000
+
+        edit = compute_edit(old, new)
+
+        assert edit is not None
+        assert (edit.start_byte, edit.old_end_byte, edit.new_end_byte) == (
+            10001,
+            10001,
+            10002,
+        )
+        assert edit.start_point == (1, 0)
+
+
+class TestParse:
+    """Tests for ParseCache.parse."""
+
+    def test_unchanged_content_is_a_hit(self, parser: tree_sitter.Parser) -> None:
+        """Parsing the same content twice returns the cached entry."""
+        cache = ParseCache()
+
+        first = cache.parse("a.py", "python", V1, parser)
+        second = cache.parse("a.py", "python", V1, parser)
+
+        assert second is first
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.full_parses) == (1, 1, 1)
+        assert stats.hit_rate == 50.0
+
+    def test_incremental_reparse_matches_cold_parse(self, parser: tree_sitter.Parser) -> None:
+        """A reparse of changed content yields the tree of a fresh parse."""
+        cache = ParseCache()
+        cache.parse("a.py", "python", V1, parser)
+
+        entry = cache.parse("a.py", "python", V2, parser)
+        cold = ts_pack.get_parser("python").parse(V2)
+
+        assert entry.tree is not None
+        assert str(entry.tree.root_node) == str(cold.root_node)
+        assert entry.tree.root_node.end_byte == len(V2)
+        assert cache.stats.incremental_parses == 1
+
+    def test_other_language_parses_from_scratch(self, parser: tree_sitter.Parser) -> None:
+        """A file parsed as another language is not reparsed incrementally."""
+        cache = ParseCache()
+        cache.parse("a.py", "other", V1, parser)
+
+        cache.parse("a.py", "python", V2, parser)
+
+        stats = cache.stats
+        assert (stats.full_parses, stats.incremental_parses) == (2, 0)
+
+
+class TestBudget:
+    """Tests for the ParseCache byte budget."""
+
+    def test_budget_counts_source_and_tree(self, parser: tree_sitter.Parser) -> None:
+        """Each entry is charged for its source and estimated tree."""
+        cache = ParseCache()
+
+        cache.parse("a.py", "python", V1, parser)
+
+        assert cache.stats.bytes == _entry_bytes(V1)
+
+    def test_evicts_least_recently_used(self, parser: tree_sitter.Parser) -> None:
+        """Going over budget evicts the entry used longest ago."""
+        cache = ParseCache(max_bytes=2 * _entry_bytes(V1))
+        cache.parse("a.py", "python", V1, parser)
+        cache.parse("b.py", "python", V1, parser)
+        cache.parse("a.py", "python", V1, parser)
+
+        cache.parse("c.py", "python", V1, parser)
+
+        stats = cache.stats
+        assert (stats.entries, stats.evictions) == (2, 1)
+        assert stats.bytes == 2 * _entry_bytes(V1)
+        assert cache.parse("a.py", "python", V1, parser).tree is not None
+        assert cache.stats.hits == 2
+        cache.parse("b.py", "python", V1, parser)
+        assert cache.stats.misses == 4
+
+    def test_oversized_file_is_not_kept(self, parser: tree_sitter.Parser) -> None:
+        """A file larger than the budget is parsed but not cached."""
+        cache = ParseCache(max_bytes=_entry_bytes(V1) - 1)
+
+        entry = cache.parse("a.py", "python", V1, parser)
+
+        assert entry.tree is not None
+        assert (cache.stats.entries, cache.stats.bytes) == (0, 0)
+
+    def test_stored_results_count_their_size(self) -> None:
+        """Results parsed elsewhere are charged their file size."""
+        cache = ParseCache()
+
+        cache.store_result("a.py", "python", "digest", object(), size=100)
+
+        assert cache.stats.bytes == 100
+        assert cache.invalidate("a.py") is True
+        assert cache.stats.bytes == 0
@@ -0,0 +1,135 @@
+"""Unit tests for the persistent symbol index."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from rice_factor.adapters.parsing.symbol_index import SymbolIndex
+from rice_factor.domain.ports.ast import SymbolKind
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a small Python project."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "service.py").write_text(
+        "class UserService:\n"
+        "    def load(self):\n"
+        "        return helper()\n"
+        "\n"
+        "def helper():\n"
+        "    return 1\n"
+    )
+    (tmp_path / "main.py").write_text("from pkg.service import helper\nprint(helper())  # helper\n")
+    return tmp_path
+
+
+@pytest.fixture
+def index(project: Path) -> Iterator[SymbolIndex]:
+    """Create an up-to-date index of the project."""
+    with SymbolIndex(project) as symbol_index:
+        symbol_index.update()
+        yield symbol_index
+
+
+class TestSymbolIndex:
+    """Tests for SymbolIndex."""
+
+    def test_stored_under_project_dir(self, project: Path, index: SymbolIndex) -> None:
+        """The database defaults to .project/symbol_index.db."""
+        assert index.db_path == project.resolve() / ".project" / "symbol_index.db"
+        assert index.db_path.exists()
+
+    def test_find_definitions(self, index: SymbolIndex) -> None:
+        """Python classes, methods and functions are indexed as definitions."""
+        (method,) = index.find_definitions("load")
+        (function,) = index.find_definitions("helper")
+
+        assert (method.file_path, method.line, method.column) == ("pkg/service.py", 2, 8)
+        assert method.kind == SymbolKind.METHOD
+        assert method.parent_name == "UserService"
+        assert function.kind == SymbolKind.FUNCTION
+
+    def test_find_references(self, index: SymbolIndex) -> None:
+        """Every whole-word occurrence is a reference, with its column."""
+        references = index.find_references("helper")
+
+        assert [(r.file_path, r.line, r.column) for r in references] == [
+            ("main.py", 1, 24),
+            ("main.py", 2, 6),
+            ("main.py", 2, 19),
+            ("pkg/service.py", 3, 15),
+            ("pkg/service.py", 5, 4),
+        ]
+        assert index.reference_lines("helper") == {
+            "main.py": [1, 2],
+            "pkg/service.py": [3, 5],
+        }
+        assert index.find_references("help") == []
+
+    def test_update_skips_unchanged_files(self, index: SymbolIndex) -> None:
+        """A second update reads nothing."""
+        stats = index.update()
+
+        assert stats.scanned == 2
+        assert stats.unchanged == 2
+        assert stats.indexed == 0
+
+    def test_update_reindexes_changed_and_drops_deleted(
+        self, project: Path, index: SymbolIndex
+    ) -> None:
+        """Changed files are re-extracted and deleted files removed."""
+        (project / "main.py").write_text("print('no usage')\n")
+        (project / "pkg" / "service.py").unlink()
+
+        stats = index.update()
+
+        assert stats.indexed == 1
+        assert stats.removed == 1
+        assert index.files_referencing("helper") == []
+        assert index.find_definitions("UserService") == []
+
+    def test_update_specific_paths(self, project: Path, index: SymbolIndex) -> None:
+        """Only the given files are checked."""
+        (project / "extra.py").write_text("helper()\n")
+
+        stats = index.update([Path("extra.py")])
+
+        assert stats.scanned == 1
+        assert "extra.py" in index.files_referencing("helper")
+
+    def test_refresh_scans_once(self, project: Path) -> None:
+        """Only the first refresh walks the project."""
+        with SymbolIndex(project) as symbol_index:
+            first = symbol_index.refresh()
+            (project / "extra.py").write_text("helper()\n")
+
+            assert first is not None and first.indexed == 2
+            assert symbol_index.refresh() is None
+            assert "extra.py" not in symbol_index.files_referencing("helper")
+
+    def test_refresh_skipped_after_full_update(self, index: SymbolIndex) -> None:
+        """A full update counts as the refresh."""
+        assert index.refresh() is None
+
+    def test_persists_across_instances(self, project: Path, index: SymbolIndex) -> None:
+        """A new instance reuses the stored index."""
+        index.close()
+
+        with SymbolIndex(project) as reopened:
+            assert reopened.update().indexed == 0
+            assert reopened.files_referencing("UserService") == ["pkg/service.py"]
+
+    def test_excludes_dependency_dirs(self, project: Path) -> None:
+        """Excluded directories are not indexed."""
+        (project / "node_modules").mkdir()
+        (project / "node_modules" / "dep.js").write_text("helper()\n")
+
+        with SymbolIndex(project) as symbol_index:
+            symbol_index.update()
+
+            assert symbol_index.files_referencing("helper") == [
+                "main.py",
+                "pkg/service.py",
+            ]
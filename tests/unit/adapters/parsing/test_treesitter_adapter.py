@@ -0,0 +1,184 @@
+"""Unit tests for bulk parsing and query reuse in TreeSitterAdapter."""
+
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from rice_factor.adapters.parsing.parse_cache import ParseCache
+from rice_factor.adapters.parsing.treesitter_adapter import TreeSitterAdapter
+
+pytest.importorskip("tree_sitter_language_pack")
+
+# One small file per supported language: (file name, content)
+SAMPLES: dict[str, tuple[str, str]] = {
+    "go": (
+        "m.go",
+        'package m\n\nimport "fmt"\n\ntype Service struct{}\n\n'
+        'func (s Service) Run() { fmt.Println("x") }\n',
+    ),
+    "rust": (
+        "m.rs",
+        "use std::fmt;\n\nstruct Service {}\n\nimpl Service {\n    fn run(&self) {}\n}\n",
+    ),
+    "java": ("M.java", "import java.util.List;\n\nclass Service {\n    void run() {}\n}\n"),
+    "kotlin": ("m.kt", "import kotlin.math.max\n\nclass Service {\n    fun run() {}\n}\n"),
+    "typescript": (
+        "m.ts",
+        "import { x } from './x';\n\nclass Service {\n  run(): void {}\n}\n",
+    ),
+    "javascript": ("m.js", "import x from './x';\n\nclass Service {\n  run() {}\n}\n"),
+    "ruby": ("m.rb", "require 'json'\n\nclass Service\n  def run\n  end\nend\n"),
+    "csharp": ("M.cs", "using System.Text;\n\nclass Service {\n    void Run() {}\n}\n"),
+    "php": (
+        "m.php",
+        "<?php\nuse App\\Models\\User;\n\nclass Service {\n    function run() {}\n}\n",
+    ),
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_queries() -> None:
+    """Start every test without compiled queries."""
+    TreeSitterAdapter.clear_query_cache()
+
+
+def _signature(adapter: TreeSitterAdapter, language: str) -> tuple[Any, ...]:
+    """Parse a language's sample and return its symbols and imports."""
+    name, content = SAMPLES[language]
+    result = adapter.parse_file(name, content)
+    if not result.success:
+        pytest.skip(f"{language} grammar unavailable: {result.errors}")
+    return result.symbols, result.imports
+
+
+@pytest.fixture
+def go_files(tmp_path: Path) -> list[str]:
+    """Write a few Go files."""
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"service_{i}.go"
+        path.write_text(
+            f'package m\n\nimport "fmt"\n\ntype Service{i} struct{{}}\n\n'
+            f'func (s Service{i}) Run() {{ fmt.Println("x") }}\n'
+        )
+        paths.append(str(path))
+    return paths
+
+
+class TestParseMany:
+    """Tests for TreeSitterAdapter.parse_many."""
+
+    def test_matches_parse_file(self, go_files: list[str]) -> None:
+        """Process-pool results equal in-process ones."""
+        serial = TreeSitterAdapter(parse_cache=ParseCache(max_bytes=0))
+        adapter = TreeSitterAdapter(parse_cache=ParseCache())
+        adapter.PARALLEL_MIN_FILES = 1
+
+        results = {r.file_path: r for r in adapter.parse_many(go_files, max_workers=2)}
+
+        assert sorted(results) == sorted(go_files)
+        for path in go_files:
+            expected = serial.parse_file(path)
+            assert results[path].success
+            assert results[path].symbols == expected.symbols
+            assert results[path].imports == expected.imports
+
+    def test_results_are_cached(self, go_files: list[str]) -> None:
+        """Worker results are served from the cache until a file changes."""
+        adapter = TreeSitterAdapter(parse_cache=ParseCache())
+        adapter.PARALLEL_MIN_FILES = 1
+        list(adapter.parse_many(go_files, max_workers=2))
+
+        assert len(list(adapter.parse_many(go_files))) == len(go_files)
+        assert adapter.parse_cache.stats.hits == len(go_files)
+
+        Path(go_files[0]).write_text("package m\n\nfunc Other() {}\n")
+        (result,) = adapter.parse_many(go_files[:1])
+        assert [s.name for s in result.symbols] == ["Other"]
+
+    def test_reports_failures(self, tmp_path: Path, go_files: list[str]) -> None:
+        """Unreadable and unknown files yield failed results."""
+        adapter = TreeSitterAdapter(parse_cache=ParseCache())
+        missing = str(tmp_path / "missing.go")
+        unknown = str(tmp_path / "notes.txt")
+
+        results = {
+            r.file_path: r for r in adapter.parse_many([*go_files, missing, unknown, missing])
+        }
+
+        assert len(results) == len(go_files) + 2
+        assert not results[missing].success
+        assert not results[unknown].success
+
+    def test_extract_symbols_many(self, go_files: list[str]) -> None:
+        """Symbols are yielded per file."""
+        adapter = TreeSitterAdapter(parse_cache=ParseCache())
+
+        symbols = dict(adapter.extract_symbols_many(go_files))
+
+        assert {s.name for s in symbols[go_files[0]]} == {"Service0", "Run"}
+
+
+class TestQueryReuse:
+    """Tests for compiling queries once per language."""
+
+    def test_compiled_once_per_language(self) -> None:
+        """Queries are compiled on first use and shared by all adapters."""
+        compile_queries = TreeSitterAdapter._compile_queries
+        with patch.object(
+            TreeSitterAdapter,
+            "_compile_queries",
+            autospec=True,
+            side_effect=compile_queries,
+        ) as mock_compile:
+            for _ in range(2):
+                adapter = TreeSitterAdapter(parse_cache=ParseCache(max_bytes=0))
+                for name, content in SAMPLES.values():
+                    adapter.parse_file(name, content)
+
+        # Languages without an installed grammar never reach compilation
+        compiled = Counter(call.args[1].language_id for call in mock_compile.call_args_list)
+        assert set(compiled) <= set(SAMPLES)
+        assert set(compiled.values()) == {1}
+        assert "go" in compiled
+
+    def test_compiled_once_under_concurrency(self) -> None:
+        """Threads parsing the same language share one compilation."""
+        compile_queries = TreeSitterAdapter._compile_queries
+        barrier = threading.Barrier(8)
+
+        def parse() -> None:
+            adapter = TreeSitterAdapter(parse_cache=ParseCache(max_bytes=0))
+            barrier.wait()
+            adapter.parse_file(*SAMPLES["go"])
+
+        with patch.object(
+            TreeSitterAdapter,
+            "_compile_queries",
+            autospec=True,
+            side_effect=compile_queries,
+        ) as mock_compile:
+            threads = [threading.Thread(target=parse) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_compile.call_count == 1
+
+    @pytest.mark.parametrize("language", sorted(SAMPLES))
+    def test_results_match_fresh_queries(self, language: str) -> None:
+        """Shared queries extract the same symbols and imports as fresh ones."""
+        adapter = TreeSitterAdapter(parse_cache=ParseCache(max_bytes=0))
+        fresh = _signature(adapter, language)
+
+        shared = _signature(adapter, language)
+        other = _signature(TreeSitterAdapter(parse_cache=ParseCache(max_bytes=0)), language)
+
+        assert fresh[0], f"no symbols extracted for {language}"
+        assert shared == fresh
+        assert other == fresh
@@ -369,3 +369,51 @@ class TestDiffPatchFileDiscovery:
         paths = [str(f) for f in files]
         assert any("main.py" in p for p in paths)
         assert not any(".venv" in p for p in paths)
+
+    def test_uses_symbol_index_for_identifiers(self, tmp_project: Path) -> None:
+        """Identifier renames find files through the symbol index."""
+        index = MagicMock()
+        index.files_referencing.return_value = ["src/main.py"]
+        adapter = DiffPatchAdapter(tmp_project, symbol_index=index)
+
+        files = adapter._find_files_containing("old_func")
+
+        index.refresh.assert_called_once()
+        index.update.assert_not_called()
+        assert files == [tmp_project / "src" / "main.py"]
+
+    def test_rename_reindexes_written_files(self, tmp_project: Path) -> None:
+        """Files a rename writes are updated in the index without a rescan."""
+        from rice_factor.adapters.parsing.symbol_index import SymbolIndex
+
+        request = RefactorRequest(
+            operation=RefactorOperation.RENAME,
+            target="old_func",
+            new_value="new_func",
+        )
+        with SymbolIndex(tmp_project) as index:
+            adapter = DiffPatchAdapter(tmp_project, symbol_index=index)
+            adapter.execute(request, dry_run=False)
+
+            assert index.files_referencing("old_func") == []
+            assert index.files_referencing("new_func") == [
+                "src/main.py",
+                "src/utils.py",
+            ]
+
+    def test_rename_with_symbol_index(self, tmp_project: Path) -> None:
+        """Renames through an index change the same files as a scan."""
+        from rice_factor.adapters.parsing.symbol_index import SymbolIndex
+
+        request = RefactorRequest(
+            operation=RefactorOperation.RENAME,
+            target="old_func",
+            new_value="new_func",
+        )
+        scanned = DiffPatchAdapter(tmp_project).execute(request)
+        with SymbolIndex(tmp_project) as index:
+            indexed = DiffPatchAdapter(tmp_project, symbol_index=index).execute(request)
+
+        assert sorted(c.file_path for c in indexed.changes) == sorted(
+            c.file_path for c in scanned.changes
+        )
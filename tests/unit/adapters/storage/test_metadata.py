@@ -0,0 +1,79 @@
+"""Unit tests for ArtifactMetadataStore."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from uuid import uuid4
+
+from rice_factor.adapters.storage.metadata import ArtifactMetadataStore
+
+
+class TestArtifactMetadataStore:
+    """Tests for ArtifactMetadataStore class."""
+
+    def test_metadata_file_path(self, tmp_path: Path) -> None:
+        """metadata_file sits next to the approvals file."""
+        store = ArtifactMetadataStore(tmp_path)
+
+        assert store.metadata_file == tmp_path / "_meta" / "metadata.json"
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Recorded metadata is read back by a new store."""
+        artifact_id = uuid4()
+        report = {"token_budget": 100, "dropped": [{"source": "requirements.md"}]}
+        ArtifactMetadataStore(tmp_path).update(artifact_id, {"context_packing": report})
+
+        store = ArtifactMetadataStore(tmp_path)
+
+        assert store.get(artifact_id) == {"context_packing": report}
+        assert store.get(uuid4()) == {}
+
+    def test_update_keeps_other_keys(self, tmp_path: Path) -> None:
+        """update() merges into the existing metadata."""
+        store = ArtifactMetadataStore(tmp_path)
+        artifact_id = uuid4()
+
+        store.update(artifact_id, {"a": 1})
+        store.update(artifact_id, {"b": 2})
+
+        assert store.get(artifact_id) == {"a": 1, "b": 2}
+
+    def test_remove(self, tmp_path: Path) -> None:
+        """remove() forgets an artifact's metadata."""
+        store = ArtifactMetadataStore(tmp_path)
+        artifact_id = uuid4()
+        store.update(artifact_id, {"a": 1})
+
+        assert store.remove(artifact_id)
+        assert not store.remove(artifact_id)
+        assert ArtifactMetadataStore(tmp_path).get(artifact_id) == {}
+
+    def test_batch_writes_once(self, tmp_path: Path) -> None:
+        """Changes inside batch() are written when the block exits."""
+        store = ArtifactMetadataStore(tmp_path)
+
+        with store.batch():
+            store.update(uuid4(), {"a": 1})
+            store.update(uuid4(), {"b": 2})
+            assert not store.metadata_file.exists()
+
+        data = json.loads(store.metadata_file.read_text())
+        assert len(data["artifacts"]) == 2
+
+    def test_concurrent_updates_are_all_kept(self, tmp_path: Path) -> None:
+        """Updates from several threads all reach the file."""
+        store = ArtifactMetadataStore(tmp_path)
+        ids = [uuid4() for _ in range(20)]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: store.update(i, {"input_hash": str(i)}), ids))
+
+        reloaded = ArtifactMetadataStore(tmp_path)
+        assert all(reloaded.get(i) == {"input_hash": str(i)} for i in ids)
+
+    def test_corrupted_file_starts_fresh(self, tmp_path: Path) -> None:
+        """A corrupted metadata file is ignored."""
+        (tmp_path / "_meta").mkdir()
+        (tmp_path / "_meta" / "metadata.json").write_text("{not json")
+
+        assert ArtifactMetadataStore(tmp_path).get(uuid4()) == {}
@@ -116,6 +116,26 @@ class TestRunModeConfigValidation:
                 voting_threshold=-0.1,
             )
 
+    def test_fan_out_limits_validation(self) -> None:
+        """Test concurrency and agent timeout bounds."""
+        agent = AgentConfig(agent_id="primary", role=AgentRole.PRIMARY)
+
+        with pytest.raises(ValueError, match="Max concurrency must be at least 1"):
+            RunModeConfig(
+                mode=RunMode.VOTING,
+                authority_agent="primary",
+                agents=(agent,),
+                max_concurrency=0,
+            )
+
+        with pytest.raises(ValueError, match="Agent timeout must be positive"):
+            RunModeConfig(
+                mode=RunMode.VOTING,
+                authority_agent="primary",
+                agents=(agent,),
+                agent_timeout_seconds=0,
+            )
+
 
 class TestRunModeConfigQueries:
     """Tests for RunModeConfig query methods."""
@@ -405,6 +425,8 @@ class TestRunModeConfigSerialization:
             }),
             voting_threshold=0.65,
             max_rounds=20,
+            max_concurrency=2,
+            agent_timeout_seconds=30.0,
         )
 
         data = original.to_dict()
@@ -415,3 +437,5 @@ class TestRunModeConfigSerialization:
         assert len(restored.agents) == len(original.agents)
         assert restored.voting_threshold == original.voting_threshold
         assert restored.max_rounds == original.max_rounds
+        assert restored.max_concurrency == 2
+        assert restored.agent_timeout_seconds == 30.0
@@ -35,6 +35,15 @@ class TestLLMPort:
         # Check return type
         assert hints.get("return") == CompilerResult
 
+    def test_repair_method_signature(self) -> None:
+        """Repair method takes the repair request and the patch schema."""
+        hints = get_type_hints(LLMPort.repair)
+
+        assert hints.get("pass_type") == CompilerPassType
+        assert hints.get("request") == CompilerContext
+        assert hints.get("schema") == dict[str, object]
+        assert hints.get("return") == CompilerResult
+
     def test_protocol_cannot_be_instantiated_directly(self) -> None:
         """Protocol classes cannot be instantiated directly."""
         # This is just documenting behavior - Protocol classes
@@ -56,6 +65,14 @@ class TestLLMPort:
             ) -> CompilerResult:
                 return CompilerResult(success=True, payload={"test": "data"})
 
+            def repair(
+                self,
+                _pass_type: CompilerPassType,
+                _request: CompilerContext,
+                _schema: dict,
+            ) -> CompilerResult:
+                return CompilerResult(success=True, payload={"/test": "data"})
+
         # Should be able to instantiate implementing class
         adapter = MockLLMAdapter()
         assert adapter is not None
@@ -8,6 +8,7 @@ from rice_factor.domain.prompts import (
     ARCHITECTURE_PLANNER_PROMPT,
     BASE_SYSTEM_PROMPT,
     IMPLEMENTATION_PLANNER_PROMPT,
+    OUTPUT_REPAIR_PROMPT,
     PASS_PROMPTS,
     PASS_TO_ARTIFACT,
     PROJECT_PLANNER_PROMPT,
@@ -134,6 +135,46 @@ class TestGetFullPrompt:
         assert "TARGET FILE: src/main.py" in result
 
 
+class TestGetRepairPrompt:
+    """Tests for the output repair prompts."""
+
+    @pytest.fixture
+    def manager(self) -> PromptManager:
+        """Create a PromptManager instance."""
+        return PromptManager()
+
+    def test_repair_system_prompt_replaces_base_prompt(
+        self, manager: PromptManager
+    ) -> None:
+        """The repair system prompt is not the artifact builder prompt."""
+        result = manager.get_repair_system_prompt()
+
+        assert result == OUTPUT_REPAIR_PROMPT
+        assert BASE_SYSTEM_PROMPT not in result
+
+    def test_includes_patch_schema_and_request(self, manager: PromptManager) -> None:
+        """Only the patch schema and the repair request are rendered."""
+        context = CompilerContext(
+            pass_type=CompilerPassType.PROJECT,
+            project_files={"requirements.md": "Build a thing"},
+            artifacts={"repair_request": {"errors": [{"pointer": "/domains"}]}},
+            target_file="src/main.py",
+        )
+        schema: dict[str, object] = {
+            "type": "object",
+            "properties": {"/domains": {"type": "array"}},
+            "required": ["/domains"],
+        }
+
+        result = manager.get_repair_prompt(context, schema)
+
+        assert result.startswith("PATCH SCHEMA:")
+        assert "repair_request" in result
+        assert "TARGET FILE: src/main.py" in result
+        assert "JSON SCHEMA" not in result
+        assert "Build a thing" not in result
+
+
 class TestAllPassPromptsDefined:
     """Tests to verify all pass prompts are defined."""
 
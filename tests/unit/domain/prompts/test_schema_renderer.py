@@ -0,0 +1,204 @@
+"""Unit tests for schema rendering modes."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from rice_factor.domain.artifacts.enums import ArtifactType
+from rice_factor.domain.prompts.schema_injector import SchemaInjector
+from rice_factor.domain.prompts.schema_renderer import (
+    SchemaRenderMode,
+    clear_render_cache,
+    compact_schema,
+    render_schema,
+    schema_fence_language,
+)
+
+
+@pytest.fixture
+def schema() -> dict[str, Any]:
+    """A schema with annotations and definitions."""
+    return {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "$id": "https://example.test/plan.schema.json",
+        "title": "Plan",
+        "description": "A plan",
+        "type": "object",
+        "required": ["target", "steps"],
+        "properties": {
+            "target": {"type": "string", "description": "Target file"},
+            "steps": {
+                "type": "array",
+                "minItems": 1,
+                "items": {"$ref": "#/$defs/step"},
+            },
+            "description": {"type": "string", "examples": ["a property"]},
+        },
+        "additionalProperties": False,
+        "$defs": {
+            "step": {
+                "type": "object",
+                "required": ["kind"],
+                "properties": {"kind": {"enum": ["add", "remove"]}},
+                "additionalProperties": False,
+            },
+            "unused": {"type": "string"},
+        },
+    }
+
+
+class TestCompactSchema:
+    """Tests for compact_schema."""
+
+    def test_strips_annotations(self, schema: dict[str, Any]) -> None:
+        """Annotation keywords are removed at every level."""
+        result = compact_schema(schema)
+
+        for keyword in ("$schema", "$id", "title", "description"):
+            assert keyword not in result
+        assert "description" not in result["properties"]["target"]
+
+    def test_keeps_property_named_like_a_keyword(
+        self, schema: dict[str, Any]
+    ) -> None:
+        """A property called "description" is data, not an annotation."""
+        result = compact_schema(schema)
+
+        assert result["properties"]["description"] == {"type": "string"}
+
+    def test_inlines_referenced_and_drops_unused_defs(
+        self, schema: dict[str, Any]
+    ) -> None:
+        """Referenced definitions are inlined, unused ones dropped."""
+        result = compact_schema(schema)
+
+        assert "$defs" not in result
+        assert result["properties"]["steps"]["items"]["required"] == ["kind"]
+        assert result["properties"]["steps"]["minItems"] == 1
+
+    def test_keeps_recursive_definitions(self) -> None:
+        """Recursive definitions stay as $refs under $defs."""
+        schema = {
+            "type": "object",
+            "properties": {"root": {"$ref": "#/$defs/node"}},
+            "$defs": {
+                "node": {
+                    "type": "object",
+                    "properties": {
+                        "children": {
+                            "type": "array",
+                            "items": {"$ref": "#/$defs/node"},
+                        }
+                    },
+                }
+            },
+        }
+
+        result = compact_schema(schema)
+
+        assert set(result["$defs"]) == {"node"}
+        node = result["$defs"]["node"]
+        assert node["properties"]["children"]["items"] == {"$ref": "#/$defs/node"}
+
+    def test_does_not_mutate_input(self, schema: dict[str, Any]) -> None:
+        """The original schema is left untouched."""
+        before = json.dumps(schema, sort_keys=True)
+        compact_schema(schema)
+        assert json.dumps(schema, sort_keys=True) == before
+
+
+class TestRenderSchema:
+    """Tests for render_schema."""
+
+    def test_pretty_matches_indented_json(self, schema: dict[str, Any]) -> None:
+        """Pretty mode is the original indented dump."""
+        assert render_schema(schema) == json.dumps(schema, indent=2)
+
+    def test_compact_is_minified_and_smaller(self, schema: dict[str, Any]) -> None:
+        """Compact mode is valid, minified and shorter."""
+        compact = render_schema(schema, SchemaRenderMode.COMPACT)
+
+        assert "\n" not in compact
+        assert json.loads(compact) == compact_schema(schema)
+        assert len(compact) < len(render_schema(schema)) / 2
+
+    def test_typescript_notation(self, schema: dict[str, Any]) -> None:
+        """TypeScript mode renders a terse type expression."""
+        rendered = render_schema(schema, SchemaRenderMode.TYPESCRIPT)
+
+        assert rendered == (
+            '{target:string;steps:{kind:"add"|"remove"}[];description?:string}'
+        )
+
+    def test_typescript_parenthesizes_union_items(self) -> None:
+        """Array items that are unions are wrapped before the [] suffix."""
+        schema = {"type": "array", "items": {"type": ["string", "null"]}}
+
+        assert render_schema(schema, SchemaRenderMode.TYPESCRIPT) == "(string|null)[]"
+
+    def test_memoized_per_hash_and_mode(self, schema: dict[str, Any]) -> None:
+        """Renderings are reused for the same content hash and mode."""
+        clear_render_cache()
+        first = render_schema(schema, SchemaRenderMode.COMPACT, content_hash="h1")
+
+        # Same hash returns the cached rendering even for other content
+        assert render_schema({}, SchemaRenderMode.COMPACT, content_hash="h1") is first
+        assert render_schema({}, SchemaRenderMode.PRETTY, content_hash="h1") == "{}"
+        clear_render_cache()
+
+    def test_hashes_each_schema_object_once(self, schema: dict[str, Any]) -> None:
+        """Repeat renders of the same schema object skip content hashing."""
+        clear_render_cache()
+        render_schema(schema, SchemaRenderMode.COMPACT)
+
+        with patch(
+            "rice_factor.domain.prompts.schema_renderer.schema_hash"
+        ) as hash_mock:
+            render_schema(schema, SchemaRenderMode.COMPACT)
+            render_schema(schema, SchemaRenderMode.TYPESCRIPT)
+
+        hash_mock.assert_not_called()
+        clear_render_cache()
+
+    def test_fence_language(self) -> None:
+        """TypeScript renderings use a typescript fence."""
+        assert schema_fence_language(SchemaRenderMode.TYPESCRIPT) == "typescript"
+        assert schema_fence_language(SchemaRenderMode.COMPACT) == "json"
+
+
+class TestSchemaInjectorModes:
+    """Tests for SchemaInjector rendering modes on the real schemas."""
+
+    @pytest.fixture
+    def injector(self) -> SchemaInjector:
+        """Create a SchemaInjector with the actual schemas directory."""
+        return SchemaInjector(
+            Path(__file__).parent.parent.parent.parent.parent / "schemas"
+        )
+
+    @pytest.mark.parametrize("artifact_type", list(SchemaInjector.SCHEMA_FILENAMES))
+    def test_compact_is_smaller_than_pretty(
+        self, injector: SchemaInjector, artifact_type: ArtifactType
+    ) -> None:
+        """Compact rendering shrinks every shipped schema."""
+        pretty = injector.format_schema_for_prompt(artifact_type)
+        compact = injector.format_schema_for_prompt(
+            artifact_type, SchemaRenderMode.COMPACT
+        )
+        assert len(compact) < len(pretty)
+        json.loads(compact)
+
+    def test_inject_schema_uses_typescript_fence(
+        self, injector: SchemaInjector
+    ) -> None:
+        """inject_schema fences TypeScript renderings accordingly."""
+        result = injector.inject_schema(
+            "Prompt",
+            ArtifactType.IMPLEMENTATION_PLAN,
+            mode=SchemaRenderMode.TYPESCRIPT,
+        )
+        assert "```typescript" in result
+        assert "target:string" in result
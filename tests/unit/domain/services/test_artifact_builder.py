@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from rice_factor.adapters.storage.metadata import ArtifactMetadataStore
 from rice_factor.domain.artifacts.compiler_types import (
     CompilerContext,
     CompilerPassType,
@@ -15,6 +16,8 @@ from rice_factor.domain.services.artifact_builder import (
     ArtifactBuilder,
     ArtifactBuilderError,
 )
+from rice_factor.domain.services.context_builder import PackedContext
+from rice_factor.domain.services.context_packer import PackingReport
 from rice_factor.domain.services.passes import PassRegistry
 
 
@@ -78,14 +81,16 @@ class TestArtifactBuilderBuild:
     def mock_context_builder(self) -> MagicMock:
         """Create a mock context builder."""
         mock = MagicMock()
-        mock.build_context.return_value = CompilerContext(
-            pass_type=CompilerPassType.PROJECT,
-            project_files={
-                "requirements.md": "Test",
-                "constraints.md": "Test",
-                "glossary.md": "Test",
-            },
-            artifacts={},
+        mock.build_packed_context.return_value = PackedContext(
+            context=CompilerContext(
+                pass_type=CompilerPassType.PROJECT,
+                project_files={
+                    "requirements.md": "Test",
+                    "constraints.md": "Test",
+                    "glossary.md": "Test",
+                },
+                artifacts={},
+            )
         )
         return mock
 
@@ -104,9 +109,9 @@ class TestArtifactBuilderBuild:
         builder: ArtifactBuilder,
         mock_context_builder: MagicMock,
     ) -> None:
-        """build calls context_builder.build_context."""
+        """build calls context_builder.build_packed_context."""
         builder.build(CompilerPassType.PROJECT, Path("/project"))
-        mock_context_builder.build_context.assert_called_once()
+        mock_context_builder.build_packed_context.assert_called_once()
 
     def test_build_calls_llm_port_generate(
         self,
@@ -126,6 +131,29 @@ class TestArtifactBuilderBuild:
         builder.build(CompilerPassType.PROJECT, Path("/project"))
         mock_storage.save.assert_called_once()
 
+    def test_build_persists_packing_report(
+        self,
+        mock_llm_port: MagicMock,
+        mock_storage: MagicMock,
+        mock_context_builder: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """The packing report is stored as metadata of the new artifact."""
+        packed = mock_context_builder.build_packed_context.return_value
+        packed.packing_report = PackingReport(token_budget=100, tokens_used=80)
+        builder = ArtifactBuilder(
+            mock_llm_port,
+            mock_storage,
+            mock_context_builder,
+            metadata_store=ArtifactMetadataStore(tmp_path),
+        )
+
+        result = builder.build(CompilerPassType.PROJECT, Path("/project"))
+
+        metadata = ArtifactMetadataStore(tmp_path).get(result.id)
+        assert metadata["context_packing"]["token_budget"] == 100
+        assert metadata["context_packing"]["tokens_used"] == 80
+
     def test_build_returns_envelope_with_draft_status(
         self,
         builder: ArtifactBuilder,
@@ -173,14 +201,16 @@ class TestArtifactBuilderBuildFailure:
     def mock_context_builder(self) -> MagicMock:
         """Create a mock context builder."""
         mock = MagicMock()
-        mock.build_context.return_value = CompilerContext(
-            pass_type=CompilerPassType.PROJECT,
-            project_files={
-                "requirements.md": "Test",
-                "constraints.md": "Test",
-                "glossary.md": "Test",
-            },
-            artifacts={},
+        mock.build_packed_context.return_value = PackedContext(
+            context=CompilerContext(
+                pass_type=CompilerPassType.PROJECT,
+                project_files={
+                    "requirements.md": "Test",
+                    "constraints.md": "Test",
+                    "glossary.md": "Test",
+                },
+                artifacts={},
+            )
         )
         return mock
 
@@ -0,0 +1,200 @@
+"""Unit tests for batch compiler service."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from rice_factor.domain.artifacts.compiler_types import (
+    CompilerContext,
+    CompilerPassType,
+)
+from rice_factor.domain.artifacts.enums import ArtifactType
+from rice_factor.domain.failures.llm_errors import LLMAPIError, SchemaViolationError
+from rice_factor.domain.services.batch_compiler import (
+    BatchCompiler,
+    TargetCompileResult,
+)
+from rice_factor.domain.services.context_builder import (
+    ContextBuilder,
+    MissingRequiredInputError,
+)
+from rice_factor.domain.services.rate_limiter import RateLimiter
+
+ARTIFACTS: dict[str, Any] = {"tp": {"tests": []}, "sp": {"files": []}}
+
+
+def _artifact(artifact_type: ArtifactType = ArtifactType.IMPLEMENTATION_PLAN) -> MagicMock:
+    artifact = MagicMock()
+    artifact.artifact_type = artifact_type
+    artifact.payload.summary = "LLM refused"
+    return artifact
+
+
+def _compiler(
+    artifact_builder: MagicMock,
+    rate_limiter: RateLimiter | None = None,
+    **kwargs: Any,
+) -> BatchCompiler:
+    return BatchCompiler(
+        artifact_builder=artifact_builder,
+        context_builder=ContextBuilder(),
+        rate_limiter=rate_limiter or RateLimiter(),
+        retry_backoff=0.0,
+        **kwargs,
+    )
+
+
+class TestBatchCompiler:
+    """Tests for BatchCompiler."""
+
+    def test_rejects_zero_concurrency(self) -> None:
+        """max_concurrency must be at least 1."""
+        with pytest.raises(ValueError):
+            _compiler(MagicMock(), max_concurrency=0)
+
+    def test_compiles_each_target(self, tmp_path: Path) -> None:
+        """Every target is compiled once and reported."""
+        builder = MagicMock()
+        builder.build_with_context.side_effect = lambda *_a, **_k: _artifact()
+        seen: list[TargetCompileResult] = []
+
+        batch = _compiler(builder).compile_targets(
+            CompilerPassType.IMPLEMENTATION,
+            tmp_path,
+            ["a.go", "b.go", "c.go"],
+            artifacts=ARTIFACTS,
+            on_result=seen.append,
+        )
+
+        assert batch.all_succeeded
+        assert sorted(r.target_file for r in batch.results) == ["a.go", "b.go", "c.go"]
+        assert len(seen) == 3
+        targets = {
+            call.args[1].target_file for call in builder.build_with_context.call_args_list
+        }
+        assert targets == {"a.go", "b.go", "c.go"}
+
+    def test_shared_context_validated_once_up_front(self, tmp_path: Path) -> None:
+        """Invalid shared context raises before anything is compiled."""
+        builder = MagicMock()
+
+        with pytest.raises(MissingRequiredInputError):
+            _compiler(builder).compile_targets(
+                CompilerPassType.IMPLEMENTATION, tmp_path, ["a.go"]
+            )
+        builder.build_with_context.assert_not_called()
+
+    def test_concurrency_is_bounded(self, tmp_path: Path) -> None:
+        """No more than max_concurrency compilations run at once."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def build(*_args: Any, **_kwargs: Any) -> MagicMock:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return _artifact()
+
+        builder = MagicMock()
+        builder.build_with_context.side_effect = build
+
+        _compiler(builder, max_concurrency=2).compile_targets(
+            CompilerPassType.IMPLEMENTATION,
+            tmp_path,
+            [f"f{i}.go" for i in range(6)],
+            artifacts=ARTIFACTS,
+        )
+
+        assert peak == 2
+
+    def test_respects_rate_limiter(self, tmp_path: Path) -> None:
+        """Each attempt acquires and releases a rate limiter slot."""
+        limiter = MagicMock()
+        builder = MagicMock()
+        builder.build_with_context.side_effect = lambda *_a, **_k: _artifact()
+
+        _compiler(builder, rate_limiter=limiter, provider="claude").compile_targets(
+            CompilerPassType.IMPLEMENTATION,
+            tmp_path,
+            ["a.go", "b.go"],
+            artifacts=ARTIFACTS,
+        )
+
+        assert limiter.acquire.call_count == 2
+        assert limiter.release.call_count == 2
+        limiter.acquire.assert_called_with("claude", block=True)
+
+    def test_retries_recoverable_errors(self, tmp_path: Path) -> None:
+        """Recoverable LLM errors are retried."""
+        builder = MagicMock()
+        builder.build_with_context.side_effect = [LLMAPIError("boom"), _artifact()]
+
+        batch = _compiler(builder, max_retries=2).compile_targets(
+            CompilerPassType.IMPLEMENTATION, tmp_path, ["a.go"], artifacts=ARTIFACTS
+        )
+
+        assert batch.results[0].succeeded
+        assert batch.results[0].attempts == 2
+
+    def test_failures_do_not_abort_batch(self, tmp_path: Path) -> None:
+        """A failing target is reported while others still complete."""
+
+        def build(_pass_type: Any, context: CompilerContext, **_kwargs: Any) -> Any:
+            if context.target_file == "bad.go":
+                raise SchemaViolationError("bad output")
+            if context.target_file == "refused.go":
+                return _artifact(ArtifactType.FAILURE_REPORT)
+            return _artifact()
+
+        builder = MagicMock()
+        builder.build_with_context.side_effect = build
+
+        batch = _compiler(builder, max_retries=3).compile_targets(
+            CompilerPassType.IMPLEMENTATION,
+            tmp_path,
+            ["good.go", "bad.go", "refused.go"],
+            artifacts=ARTIFACTS,
+        )
+
+        failed = {r.target_file: r for r in batch.failed}
+        assert set(failed) == {"bad.go", "refused.go"}
+        assert failed["bad.go"].attempts == 1  # Not recoverable
+        assert failed["refused.go"].error == "LLM refused"
+        assert [r.target_file for r in batch.succeeded] == ["good.go"]
+
+    def test_gives_up_after_max_retries(self, tmp_path: Path) -> None:
+        """Persistent recoverable errors stop after max_retries."""
+        builder = MagicMock()
+        builder.build_with_context.side_effect = LLMAPIError("down")
+
+        batch = _compiler(builder, max_retries=1).compile_targets(
+            CompilerPassType.IMPLEMENTATION, tmp_path, ["a.go"], artifacts=ARTIFACTS
+        )
+
+        assert batch.results[0].attempts == 2
+        assert batch.results[0].error == "down"
+        assert batch.to_dict()["failed"] == 1
+
+
+class TestContextBuilderBuildContexts:
+    """Tests for ContextBuilder.build_contexts."""
+
+    def test_one_context_per_target(self, tmp_path: Path) -> None:
+        """Contexts share inputs and differ only by target."""
+        contexts = ContextBuilder().build_contexts(
+            CompilerPassType.IMPLEMENTATION, tmp_path, ["a.go", "b.go"], ARTIFACTS
+        )
+
+        assert list(contexts) == ["a.go", "b.go"]
+        assert contexts["b.go"].context.target_file == "b.go"
+        assert contexts["a.go"].context.artifacts == contexts["b.go"].context.artifacts
+        assert contexts["a.go"].packing_report is None
@@ -4,9 +4,22 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from pathlib import Path
+from uuid import UUID
 
 import pytest
 
+from rice_factor.adapters.storage.approvals import ApprovalsTracker
+from rice_factor.adapters.storage.filesystem import FilesystemStorageAdapter
+from rice_factor.adapters.storage.registry import ArtifactRegistry
+from rice_factor.domain.artifacts.enums import ArtifactStatus, ArtifactType, CreatedBy
+from rice_factor.domain.artifacts.envelope import ArtifactEnvelope
+from rice_factor.domain.artifacts.payloads import ProjectPlanPayload
+from rice_factor.domain.artifacts.payloads.project_plan import (
+    Architecture,
+    Constraints,
+    Domain,
+    Module,
+)
 from rice_factor.domain.services.batch_processor import (
     ArtifactResult,
     BatchOperation,
@@ -17,6 +30,40 @@ from rice_factor.domain.services.batch_processor import (
 )
 
 
+@pytest.fixture
+def processor(tmp_path: Path) -> BatchProcessor:
+    """Create a batch processor rooted at a temporary repository."""
+    return BatchProcessor(repo_root=tmp_path)
+
+
+def save_drafts(processor: BatchProcessor, count: int) -> list[str]:
+    """Save draft ProjectPlan artifacts and return their IDs."""
+    ids: list[str] = []
+    for i in range(count):
+        artifact: ArtifactEnvelope[ProjectPlanPayload] = ArtifactEnvelope(
+            artifact_type=ArtifactType.PROJECT_PLAN,
+            status=ArtifactStatus.DRAFT,
+            created_by=CreatedBy.LLM,
+            payload=ProjectPlanPayload(
+                domains=[Domain(name=f"core{i}", responsibility="Core")],
+                modules=[Module(name="main", domain=f"core{i}")],
+                constraints=Constraints(
+                    architecture=Architecture.HEXAGONAL,
+                    languages=["python"],
+                ),
+            ),
+        )
+        processor.artifact_service.storage.save(artifact)
+        ids.append(str(artifact.id))
+    return ids
+
+
+def status_on_disk(processor: BatchProcessor, artifact_id: str) -> ArtifactStatus:
+    """Reload an artifact from storage and return its status."""
+    storage = FilesystemStorageAdapter(processor.repo_root / "artifacts")
+    return storage.load_by_id(UUID(artifact_id)).status
+
+
 class TestBatchOperationType:
     """Tests for BatchOperationType enum."""
 
@@ -184,71 +231,159 @@ class TestBatchProcessor:
         processor = BatchProcessor(repo_root=tmp_path)
         assert processor.repo_root == tmp_path
 
-    def test_approve_batch_empty(self, tmp_path: Path) -> None:
+    def test_approve_batch_empty(self, processor: BatchProcessor) -> None:
         """should handle empty batch."""
-        processor = BatchProcessor(repo_root=tmp_path)
         result = processor.approve_batch([])
         assert result.status == BatchResultStatus.SUCCESS
         assert result.total_count == 0
 
-    def test_approve_batch(self, tmp_path: Path) -> None:
+    def test_approve_batch(self, processor: BatchProcessor) -> None:
         """should approve multiple artifacts."""
-        processor = BatchProcessor(repo_root=tmp_path)
+        ids = save_drafts(processor, 3)
+
         result = processor.approve_batch(
-            ["art-1", "art-2", "art-3"],
-            approver="test-user",
-            reason="Batch approved",
+            ids, approver="test-user", reason="Batch approved"
         )
+
         assert result.status == BatchResultStatus.SUCCESS
-        assert result.total_count == 3
         assert result.success_count == 3
+        assert result.results[0].old_status == "draft"
+        assert result.results[0].new_status == "approved"
+        artifacts_dir = processor.repo_root / "artifacts"
+        approvals = ApprovalsTracker(artifacts_dir)
+        registry = ArtifactRegistry(artifacts_dir)
+        for aid in ids:
+            assert status_on_disk(processor, aid) == ArtifactStatus.APPROVED
+            assert approvals.get_approval(UUID(aid)).approved_by == "test-user"
+            assert registry.lookup(UUID(aid)).status == ArtifactStatus.APPROVED
+
+    def test_approve_batch_commits_metadata_once(
+        self, processor: BatchProcessor, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """should write approvals and index once for the whole batch."""
+        ids = save_drafts(processor, 20)
+        writes: list[str] = []
+        original_approvals = ApprovalsTracker._write
+        original_registry = ArtifactRegistry._write
+
+        def count_approvals(self: ApprovalsTracker) -> None:
+            writes.append("approvals")
+            original_approvals(self)
+
+        def count_registry(self: ArtifactRegistry) -> None:
+            writes.append("index")
+            original_registry(self)
+
+        monkeypatch.setattr(ApprovalsTracker, "_write", count_approvals)
+        monkeypatch.setattr(ArtifactRegistry, "_write", count_registry)
+
+        result = processor.approve_batch(ids)
+
+        assert result.success_count == 20
+        assert sorted(writes) == ["approvals", "index"]
+
+    def test_pre_validation_failure_approves_nothing(
+        self, processor: BatchProcessor
+    ) -> None:
+        """should approve nothing if any artifact fails the check."""
+        ids = save_drafts(processor, 2)
+
+        result = processor.approve_batch([*ids, "not-a-uuid"])
+
+        assert result.status == BatchResultStatus.FAILED
+        assert result.failure_count == 3
+        assert "Invalid artifact ID" in result.results[2].error
+        assert all(status_on_disk(processor, aid) == ArtifactStatus.DRAFT for aid in ids)
+
+    def test_approve_without_validation_is_partial(
+        self, processor: BatchProcessor
+    ) -> None:
+        """should approve valid artifacts when validate_all is off."""
+        ids = save_drafts(processor, 2)
+        processor.approve_batch(ids[:1])
+
+        result = processor.approve_batch(ids, validate_all=False)
+
+        assert result.status == BatchResultStatus.PARTIAL
+        assert result.results[0].error == "Artifact is approved"
+        assert status_on_disk(processor, ids[1]) == ArtifactStatus.APPROVED
+
+    def test_failure_mid_batch_rolls_back(
+        self, processor: BatchProcessor, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """should restore every artifact if the apply phase fails."""
+        ids = save_drafts(processor, 3)
+        storage = processor.artifact_service.storage
+        original_save = storage.save
+        calls: list[int] = []
+
+        def failing_save(artifact: ArtifactEnvelope, path: Path | None = None) -> Path:
+            calls.append(1)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            return original_save(artifact, path)
+
+        monkeypatch.setattr(storage, "save", failing_save)
+
+        result = processor.approve_batch(ids)
+
+        assert result.status == BatchResultStatus.ROLLED_BACK
+        assert "disk full" in result.results[0].error
+        monkeypatch.undo()
+        assert all(status_on_disk(processor, aid) == ArtifactStatus.DRAFT for aid in ids)
+        assert ApprovalsTracker(processor.repo_root / "artifacts").list_approvals() == []
+
+    def test_reject_batch(self, processor: BatchProcessor) -> None:
+        """should return approved artifacts to draft and revoke approvals."""
+        ids = save_drafts(processor, 2)
+        processor.approve_batch(ids)
+
+        result = processor.reject_batch(ids, reason="Batch rejected")
 
-    def test_reject_batch(self, tmp_path: Path) -> None:
-        """should reject multiple artifacts."""
-        processor = BatchProcessor(repo_root=tmp_path)
-        result = processor.reject_batch(
-            ["art-1", "art-2"],
-            reason="Batch rejected",
-        )
         assert result.status == BatchResultStatus.SUCCESS
-        assert result.total_count == 2
+        assert result.results[0].old_status == "approved"
+        assert result.results[0].new_status == "draft"
+        assert not processor.artifact_service.is_approved(UUID(ids[0]))
+        assert status_on_disk(processor, ids[1]) == ArtifactStatus.DRAFT
 
-    def test_reject_batch_individual_reasons(self, tmp_path: Path) -> None:
+    def test_reject_batch_individual_reasons(self, processor: BatchProcessor) -> None:
         """should use individual reasons."""
-        processor = BatchProcessor(repo_root=tmp_path)
+        ids = save_drafts(processor, 2)
+
         result = processor.reject_batch(
-            ["art-1", "art-2"],
+            ids,
             reason="Default reason",
-            individual_reasons={"art-1": "Specific reason for art-1"},
+            individual_reasons={ids[0]: "Specific reason"},
         )
+
         assert result.status == BatchResultStatus.SUCCESS
+        service = processor.artifact_service
+        assert service.get(UUID(ids[0])).review_notes == "Specific reason"
+        assert service.get(UUID(ids[1])).review_notes == "Default reason"
 
-    def test_execute_approve_operation(self, tmp_path: Path) -> None:
+    def test_execute_approve_operation(self, processor: BatchProcessor) -> None:
         """should execute approve operation."""
-        processor = BatchProcessor(repo_root=tmp_path)
         operation = BatchOperation(
             operation_type=BatchOperationType.APPROVE,
-            artifact_ids=["a1", "a2"],
+            artifact_ids=save_drafts(processor, 2),
             options={"approver": "test"},
         )
         result = processor.execute(operation)
         assert result.operation_type == BatchOperationType.APPROVE
         assert result.success_count == 2
 
-    def test_execute_reject_operation(self, tmp_path: Path) -> None:
+    def test_execute_reject_operation(self, processor: BatchProcessor) -> None:
         """should execute reject operation."""
-        processor = BatchProcessor(repo_root=tmp_path)
         operation = BatchOperation(
             operation_type=BatchOperationType.REJECT,
-            artifact_ids=["a1"],
+            artifact_ids=save_drafts(processor, 1),
             options={"reason": "Test reject"},
         )
         result = processor.execute(operation)
         assert result.operation_type == BatchOperationType.REJECT
 
-    def test_execute_unsupported_operation(self, tmp_path: Path) -> None:
+    def test_execute_unsupported_operation(self, processor: BatchProcessor) -> None:
         """should fail for unsupported operations."""
-        processor = BatchProcessor(repo_root=tmp_path)
         operation = BatchOperation(
             operation_type=BatchOperationType.LOCK,
             artifact_ids=["a1"],
@@ -256,9 +391,14 @@ class TestBatchProcessor:
         result = processor.execute(operation)
         assert result.status == BatchResultStatus.FAILED
 
-    def test_rollback(self, tmp_path: Path) -> None:
+    def test_rollback(self, processor: BatchProcessor) -> None:
         """should rollback batch operation."""
-        processor = BatchProcessor(repo_root=tmp_path)
-        processor.approve_batch(["a1", "a2", "a3"])
+        ids = save_drafts(processor, 3)
+        processor.approve_batch(ids)
+
         count = processor.rollback()
+
         assert count == 3
+        assert all(status_on_disk(processor, aid) == ArtifactStatus.DRAFT for aid in ids)
+        assert ApprovalsTracker(processor.repo_root / "artifacts").list_approvals() == []
+        assert ArtifactRegistry(processor.repo_root / "artifacts").list_all() == []
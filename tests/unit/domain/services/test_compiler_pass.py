@@ -12,6 +12,7 @@ from rice_factor.domain.artifacts.compiler_types import (
     CompilerResult,
 )
 from rice_factor.domain.artifacts.enums import ArtifactType
+from rice_factor.domain.failures.llm_errors import SchemaViolationError
 from rice_factor.domain.services.compiler_pass import CompilerPass
 from rice_factor.domain.services.context_builder import ForbiddenInputError
 
@@ -330,3 +331,64 @@ class TestCompilerPassValidateOutput:
         }
         # Should not raise
         pass_instance.validate_output(payload)
+
+
+class TestCompilerPassRepair:
+    """Tests for targeted repair of invalid output during compile."""
+
+    @pytest.fixture
+    def schemas_dir(self) -> Path:
+        """Get the actual schemas directory."""
+        return Path(__file__).parent.parent.parent.parent.parent / "schemas"
+
+    @pytest.fixture
+    def mock_context(self) -> CompilerContext:
+        """Create a mock context."""
+        return CompilerContext(
+            pass_type=CompilerPassType.PROJECT,
+            project_files={
+                "requirements.md": "Test requirements",
+                "constraints.md": "Test constraints",
+                "glossary.md": "Test glossary",
+            },
+            artifacts={},
+        )
+
+    def test_compile_repairs_missing_field(
+        self, schemas_dir: Path, mock_context: CompilerContext
+    ) -> None:
+        """A missing field is requested on its own and merged into the output."""
+        mock_llm_port = MagicMock()
+        mock_llm_port.generate.return_value = CompilerResult(
+            success=True,
+            payload={
+                "domains": [{"name": "Test", "responsibility": "Testing"}],
+                "modules": [{"name": "test", "domain": "Test"}],
+                "constraints": {"architecture": "hexagonal"},
+            },
+        )
+        mock_llm_port.repair.return_value = CompilerResult(
+            success=True, payload={"/constraints/languages": ["python"]}
+        )
+
+        result = ConcreteTestPass(schemas_dir).compile(mock_context, mock_llm_port)
+
+        assert result.payload is not None
+        assert result.payload["constraints"]["languages"] == ["python"]
+        mock_llm_port.generate.assert_called_once()
+        mock_llm_port.repair.assert_called_once()
+
+    def test_compile_raises_when_repair_disabled(
+        self, schemas_dir: Path, mock_context: CompilerContext
+    ) -> None:
+        """With repair disabled, invalid output raises as before."""
+        mock_llm_port = MagicMock()
+        mock_llm_port.generate.return_value = CompilerResult(
+            success=True, payload={"domains": []}
+        )
+        pass_instance = ConcreteTestPass(schemas_dir, max_repair_attempts=0)
+
+        with pytest.raises(SchemaViolationError):
+            pass_instance.compile(mock_context, mock_llm_port)
+        mock_llm_port.generate.assert_called_once()
+        mock_llm_port.repair.assert_not_called()
@@ -0,0 +1,260 @@
+"""Unit tests for context packer service."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from rice_factor.domain.artifacts.compiler_types import CompilerPassType
+from rice_factor.domain.ports.ast import (
+    ParseResult,
+    SymbolInfo,
+    SymbolKind,
+    Visibility,
+)
+from rice_factor.domain.prompts import split_project_files
+from rice_factor.domain.services.context_builder import ContextBuilder
+from rice_factor.domain.services.context_packer import (
+    TRUNCATED_KEY,
+    ContextPacker,
+    FragmentKind,
+    PackingReport,
+    create_context_packer,
+)
+
+REQUIREMENTS = (
+    "# Requirements\n\nOverview of the system.\n\n"
+    "## Billing\n\n" + "Invoices are generated monthly. " * 20 + "\n\n"
+    "## Payment Gateway\n\n" + "The payment gateway retries charges. " * 20 + "\n"
+)
+
+
+def _symbol(name: str, kind: SymbolKind = SymbolKind.FUNCTION) -> SymbolInfo:
+    return SymbolInfo(
+        name=name,
+        kind=kind,
+        visibility=Visibility.PUBLIC,
+        line_start=1,
+        line_end=5,
+        column_start=0,
+        column_end=0,
+        signature=f"func {name}()",
+    )
+
+
+class TestContextPacker:
+    """Tests for ContextPacker."""
+
+    def test_rejects_non_positive_budget(self) -> None:
+        """The token budget must be positive."""
+        with pytest.raises(ValueError):
+            ContextPacker(token_budget=0)
+
+    def test_everything_fits(self) -> None:
+        """Nothing is dropped when the budget is large enough."""
+        packer = ContextPacker(token_budget=100_000)
+        files, artifacts, report = packer.pack(
+            CompilerPassType.TEST,
+            {"requirements.md": REQUIREMENTS},
+            {"a1": {"domains": ["billing"], "modules": [{"name": "core"}]}},
+        )
+
+        assert files == {"requirements.md": REQUIREMENTS}
+        assert artifacts == {"a1": {"domains": ["billing"], "modules": [{"name": "core"}]}}
+        assert report.dropped == []
+        assert not report.over_budget
+
+    def test_drops_least_relevant_section(self) -> None:
+        """Sections unrelated to the target are dropped first."""
+        packer = ContextPacker(token_budget=200)
+        files, _, report = packer.pack(
+            CompilerPassType.IMPLEMENTATION,
+            {"requirements.md": REQUIREMENTS},
+            {},
+            target_file="src/payment_gateway.go",
+        )
+
+        content = files["target:requirements.md"]
+        assert content.startswith("# Requirements")
+        assert "## Payment Gateway" in content
+        assert "## Billing" not in content
+        assert [f.section for f in report.dropped] == ["Billing"]
+        assert report.tokens_used <= 200
+        assert content.endswith(
+            "[Truncated to fit the context budget; omitted sections: Billing]\n"
+        )
+
+    def test_whole_documents_stay_in_cached_prefix(self) -> None:
+        """Only documents trimmed for a target are keyed per target."""
+        packer = ContextPacker(token_budget=220)
+        project_files = {
+            "requirements.md": REQUIREMENTS,
+            "glossary.md": "# Glossary\n\nInvoice: a monthly bill.\n",
+        }
+
+        packed = [
+            packer.pack(
+                CompilerPassType.IMPLEMENTATION, project_files, {}, target_file=target
+            )[0]
+            for target in ("src/payment_gateway.go", "src/billing.go")
+        ]
+        (first_prefix, first_target), (second_prefix, second_target) = (
+            split_project_files(files) for files in packed
+        )
+
+        assert first_prefix == second_prefix == {
+            "glossary.md": project_files["glossary.md"]
+        }
+        assert list(first_target) == list(second_target) == ["requirements.md"]
+        assert first_target != second_target
+
+    def test_first_section_always_kept(self) -> None:
+        """Required files keep their first section even over budget."""
+        packer = ContextPacker(token_budget=1)
+        files, _, report = packer.pack(
+            CompilerPassType.TEST, {"requirements.md": REQUIREMENTS}, {}
+        )
+
+        assert files["requirements.md"].startswith("# Requirements")
+        assert report.over_budget
+        assert len(report.dropped) == 2
+
+    def test_artifact_list_items_packed_individually(self) -> None:
+        """List items of artifact payloads are packed one by one."""
+        payload = {
+            "tests": [
+                {"id": "t1", "target": "billing"},
+                {"id": "t2", "target": "payment gateway " * 30},
+            ]
+        }
+        packer = ContextPacker(token_budget=20)
+        _, artifacts, report = packer.pack(
+            CompilerPassType.IMPLEMENTATION,
+            {},
+            {"tp": payload},
+            target_file="billing.go",
+        )
+
+        assert artifacts == {
+            "tp": {
+                "tests": [{"id": "t1", "target": "billing"}],
+                TRUNCATED_KEY: "Omitted to fit the context budget: tests[1]",
+            }
+        }
+        assert report.dropped[0].kind == FragmentKind.ARTIFACT
+        assert report.dropped[0].section == "tests[1]"
+
+    def test_target_symbols_added(self, tmp_path: Path) -> None:
+        """Symbols of an existing target file are added as a fragment."""
+        (tmp_path / "billing.go").write_text("package billing\n")
+        ast_port = MagicMock()
+        ast_port.parse_file.return_value = ParseResult(
+            success=True,
+            symbols=[_symbol("ChargeInvoice")],
+            imports=[],
+            errors=[],
+            language="go",
+        )
+        packer = ContextPacker(token_budget=1000, ast_port=ast_port)
+
+        files, _, _ = packer.pack(
+            CompilerPassType.IMPLEMENTATION,
+            {},
+            {},
+            target_file="billing.go",
+            project_root=tmp_path,
+        )
+
+        assert "func ChargeInvoice()" in files["target:billing.go (symbols)"]
+
+    def test_missing_target_not_parsed(self, tmp_path: Path) -> None:
+        """A target file that does not exist yet is not parsed."""
+        ast_port = MagicMock()
+        packer = ContextPacker(token_budget=1000, ast_port=ast_port)
+
+        files, _, _ = packer.pack(
+            CompilerPassType.IMPLEMENTATION,
+            {},
+            {},
+            target_file="new.go",
+            project_root=tmp_path,
+        )
+
+        ast_port.parse_file.assert_not_called()
+        assert files == {}
+
+    def test_report_to_dict(self) -> None:
+        """The report serializes dropped fragments for metadata."""
+        packer = ContextPacker(token_budget=1)
+        _, _, report = packer.pack(
+            CompilerPassType.TEST, {"requirements.md": REQUIREMENTS}, {}
+        )
+
+        data = report.to_dict()
+        assert data["token_budget"] == 1
+        assert data["tokens_dropped"] == report.tokens_dropped
+        assert data["dropped"][0]["source"] == "requirements.md"
+        assert data["dropped"][0]["kind"] == "project_file"
+
+
+class TestCreateContextPacker:
+    """Tests for create_context_packer."""
+
+    def test_disabled_without_budget(self) -> None:
+        """No packer is created for a null or zero budget."""
+        assert create_context_packer(None) is None
+        assert create_context_packer(0) is None
+
+    def test_created_with_budget(self) -> None:
+        """A packer is created for a positive budget."""
+        packer = create_context_packer(4000)
+        assert packer is not None
+        assert packer.token_budget == 4000
+
+
+class TestContextBuilderPacking:
+    """Tests for ContextBuilder with a packer."""
+
+    @pytest.fixture
+    def project(self, tmp_path: Path) -> Path:
+        project_dir = tmp_path / ".project"
+        project_dir.mkdir()
+        (project_dir / "requirements.md").write_text(REQUIREMENTS)
+        (project_dir / "constraints.md").write_text("# Constraints\n\nGo only.\n")
+        (project_dir / "glossary.md").write_text("# Glossary\n\nInvoice: a bill.\n")
+        return tmp_path
+
+    def test_unpacked_by_default(self, project: Path) -> None:
+        """Without a packer there is no packing report."""
+        packed = ContextBuilder().build_packed_context(CompilerPassType.PROJECT, project)
+
+        assert packed.context.project_files["requirements.md"] == REQUIREMENTS
+        assert packed.packing_report is None
+
+    def test_packs_context(self, project: Path) -> None:
+        """With a packer the context is trimmed and the report returned."""
+        builder = ContextBuilder(packer=ContextPacker(token_budget=50))
+        packed = builder.build_packed_context(CompilerPassType.PROJECT, project)
+        context = packed.context
+
+        assert set(context.project_files) == {
+            "requirements.md",
+            "constraints.md",
+            "glossary.md",
+        }
+        assert "## Billing" not in context.project_files["requirements.md"]
+        assert isinstance(packed.packing_report, PackingReport)
+        assert packed.packing_report.dropped
+
+    def test_reports_returned_per_target(self, project: Path) -> None:
+        """build_contexts returns each target's own packing report."""
+        builder = ContextBuilder(packer=ContextPacker(token_budget=50))
+        contexts = builder.build_contexts(
+            CompilerPassType.PROJECT, project, ["a.go", "b.go"]
+        )
+
+        first = contexts["a.go"].packing_report
+        second = contexts["b.go"].packing_report
+        assert first is not None and second is not None
+        assert first is not second
+        assert not hasattr(builder, "last_packing_report")
@@ -218,6 +218,27 @@ class TestCostTrackerRecord:
 
         assert record.metadata["request_id"] == "123"
 
+    def test_record_with_cache_tokens(self) -> None:
+        """record should keep prompt cache counters and summarize them."""
+        tracker = CostTracker()
+
+        record = tracker.record(
+            provider="claude",
+            model="model",
+            operation="implementation",
+            input_tokens=100,
+            output_tokens=50,
+            cost_usd=0.01,
+            cache_read_tokens=4000,
+            cache_write_tokens=500,
+        )
+
+        assert record.cache_read_tokens == 4000
+        assert record.cache_write_tokens == 500
+        summary = tracker.get_summary("daily")
+        assert summary.cache_read_tokens == 4000
+        assert summary.cache_write_tokens == 500
+
     def test_record_accumulates(self) -> None:
         """Multiple records should accumulate."""
         tracker = CostTracker()
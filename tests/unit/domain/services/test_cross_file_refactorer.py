@@ -4,17 +4,22 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
 
+from rice_factor.domain.ports.lsp import LSPResult, TextEdit
 from rice_factor.domain.services.cross_file_refactorer import (
     CrossFileRefactorer,
     FileOperation,
     OperationResult,
     OperationType,
+    SymbolRename,
     Transaction,
     TransactionResult,
     TransactionState,
+    apply_text_edits,
+    merge_text_edits,
 )
 
 if TYPE_CHECKING:
@@ -444,6 +449,19 @@ class TestCrossFileRefactorer:
         assert "old_func" not in file1.read_text()
         assert "old_func" not in file2.read_text()
 
+    def test_rename_symbols_across_files_in_one_pass(self, tmp_path: Path) -> None:
+        """Test several renames are applied simultaneously."""
+        refactorer = CrossFileRefactorer(repo_root=tmp_path)
+
+        file1 = tmp_path / "file1.py"
+        file1.write_text("a = b\nab = a\n")
+
+        result = refactorer.rename_symbols_across_files([file1], {"a": "b", "b": "a"})
+
+        assert result.success is True
+        assert result.operations_completed == 1
+        assert file1.read_text() == "b = a\nab = b\n"
+
     def test_move_class_to_file(self, tmp_path: Path) -> None:
         """Test moving a class to a new file."""
         refactorer = CrossFileRefactorer(repo_root=tmp_path)
@@ -565,3 +583,146 @@ class TestCrossFileRefactorer:
 
         # Backup directory should not exist after successful commit
         assert not txn.backup_dir.exists()
+
+
+def edit(path: Path, line: int, start: int, end: int, text: str) -> TextEdit:
+    """Create a single-line TextEdit."""
+    return TextEdit(str(path), line, start, line, end, text)
+
+
+class TestMergeTextEdits:
+    """Tests for merging and applying LSP text edits."""
+
+    def test_merges_and_sorts_per_file(self, tmp_path: Path) -> None:
+        """Test edits are grouped by file, sorted and deduplicated."""
+        first = edit(tmp_path / "a.go", 2, 0, 1, "x")
+        second = edit(tmp_path / "a.go", 0, 4, 5, "y")
+
+        merged = merge_text_edits([first, second, first])
+
+        assert merged == {tmp_path / "a.go": [second, first]}
+
+    def test_overlapping_edits_conflict(self, tmp_path: Path) -> None:
+        """Test overlapping edits from different operations are rejected."""
+        with pytest.raises(ValueError, match="Conflicting edits"):
+            merge_text_edits(
+                [edit(tmp_path / "a.go", 0, 0, 3, "x"), edit(tmp_path / "a.go", 0, 2, 4, "y")]
+            )
+
+    def test_same_range_different_text_conflicts(self, tmp_path: Path) -> None:
+        """Test two renames of the same symbol to different names conflict."""
+        with pytest.raises(ValueError, match="Conflicting edits"):
+            merge_text_edits(
+                [edit(tmp_path / "a.go", 0, 0, 1, "x"), edit(tmp_path / "a.go", 0, 0, 1, "y")]
+            )
+
+    def test_apply_counts_utf16_columns(self, tmp_path: Path) -> None:
+        """Test columns are UTF-16 code units as in LSP."""
+        content = 's := "😀"; a := 1\nb := a\n'
+
+        result = apply_text_edits(
+            content,
+            [edit(tmp_path / "a.go", 0, 11, 12, "x"), edit(tmp_path / "a.go", 1, 5, 6, "x")],
+        )
+
+        assert result == 's := "😀"; x := 1\nb := x\n'
+
+
+class TestRenameSymbols:
+    """Tests for batched semantic renames."""
+
+    def test_renames_share_one_session_and_write_once(self, tmp_path: Path) -> None:
+        """Test all renames go to the server together and files change once."""
+        main = tmp_path / "main.go"
+        util = tmp_path / "util.go"
+        main.write_text("a := b()\n")
+        util.write_text("func b() {}\n")
+        lsp = MagicMock()
+        lsp.rename_many.return_value = [
+            LSPResult(success=True, edits=[edit(main, 0, 0, 1, "x")]),
+            LSPResult(
+                success=True,
+                edits=[edit(main, 0, 5, 6, "y"), edit(util, 0, 5, 6, "y")],
+            ),
+        ]
+        refactorer = CrossFileRefactorer(repo_root=tmp_path, lsp=lsp)
+
+        result = refactorer.rename_symbols(
+            [SymbolRename(main, 0, 0, "x"), SymbolRename(util, 0, 5, "y")]
+        )
+
+        assert result.success is True
+        assert result.operations_total == 2
+        lsp.rename_many.assert_called_once_with(
+            [(str(main), 0, 0, "x"), (str(util), 0, 5, "y")]
+        )
+        assert main.read_text() == "x := y()\n"
+        assert util.read_text() == "func y() {}\n"
+
+    def test_conflict_writes_nothing(self, tmp_path: Path) -> None:
+        """Test conflicting renames leave every file untouched."""
+        main = tmp_path / "main.go"
+        main.write_text("a := 1\n")
+        lsp = MagicMock()
+        lsp.rename_many.return_value = [
+            LSPResult(success=True, edits=[edit(main, 0, 0, 1, "x")]),
+            LSPResult(success=True, edits=[edit(main, 0, 0, 1, "y")]),
+        ]
+        refactorer = CrossFileRefactorer(repo_root=tmp_path, lsp=lsp)
+
+        result = refactorer.rename_symbols(
+            [SymbolRename(main, 0, 0, "x"), SymbolRename(main, 0, 0, "y")]
+        )
+
+        assert result.success is False
+        assert "Conflicting edits" in (result.error or "")
+        assert main.read_text() == "a := 1\n"
+
+    def test_failed_rename_writes_nothing(self, tmp_path: Path) -> None:
+        """Test one failed rename aborts the whole batch."""
+        main = tmp_path / "main.go"
+        main.write_text("a := 1\n")
+        lsp = MagicMock()
+        lsp.rename_many.return_value = [
+            LSPResult(success=True, edits=[edit(main, 0, 0, 1, "x")]),
+            LSPResult(success=False, errors=["Rename request failed or timed out"]),
+        ]
+        refactorer = CrossFileRefactorer(repo_root=tmp_path, lsp=lsp)
+
+        result = refactorer.rename_symbols(
+            [SymbolRename(main, 0, 0, "x"), SymbolRename(main, 0, 5, "y")]
+        )
+
+        assert result.success is False
+        assert result.error == "Rename request failed or timed out"
+        assert main.read_text() == "a := 1\n"
+
+    def test_missing_file_leaves_no_open_transaction(self, tmp_path: Path) -> None:
+        """Test an edit to a missing file aborts before any transaction."""
+        main = tmp_path / "main.go"
+        main.write_text("a := 1\n")
+        gone = tmp_path / "gone.go"
+        lsp = MagicMock()
+        lsp.rename_many.return_value = [
+            LSPResult(
+                success=True,
+                edits=[edit(main, 0, 0, 1, "x"), edit(gone, 0, 0, 1, "x")],
+            ),
+        ]
+        refactorer = CrossFileRefactorer(repo_root=tmp_path, lsp=lsp)
+
+        result = refactorer.rename_symbols([SymbolRename(main, 0, 0, "x")])
+
+        assert result.success is False
+        assert f"File does not exist: {gone}" == result.error
+        assert refactorer._active_transactions == {}
+        assert main.read_text() == "a := 1\n"
+
+    def test_requires_lsp(self, tmp_path: Path) -> None:
+        """Test semantic renames fail cleanly without a language server."""
+        refactorer = CrossFileRefactorer(repo_root=tmp_path)
+
+        result = refactorer.rename_symbols([SymbolRename(tmp_path / "a.go", 0, 0, "x")])
+
+        assert result.success is False
+        assert "LSP" in (result.error or "")
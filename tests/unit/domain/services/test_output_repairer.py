@@ -0,0 +1,256 @@
+"""Unit tests for OutputRepairer."""
+
+import copy
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from rice_factor.domain.artifacts.compiler_types import (
+    CompilerContext,
+    CompilerPassType,
+    CompilerResult,
+)
+from rice_factor.domain.artifacts.enums import ArtifactType
+from rice_factor.domain.failures.llm_errors import SchemaViolationError
+from rice_factor.domain.services.output_repairer import (
+    OutputRepairer,
+    RepairTracker,
+    code_location_parts,
+    get_at_pointer,
+    json_pointer,
+    pointer_parts,
+    set_at_pointer,
+    subschema_at,
+)
+from rice_factor.domain.services.output_validator import OutputValidator
+
+SCHEMAS_DIR = Path(__file__).parent.parent.parent.parent.parent / "schemas"
+
+VALID_PLAN: dict[str, Any] = {
+    "domains": [{"name": "Billing", "responsibility": "Invoices and payments"}],
+    "modules": [{"name": "billing", "domain": "Billing"}],
+    "constraints": {"architecture": "hexagonal", "languages": ["python"]},
+}
+
+
+def _context() -> CompilerContext:
+    return CompilerContext(
+        pass_type=CompilerPassType.PROJECT,
+        project_files={"requirements.md": "A billing system. " * 200},
+        artifacts={},
+    )
+
+
+def _llm(*payloads: dict[str, Any]) -> MagicMock:
+    llm = MagicMock()
+    llm.repair.side_effect = [
+        CompilerResult(success=True, payload=payload) for payload in payloads
+    ]
+    return llm
+
+
+@pytest.fixture
+def validator() -> OutputValidator:
+    """Create an OutputValidator with the real schemas."""
+    return OutputValidator(SCHEMAS_DIR)
+
+
+@pytest.fixture
+def tracker() -> RepairTracker:
+    """Create an isolated repair tracker."""
+    return RepairTracker()
+
+
+class TestJsonPointers:
+    """Tests for JSON pointer helpers."""
+
+    def test_round_trip_escapes(self) -> None:
+        """Keys containing / and ~ survive a round trip."""
+        pointer = json_pointer(["a/b", "c~d", 0])
+
+        assert pointer == "/a~1b/c~0d/0"
+        assert pointer_parts(pointer) == ["a/b", "c~d", "0"]
+
+    def test_code_location_parts(self) -> None:
+        """CodeDetector locations convert to path parts."""
+        assert code_location_parts("steps[0].notes[12]") == ["steps", 0, "notes", 12]
+        assert code_location_parts("$") == []
+
+    def test_set_at_pointer(self) -> None:
+        """Values are replaced, added and appended in place."""
+        data: dict[str, Any] = {"items": ["a"], "meta": {}}
+
+        set_at_pointer(data, "/items/0", "b")
+        set_at_pointer(data, "/items/1", "c")
+        set_at_pointer(data, "/meta/name", "x")
+
+        assert data == {"items": ["b", "c"], "meta": {"name": "x"}}
+        assert get_at_pointer(data, "/items/1") == "c"
+        with pytest.raises(ValueError):
+            set_at_pointer(data, "", {})
+
+    def test_subschema_at(self, validator: OutputValidator) -> None:
+        """Schema fragments are found through properties and items."""
+        schema = validator.get_schema(ArtifactType.PROJECT_PLAN)
+
+        fragment = subschema_at(schema, ["domains", 0, "name"])
+
+        assert fragment["type"] == "string"
+        assert subschema_at(schema, ["unknown"]) == {}
+
+
+class TestFindTargets:
+    """Tests for locating invalid sub-trees."""
+
+    def test_valid_payload_has_no_targets(self, validator: OutputValidator) -> None:
+        """A valid payload needs no repair."""
+        repairer = OutputRepairer(validator, tracker=RepairTracker())
+
+        assert repairer.find_targets(VALID_PLAN, ArtifactType.PROJECT_PLAN) == []
+
+    def test_missing_field_targets_the_field(self, validator: OutputValidator) -> None:
+        """A missing required property is targeted with its own schema."""
+        payload = copy.deepcopy(VALID_PLAN)
+        del payload["constraints"]["languages"]
+        repairer = OutputRepairer(validator, tracker=RepairTracker())
+
+        targets = repairer.find_targets(payload, ArtifactType.PROJECT_PLAN)
+
+        assert targets is not None
+        assert [t.pointer for t in targets] == ["/constraints/languages"]
+        assert targets[0].schema["type"] == "array"
+        assert targets[0].current is None
+
+    def test_each_invalid_value_is_targeted(self, validator: OutputValidator) -> None:
+        """Independent violations become separate targets."""
+        payload = copy.deepcopy(VALID_PLAN)
+        payload["constraints"] = {"architecture": "layered", "languages": "python"}
+        repairer = OutputRepairer(validator, tracker=RepairTracker())
+
+        targets = repairer.find_targets(payload, ArtifactType.PROJECT_PLAN)
+
+        assert targets is not None
+        assert [t.pointer for t in targets] == [
+            "/constraints/architecture",
+            "/constraints/languages",
+        ]
+
+    def test_nested_errors_fold_into_parent(self, validator: OutputValidator) -> None:
+        """Errors inside a targeted sub-tree do not become extra targets."""
+        payload = copy.deepcopy(VALID_PLAN)
+        payload["domains"][0] = {"name": "Billing", "owner": "finance"}
+        repairer = OutputRepairer(validator, tracker=RepairTracker())
+
+        targets = repairer.find_targets(payload, ArtifactType.PROJECT_PLAN)
+
+        assert targets is not None
+        assert [t.pointer for t in targets] == ["/domains/0"]
+        assert len(targets[0].messages) == 2
+        assert targets[0].messages[1].startswith("/domains/0/responsibility: ")
+
+    def test_root_errors_are_not_targetable(self, validator: OutputValidator) -> None:
+        """Errors about the payload as a whole cannot be repaired."""
+        payload = {**VALID_PLAN, "extra": True}
+        repairer = OutputRepairer(validator, tracker=RepairTracker())
+
+        assert repairer.find_targets(payload, ArtifactType.PROJECT_PLAN) is None
+
+    def test_code_hit_is_targeted(self, validator: OutputValidator) -> None:
+        """Code detected in a string targets that string."""
+        payload = copy.deepcopy(VALID_PLAN)
+        payload["domains"][0]["responsibility"] = (
+            "def charge(invoice):\n    return gateway.charge(invoice.total)\n"
+        )
+        repairer = OutputRepairer(validator, tracker=RepairTracker())
+
+        targets = repairer.find_targets(payload, ArtifactType.PROJECT_PLAN)
+
+        assert targets is not None
+        assert [t.pointer for t in targets] == ["/domains/0/responsibility"]
+        assert targets[0].schema["type"] == "string"
+
+
+class TestRepair:
+    """Tests for OutputRepairer.repair."""
+
+    def _invalid(self) -> tuple[dict[str, Any], SchemaViolationError]:
+        payload = copy.deepcopy(VALID_PLAN)
+        del payload["constraints"]["languages"]
+        return payload, SchemaViolationError("languages is a required property")
+
+    def test_repairs_only_invalid_subtree(
+        self, validator: OutputValidator, tracker: RepairTracker
+    ) -> None:
+        """The model is asked for the broken pointer only and its value is merged."""
+        payload, error = self._invalid()
+        llm = _llm({"/constraints/languages": ["python"]})
+        repairer = OutputRepairer(validator, tracker=tracker)
+
+        repaired = repairer.repair(
+            CompilerPassType.PROJECT,
+            ArtifactType.PROJECT_PLAN,
+            payload,
+            _context(),
+            llm,
+            error,
+            full_tokens=2000,
+            full_ms=5000.0,
+        )
+
+        assert repaired == VALID_PLAN
+        assert "languages" not in payload["constraints"]
+        request, schema = llm.repair.call_args.args[1:]
+        assert request.project_files == {}
+        assert schema["required"] == ["/constraints/languages"]
+        stats = tracker.get_stats(CompilerPassType.PROJECT)
+        assert (stats.repairs, stats.repaired, stats.llm_calls) == (1, 1, 1)
+        assert 0 < stats.repair_tokens < 2000
+        assert stats.tokens_saved == 2000 - stats.repair_tokens
+        assert stats.latency_saved_ms > 0
+
+    def test_raises_after_max_attempts(
+        self, validator: OutputValidator, tracker: RepairTracker
+    ) -> None:
+        """A payload that stays invalid raises the last validation error."""
+        payload, error = self._invalid()
+        llm = _llm({"/constraints/languages": "python"}, {"/constraints/languages": 3})
+        repairer = OutputRepairer(validator, max_attempts=2, tracker=tracker)
+
+        with pytest.raises(SchemaViolationError) as exc_info:
+            repairer.repair(
+                CompilerPassType.PROJECT,
+                ArtifactType.PROJECT_PLAN,
+                payload,
+                _context(),
+                llm,
+                error,
+            )
+
+        assert exc_info.value is not error
+        assert llm.repair.call_count == 2
+        stats = tracker.get_stats(CompilerPassType.PROJECT)
+        assert (stats.repaired, stats.failed, stats.tokens_saved) == (0, 1, 0)
+
+    def test_disabled_repair_raises_original_error(
+        self, validator: OutputValidator, tracker: RepairTracker
+    ) -> None:
+        """With zero attempts the original error is raised untouched."""
+        payload, error = self._invalid()
+        llm = MagicMock()
+        repairer = OutputRepairer(validator, max_attempts=0, tracker=tracker)
+
+        with pytest.raises(SchemaViolationError) as exc_info:
+            repairer.repair(
+                CompilerPassType.PROJECT,
+                ArtifactType.PROJECT_PLAN,
+                payload,
+                _context(),
+                llm,
+                error,
+            )
+
+        assert exc_info.value is error
+        llm.repair.assert_not_called()
+        assert tracker.summary() == {}
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import threading
 import time
 from datetime import UTC, datetime
+from pathlib import Path
 
 import pytest
 
 from rice_factor.domain.services.parallel_executor import (
     BatchExecutionResult,
+    ExecutionBackend,
     ExecutionResult,
     ExecutionStatus,
     ExecutionTask,
@@ -418,6 +422,280 @@ class TestParallelExecutor:
         assert executor._cancelled is True
 
 
+def _task(task_id: str, priority: int = 0, depends_on: list[str] | None = None) -> ExecutionTask:
+    return ExecutionTask(
+        task_id=task_id,
+        artifact_id=f"a-{task_id}",
+        artifact_type="Test",
+        payload={},
+        priority=priority,
+        depends_on=depends_on or [],
+    )
+
+
+class TestParallelExecutorScheduling:
+    """Tests for dependency-aware priority scheduling."""
+
+    def test_priority_order_with_single_worker(self) -> None:
+        """Tasks are dispatched strictly by priority."""
+        executor = ParallelExecutor(config=ParallelismConfig(max_workers=1))
+        order: list[str] = []
+
+        executor.execute_sync(
+            [_task("c", 3), _task("a", 1), _task("b", 2)],
+            lambda t: order.append(t.task_id),
+        )
+
+        assert order == ["a", "b", "c"]
+
+    def test_dependencies_run_first(self) -> None:
+        """A task starts only after all of its dependencies completed."""
+        executor = ParallelExecutor(config=ParallelismConfig(max_workers=4))
+        finished: list[str] = []
+
+        def handler(t: ExecutionTask) -> None:
+            time.sleep(0.02 if t.task_id == "impl" else 0)
+            finished.append(t.task_id)
+
+        result = executor.execute_sync(
+            [
+                _task("test", depends_on=["apply"]),
+                _task("apply", depends_on=["impl"]),
+                _task("impl", priority=5),
+                _task("other", priority=9),
+            ],
+            handler,
+        )
+
+        assert result.all_succeeded
+        assert finished.index("impl") < finished.index("apply") < finished.index("test")
+
+    def test_stream_yields_before_batch_finishes(self) -> None:
+        """Results are streamed as tasks complete."""
+        executor = ParallelExecutor(config=ParallelismConfig(max_workers=2))
+        release = threading.Event()
+
+        def handler(t: ExecutionTask) -> str:
+            if t.task_id == "slow":
+                release.wait(timeout=5)
+            return t.task_id
+
+        stream = executor.execute_stream([_task("fast"), _task("slow")], handler)
+        first = next(stream)
+        assert first.task_id == "fast"
+        release.set()
+        assert [r.task_id for r in stream] == ["slow"]
+
+    def test_failure_cancels_dependents_only(self) -> None:
+        """Dependents of a failed task are cancelled; others still run."""
+        executor = ParallelExecutor()
+
+        def handler(t: ExecutionTask) -> str:
+            if t.task_id == "impl":
+                raise ValueError("boom")
+            return "ok"
+
+        result = executor.execute_sync(
+            [
+                _task("impl"),
+                _task("apply", depends_on=["impl"]),
+                _task("test", depends_on=["apply"]),
+                _task("docs"),
+            ],
+            handler,
+        )
+
+        by_id = {r.task_id: r for r in result.results}
+        assert by_id["impl"].status == ExecutionStatus.FAILED
+        assert by_id["apply"].status == ExecutionStatus.CANCELLED
+        assert by_id["test"].error == "Dependency 'impl' failed"
+        assert by_id["docs"].status == ExecutionStatus.COMPLETED
+
+    def test_fail_fast_cancels_unstarted_tasks(self) -> None:
+        """fail_fast stops dispatching once a task fails."""
+        executor = ParallelExecutor(
+            config=ParallelismConfig(max_workers=1, fail_fast=True)
+        )
+        started: list[str] = []
+
+        def handler(t: ExecutionTask) -> None:
+            started.append(t.task_id)
+            if t.task_id == "t1":
+                raise ValueError("fail")
+
+        result = executor.execute_sync(
+            [_task(f"t{i}", priority=i) for i in range(5)], handler
+        )
+
+        assert started == ["t0", "t1"]
+        assert result.failed_count == 1
+        assert result.cancelled_count == 3
+        assert result.total_tasks == len(result.results)
+
+    def test_unknown_dependency_rejected(self) -> None:
+        """Dependencies must name tasks in the batch."""
+        with pytest.raises(ValueError, match="unknown task 'missing'"):
+            ParallelExecutor().execute_sync(
+                [_task("a", depends_on=["missing"])], lambda _: None
+            )
+
+    def test_cycle_rejected(self) -> None:
+        """Cyclic dependencies are reported before anything runs."""
+        with pytest.raises(ValueError, match="cycle"):
+            ParallelExecutor().execute_sync(
+                [_task("a", depends_on=["b"]), _task("b", depends_on=["a"])],
+                lambda _: None,
+            )
+
+
+_WORKER_STATE: dict[str, str] = {}
+
+
+def _init_worker(label: str) -> None:
+    _WORKER_STATE["label"] = label
+
+
+def _labelled_square(task: ExecutionTask) -> tuple[str, int, int]:
+    value = int(task.payload["n"])
+    return _WORKER_STATE.get("label", ""), os.getpid(), value * value
+
+
+def _read_file(task: ExecutionTask) -> str:
+    assert task.source_path is not None
+    return Path(task.source_path).read_text(encoding="utf-8")
+
+
+class TestParallelExecutorProcessBackend:
+    """Tests for the process-pool backend."""
+
+    def test_runs_in_initialized_worker_processes(self) -> None:
+        """Handlers run in other processes set up by the initializer."""
+        executor = ParallelExecutor(
+            config=ParallelismConfig(
+                max_workers=2,
+                backend=ExecutionBackend.PROCESS,
+                initializer=_init_worker,
+                initargs=("warm",),
+                ordered_results=True,
+            )
+        )
+        tasks = [
+            ExecutionTask(
+                task_id=f"t{i}", artifact_id=f"a{i}", artifact_type="Test",
+                payload={"n": i}, priority=i,
+            )
+            for i in range(6)
+        ]
+
+        result = executor.execute_sync(tasks, _labelled_square)
+
+        assert result.all_succeeded
+        assert [r.result[2] for r in result.results] == [0, 1, 4, 9, 16, 25]
+        assert {r.result[0] for r in result.results} == {"warm"}
+        assert os.getpid() not in {r.result[1] for r in result.results}
+
+    def test_backend_selectable_per_call(self) -> None:
+        """The backend argument overrides the configured one."""
+        executor = ParallelExecutor(config=ParallelismConfig(chunk_size=3))
+        tasks = [
+            ExecutionTask(
+                task_id=f"t{i}", artifact_id=f"a{i}", artifact_type="Test",
+                payload={"n": i},
+            )
+            for i in range(3)
+        ]
+
+        result = executor.execute_sync(
+            tasks, _labelled_square, backend=ExecutionBackend.PROCESS
+        )
+
+        pids = {r.result[1] for r in result.results}
+        assert len(pids) == 1  # One chunk, one worker
+        assert os.getpid() not in pids
+
+    def test_file_tasks_pass_paths(self, tmp_path: Path) -> None:
+        """File tasks carry only a path that the worker reads."""
+        path = tmp_path / "artifact.json"
+        path.write_text("{}", encoding="utf-8")
+        task = ExecutionTask.for_file(path, "ImplementationPlan")
+
+        result = ParallelExecutor().execute_sync(
+            [task], _read_file, backend=ExecutionBackend.PROCESS
+        )
+
+        assert task.payload == {}
+        assert task.task_id == str(path)
+        assert result.results[0].result == "{}"
+
+    def test_unpicklable_handler_fails_tasks(self) -> None:
+        """A handler that cannot reach the worker fails its tasks."""
+        task = ExecutionTask(
+            task_id="t1", artifact_id="a1", artifact_type="Test", payload={}
+        )
+
+        result = ParallelExecutor().execute_sync(
+            [task], lambda t: t.task_id, backend=ExecutionBackend.PROCESS
+        )
+
+        assert result.failed_count == 1
+        assert result.results[0].error is not None
+        assert result.results[0].error.startswith("Worker failed")
+
+
+class TestParallelExecutorBatched:
+    """Tests for batch handlers."""
+
+    def test_batches_ready_tasks(self) -> None:
+        """Ready tasks are handed over in batches, dependents in later ones."""
+        executor = ParallelExecutor(config=ParallelismConfig(max_workers=2))
+        batches: list[list[str]] = []
+        lock = threading.Lock()
+
+        def batch_handler(tasks: list[ExecutionTask]) -> list[str]:
+            with lock:
+                batches.append([t.task_id for t in tasks])
+            return [t.task_id.upper() for t in tasks]
+
+        result = executor.execute_batched(
+            [_task("a"), _task("b"), _task("c"), _task("d", depends_on=["a"])],
+            batch_handler,
+            batch_size=3,
+        )
+
+        assert result.all_succeeded
+        assert batches[0] == ["a", "b", "c"]
+        assert batches[-1] == ["d"]
+        assert {r.task_id: r.result for r in result.results}["d"] == "D"
+
+    def test_exception_results_fail_their_task(self) -> None:
+        """An Exception in the returned list fails only that task."""
+        executor = ParallelExecutor(config=ParallelismConfig(max_workers=1))
+
+        result = executor.execute_batched(
+            [_task("a"), _task("b"), _task("c", depends_on=["b"])],
+            lambda tasks: [
+                ValueError("bad prompt") if t.task_id == "b" else t.task_id
+                for t in tasks
+            ],
+        )
+
+        statuses = {r.task_id: r.status for r in result.results}
+        assert statuses == {
+            "a": ExecutionStatus.COMPLETED,
+            "b": ExecutionStatus.FAILED,
+            "c": ExecutionStatus.CANCELLED,
+        }
+
+    def test_wrong_result_count_fails_batch(self) -> None:
+        """A handler returning the wrong number of results fails the batch."""
+        executor = ParallelExecutor(config=ParallelismConfig(max_workers=1))
+
+        result = executor.execute_batched([_task("a"), _task("b")], lambda _: [1])
+
+        assert result.failed_count == 2
+        assert "1 results for 2 tasks" in (result.results[0].error or "")
+
+
 class TestParallelExecutorAsync:
     """Tests for async execution."""
 
@@ -0,0 +1,258 @@
+"""Unit tests for RebuildService."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from rice_factor.adapters.llm.stub import StubLLMAdapter
+from rice_factor.adapters.storage.filesystem import FilesystemStorageAdapter
+from rice_factor.adapters.storage.metadata import ArtifactMetadataStore
+from rice_factor.domain.artifacts.compiler_types import CompilerPassType
+from rice_factor.domain.artifacts.enums import ArtifactStatus, ArtifactType, CreatedBy
+from rice_factor.domain.artifacts.envelope import ArtifactEnvelope
+from rice_factor.domain.services.rebuild_service import (
+    INPUT_HASH_KEY,
+    RebuildAction,
+    RebuildService,
+    RebuildStatus,
+    compute_input_hash,
+    topological_levels,
+)
+
+_PASS_OUTPUT = {
+    CompilerPassType.PROJECT: ArtifactType.PROJECT_PLAN,
+    CompilerPassType.ARCHITECTURE: ArtifactType.ARCHITECTURE_PLAN,
+}
+
+
+class FakeArtifactBuilder:
+    """Builder that saves stub payloads instead of calling an LLM."""
+
+    def __init__(self, storage: FilesystemStorageAdapter, fail: bool = False) -> None:
+        self.storage = storage
+        self.fail = fail
+        self.calls: list[CompilerPassType] = []
+
+    def build_with_context(
+        self,
+        pass_type: CompilerPassType,
+        context: Any,  # noqa: ARG002
+        packing_report: Any = None,  # noqa: ARG002
+        depends_on: list[UUID] | None = None,
+    ) -> ArtifactEnvelope:
+        self.calls.append(pass_type)
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        stub = StubLLMAdapter()
+        payload = (
+            stub.generate_project_plan()
+            if pass_type == CompilerPassType.PROJECT
+            else stub.generate_architecture_plan()
+        )
+        envelope: ArtifactEnvelope = ArtifactEnvelope(
+            artifact_type=_PASS_OUTPUT[pass_type],
+            status=ArtifactStatus.DRAFT,
+            created_by=CreatedBy.LLM,
+            payload=payload,
+            depends_on=depends_on or [],
+        )
+        self.storage.save(envelope)
+        return envelope
+
+
+@pytest.fixture
+def project_root(tmp_path: Path) -> Path:
+    """Create a project with intake files and two planning artifacts."""
+    project_dir = tmp_path / ".project"
+    project_dir.mkdir()
+    for name in ("requirements.md", "constraints.md", "glossary.md"):
+        (project_dir / name).write_text(f"# {name}\n", encoding="utf-8")
+
+    storage = FilesystemStorageAdapter(tmp_path / "artifacts")
+    stub = StubLLMAdapter()
+    for artifact_type, payload in (
+        (ArtifactType.PROJECT_PLAN, stub.generate_project_plan()),
+        (ArtifactType.ARCHITECTURE_PLAN, stub.generate_architecture_plan()),
+    ):
+        storage.save(
+            ArtifactEnvelope(
+                artifact_type=artifact_type,
+                status=ArtifactStatus.APPROVED,
+                created_by=CreatedBy.LLM,
+                payload=payload,
+            )
+        )
+    return tmp_path
+
+
+def make_service(
+    project_root: Path, fail: bool = False
+) -> tuple[RebuildService, FakeArtifactBuilder]:
+    """Create a rebuild service with a fake builder."""
+    storage = FilesystemStorageAdapter(project_root / "artifacts")
+    builder = FakeArtifactBuilder(storage, fail=fail)
+    context_builder = MagicMock()
+    context_builder.build_packed_context.return_value.packing_report = None
+    service = RebuildService(
+        storage=storage,
+        project_root=project_root,
+        artifact_builder=builder,  # type: ignore[arg-type]
+        context_builder=context_builder,
+        rate_limiter=MagicMock(),
+    )
+    return service, builder
+
+
+class TestTopologicalLevels:
+    """Tests for topological_levels."""
+
+    def test_groups_by_level(self) -> None:
+        """Nodes come after everything they depend on."""
+        graph = {"a": set(), "b": {"a"}, "c": {"a"}, "d": {"b", "c"}}
+
+        assert topological_levels(graph) == [["a"], ["b", "c"], ["d"]]
+
+    def test_ignores_unknown_dependencies(self) -> None:
+        """Dependencies outside the graph do not block a node."""
+        assert topological_levels({"a": {"gone"}}) == [["a"]]
+
+    def test_rejects_cycles(self) -> None:
+        """A cycle raises ValueError naming the nodes."""
+        with pytest.raises(ValueError, match="cycle"):
+            topological_levels({"a": {"b"}, "b": {"a"}})
+
+
+class TestComputeInputHash:
+    """Tests for compute_input_hash."""
+
+    def test_stable_across_key_order(self) -> None:
+        """Hashes do not depend on dict ordering."""
+        first = compute_input_hash({"a.md": "x", "b.md": "y"}, {"P": {"k": 1, "j": 2}})
+        second = compute_input_hash({"b.md": "y", "a.md": "x"}, {"P": {"j": 2, "k": 1}})
+
+        assert first == second
+
+    def test_changes_with_inputs(self) -> None:
+        """Any input change changes the hash."""
+        base = compute_input_hash({"a.md": "x"}, {}, target_file="src/a.py")
+
+        assert compute_input_hash({"a.md": "y"}, {}, target_file="src/a.py") != base
+        assert compute_input_hash({"a.md": "x"}, {}, target_file="src/b.py") != base
+
+
+class TestRebuildPlan:
+    """Tests for RebuildService.plan and touch."""
+
+    def test_unrecorded_artifacts_are_stale(self, project_root: Path) -> None:
+        """Artifacts without a recorded input hash need building."""
+        service, _ = make_service(project_root)
+
+        plan = service.plan()
+
+        assert [[n.key for n in level] for level in plan.levels] == [
+            ["ProjectPlan"],
+            ["ArchitecturePlan"],
+        ]
+        assert {n.action for n in plan.nodes} == {RebuildAction.BUILD}
+        assert plan.levels[1][0].dependencies == ["ProjectPlan"]
+
+    def test_touch_marks_everything_up_to_date(self, project_root: Path) -> None:
+        """Touched artifacts are up to date until their inputs change."""
+        service, _ = make_service(project_root)
+
+        assert service.touch() == ["ProjectPlan", "ArchitecturePlan"]
+
+        assert service.plan().is_up_to_date
+
+    def test_input_hashes_persist_across_services(self, project_root: Path) -> None:
+        """Recorded hashes are read back from disk by a new service."""
+        make_service(project_root)[0].touch()
+
+        service, _ = make_service(project_root)
+
+        assert service.plan().is_up_to_date
+        assert (project_root / "artifacts" / "_meta" / "metadata.json").exists()
+
+    def test_upstream_change_marks_downstream(self, project_root: Path) -> None:
+        """Changing an intake file rebuilds its artifact and checks dependents."""
+        service, _ = make_service(project_root)
+        service.touch()
+        (project_root / ".project" / "requirements.md").write_text("# changed\n")
+
+        nodes = {n.key: n for n in service.plan().nodes}
+
+        assert nodes["ProjectPlan"].action == RebuildAction.BUILD
+        assert nodes["ProjectPlan"].reason == "inputs changed"
+        assert nodes["ArchitecturePlan"].action == RebuildAction.CHECK
+
+    def test_locked_artifacts_are_never_rebuilt(self, project_root: Path) -> None:
+        """Locked artifacts are reported but left alone."""
+        storage = FilesystemStorageAdapter(project_root / "artifacts")
+        architecture = storage.list_by_type(ArtifactType.ARCHITECTURE_PLAN)[0]
+        storage.save(architecture.model_copy(update={"status": ArtifactStatus.LOCKED}))
+        service, _ = make_service(project_root)
+
+        nodes = {n.key: n for n in service.plan().nodes}
+
+        assert nodes["ArchitecturePlan"].action == RebuildAction.LOCKED
+        assert "ArchitecturePlan" not in service.touch()
+
+
+class TestRebuildServiceRebuild:
+    """Tests for RebuildService.rebuild."""
+
+    def test_rebuilds_in_dependency_order(self, project_root: Path) -> None:
+        """Stale artifacts are rebuilt upstream first and record their inputs."""
+        service, builder = make_service(project_root)
+        plan = service.plan()
+
+        result = service.rebuild(plan)
+
+        assert builder.calls == [CompilerPassType.PROJECT, CompilerPassType.ARCHITECTURE]
+        assert result.all_succeeded
+        rebuilt = {o.key: o.artifact for o in result.outcomes}
+        architecture = rebuilt["ArchitecturePlan"]
+        assert architecture.depends_on == [rebuilt["ProjectPlan"].id]
+        recorded = ArtifactMetadataStore(project_root / "artifacts").get(architecture.id)
+        assert recorded[INPUT_HASH_KEY]
+        assert service.plan().is_up_to_date
+
+    def test_skips_dependents_with_unchanged_inputs(self, project_root: Path) -> None:
+        """A re-check is skipped when the rebuilt upstream is identical."""
+        service, builder = make_service(project_root)
+        service.touch()
+        (project_root / ".project" / "requirements.md").write_text("# changed\n")
+
+        result = service.rebuild()
+
+        statuses = {o.key: o.status for o in result.outcomes}
+        assert statuses == {
+            "ProjectPlan": RebuildStatus.REBUILT,
+            "ArchitecturePlan": RebuildStatus.UNCHANGED,
+        }
+        assert builder.calls == [CompilerPassType.PROJECT]
+
+    def test_failure_skips_dependents(self, project_root: Path) -> None:
+        """Artifacts downstream of a failed rebuild are skipped."""
+        service, _ = make_service(project_root, fail=True)
+
+        result = service.rebuild()
+
+        outcomes = {o.key: o for o in result.outcomes}
+        assert outcomes["ProjectPlan"].status == RebuildStatus.FAILED
+        assert outcomes["ArchitecturePlan"].status == RebuildStatus.SKIPPED
+        assert "ProjectPlan" in (outcomes["ArchitecturePlan"].error or "")
+        assert not result.all_succeeded
+
+    def test_rebuild_requires_builders(self, project_root: Path) -> None:
+        """A plan-only service cannot rebuild."""
+        service = RebuildService(
+            storage=FilesystemStorageAdapter(project_root / "artifacts"),
+            project_root=project_root,
+        )
+
+        with pytest.raises(ValueError, match="builder"):
+            service.rebuild()
@@ -155,6 +155,20 @@ class TestRunModeRouterCoordinate:
 
         assert result.session_id.startswith("session-")
 
+    @pytest.mark.asyncio
+    async def test_close_releases_coordinator(
+        self, solo_config: RunModeConfig, context: CoordinationContext
+    ) -> None:
+        """Closing the router stops its coordinator's bus."""
+        router = RunModeRouter(config=solo_config)
+        await router.coordinate(context)
+        coordinator = router.get_coordinator()
+
+        await router.close()
+
+        assert coordinator.bus._workers == {}
+        assert router.get_coordinator() is not coordinator
+
 
 class TestRunModeRouterFromCliMode:
     """Tests for CLI mode parsing."""
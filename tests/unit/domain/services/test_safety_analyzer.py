@@ -369,6 +369,31 @@ class TestSafetyAnalyzer:
         total_changes = sum(i.changes_count for i in impacts)
         assert total_changes == 3  # 2 in a.py, 1 in c.py
 
+    def test_check_symbol_usage_with_index(self, tmp_path: Path) -> None:
+        """Test symbol usage from the symbol index matches a scan."""
+        from rice_factor.adapters.parsing.symbol_index import SymbolIndex
+
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "a.py").write_text("from module import my_func\nmy_func()\n")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_a.py").write_text("my_func = 1\n")
+        (tmp_path / "main.go").write_text("my_func()\n")
+
+        scanned = SafetyAnalyzer(repo_root=tmp_path).check_symbol_usage(
+            "my_func", tmp_path / "pkg"
+        )
+        with SymbolIndex(tmp_path) as index:
+            analyzer = SafetyAnalyzer(repo_root=tmp_path, symbol_index=index)
+            all_usages = analyzer.check_symbol_usage("my_func")
+            pkg_usages = analyzer.check_symbol_usage("my_func", tmp_path / "pkg")
+
+        assert [i.to_dict() for i in pkg_usages] == [i.to_dict() for i in scanned]
+        # Only Python files are checked, as with a scan
+        assert sorted((Path(i.file_path).name, i.impact_type) for i in all_usages) == [
+            ("a.py", ImpactType.DEPENDENCY_CHANGE),
+            ("test_a.py", ImpactType.TEST_IMPACT),
+        ]
+
     def test_estimate_complexity_low(self, tmp_path: Path) -> None:
         """Test low complexity estimation."""
         analyzer = SafetyAnalyzer(repo_root=tmp_path)
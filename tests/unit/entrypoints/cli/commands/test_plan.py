@@ -146,6 +146,47 @@ class TestImplCommand:
         assert result.exit_code == 1
         assert "not initialized" in result.stdout.lower()
 
+    def test_impl_glob_dry_run_lists_targets(self, tmp_path: Path) -> None:
+        """plan impl with a glob should list every matched target."""
+        src = tmp_path / "src"
+        src.mkdir()
+        for name in ("b.go", "a.go", "notes.txt"):
+            (src / name).write_text("")
+
+        with (
+            patch("rice_factor.entrypoints.cli.commands.plan._check_phase"),
+            patch("rice_factor.entrypoints.cli.commands.plan._validate_intake"),
+            patch("rice_factor.entrypoints.cli.commands.plan._check_lifecycle"),
+            patch("rice_factor.entrypoints.cli.commands.plan.SafetyEnforcer"),
+            patch("rice_factor.entrypoints.cli.commands.plan.AuditLogger"),
+        ):
+            result = runner.invoke(
+                app,
+                ["impl", "src/*.go", "src/a.go", "--path", str(tmp_path), "--dry-run"],
+            )
+
+        assert result.exit_code == 0
+        assert "Would create 2 ImplementationPlans" in result.stdout
+        assert result.stdout.index("src/a.go") < result.stdout.index("src/b.go")
+        assert "notes.txt" not in result.stdout
+        assert not (tmp_path / "artifacts").exists()
+
+    def test_impl_no_matches_fails(self, tmp_path: Path) -> None:
+        """plan impl should fail if a glob matches nothing."""
+        with (
+            patch("rice_factor.entrypoints.cli.commands.plan._check_phase"),
+            patch("rice_factor.entrypoints.cli.commands.plan._validate_intake"),
+            patch("rice_factor.entrypoints.cli.commands.plan._check_lifecycle"),
+            patch("rice_factor.entrypoints.cli.commands.plan.SafetyEnforcer"),
+            patch("rice_factor.entrypoints.cli.commands.plan.AuditLogger"),
+        ):
+            result = runner.invoke(
+                app, ["impl", "src/*.go", "--path", str(tmp_path)]
+            )
+
+        assert result.exit_code == 1
+        assert "No target files matched" in result.stdout
+
 
 class TestRefactorCommand:
     """Tests for plan refactor command."""